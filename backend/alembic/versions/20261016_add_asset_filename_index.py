@@ -0,0 +1,29 @@
+"""Add organization/source/filename index on assets
+
+Bulk upload analysis looks up existing assets by filename within an
+organization and source type using batched IN queries.
+
+Revision ID: asset_org_source_filename_idx
+Revises: run_group_finalized_at
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "asset_org_source_filename_idx"
+down_revision = "run_group_finalized_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_assets_org_source_filename",
+        "assets",
+        ["organization_id", "source_type", "original_filename"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assets_org_source_filename", table_name="assets")
@@ -0,0 +1,49 @@
+"""Add event outbox for batched event dispatch
+
+Events emitted from extraction, connector syncs and run groups are written
+to event_outbox and dispatched to their triggers in batches by a Celery
+task, instead of creating runs and committing once per trigger inline in
+the emitting run.
+
+Revision ID: event_outbox
+Revises: search_facet_counts
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+# revision identifiers
+revision = "event_outbox"
+down_revision = "search_facet_counts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "organization_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("event_name", sa.String(255), nullable=False),
+        sa.Column("payload", JSONB(), nullable=False, server_default="{}"),
+        sa.Column("source_run_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("status", sa.String(50), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_event_outbox_status_created", "event_outbox", ["status", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_outbox_status_created", table_name="event_outbox")
+    op.drop_table("event_outbox")
@@ -0,0 +1,32 @@
+"""Add finalized_at to run_groups
+
+Child completions are now counted atomically and the group completes when
+its counters reach total_children. finalized_at records that the parent
+has finished registering children, so a group whose first children finish
+while the parent is still spawning does not complete early.
+
+Existing groups are marked finalized: they were created before completion
+was gated on finalization.
+
+Revision ID: run_group_finalized_at
+Revises: event_outbox
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "run_group_finalized_at"
+down_revision = "event_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("run_groups", sa.Column("finalized_at", sa.DateTime(), nullable=True))
+    op.execute("UPDATE run_groups SET finalized_at = created_at")
+
+
+def downgrade() -> None:
+    op.drop_column("run_groups", "finalized_at")
@@ -0,0 +1,36 @@
+"""Add group_result_recorded_at to runs
+
+A child run's result can be reported more than once: the queue timeout
+sweep fails a stalled child, and the worker may still complete it later.
+group_result_recorded_at marks the child as counted, so its group's
+completed/failed counters include each child only once.
+
+Children already in a terminal state were counted when they finished and
+are marked recorded.
+
+Revision ID: run_group_result_recorded_at
+Revises: asset_org_source_filename_idx
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "run_group_result_recorded_at"
+down_revision = "asset_org_source_filename_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("runs", sa.Column("group_result_recorded_at", sa.DateTime(), nullable=True))
+    op.execute(
+        "UPDATE runs SET group_result_recorded_at = COALESCE(completed_at, created_at) "
+        "WHERE group_id IS NOT NULL "
+        "AND status IN ('completed', 'failed', 'timed_out', 'cancelled')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("runs", "group_result_recorded_at")
@@ -0,0 +1,74 @@
+"""Add search_documents table and move metadata off search_chunks
+
+search_chunks carried a full copy of the document's namespaced metadata on
+every chunk row, so a single metadata change rewrote every chunk of the
+document. Metadata now lives once per source in search_documents, joined to
+chunks on (source_type, source_id).
+
+Seeds search_documents from each source's first chunk, then drops
+search_chunks.metadata and its GIN index.
+
+Revision ID: search_documents_table
+Revises: user_org_memberships
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+# revision identifiers
+revision = "search_documents_table"
+down_revision = "user_org_memberships"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_documents",
+        sa.Column("source_type", sa.String(50), nullable=False),
+        sa.Column("source_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("organization_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("metadata", JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("source_type", "source_id", name="pk_search_documents"),
+    )
+    op.create_index(
+        "ix_search_documents_org", "search_documents", ["organization_id", "source_type"]
+    )
+
+    # One row per source, taken from its lowest chunk
+    op.execute("""
+        INSERT INTO search_documents (source_type, source_id, organization_id, metadata)
+        SELECT DISTINCT ON (source_type, source_id)
+            source_type, source_id, organization_id, COALESCE(metadata, '{}'::jsonb)
+        FROM search_chunks
+        ORDER BY source_type, source_id, chunk_index
+    """)
+
+    op.execute("""
+        CREATE INDEX ix_search_documents_metadata_gin
+        ON search_documents USING GIN(metadata jsonb_path_ops)
+    """)
+
+    op.execute("DROP INDEX IF EXISTS ix_search_chunks_metadata_gin")
+    op.drop_column("search_chunks", "metadata")
+
+
+def downgrade() -> None:
+    op.add_column("search_chunks", sa.Column("metadata", JSONB(), nullable=True))
+    op.execute("""
+        UPDATE search_chunks sc
+        SET metadata = sd.metadata
+        FROM search_documents sd
+        WHERE sd.source_type = sc.source_type AND sd.source_id = sc.source_id
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_search_chunks_metadata_gin
+        ON search_chunks USING GIN(metadata jsonb_path_ops)
+    """)
+
+    op.execute("DROP INDEX IF EXISTS ix_search_documents_metadata_gin")
+    op.drop_index("ix_search_documents_org", table_name="search_documents")
+    op.drop_table("search_documents")
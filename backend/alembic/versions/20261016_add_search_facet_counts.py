@@ -0,0 +1,156 @@
+"""Add precomputed per-organization facet counts
+
+Browse pages (no search query) need facet counts over every document of a
+source type, which meant aggregating JSONB values across the whole index on
+each request. search_facet_counts keeps those counts precomputed, maintained
+incrementally by statement-level triggers on search_documents, so indexing
+and metadata propagation update them as a side effect of their writes.
+
+search_facet_paths lists the JSON path of each registry facet per source
+type. It is synced from the metadata registry by FacetService, which also
+rebuilds the counts whenever the paths change; it starts empty here.
+
+Revision ID: search_facet_counts
+Revises: search_documents_table
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers
+revision = "search_facet_counts"
+down_revision = "search_documents_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_facet_paths",
+        sa.Column("facet_name", sa.String(100), nullable=False),
+        sa.Column("source_type", sa.String(50), nullable=False),
+        sa.Column("json_path", sa.String(500), nullable=False),
+        sa.PrimaryKeyConstraint("facet_name", "source_type", name="pk_search_facet_paths"),
+    )
+
+    op.create_table(
+        "search_facet_counts",
+        sa.Column("organization_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("source_type", sa.String(50), nullable=False),
+        sa.Column("facet_name", sa.String(100), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("doc_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint(
+            "organization_id", "source_type", "facet_name", "value",
+            name="pk_search_facet_counts",
+        ),
+    )
+
+    # Scalar facet values of one document (one row per facet/value)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_document_facet_values(
+            doc_source_type text, doc_metadata jsonb
+        )
+        RETURNS TABLE (facet_name text, value text)
+        LANGUAGE sql STABLE AS $$
+            SELECT DISTINCT p.facet_name::text, v.value #>> '{}'
+            FROM search_facet_paths p
+            -- json_path is "namespace.field"; the field key may contain dots
+            CROSS JOIN LATERAL (
+                SELECT doc_metadata -> split_part(p.json_path, '.', 1)
+                       -> substr(p.json_path, strpos(p.json_path, '.') + 1) AS value
+            ) v
+            WHERE p.source_type = doc_source_type
+            AND jsonb_typeof(v.value) IN ('string', 'number', 'boolean')
+            AND v.value #>> '{}' <> ''
+        $$
+    """)
+
+    # Apply per-statement deltas; rows are upserted in key order so
+    # concurrent statements lock counters in the same order
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_documents_update_facet_counts()
+        RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO search_facet_counts AS c
+                    (organization_id, source_type, facet_name, value, doc_count)
+                SELECT n.organization_id, n.source_type, f.facet_name, f.value, COUNT(*)
+                FROM new_rows n,
+                     search_document_facet_values(n.source_type, n.metadata) f
+                GROUP BY 1, 2, 3, 4
+                ORDER BY 1, 2, 3, 4
+                ON CONFLICT (organization_id, source_type, facet_name, value)
+                DO UPDATE SET doc_count = c.doc_count + EXCLUDED.doc_count;
+
+            ELSIF TG_OP = 'UPDATE' THEN
+                INSERT INTO search_facet_counts AS c
+                    (organization_id, source_type, facet_name, value, doc_count)
+                SELECT organization_id, source_type, facet_name, value, SUM(delta)
+                FROM (
+                    SELECT n.organization_id, n.source_type, f.facet_name, f.value, 1 AS delta
+                    FROM new_rows n,
+                         search_document_facet_values(n.source_type, n.metadata) f
+                    UNION ALL
+                    SELECT o.organization_id, o.source_type, f.facet_name, f.value, -1
+                    FROM old_rows o,
+                         search_document_facet_values(o.source_type, o.metadata) f
+                ) deltas
+                GROUP BY 1, 2, 3, 4
+                HAVING SUM(delta) <> 0
+                ORDER BY 1, 2, 3, 4
+                ON CONFLICT (organization_id, source_type, facet_name, value)
+                DO UPDATE SET doc_count = c.doc_count + EXCLUDED.doc_count;
+
+            ELSE
+                UPDATE search_facet_counts c
+                SET doc_count = c.doc_count - d.doc_count
+                FROM (
+                    SELECT o.organization_id, o.source_type, f.facet_name, f.value,
+                           COUNT(*) AS doc_count
+                    FROM old_rows o,
+                         search_document_facet_values(o.source_type, o.metadata) f
+                    GROUP BY 1, 2, 3, 4
+                ) d
+                WHERE c.organization_id = d.organization_id
+                AND c.source_type = d.source_type
+                AND c.facet_name = d.facet_name
+                AND c.value = d.value;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+    # Transition tables require one trigger per event
+    op.execute("""
+        CREATE TRIGGER search_documents_facet_counts_insert
+        AFTER INSERT ON search_documents
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION search_documents_update_facet_counts()
+    """)
+    op.execute("""
+        CREATE TRIGGER search_documents_facet_counts_update
+        AFTER UPDATE ON search_documents
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION search_documents_update_facet_counts()
+    """)
+    op.execute("""
+        CREATE TRIGGER search_documents_facet_counts_delete
+        AFTER DELETE ON search_documents
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION search_documents_update_facet_counts()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS search_documents_facet_counts_delete ON search_documents")
+    op.execute("DROP TRIGGER IF EXISTS search_documents_facet_counts_update ON search_documents")
+    op.execute("DROP TRIGGER IF EXISTS search_documents_facet_counts_insert ON search_documents")
+    op.execute("DROP FUNCTION IF EXISTS search_documents_update_facet_counts()")
+    op.execute("DROP FUNCTION IF EXISTS search_document_facet_values(text, jsonb)")
+    op.drop_table("search_facet_counts")
+    op.drop_table("search_facet_paths")
@@ -21,6 +21,7 @@ from sqlalchemy import and_, func, select
 
 from app.core.database.procedures import Pipeline, PipelineItemState, PipelineRun, PipelineTrigger
 from app.core.shared.database_service import database_service
+from app.core.shared.event_service import event_service
 from app.core.shared.run_service import run_service
 from app.cwr.pipelines import pipeline_executor
 from app.dependencies import get_current_org_id, get_current_org_id_or_delegated, get_optional_current_user
@@ -42,6 +43,8 @@ class StageSchema(BaseModel):
     function: str
     description: Optional[str] = None
     batch_size: int = 50
+    batched: bool = False
+    concurrency: int = 1
     on_error: str = "skip"
 
 
@@ -278,6 +281,8 @@ async def get_pipeline(
                 function=s.get("function", ""),
                 description=s.get("description"),
                 batch_size=s.get("batch_size", 50),
+                batched=s.get("batched", False),
+                concurrency=s.get("concurrency", 1),
                 on_error=s.get("on_error", "skip"),
             )
             for s in stages
@@ -668,6 +673,7 @@ async def update_pipeline(
 
         pipeline.updated_at = datetime.utcnow()
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return await get_pipeline(slug, organization_id)
 
@@ -694,6 +700,7 @@ async def enable_pipeline(
         pipeline.is_active = True
         pipeline.updated_at = datetime.utcnow()
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return {"status": "success", "message": f"Pipeline {slug} enabled"}
 
@@ -720,6 +727,7 @@ async def disable_pipeline(
         pipeline.is_active = False
         pipeline.updated_at = datetime.utcnow()
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return {"status": "success", "message": f"Pipeline {slug} disabled"}
 
@@ -815,6 +823,7 @@ async def create_pipeline_trigger(
         )
         session.add(trigger)
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
         await session.refresh(trigger)
 
         return TriggerSchema(
@@ -852,5 +861,6 @@ async def delete_pipeline_trigger(
 
         await session.delete(trigger)
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return {"status": "success", "message": "Trigger deleted"}
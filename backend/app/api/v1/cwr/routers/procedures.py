@@ -21,6 +21,7 @@ from sqlalchemy import select
 
 from app.core.database.procedures import Procedure, ProcedureTrigger, ProcedureVersion
 from app.core.shared.database_service import database_service
+from app.core.shared.event_service import event_service
 from app.cwr.procedures import procedure_executor, procedure_loader
 from app.core.database.models import User
 from app.dependencies import (
@@ -588,6 +589,7 @@ async def create_procedure(
         session.add(version_record)
 
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
         await session.refresh(procedure)
 
         logger.info(f"Created user procedure: {request.slug}")
@@ -901,6 +903,7 @@ async def update_procedure(
 
         procedure.updated_at = datetime.utcnow()
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return await get_procedure(slug, organization_id)
 
@@ -935,6 +938,7 @@ async def delete_procedure(
 
         await session.delete(procedure)
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         logger.info(f"Deleted user procedure: {slug}")
 
@@ -1066,6 +1070,7 @@ async def enable_procedure(
         procedure.is_active = True
         procedure.updated_at = datetime.utcnow()
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return await get_procedure(slug, organization_id)
 
@@ -1095,6 +1100,7 @@ async def disable_procedure(
         procedure.is_active = False
         procedure.updated_at = datetime.utcnow()
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return await get_procedure(slug, organization_id)
 
@@ -1196,6 +1202,7 @@ async def create_trigger(
         )
         session.add(trigger)
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return TriggerSchema(
             id=str(trigger.id),
@@ -1231,6 +1238,7 @@ async def delete_trigger(
 
         await session.delete(trigger)
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         return {"status": "deleted"}
 
@@ -1382,6 +1390,7 @@ async def restore_version(
         )
         session.add(new_version_record)
         await session.commit()
+        event_service.invalidate_triggers(organization_id)
 
         logger.info(f"Restored procedure {slug} to version {version} (now version {new_version})")
 
@@ -5,7 +5,7 @@ Assets API Router for Phase 0.
 Provides endpoints for querying assets, extraction status, and related runs.
 """
 
-import io
+import asyncio
 import logging
 import re
 from pathlib import Path
@@ -13,7 +13,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select
 
 from app.api.v1.data.schemas import (
@@ -704,12 +704,11 @@ async def preview_bulk_upload(
     """
     from app.core.ingestion.bulk_upload_service import bulk_upload_service
 
-    # Read file contents
-    file_list = []
-    for file in files:
-        content = await file.read()
-        file_list.append((file.filename, content))
-        await file.seek(0)  # Reset file pointer
+    # Hash spooled uploads in chunks (content is never held in memory)
+    file_list = [
+        await asyncio.to_thread(bulk_upload_service.describe_file, file.filename, file.file)
+        for file in files
+    ]
 
     async with database_service.get_session() as session:
         analysis = await bulk_upload_service.analyze_bulk_upload(
@@ -782,7 +781,6 @@ async def apply_bulk_upload(
             }
         }
     """
-    import io
     import uuid as uuid_lib
     from datetime import datetime, timedelta
 
@@ -798,17 +796,14 @@ async def apply_bulk_upload(
 
     organization_id = org_id
 
-    # Read file contents
+    # Hash spooled uploads in chunks; content is streamed to storage later
     file_list = []
     files_by_name = {}
     for file in files:
-        content = await file.read()
-        file_list.append((file.filename, content))
-        files_by_name[file.filename] = {
-            "content": content,
-            "content_type": file.content_type,
-        }
-        await file.seek(0)  # Reset file pointer
+        file_list.append(
+            await asyncio.to_thread(bulk_upload_service.describe_file, file.filename, file.file)
+        )
+        files_by_name[file.filename] = file
 
     async with database_service.get_session() as session:
         # Analyze the upload
@@ -831,10 +826,9 @@ async def apply_bulk_upload(
         for file_info in analysis.new:
             try:
                 filename = file_info["filename"]
-                file_data = files_by_name[filename]
-                file_content = file_data["content"]
-                file_size = len(file_content)
-                content_type = file_data["content_type"]
+                upload = files_by_name[filename]
+                file_size = file_info["file_size"]
+                content_type = upload.content_type
 
                 # Generate IDs
                 document_id = str(uuid_lib.uuid4())
@@ -851,17 +845,20 @@ async def apply_bulk_upload(
                     original_filename=filename,
                     content_type=content_type,
                     file_size=file_size,
+                    file_hash=file_info["file_hash"],
                     status="pending",
                     expires_at=expires_at,
                 )
                 await session.commit()
                 await session.refresh(artifact)
 
-                # Upload to MinIO
-                minio.put_object(
+                # Stream to MinIO from the spooled upload
+                upload.file.seek(0)
+                await asyncio.to_thread(
+                    minio.put_object,
                     bucket=bucket,
                     key=object_key,
-                    data=io.BytesIO(file_content),
+                    data=upload.file,
                     length=file_size,
                     content_type=content_type or "application/octet-stream",
                 )
@@ -898,10 +895,9 @@ async def apply_bulk_upload(
             try:
                 filename = file_info["filename"]
                 asset_id = UUID(file_info["asset_id"])
-                file_data = files_by_name[filename]
-                file_content = file_data["content"]
-                file_size = len(file_content)
-                content_type = file_data["content_type"]
+                upload = files_by_name[filename]
+                file_size = file_info["file_size"]
+                content_type = upload.content_type
 
                 # Get existing asset
                 asset = await asset_service.get_asset(session=session, asset_id=asset_id)
@@ -913,11 +909,13 @@ async def apply_bulk_upload(
                 document_id = str(asset_id)
                 object_key = f"{organization_id}/uploads/{document_id}-{filename}"
 
-                # Upload to MinIO
-                minio.put_object(
+                # Stream to MinIO from the spooled upload
+                upload.file.seek(0)
+                await asyncio.to_thread(
+                    minio.put_object,
                     bucket=bucket,
                     key=object_key,
-                    data=io.BytesIO(file_content),
+                    data=upload.file,
                     length=file_size,
                     content_type=content_type or "application/octet-stream",
                 )
@@ -1378,10 +1376,11 @@ async def get_asset_content(
             )
 
         try:
-            content_io = minio.get_object(
-                extraction.extracted_bucket, extraction.extracted_object_key
+            content = await asyncio.to_thread(
+                minio.read_object_text,
+                extraction.extracted_bucket,
+                extraction.extracted_object_key,
             )
-            content = content_io.getvalue().decode("utf-8")
             return {"content": content}
         except Exception as e:
             logger.error(f"Failed to download content for asset {asset_id}: {e}")
@@ -1429,19 +1428,27 @@ async def download_asset_content(
         download_name = f"{Path(clean_filename).stem}.md"
 
         try:
-            content_io = minio.get_object(
+            info = await asyncio.to_thread(
+                minio.get_object_info,
+                extraction.extracted_bucket,
+                extraction.extracted_object_key,
+            )
+            if not info:
+                raise HTTPException(status_code=404, detail="Processed file not found in storage")
+            chunks = await minio.stream_object(
                 extraction.extracted_bucket, extraction.extracted_object_key
             )
-            content = content_io.getvalue()
 
             return StreamingResponse(
-                io.BytesIO(content),
+                chunks,
                 media_type="text/markdown",
                 headers={
                     "Content-Disposition": f'attachment; filename="{download_name}"',
-                    "Content-Length": str(len(content)),
+                    "Content-Length": str(info["size"]),
                 },
             )
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Failed to download asset {asset_id}: {e}")
             raise HTTPException(
@@ -1491,17 +1498,23 @@ async def download_asset_original(
         disposition = "inline" if inline else "attachment"
 
         try:
-            content_io = minio.get_object(asset.raw_bucket, asset.raw_object_key)
-            content = content_io.getvalue()
+            info = await asyncio.to_thread(
+                minio.get_object_info, asset.raw_bucket, asset.raw_object_key
+            )
+            if not info:
+                raise HTTPException(status_code=404, detail="Original file not found in storage")
+            chunks = await minio.stream_object(asset.raw_bucket, asset.raw_object_key)
 
             return StreamingResponse(
-                io.BytesIO(content),
+                chunks,
                 media_type=content_type,
                 headers={
                     "Content-Disposition": f'{disposition}; filename="{clean_filename}"',
-                    "Content-Length": str(len(content)),
+                    "Content-Length": str(info["size"]),
                 },
             )
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Failed to download original for asset {asset_id}: {e}")
             raise HTTPException(
@@ -1516,15 +1529,20 @@ async def download_asset_original(
 )
 async def download_bulk_assets(
     request: Dict[str, Any],
+    org_id: UUID = Depends(get_current_org_id),
     current_user: User = Depends(get_current_user),
 ):
     """Download multiple processed documents as a ZIP archive.
 
+    The archive is streamed as it is built. With save_to_storage, it is
+    uploaded to object storage instead and the artifact details are returned.
+
     Accepts:
         document_ids: List of document IDs
         download_type: 'individual', 'combined', or 'rag_ready'
         custom_filename: Optional ZIP filename
         include_summary: Whether to include a processing summary
+        save_to_storage: Upload the archive as a temp artifact
     """
     document_ids = request.get("document_ids", [])
     download_type = request.get("download_type", "individual")
@@ -1533,7 +1551,7 @@ async def download_bulk_assets(
     include_combined = request.get("include_combined", download_type == "combined")
 
     try:
-        zip_info = await zip_service.create_bulk_download(
+        archive = await zip_service.stream_bulk_download(
             document_ids=document_ids,
             download_type=download_type,
             custom_filename=custom_filename,
@@ -1541,15 +1559,14 @@ async def download_bulk_assets(
             include_combined=include_combined,
         )
 
-        if not zip_info.zip_path.exists():
-            raise HTTPException(status_code=404, detail="Archive not found")
+        if request.get("save_to_storage"):
+            return await zip_service.save_to_storage(archive, org_id)
 
-        return FileResponse(
-            path=str(zip_info.zip_path),
-            filename=zip_info.zip_path.name,
+        return StreamingResponse(
+            archive.chunks,
             media_type="application/zip",
             headers={
-                "Content-Disposition": f"attachment; filename={zip_info.zip_path.name}"
+                "Content-Disposition": f"attachment; filename={archive.filename}"
             },
         )
     except HTTPException:
@@ -1621,22 +1638,20 @@ async def download_rag_ready_assets(
 ):
     """Download all RAG-ready documents as a ZIP archive."""
     try:
-        zip_info = await zip_service.create_rag_ready_download(
+        archive = await zip_service.stream_rag_ready_download(
             custom_filename=zip_name,
             include_summary=include_summary,
         )
 
-        if not zip_info.zip_path.exists():
-            raise HTTPException(status_code=404, detail="No RAG-ready documents found")
-
-        return FileResponse(
-            path=str(zip_info.zip_path),
-            filename=zip_info.zip_path.name,
+        return StreamingResponse(
+            archive.chunks,
             media_type="application/zip",
             headers={
-                "Content-Disposition": f"attachment; filename={zip_info.zip_path.name}"
+                "Content-Disposition": f"attachment; filename={archive.filename}"
             },
         )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -208,8 +208,8 @@ async def get_field_stats(
 
         # Get doc count for this field
         count_sql = text("""
-            SELECT COUNT(DISTINCT source_id) as doc_count
-            FROM search_chunks
+            SELECT COUNT(*) as doc_count
+            FROM search_documents
             WHERE organization_id = :org_id
               AND source_type = ANY(:source_types)
               AND metadata->:namespace->>:field IS NOT NULL
@@ -86,6 +86,13 @@ class SearchRequest(BaseModel):
     limit: int = Field(20, ge=1, le=100, description="Maximum results to return")
     offset: int = Field(0, ge=0, description="Offset for pagination")
     include_facets: bool = Field(True, description="Include faceted counts in response")
+    facet_fields: Optional[List[str]] = Field(
+        None,
+        description=(
+            "Facets to compute: source_type, content_type and/or registry facet names "
+            "(e.g. agency, notice_type). Default: source_type and content_type"
+        ),
+    )
 
 
 class SearchHitResponse(BaseModel):
@@ -125,6 +132,9 @@ class SearchResponse(BaseModel):
     """Search results with metadata."""
 
     total: int = Field(..., description="Total matching results")
+    total_capped: bool = Field(
+        False, description="True when total is a lower bound (display as e.g. '1000+')"
+    )
     limit: int = Field(..., description="Results limit")
     offset: int = Field(..., description="Results offset")
     query: str = Field(..., description="Original search query")
@@ -265,6 +275,7 @@ async def search_assets(
                     facet_filters=request.facet_filters,
                     limit=request.limit,
                     offset=request.offset,
+                    facet_fields=request.facet_fields,
                 )
             else:
                 results = await pg_search_service.search(
@@ -301,6 +312,7 @@ async def search_assets(
 
         return SearchResponse(
             total=results.total,
+            total_capped=results.total_capped,
             limit=request.limit,
             offset=request.offset,
             query=request.query,
@@ -383,6 +395,7 @@ async def search_assets_get(
 
         return SearchResponse(
             total=results.total,
+            total_capped=results.total_capped,
             limit=limit,
             offset=offset,
             query=q,
@@ -534,6 +547,75 @@ async def check_search_health(
     }
 
 
+# =========================================================================
+# BROWSE FACETS ENDPOINT
+# =========================================================================
+
+
+@router.get(
+    "/facets",
+    response_model=Dict[str, FacetResponse],
+    summary="Browse facet counts",
+    description=(
+        "Facet counts over all indexed documents (no search query), read from "
+        "precomputed per-organization counts. Used by browse page sidebars."
+    ),
+)
+async def get_browse_facets(
+    facets: List[str] = Query(..., description="Registry facet names (e.g. agency, notice_type)"),
+    source_types: Optional[List[str]] = Query(
+        None, description="Restrict to source types (e.g. sam_notice, ag_forecast)"
+    ),
+    size: int = Query(20, ge=1, le=500, description="Buckets per facet"),
+    org_id: UUID = Depends(get_current_org_id),
+) -> Dict[str, FacetResponse]:
+    """
+    Get facet counts for browse pages.
+
+    Counts are maintained incrementally as documents are indexed, so this
+    does not aggregate the index per request. Results are cached briefly
+    and refreshed after index operations.
+    """
+    if not _is_search_enabled():
+        raise HTTPException(
+            status_code=503,
+            detail="Search is not enabled.",
+        )
+
+    from app.core.search.facet_service import facet_service
+
+    try:
+        async with database_service.get_session() as session:
+            results = await facet_service.get_browse_facets(
+                session=session,
+                organization_id=org_id,
+                facet_names=facets,
+                source_types=source_types,
+                facet_size=size,
+            )
+
+        return {
+            name: FacetResponse(
+                field=facet.field,
+                buckets=[
+                    FacetBucketResponse(value=b.value, count=b.count)
+                    for b in facet.buckets
+                ],
+                total_other=facet.total_other,
+            )
+            for name, facet in results.items()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get browse facets: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get browse facets: {str(e)}",
+        )
+
+
 # =========================================================================
 # METADATA SCHEMA ENDPOINT
 # =========================================================================
@@ -659,6 +741,7 @@ async def search_sam(
 
         return SearchResponse(
             total=results.total,
+            total_capped=results.total_capped,
             limit=request.limit,
             offset=request.offset,
             query=request.query,
@@ -759,6 +842,7 @@ async def search_salesforce(
 
         return SearchResponse(
             total=results.total,
+            total_capped=results.total_capped,
             limit=request.limit,
             offset=request.offset,
             query=request.query,
@@ -841,6 +925,7 @@ async def search_salesforce_get(
 
         return SearchResponse(
             total=results.total,
+            total_capped=results.total_capped,
             limit=limit,
             offset=offset,
             query=q,
@@ -923,6 +1008,7 @@ async def search_sam_get(
 
         return SearchResponse(
             total=results.total,
+            total_capped=results.total_capped,
             limit=limit,
             offset=offset,
             query=q,
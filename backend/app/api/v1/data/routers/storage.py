@@ -15,7 +15,9 @@ All file operations are proxied through the backend for security and simplicity.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -72,6 +74,13 @@ def _require_storage_enabled():
         )
 
 
+def _upload_size(file: fastapi.UploadFile) -> int:
+    """Get the size of a spooled upload without reading it into memory."""
+    size = file.file.seek(0, os.SEEK_END)
+    file.file.seek(0)
+    return size
+
+
 # =========================================================================
 # HEALTH CHECK (delegates to system health helper)
 # =========================================================================
@@ -123,8 +132,6 @@ async def proxy_upload(
     """
     _require_storage_enabled()
 
-    import io
-
     minio = get_minio_service()
     if not minio:
         raise HTTPException(status_code=503, detail="MinIO service unavailable")
@@ -138,8 +145,7 @@ async def proxy_upload(
 
     try:
         async with database_service.get_session() as session:
-            file_content = await file.read()
-            file_size = len(file_content)
+            file_size = _upload_size(file)
 
             artifact = await artifact_service.create_artifact(
                 session=session,
@@ -157,10 +163,12 @@ async def proxy_upload(
             await session.commit()
             await session.refresh(artifact)
 
-            minio.put_object(
+            # Stream from the spooled upload, hashing on the way
+            upload = await asyncio.to_thread(
+                minio.put_stream,
                 bucket=bucket,
                 key=object_key,
-                data=io.BytesIO(file_content),
+                data=file.file,
                 length=file_size,
                 content_type=file.content_type or "application/octet-stream",
             )
@@ -172,6 +180,7 @@ async def proxy_upload(
                 artifact_id=artifact.id,
                 status="available",
                 file_size=info.get("size") if info else file_size,
+                file_hash=upload.file_hash,
                 etag=info.get("etag") if info else None,
             )
 
@@ -935,8 +944,6 @@ async def upload_to_folder(
     """
     _require_storage_enabled()
 
-    import io
-
     minio = get_minio_service()
     if not minio:
         raise HTTPException(status_code=503, detail="MinIO service unavailable")
@@ -962,15 +969,14 @@ async def upload_to_folder(
     object_key = f"{prefix}{filename}"
 
     try:
-        # Read file content
-        file_content = await file.read()
-        file_size = len(file_content)
+        file_size = _upload_size(file)
 
-        # Upload to MinIO
-        minio.put_object(
+        # Stream from the spooled upload to MinIO, hashing on the way
+        upload = await asyncio.to_thread(
+            minio.put_stream,
             bucket=bucket,
             key=object_key,
-            data=io.BytesIO(file_content),
+            data=file.file,
             length=file_size,
             content_type=file.content_type or "application/octet-stream",
         )
@@ -1013,6 +1019,7 @@ async def upload_to_folder(
                             original_filename=filename,
                             content_type=content_type,
                             file_size=file_size,
+                            file_hash=upload.file_hash,
                             expires_at=expires_at,
                         )
                     else:
@@ -1028,6 +1035,7 @@ async def upload_to_folder(
                             original_filename=filename,
                             content_type=content_type,
                             file_size=file_size,
+                            file_hash=upload.file_hash,
                             status="available",
                             expires_at=expires_at,
                         )
@@ -944,7 +944,7 @@ class MetadataFieldDefinitionResponse(BaseModel):
 class FacetMappingResponse(BaseModel):
     """Maps a facet to a JSON path within a content type."""
     content_type: str = Field(..., description="Content type (e.g., sam_notice, asset)")
-    json_path: str = Field(..., description="JSON path in search_chunks.metadata (e.g., sam.agency)")
+    json_path: str = Field(..., description="JSON path in search_documents.metadata (e.g., sam.agency)")
 
 
 class FacetDefinitionResponse(BaseModel):
@@ -1009,7 +1009,7 @@ class MetadataFieldUpdateRequest(BaseModel):
 class FacetMappingCreateRequest(BaseModel):
     """Request to add a content type mapping to a facet."""
     content_type: str = Field(..., description="Content type (e.g., sam_notice, asset)")
-    json_path: str = Field(..., description="JSON path in search_chunks.metadata (e.g., sam.agency)")
+    json_path: str = Field(..., description="JSON path in search_documents.metadata (e.g., sam.agency)")
 
 
 class FacetCreateRequest(BaseModel):
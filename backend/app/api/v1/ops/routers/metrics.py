@@ -127,3 +127,21 @@ async def get_procedure_metrics(
             ),
             "by_function": by_function,
         }
+
+
+@router.get(
+    "/caches",
+    summary="Get cache hit/miss metrics",
+    description="Hit/miss counters for the LLM response cache and the embedding cache.",
+)
+async def get_cache_metrics(
+    current_user: User = Depends(get_current_user),
+):
+    """Get hit/miss metrics for the LLM response and embedding caches."""
+    from app.core.llm.llm_response_cache import llm_response_cache
+    from app.core.search.embedding_cache import embedding_cache
+
+    return {
+        "llm_response_cache": await llm_response_cache.get_stats(),
+        "embedding_cache": embedding_cache.get_stats(),
+    }
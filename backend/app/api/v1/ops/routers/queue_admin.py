@@ -910,6 +910,8 @@ async def list_active_jobs(
                     "enforce_retention": "Enforce Retention Policies",
                     "system_health_report": "System Health Report",
                     "search_reindex": "Search Index Rebuild",
+                    "search_ann_rebuild": "Search ANN Index Rebuild",
+                    "search_facet_counts_rebuild": "Search Facet Counts Rebuild",
                     "stale_run_cleanup": "Stale Run Cleanup",
                     "reindex_search": "Reindex Search",
                     "sharepoint_sync_hourly": "SharePoint Sync (Hourly)",
@@ -95,6 +95,8 @@ def get_display_name_for_run(run) -> str:
         # Common task name mappings
         task_labels = {
             "search_reindex": "Search Index Rebuild",
+            "search_ann_rebuild": "Search ANN Index Rebuild",
+            "search_facet_counts_rebuild": "Search Facet Counts Rebuild",
             "queue_pending_assets": "Queue Pending Assets",
             "stale_run_cleanup": "Stale Run Cleanup",
             "system_health_report": "System Health Report",
@@ -272,6 +274,7 @@ async def websocket_jobs(
     # Create tasks for receiving messages and listening to pubsub
     receive_task = None
     pubsub_task = None
+    closed_task = None
 
     try:
         # Send initial state
@@ -293,7 +296,7 @@ async def websocket_jobs(
                 while True:
                     data = await websocket.receive_json()
                     if data.get("type") == "ping":
-                        await websocket.send_json({"type": "pong"})
+                        await websocket_manager.send_to_connection(websocket, {"type": "pong"})
             except WebSocketDisconnect:
                 pass
             except Exception as e:
@@ -308,7 +311,9 @@ async def websocket_jobs(
                     # System admin: subscribe to all org channels
                     channel = pubsub_service.subscribe_all_org_channels()
                 async for message in channel:
-                    await websocket_manager.send_to_connection(websocket, message)
+                    # Queued for the connection's writer; False once it is dropped
+                    if not await websocket_manager.send_to_connection(websocket, message):
+                        break
             except asyncio.CancelledError:
                 pass
             except Exception as e:
@@ -317,10 +322,12 @@ async def websocket_jobs(
         # Run both tasks concurrently
         receive_task = asyncio.create_task(receive_messages())
         pubsub_task = asyncio.create_task(listen_pubsub())
+        # Completes if the manager drops the connection (send failed or client too slow)
+        closed_task = asyncio.create_task(websocket_manager.wait_closed(websocket))
 
-        # Wait for either task to complete (usually due to disconnect)
+        # Wait for any task to complete (usually due to disconnect)
         done, pending = await asyncio.wait(
-            [receive_task, pubsub_task],
+            [receive_task, pubsub_task, closed_task],
             return_when=asyncio.FIRST_COMPLETED,
         )
 
@@ -342,5 +349,7 @@ async def websocket_jobs(
             receive_task.cancel()
         if pubsub_task and not pubsub_task.done():
             pubsub_task.cancel()
+        if closed_task and not closed_task.done():
+            closed_task.cancel()
 
         await websocket_manager.disconnect(websocket, organization_id)
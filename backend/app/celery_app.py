@@ -129,6 +129,8 @@ app.conf.update(
         # =================================================================
         # Procedure execution (uses maintenance queue for lightweight execution)
         "app.tasks.execute_procedure_task": {"queue": "maintenance"},
+        # Event outbox dispatch (creates runs for event triggers)
+        "app.tasks.dispatch_event_outbox_task": {"queue": "maintenance"},
         # Scheduled task system
         "app.tasks.check_scheduled_tasks": {"queue": "maintenance"},
         "app.tasks.execute_scheduled_task_async": {"queue": "maintenance"},
@@ -230,6 +232,19 @@ if extraction_recovery_enabled:
         "options": {"queue": "maintenance"},
     }
 
+# Add event outbox dispatcher
+# Deferred events schedule a dispatch themselves; this is the safety net for
+# events whose dispatch could not be scheduled
+event_outbox_dispatch_enabled = _bool(os.getenv("EVENT_OUTBOX_DISPATCH_ENABLED", "true"), True)
+event_outbox_dispatch_interval = int(os.getenv("EVENT_OUTBOX_DISPATCH_INTERVAL", "30"))  # 30 seconds
+
+if event_outbox_dispatch_enabled:
+    beat_schedule["dispatch-event-outbox"] = {
+        "task": "app.tasks.dispatch_event_outbox_task",
+        "schedule": event_outbox_dispatch_interval,  # Every N seconds (default: 30)
+        "options": {"queue": "maintenance"},
+    }
+
 # Add extraction queue processing task
 # This task submits pending extractions to Celery based on available capacity
 extraction_queue_enabled = _bool(os.getenv("EXTRACTION_QUEUE_ENABLED", "true"), True)
@@ -270,11 +285,25 @@ app.conf.timezone = "UTC"
 
 import logging
 
-from celery.signals import worker_ready
+from celery.signals import worker_process_init, worker_ready
 
 _recovery_logger = logging.getLogger("curatore.celery.recovery")
 
 
+def _start_cache_listener() -> None:
+    try:
+        from .core.shared.shared_cache import start_invalidation_listener
+        start_invalidation_listener()
+    except Exception as e:
+        _recovery_logger.warning(f"Failed to start shared cache listener: {e}")
+
+
+@worker_process_init.connect
+def on_worker_process_init(**kwargs):
+    """Start the shared cache invalidation listener in each pool process."""
+    _start_cache_listener()
+
+
 @worker_ready.connect
 def on_worker_ready(sender, **kwargs):
     """
@@ -293,6 +322,9 @@ def on_worker_ready(sender, **kwargs):
     except Exception as e:
         _recovery_logger.warning(f"Failed to initialize queue registry: {e}")
 
+    # Shared cache invalidations (solo/threads pools run tasks in this process)
+    _start_cache_listener()
+
     # Schedule orphaned extraction recovery
     recovery_enabled = _bool(os.getenv("CELERY_STARTUP_RECOVERY_ENABLED", "true"), True)
 
@@ -17,16 +17,20 @@ Usage:
     if llm_adapter.is_available:
         client = llm_adapter.client
         # ... use the OpenAI client
+
+    # From async code, use the pooled AsyncOpenAI client instead
+    async_client = llm_adapter.get_async_client()
+    resp = await async_client.chat.completions.create(...)
 """
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 from uuid import UUID
 
 import httpx
 import urllib3
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -34,9 +38,14 @@ from app.connectors.adapters.base import ServiceAdapter
 from app.core.models import LLMConnectionStatus
 from app.core.models.llm_models import LLMTaskType
 from app.core.shared.config_loader import config_loader
+from app.core.utils.http_clients import close_at_loop_shutdown
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the async client (per event loop)
+ASYNC_MAX_CONNECTIONS = 100
+ASYNC_MAX_KEEPALIVE = 20
+
 
 class LLMAdapter(ServiceAdapter):
     """
@@ -50,6 +59,10 @@ class LLMAdapter(ServiceAdapter):
 
     def __init__(self):
         self._client: Optional[OpenAI] = None
+        self._client_settings: Optional[Dict[str, Any]] = None
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_client_closer: Optional[AsyncIterator[None]] = None
         self._initialize_client()
 
     # ========================================================================
@@ -86,6 +99,11 @@ class LLMAdapter(ServiceAdapter):
             max_retries = settings.openai_max_retries
             verify_ssl = settings.openai_verify_ssl
 
+        # Async clients are rebuilt lazily from these settings
+        self._async_client = None
+        self._async_client_loop = None
+        self._client_settings = None
+
         if not api_key:
             logger.warning("No LLM API key configured (checked config.yml and environment)")
             self._client = None
@@ -106,11 +124,59 @@ class LLMAdapter(ServiceAdapter):
                 http_client=http_client,
                 max_retries=max_retries
             )
+            self._client_settings = {
+                "api_key": api_key,
+                "base_url": base_url,
+                "timeout": timeout,
+                "max_retries": max_retries,
+                "verify_ssl": verify_ssl,
+            }
 
         except Exception as e:
             print(f"Warning: Failed to initialize OpenAI client: {e}")
             self._client = None
 
+    def get_async_client(self) -> Optional[AsyncOpenAI]:
+        """
+        Get the AsyncOpenAI client for the running event loop.
+
+        All requests on a loop share one pooled httpx.AsyncClient. The SDK
+        handles retries (exponential backoff, honouring Retry-After) up to the
+        configured max_retries, and every request is bounded by the configured
+        timeout. Celery tasks run each task in a fresh loop and httpx clients
+        cannot be reused across loops, so a new client is created whenever
+        the loop changes; each client is closed when its loop shuts down, so
+        finished tasks do not leak connection pools.
+
+        Must be called from within a running event loop.
+
+        Returns:
+            Optional[AsyncOpenAI]: The async client, or None if no API key is configured
+        """
+        if not self._client_settings:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            config = self._client_settings
+            http_client = httpx.AsyncClient(
+                verify=config["verify_ssl"],
+                timeout=config["timeout"],
+                limits=httpx.Limits(
+                    max_connections=ASYNC_MAX_CONNECTIONS,
+                    max_keepalive_connections=ASYNC_MAX_KEEPALIVE,
+                ),
+            )
+            self._async_client = AsyncOpenAI(
+                api_key=config["api_key"],
+                base_url=config["base_url"],
+                http_client=http_client,
+                max_retries=config["max_retries"],
+            )
+            self._async_client_loop = loop
+            self._async_client_closer = close_at_loop_shutdown(http_client)
+        return self._async_client
+
     # ========================================================================
     # ServiceAdapter interface
     # ========================================================================
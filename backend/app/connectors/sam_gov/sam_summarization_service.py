@@ -480,11 +480,11 @@ class SamSummarizationService:
 
         # Call LLM
         try:
-            if not self.llm_service._client:
+            if not self.llm_service.is_available:
                 logger.error("LLM client not initialized")
                 return None
 
-            response = self.llm_service._client.chat.completions.create(
+            response = await self.llm_service.chat_completion(
                 model=model,
                 messages=[
                     {
@@ -684,10 +684,10 @@ Keep the summary brief and actionable."""
         temperature = task_config.temperature if task_config.temperature is not None else 0.3
 
         try:
-            if not self.llm_service._client:
+            if not self.llm_service.is_available:
                 return None
 
-            response = self.llm_service._client.chat.completions.create(
+            response = await self.llm_service.chat_completion(
                 model=resolved_model,
                 messages=[
                     {"role": "system", "content": "You are a federal contracting analyst."},
@@ -847,16 +847,15 @@ Keep the summary brief and actionable."""
         prompt = prompt_template.format(**context)
 
         # Use the global LLM client (infrastructure service)
-        client = self.llm_service._client
         model = settings.openai_model
 
-        if not client:
+        if not self.llm_service.is_available:
             logger.error(f"No LLM client available for auto-summary of {solicitation_id}")
             return None
 
         # Call LLM
         try:
-            response = client.chat.completions.create(
+            response = await self.llm_service.chat_completion(
                 model=model,
                 messages=[
                     {
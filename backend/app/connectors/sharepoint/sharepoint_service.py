@@ -43,6 +43,8 @@ class TokenManager:
         self._token: Optional[str] = None
         self._token_acquired_at: float = 0
         self._refresh_count = 0
+        # Serializes refreshes when one manager is shared by concurrent downloads
+        self._refresh_lock = asyncio.Lock()
 
     @property
     def token(self) -> Optional[str]:
@@ -67,7 +69,25 @@ class TokenManager:
             Valid access token
         """
         if self.is_token_expired():
-            await self.refresh_token(client)
+            async with self._refresh_lock:
+                if self.is_token_expired():
+                    await self.refresh_token(client)
+        return self._token
+
+    async def refresh_if_current(self, client: httpx.AsyncClient, stale_token: Optional[str]) -> str:
+        """
+        Refresh after a 401, unless another caller already replaced the token.
+
+        Args:
+            client: httpx client to use for token request
+            stale_token: Token that was rejected
+
+        Returns:
+            Valid access token
+        """
+        async with self._refresh_lock:
+            if self._token == stale_token:
+                await self.refresh_token(client)
         return self._token
 
     async def refresh_token(self, client: httpx.AsyncClient) -> str:
@@ -5,6 +5,7 @@ Provides operations for:
 - Sync config CRUD (create, read, update, archive)
 - Sync execution (one-way pull from SharePoint)
 - File sync (create/update assets from SharePoint files)
+- Pooled downloads streamed into object storage (one client and token per run)
 - Deleted file detection and cleanup
 
 Usage:
@@ -28,12 +29,10 @@ Usage:
 """
 
 import asyncio
-import hashlib
+import importlib.util
 import logging
 import re
-import tempfile
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
@@ -95,101 +94,160 @@ TRANSIENT_ERROR_PATTERNS = (
 )
 
 
-async def _download_file_with_retry(
-    organization_id: UUID,
-    session: AsyncSession,
-    drive_id: str,
-    item_id: str,
-    file_name: str,
-    max_retries: int = 3,
-    retry_delay_seconds: int = 30,
-) -> bytes:
+# Connection pool for one sync's downloads
+DOWNLOAD_MAX_CONNECTIONS = 8
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class SharePointDownloader:
     """
-    Download a file from SharePoint with retry logic for transient errors.
+    Download session shared by all files of one sync run.
 
     Features:
-    - Retries on network errors (server disconnected, connection reset, etc.)
-    - Retries on 401 with token refresh
-    - Retries on 429 (rate limiting) with Retry-After header support
-    - 30 second wait between retries by default
-
-    Args:
-        organization_id: Organization UUID for credentials lookup
-        session: Database session for credentials lookup
-        drive_id: SharePoint drive ID
-        item_id: SharePoint item ID
-        file_name: File name for logging
-        max_retries: Maximum retry attempts (default: 3)
-        retry_delay_seconds: Seconds to wait between retries (default: 30)
-
-    Returns:
-        File content as bytes
-
-    Raises:
-        Exception if all retries fail
+    - One pooled httpx client (HTTP/2 when h2 is installed), so connections
+      and TLS sessions are reused across files
+    - One TokenManager: the token is fetched once, refreshed before expiry,
+      and refreshed once (not per file) when Graph returns 401
+    - File bodies stream straight into a MinIO multipart upload and are
+      hashed on the way, so memory does not grow with file size
+    - Retries on network errors, 401, 429 (Retry-After) and 5xx
+
+    Credentials and the token are resolved lazily on the first download.
+
+    Usage:
+        async with SharePointDownloader(organization_id, session) as downloader:
+            upload = await downloader.download_to_storage(
+                drive_id, item_id, name, bucket, key, content_type
+            )
     """
-    from .sharepoint_service import (
-        TokenManager,
-        _get_sharepoint_credentials,
-        _graph_base_url,
-    )
 
-    credentials = await _get_sharepoint_credentials(organization_id, session)
-    tenant_id = credentials["tenant_id"]
-    client_id = credentials["client_id"]
-    client_secret = credentials["client_secret"]
+    def __init__(
+        self,
+        organization_id: UUID,
+        session: AsyncSession,
+        max_connections: int = DOWNLOAD_MAX_CONNECTIONS,
+    ):
+        self.organization_id = organization_id
+        self._session = session
+        self._max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+        self._token_manager = None
+        self._graph_base: Optional[str] = None
+        self._init_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "SharePointDownloader":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _ensure_ready(self) -> None:
+        """Resolve credentials and open the pooled client on first use."""
+        if self._client is not None:
+            return
+        async with self._init_lock:
+            if self._client is not None:
+                return
+
+            from .sharepoint_service import (
+                TokenManager,
+                _get_sharepoint_credentials,
+                _graph_base_url,
+            )
 
-    graph_base = _graph_base_url()
-    download_url = f"{graph_base}/drives/{drive_id}/items/{item_id}/content"
+            credentials = await _get_sharepoint_credentials(self.organization_id, self._session)
+            self._token_manager = TokenManager(
+                tenant_id=credentials["tenant_id"],
+                client_id=credentials["client_id"],
+                client_secret=credentials["client_secret"],
+            )
+            self._graph_base = _graph_base_url()
+            self._client = httpx.AsyncClient(
+                timeout=120.0,
+                follow_redirects=True,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
 
-    # Create token manager for automatic refresh
-    token_manager = TokenManager(
-        tenant_id=tenant_id,
-        client_id=client_id,
-        client_secret=client_secret,
-    )
+    async def download_to_storage(
+        self,
+        drive_id: str,
+        item_id: str,
+        file_name: str,
+        bucket: str,
+        key: str,
+        content_type: str = "application/octet-stream",
+        max_retries: int = 3,
+        retry_delay_seconds: int = 30,
+    ):
+        """
+        Stream a SharePoint file into object storage with retry logic.
 
-    last_error = None
+        Args:
+            drive_id: SharePoint drive ID
+            item_id: SharePoint item ID
+            file_name: File name for logging
+            bucket: Destination bucket
+            key: Destination object key (overwritten on retry)
+            content_type: MIME type of the stored object
+            max_retries: Maximum retry attempts (default: 3)
+            retry_delay_seconds: Seconds to wait between retries (default: 30)
 
-    async with httpx.AsyncClient(timeout=120.0, follow_redirects=True) as client:
-        # Get initial token
-        await token_manager.get_valid_token(client)
+        Returns:
+            StreamedUpload with etag, file_hash (SHA-256) and file_size
 
-        for attempt in range(max_retries + 1):
-            try:
-                headers = token_manager.get_headers()
+        Raises:
+            Exception if all retries fail
+        """
+        from app.core.storage.minio_service import get_minio_service
+
+        minio_service = get_minio_service()
+        if not minio_service:
+            raise RuntimeError("MinIO service is not available")
 
-                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                    async with client.stream("GET", download_url, headers=headers) as response:
-                        response.raise_for_status()
-                        async for chunk in response.aiter_bytes():
-                            tmp_file.write(chunk)
-                    tmp_path = tmp_file.name
+        await self._ensure_ready()
+        client = self._client
+        token_manager = self._token_manager
+        download_url = f"{self._graph_base}/drives/{drive_id}/items/{item_id}/content"
 
-                # Read file content
-                try:
-                    with open(tmp_path, "rb") as f:
-                        file_content = f.read()
-                    return file_content
-                finally:
-                    # Clean up temp file
-                    try:
-                        Path(tmp_path).unlink()
-                    except Exception:
-                        pass
+        last_error = None
+
+        for attempt in range(max_retries + 1):
+            token = await token_manager.get_valid_token(client)
+            try:
+                async with client.stream(
+                    "GET", download_url, headers={"Authorization": f"Bearer {token}"}
+                ) as response:
+                    response.raise_for_status()
+                    return await minio_service.put_async_stream(
+                        bucket=bucket,
+                        key=key,
+                        chunks=response.aiter_bytes(),
+                        content_type=content_type,
+                    )
 
             except httpx.HTTPStatusError as e:
                 last_error = e
                 status_code = e.response.status_code
 
                 if status_code == 401:
-                    # Token expired - refresh and retry
+                    # Token expired - refresh (once across concurrent downloads) and retry
                     if attempt < max_retries:
                         logger.warning(
                             f"Download {file_name}: 401 Unauthorized (attempt {attempt + 1}/{max_retries + 1}). "
                             f"Refreshing token and retrying..."
                         )
-                        await token_manager.refresh_token(client)
+                        await token_manager.refresh_if_current(client, token)
                         continue
                 elif status_code == 429:
                     # Rate limited - wait and retry
@@ -223,8 +281,6 @@ async def _download_file_with_retry(
                         f"Waiting {retry_delay_seconds}s..."
                     )
                     await asyncio.sleep(retry_delay_seconds)
-                    # Refresh token in case it expired during the wait
-                    await token_manager.get_valid_token(client)
                     continue
                 raise
 
@@ -242,14 +298,13 @@ async def _download_file_with_retry(
                         f"Waiting {retry_delay_seconds}s..."
                     )
                     await asyncio.sleep(retry_delay_seconds)
-                    await token_manager.get_valid_token(client)
                     continue
                 raise
 
-    # All retries exhausted
-    if last_error:
-        raise last_error
-    raise RuntimeError(f"Download failed for {file_name} after {max_retries + 1} attempts")
+        # All retries exhausted
+        if last_error:
+            raise last_error
+        raise RuntimeError(f"Download failed for {file_name} after {max_retries + 1} attempts")
 
 
 def generate_slug(name: str) -> str:
@@ -1092,6 +1147,31 @@ class SharePointSyncService:
         Returns:
             Sync result dict with statistics
         """
+        # One download session (pooled client + shared token) for the whole run
+        async with SharePointDownloader(organization_id, session) as downloader:
+            return await self._run_sync(
+                session=session,
+                sync_config_id=sync_config_id,
+                organization_id=organization_id,
+                run_id=run_id,
+                full_sync=full_sync,
+                use_delta=use_delta,
+                group_id=group_id,
+                downloader=downloader,
+            )
+
+    async def _run_sync(
+        self,
+        session: AsyncSession,
+        sync_config_id: UUID,
+        organization_id: UUID,
+        run_id: UUID,
+        full_sync: bool,
+        use_delta: Optional[bool],
+        group_id: Optional[UUID],
+        downloader: SharePointDownloader,
+    ) -> Dict[str, Any]:
+        """Sync implementation for execute_sync, using the run's download session."""
         from app.core.shared.run_log_service import run_log_service
         from app.core.shared.run_service import run_service
 
@@ -1249,6 +1329,7 @@ class SharePointSyncService:
                     selected_folders=selected_folders,
                     selected_file_ids=selected_file_ids,
                     group_id=group_id,
+                    downloader=downloader,
                 )
             except DeltaTokenExpiredError:
                 # Delta token expired - fall through to full sync
@@ -1455,6 +1536,7 @@ class SharePointSyncService:
                         config=config,
                         item=item,
                         run_id=run_id,
+                        downloader=downloader,
                         full_sync=full_sync,
                         group_id=group_id,
                     )
@@ -1765,6 +1847,7 @@ class SharePointSyncService:
         has_selection_filter: bool,
         selected_folders: List[str],
         selected_file_ids: set,
+        downloader: SharePointDownloader,
         group_id: Optional[UUID] = None,
     ) -> Dict[str, Any]:
         """
@@ -1785,6 +1868,7 @@ class SharePointSyncService:
             has_selection_filter: Whether folder/file selection is active
             selected_folders: Selected folder paths
             selected_file_ids: Set of selected file IDs
+            downloader: Download session for the run
 
         Returns:
             Sync result dict with statistics
@@ -1925,6 +2009,7 @@ class SharePointSyncService:
                             config=config,
                             item=item,
                             run_id=run_id,
+                            downloader=downloader,
                             full_sync=False,
                             group_id=group_id,
                         )
@@ -2358,6 +2443,7 @@ class SharePointSyncService:
         config: SharePointSyncConfig,
         item: Dict[str, Any],
         run_id: UUID,
+        downloader: SharePointDownloader,
         full_sync: bool,
         group_id: Optional[UUID] = None,
     ) -> str:
@@ -2414,6 +2500,7 @@ class SharePointSyncService:
                 item=item,
                 existing_doc=existing_doc,
                 run_id=run_id,
+                downloader=downloader,
                 group_id=group_id,
             )
 
@@ -2454,6 +2541,7 @@ class SharePointSyncService:
             config=config,
             item=item,
             run_id=run_id,
+            downloader=downloader,
             group_id=group_id,
         )
 
@@ -2531,6 +2619,7 @@ class SharePointSyncService:
         config: SharePointSyncConfig,
         item: Dict[str, Any],
         run_id: UUID,
+        downloader: SharePointDownloader,
         group_id: Optional[UUID] = None,
     ) -> str:
         """Download a new file and create an asset with comprehensive metadata."""
@@ -2640,33 +2729,22 @@ class SharePointSyncService:
             await session.flush()
             return "unchanged_files"
 
-        # Download file with retry logic for transient errors
+        # Stream file into MinIO (hashing on the way) with retry logic
         drive_id = config.folder_drive_id
-        file_content = await _download_file_with_retry(
-            organization_id=config.organization_id,
-            session=session,
+        upload = await downloader.download_to_storage(
             drive_id=drive_id,
             item_id=item_id,
             file_name=name,
-            max_retries=3,
-            retry_delay_seconds=30,
-        )
-
-        # Calculate content hash
-        content_hash = hashlib.sha256(file_content).hexdigest()
-
-        # Upload to MinIO
-        from io import BytesIO
-        minio_service.put_object(
             bucket=uploads_bucket,
             key=storage_key,
-            data=BytesIO(file_content),
-            length=len(file_content),
             content_type=mime_type or "application/octet-stream",
+            max_retries=3,
+            retry_delay_seconds=30,
         )
+        content_hash = upload.file_hash
 
         # Create asset with comprehensive namespaced source metadata
-        actual_size = len(file_content)
+        actual_size = upload.file_size
         source_metadata = {
             "source": {
                 "storage_folder": storage_key.rsplit("/", 1)[0] if "/" in storage_key else "",
@@ -2817,6 +2895,7 @@ class SharePointSyncService:
         item: Dict[str, Any],
         existing_doc: SharePointSyncedDocument,
         run_id: UUID,
+        downloader: SharePointDownloader,
         group_id: Optional[UUID] = None,
     ) -> str:
         """Update an existing synced file that has changed in SharePoint."""
@@ -2879,37 +2958,27 @@ class SharePointSyncService:
                 config=config,
                 item=item,
                 run_id=run_id,
+                downloader=downloader,
                 group_id=group_id,
             )
 
-        # Download updated content with retry logic for transient errors
+        # Stream updated content to the same location (overwrite), hashing on the way
         drive_id = config.folder_drive_id
-        file_content = await _download_file_with_retry(
-            organization_id=config.organization_id,
-            session=session,
+        uploads_bucket = minio_service.bucket_uploads
+        upload = await downloader.download_to_storage(
             drive_id=drive_id,
             item_id=item_id,
             file_name=name,
-            max_retries=3,
-            retry_delay_seconds=30,
-        )
-
-        # Calculate content hash
-        content_hash = hashlib.sha256(file_content).hexdigest()
-
-        # Upload to same location (overwrite)
-        from io import BytesIO
-        uploads_bucket = minio_service.bucket_uploads
-        minio_service.put_object(
             bucket=uploads_bucket,
             key=asset.raw_object_key,
-            data=BytesIO(file_content),
-            length=len(file_content),
             content_type=mime_type or "application/octet-stream",
+            max_retries=3,
+            retry_delay_seconds=30,
         )
+        content_hash = upload.file_hash
 
         # Update asset metadata
-        actual_size = len(file_content)
+        actual_size = upload.file_size
         asset.file_size = actual_size
         asset.file_hash = content_hash
         asset.content_type = mime_type or "application/octet-stream"
@@ -18,6 +18,7 @@ from .models import (
     User,
 )
 from .procedures import (
+    EventOutbox,
     FunctionExecution,
     Pipeline,
     PipelineItemState,
@@ -48,4 +49,5 @@ __all__ = [
     "PipelineRun",
     "PipelineItemState",
     "FunctionExecution",
+    "EventOutbox",
 ]
@@ -850,6 +850,7 @@ class Asset(Base):
         Index("ix_assets_org_created", "organization_id", "created_at"),
         Index("ix_assets_org_status", "organization_id", "status"),
         Index("ix_assets_hash", "file_hash"),
+        Index("ix_assets_org_source_filename", "organization_id", "source_type", "original_filename"),
         Index("ix_assets_bucket_key", "raw_bucket", "raw_object_key", unique=True),
     )
 
@@ -1060,6 +1061,8 @@ class Run(Base):
     # Group relationship (for parent-child job tracking)
     group_id = Column(UUID(), ForeignKey("run_groups.id", ondelete="SET NULL"), nullable=True, index=True)
     is_group_parent = Column(Boolean, default=False, nullable=False)
+    # Set when this child's result is counted in its group (counted at most once)
+    group_result_recorded_at = Column(DateTime, nullable=True)
     group = relationship("RunGroup", back_populates="runs", foreign_keys=[group_id])
 
     # Observability: trace context
@@ -1101,6 +1104,8 @@ class RunGroup(Base):
         failed_children: Number of failed children
         config: Group-specific config (e.g., procedure triggers to run)
         created_at: When group was created
+        finalized_at: When the parent finished registering children (the
+            group cannot complete before this is set)
         completed_at: When group completed
     """
 
@@ -1142,6 +1147,7 @@ class RunGroup(Base):
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     started_at = Column(DateTime, nullable=True)
+    finalized_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
 
     # Relationships
@@ -643,3 +643,51 @@ class FunctionExecution(Base):
 
     def __repr__(self) -> str:
         return f"<FunctionExecution(id={self.id}, function={self.function_name}, status={self.status})>"
+
+
+class EventOutbox(Base):
+    """
+    Pending system event awaiting dispatch to its triggers.
+
+    Events emitted from hot paths (extraction, connector syncs, run groups)
+    are recorded here instead of creating runs inline; the outbox dispatcher
+    drains pending rows in batches and deletes them in the same transaction
+    that creates the triggered runs.
+
+    Attributes:
+        id: Unique outbox entry identifier
+        organization_id: Organization the event belongs to
+        event_name: Event name (e.g., "sam_pull.completed")
+        payload: Event payload passed to triggered procedures/pipelines
+        source_run_id: Run that emitted the event (if any)
+        status: 'pending' or 'failed' (dispatched rows are deleted)
+        attempts: Dispatch attempts so far
+        error_message: Last dispatch error
+        created_at: When the event was emitted
+    """
+
+    __tablename__ = "event_outbox"
+
+    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(
+        UUID(), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    event_name = Column(String(255), nullable=False)
+    payload = Column(JSONB, nullable=False, default=dict)
+    source_run_id = Column(UUID(), nullable=True)
+
+    # Dispatch state
+    status = Column(String(50), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    error_message = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_event_outbox_status_created", "status", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<EventOutbox(id={self.id}, event={self.event_name}, status={self.status})>"
@@ -8,12 +8,14 @@ This service provides functionality to analyze bulk file uploads and detect:
 - Missing files (in database but not in upload batch)
 
 The service enables efficient document collection updates without data loss.
+Uploads are described by (filename, hash, size) so file content never has to
+be held in memory; existing assets are matched with indexed IN lookups.
 """
 
 import hashlib
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import BinaryIO, Dict, Iterable, List, NamedTuple, Tuple
 from uuid import UUID
 
 from sqlalchemy import select
@@ -24,6 +26,30 @@ from app.core.shared.asset_service import asset_service
 
 logger = logging.getLogger("curatore.services.bulk_upload")
 
+# Maximum values per IN clause when looking up existing assets
+LOOKUP_BATCH_SIZE = 1000
+
+# Read size when hashing uploads
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+
+class BulkUploadFile(NamedTuple):
+    """Descriptor of an uploaded file (content stays on disk or in storage)."""
+    filename: str
+    file_hash: str
+    file_size: int
+
+
+# Asset columns needed for analysis (avoids loading full Asset rows)
+_ASSET_COLUMNS = (
+    Asset.id,
+    Asset.original_filename,
+    Asset.file_hash,
+    Asset.file_size,
+    Asset.status,
+    Asset.current_version_number,
+)
+
 
 class BulkUploadAnalysis:
     """Result of analyzing a bulk upload against existing assets."""
@@ -90,30 +116,56 @@ class BulkUploadService:
         """
         return hashlib.sha256(file_bytes).hexdigest()
 
+    @staticmethod
+    def describe_file(filename: str, file_obj: BinaryIO) -> BulkUploadFile:
+        """
+        Hash a file-like object in chunks and describe it.
+
+        The file is rewound afterwards so it can be streamed to storage.
+        Blocking; call via asyncio.to_thread() from async code.
+
+        Args:
+            filename: Uploaded filename
+            file_obj: Seekable file-like object (e.g. UploadFile.file)
+
+        Returns:
+            BulkUploadFile descriptor
+        """
+        sha256_hash = hashlib.sha256()
+        file_size = 0
+        file_obj.seek(0)
+        for byte_block in iter(lambda: file_obj.read(HASH_CHUNK_SIZE), b""):
+            sha256_hash.update(byte_block)
+            file_size += len(byte_block)
+        file_obj.seek(0)
+        return BulkUploadFile(filename, sha256_hash.hexdigest(), file_size)
+
     async def analyze_bulk_upload(
         self,
         session: AsyncSession,
         organization_id: UUID,
-        files: List[Tuple[str, bytes]],  # List of (filename, content) tuples
+        files: List[BulkUploadFile],
         source_type: str = "upload",
     ) -> BulkUploadAnalysis:
         """
         Analyze bulk file upload against existing assets.
 
         Compares uploaded files with existing assets in the organization
-        to detect unchanged, updated, new, and missing files.
+        to detect unchanged, updated, new, and missing files. Unchanged files
+        are found by hash and updated files by filename, both with batched
+        indexed IN lookups; missing files are found from a column-only scan.
 
         Args:
             session: Database session
             organization_id: Organization ID
-            files: List of (filename, file_bytes) tuples
+            files: (filename, file_hash, file_size) descriptors
             source_type: Source type for filtering existing assets
 
         Returns:
             BulkUploadAnalysis with categorized files
 
         Example:
-            >>> files = [("doc1.pdf", pdf_bytes), ("doc2.pdf", pdf_bytes2)]
+            >>> files = [bulk_upload_service.describe_file(f.filename, f.file) for f in uploads]
             >>> analysis = await bulk_upload_service.analyze_bulk_upload(
             ...     session, org_id, files
             ... )
@@ -122,91 +174,86 @@ class BulkUploadService:
         analysis = BulkUploadAnalysis()
 
         # Build index of uploaded files by filename
-        uploaded_files = {}
-        for filename, file_bytes in files:
-            file_hash = self.compute_file_hash_from_bytes(file_bytes)
-            file_size = len(file_bytes)
-            uploaded_files[filename] = {
-                "filename": filename,
-                "file_hash": file_hash,
-                "file_size": file_size,
-                "file_bytes": file_bytes,
-            }
+        uploaded_files: Dict[str, BulkUploadFile] = {
+            f.filename: BulkUploadFile(*f) for f in files
+        }
 
-        # Get all existing assets for this organization and source type
-        stmt = select(Asset).where(
+        scope = (
             Asset.organization_id == organization_id,
             Asset.source_type == source_type,
         )
-        result = await session.execute(stmt)
-        existing_assets = result.scalars().all()
 
-        # Build index of existing assets by filename
-        existing_by_filename = {}
-        for asset in existing_assets:
+        # Unchanged: same filename and content hash
+        unchanged_by_filename = {}
+        hashes = {f.file_hash for f in uploaded_files.values()}
+        for row in await self._lookup(session, scope, Asset.file_hash, hashes):
+            upload_info = uploaded_files.get(row.original_filename)
+            if upload_info and upload_info.file_hash == row.file_hash:
+                unchanged_by_filename[row.original_filename] = row
+
+        # Updated: same filename, different content hash
+        updated_by_filename = {}
+        remaining = set(uploaded_files) - set(unchanged_by_filename)
+        for row in await self._lookup(session, scope, Asset.original_filename, remaining):
             # Skip assets without file_hash (indicates storage inconsistency)
-            if not asset.file_hash:
-                logger.error(
-                    f"Asset {asset.id} ({asset.original_filename}) has no file_hash. "
-                    "Storage may be inconsistent. Consider running storage cleanup: "
-                    "./scripts/cleanup_storage.sh --dry-run"
-                )
+            if not row.file_hash:
+                self._log_missing_hash(row)
                 continue
-
-            existing_by_filename[asset.original_filename] = {
-                "asset_id": str(asset.id),
-                "filename": asset.original_filename,
-                "file_hash": asset.file_hash,
-                "file_size": asset.file_size,
-                "status": asset.status,
-                "current_version": asset.current_version_number,
-                "created_at": asset.created_at.isoformat(),
-                "updated_at": asset.updated_at.isoformat(),
-            }
+            updated_by_filename[row.original_filename] = row
 
         # Categorize uploaded files
         for filename, upload_info in uploaded_files.items():
-            if filename not in existing_by_filename:
+            existing = unchanged_by_filename.get(filename)
+            if existing is not None:
+                # Unchanged file (content matches)
+                analysis.unchanged.append({
+                    "filename": filename,
+                    "file_size": upload_info.file_size,
+                    "file_hash": upload_info.file_hash,
+                    "asset_id": str(existing.id),
+                    "current_version": existing.current_version_number,
+                })
+                continue
+
+            existing = updated_by_filename.get(filename)
+            if existing is not None:
+                # Updated file (content changed)
+                analysis.updated.append({
+                    "filename": filename,
+                    "file_size": upload_info.file_size,
+                    "file_hash": upload_info.file_hash,
+                    "old_file_hash": existing.file_hash,
+                    "asset_id": str(existing.id),
+                    "current_version": existing.current_version_number,
+                })
+            else:
                 # New file
                 analysis.new.append({
                     "filename": filename,
-                    "file_size": upload_info["file_size"],
-                    "file_hash": upload_info["file_hash"],
+                    "file_size": upload_info.file_size,
+                    "file_hash": upload_info.file_hash,
                 })
-            else:
-                existing_info = existing_by_filename[filename]
-                if upload_info["file_hash"] == existing_info["file_hash"]:
-                    # Unchanged file (content matches)
-                    analysis.unchanged.append({
-                        "filename": filename,
-                        "file_size": upload_info["file_size"],
-                        "file_hash": upload_info["file_hash"],
-                        "asset_id": existing_info["asset_id"],
-                        "current_version": existing_info["current_version"],
-                    })
-                else:
-                    # Updated file (content changed)
-                    analysis.updated.append({
-                        "filename": filename,
-                        "file_size": upload_info["file_size"],
-                        "file_hash": upload_info["file_hash"],
-                        "old_file_hash": existing_info["file_hash"],
-                        "asset_id": existing_info["asset_id"],
-                        "current_version": existing_info["current_version"],
-                    })
 
         # Identify missing files (in DB but not in upload)
-        uploaded_filenames = set(uploaded_files.keys())
-        for filename, existing_info in existing_by_filename.items():
-            if filename not in uploaded_filenames:
-                analysis.missing.append({
-                    "filename": filename,
-                    "file_size": existing_info["file_size"],
-                    "file_hash": existing_info["file_hash"],
-                    "asset_id": existing_info["asset_id"],
-                    "current_version": existing_info["current_version"],
-                    "status": existing_info["status"],
-                })
+        result = await session.execute(select(*_ASSET_COLUMNS).where(*scope))
+        missing_by_filename = {}
+        for row in result:
+            if row.original_filename in uploaded_files:
+                continue
+            if not row.file_hash:
+                self._log_missing_hash(row)
+                continue
+            missing_by_filename[row.original_filename] = row
+
+        for filename, existing in missing_by_filename.items():
+            analysis.missing.append({
+                "filename": filename,
+                "file_size": existing.file_size,
+                "file_hash": existing.file_hash,
+                "asset_id": str(existing.id),
+                "current_version": existing.current_version_number,
+                "status": existing.status,
+            })
 
         logger.info(
             "Bulk upload analysis complete: %d unchanged, %d updated, %d new, %d missing",
@@ -218,6 +265,32 @@ class BulkUploadService:
 
         return analysis
 
+    async def _lookup(
+        self,
+        session: AsyncSession,
+        scope: Tuple,
+        column,
+        values: Iterable[str],
+    ) -> List:
+        """Fetch analysis columns for assets whose column is IN values, in batches."""
+        values = sorted(values)
+        rows = []
+        for i in range(0, len(values), LOOKUP_BATCH_SIZE):
+            stmt = select(*_ASSET_COLUMNS).where(
+                *scope, column.in_(values[i:i + LOOKUP_BATCH_SIZE])
+            )
+            result = await session.execute(stmt)
+            rows.extend(result.all())
+        return rows
+
+    @staticmethod
+    def _log_missing_hash(row) -> None:
+        logger.error(
+            f"Asset {row.id} ({row.original_filename}) has no file_hash. "
+            "Storage may be inconsistent. Consider running storage cleanup: "
+            "./scripts/cleanup_storage.sh --dry-run"
+        )
+
     async def mark_assets_inactive(
         self,
         session: AsyncSession,
@@ -17,6 +17,7 @@ Usage:
     )
 """
 
+import asyncio
 import logging
 import tempfile
 import time
@@ -265,8 +266,9 @@ class ExtractionOrchestrator:
         temp_dir = Path(tempfile.mkdtemp(prefix="curatore_extract_"))
         temp_input_file = temp_dir / asset.original_filename
 
-        file_data = minio.get_object(asset.raw_bucket, asset.raw_object_key)
-        temp_input_file.write_bytes(file_data.getvalue())
+        await asyncio.to_thread(
+            minio.fget_object, asset.raw_bucket, asset.raw_object_key, temp_input_file
+        )
 
         logger.info(f"Downloaded {asset.original_filename} to {temp_input_file}")
 
@@ -507,6 +509,7 @@ class ExtractionOrchestrator:
                     "markdown_length": len(markdown_content),
                 },
                 source_run_id=run_id,
+                defer=True,
             )
         except Exception as e:
             # Don't fail extraction if event emission fails
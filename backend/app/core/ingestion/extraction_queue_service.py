@@ -208,6 +208,9 @@ class ExtractionQueueService:
             run.is_group_parent = False
             run.spawned_by_parent = True
 
+            from ..shared.run_group_service import run_group_service
+            await run_group_service.register_children(session, group_id)
+
             # Auto-determine priority based on group type if not explicitly set
             if priority is None:
                 from ..database.models import RunGroup
@@ -542,6 +545,11 @@ class ExtractionQueueService:
                             extraction.status = "failed"
                             extraction.error_message = run.error_message
 
+                    # Count the dead child so its group can still complete
+                    if run.group_id and not run.is_group_parent:
+                        from ..shared.run_group_service import run_group_service
+                        await run_group_service.child_failed(session, run.id, run.error_message)
+
                     timed_out_count += 1
                     logger.warning(
                         f"Marked run {run.id} ({run.run_type}) as timed_out: "
@@ -616,6 +624,11 @@ class ExtractionQueueService:
                             extraction.status = "failed"
                             extraction.error_message = run.error_message
 
+                    # Count the dead child so its group can still complete
+                    if run.group_id and not run.is_group_parent:
+                        from ..shared.run_group_service import run_group_service
+                        await run_group_service.child_failed(session, run.id, run.error_message)
+
                     timed_out_count += 1
                     logger.warning(
                         f"Marked stale run {run.id} ({run.run_type}) as timed_out: "
@@ -908,6 +921,10 @@ class ExtractionQueueService:
         run.completed_at = datetime.utcnow()
         run.error_message = reason
 
+        if run.group_id and not run.is_group_parent:
+            from ..shared.run_group_service import run_group_service
+            await run_group_service.child_failed(session, run.id, reason)
+
         # Update asset status if needed
         if run.input_asset_ids:
             asset_id = UUID(run.input_asset_ids[0])
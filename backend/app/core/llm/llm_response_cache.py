@@ -0,0 +1,291 @@
+# ============================================================================
+# backend/app/core/llm/llm_response_cache.py
+# ============================================================================
+"""
+LLM Response Cache for Curatore v2 - Prompt-Fingerprint Keyed Completions
+
+Scheduled procedures (digests, solicitation summaries) re-send byte-identical
+prompts on every run when the underlying records have not changed. This module
+caches chat completion responses keyed by a fingerprint of the request so
+those repeats are served from Redis instead of the LLM provider.
+
+The cache is opt-in: callers pass ``cache=True`` to
+``LLMService.chat_completion()``, or a procedure step declares ``cache: true``
+which enables it for every completion made while that step runs.
+
+Architecture:
+    - Fingerprint = sha256 of every request argument except transport-only
+      options (timeout, extra headers/query), serialized as canonical JSON
+    - Redis DB 3 (shared cache DB), key pattern: curatore:llm:resp:{sha256}
+    - Values are the provider response serialized as JSON
+    - TTL eviction plus a size cap: a sorted-set index of keys by insertion
+      time is trimmed to max_entries, oldest first
+    - Hit/miss counters are kept per process and aggregated in Redis
+    - Best-effort: any Redis failure is logged and treated as a miss, and
+      Redis is skipped for a short cooldown
+
+Usage:
+    from app.core.llm.llm_response_cache import llm_response_cache
+
+    resp = await llm_service.chat_completion(model=..., messages=..., cache=True)
+
+    # Enable for everything in a block (used by the procedure executor)
+    with llm_response_cache.enabled_for(step.cache):
+        await func(ctx, **params)
+
+Configuration (config.yml):
+    llm:
+      response_cache_enabled: true
+      response_cache_ttl_hours: 24
+      response_cache_max_entries: 10000
+
+Author: Curatore v2 Development Team
+Version: 2.0.0
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import redis.asyncio as redis
+from openai.types.chat import ChatCompletion
+
+logger = logging.getLogger("curatore.llm.response_cache")
+
+KEY_PREFIX = "curatore:llm:resp:"
+INDEX_KEY = "curatore:llm:resp-index"
+STATS_KEY = "curatore:llm:resp-stats"
+
+# Request arguments that only affect transport, not the response
+TRANSPORT_FIELDS = frozenset({"timeout", "extra_headers", "extra_query", "stream_options"})
+
+# Seconds to skip Redis after a connection/command failure
+REDIS_COOLDOWN_SECONDS = 60.0
+
+DEFAULT_TTL_HOURS = 24
+DEFAULT_MAX_ENTRIES = 10000
+
+# Set by the procedure executor for steps that declare `cache: true`
+_cache_requested: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "llm_response_cache_requested", default=False
+)
+
+
+def _cache_redis_url() -> str:
+    """Build the Redis URL for the response cache (DB 3 on the broker host)."""
+    explicit = os.getenv("LLM_CACHE_REDIS_URL")
+    if explicit:
+        return explicit
+    base_redis_url = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
+    head, _, tail = base_redis_url.rpartition("/")
+    if head and tail.isdigit():
+        return f"{head}/3"
+    return base_redis_url.rstrip("/") + "/3"
+
+
+def fingerprint(request: Dict[str, Any]) -> str:
+    """
+    Compute the cache fingerprint for a chat completion request.
+
+    Every argument is included (tools, tool_choice, seed, stop, ...) except
+    TRANSPORT_FIELDS, so requests that could get different completions
+    never share a key.
+
+    Args:
+        request: Keyword arguments for chat.completions.create
+
+    Returns:
+        Hex sha256 digest
+    """
+    payload = {field: value for field, value in request.items() if field not in TRANSPORT_FIELDS}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Redis-backed cache of chat completion responses.
+
+    Attributes:
+        hits: Number of requests served from cache since process start
+        misses: Number of cacheable requests not found since process start
+    """
+
+    def __init__(self):
+        """Initialize the cache; Redis is connected lazily per event loop."""
+        self._redis: Optional[redis.Redis] = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_disabled_until = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    # =====================================================================
+    # Configuration
+    # =====================================================================
+
+    def _get_llm_config(self):
+        try:
+            from app.core.shared.config_loader import config_loader
+            return config_loader.get_llm_config()
+        except Exception:
+            return None
+
+    @property
+    def enabled(self) -> bool:
+        """Global switch; when False, cache requests are ignored."""
+        config = self._get_llm_config()
+        return config.response_cache_enabled if config else True
+
+    @property
+    def ttl_seconds(self) -> int:
+        config = self._get_llm_config()
+        hours = config.response_cache_ttl_hours if config else DEFAULT_TTL_HOURS
+        return hours * 3600
+
+    @property
+    def max_entries(self) -> int:
+        config = self._get_llm_config()
+        return config.response_cache_max_entries if config else DEFAULT_MAX_ENTRIES
+
+    # =====================================================================
+    # Opt-in scope
+    # =====================================================================
+
+    @contextmanager
+    def enabled_for(self, requested: bool = True) -> Iterator[None]:
+        """
+        Enable caching for completions made inside this block.
+
+        The flag is a context variable, so it follows the code into tasks
+        spawned from the block (e.g. concurrent collection items).
+        """
+        token = _cache_requested.set(bool(requested))
+        try:
+            yield
+        finally:
+            _cache_requested.reset(token)
+
+    def should_cache(self, requested: Optional[bool] = None) -> bool:
+        """Whether a completion should use the cache."""
+        if requested is None:
+            requested = _cache_requested.get()
+        return bool(requested) and self.enabled
+
+    # =====================================================================
+    # Redis
+    # =====================================================================
+
+    async def _get_redis(self) -> Optional[redis.Redis]:
+        """Get the Redis client for the current loop, or None during cooldown."""
+        if time.monotonic() < self._redis_disabled_until:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            # Clients are bound to the loop that created them; Celery tasks run
+            # each task in a fresh loop, so abandon the old client.
+            self._redis_loop = loop
+            self._redis = redis.from_url(
+                _cache_redis_url(),
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=2.0,
+            )
+        return self._redis
+
+    def _redis_failed(self, error: Exception) -> None:
+        logger.debug(f"LLM response cache Redis unavailable, skipping for "
+                     f"{REDIS_COOLDOWN_SECONDS:.0f}s: {error}")
+        self._redis_disabled_until = time.monotonic() + REDIS_COOLDOWN_SECONDS
+        self._redis = None
+        self._redis_loop = None
+
+    # =====================================================================
+    # Public API
+    # =====================================================================
+
+    async def get(self, key: str) -> Optional[ChatCompletion]:
+        """
+        Look up a cached response by fingerprint.
+
+        Args:
+            key: Fingerprint from fingerprint()
+
+        Returns:
+            The cached ChatCompletion, or None on miss
+        """
+        response = None
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                value = await client.get(KEY_PREFIX + key)
+                if value is not None:
+                    response = ChatCompletion.model_validate_json(value)
+                await client.hincrby(STATS_KEY, "hits" if response else "misses", 1)
+            except Exception as e:
+                self._redis_failed(e)
+
+        if response is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return response
+
+    async def set(self, key: str, response: ChatCompletion) -> None:
+        """
+        Store a response and trim the cache to max_entries.
+
+        Args:
+            key: Fingerprint from fingerprint()
+            response: Provider response to cache
+        """
+        client = await self._get_redis()
+        if client is None:
+            return
+        try:
+            ttl = self.ttl_seconds
+            now = time.time()
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.set(KEY_PREFIX + key, response.model_dump_json(), ex=ttl)
+                pipe.zadd(INDEX_KEY, {key: now})
+                # Drop index entries whose keys have already expired
+                pipe.zremrangebyscore(INDEX_KEY, 0, now - ttl)
+                pipe.zcard(INDEX_KEY)
+                results = await pipe.execute()
+
+            overflow = results[-1] - self.max_entries
+            if overflow > 0:
+                evicted = await client.zpopmin(INDEX_KEY, overflow)
+                if evicted:
+                    await client.delete(*(KEY_PREFIX + k for k, _ in evicted))
+        except Exception as e:
+            self._redis_failed(e)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Return hit/miss counters for this process and across all workers.
+
+        Returns:
+            Dict with process hits/misses and, when Redis is reachable,
+            cluster-wide hits/misses and current entry count
+        """
+        stats: Dict[str, Any] = {"hits": self.hits, "misses": self.misses}
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                totals = await client.hgetall(STATS_KEY)
+                stats["total_hits"] = int(totals.get("hits", 0))
+                stats["total_misses"] = int(totals.get("misses", 0))
+                stats["entries"] = await client.zcard(INDEX_KEY)
+            except Exception as e:
+                self._redis_failed(e)
+        return stats
+
+
+# Global cache instance
+llm_response_cache = LLMResponseCache()
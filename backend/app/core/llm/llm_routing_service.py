@@ -36,6 +36,9 @@ from app.core.shared.config_loader import config_loader
 
 logger = logging.getLogger(__name__)
 
+# Fallback collection concurrency when no llm config is loaded
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 class LLMRoutingService:
     """
@@ -198,6 +201,75 @@ class LLMRoutingService:
 
         return None
 
+    async def get_max_concurrency(
+        self,
+        model: str,
+        organization_id: Optional[UUID] = None,
+        session: Optional[AsyncSession] = None,
+        requested: Optional[int] = None,
+    ) -> int:
+        """
+        Resolve how many LLM requests a collection may run concurrently.
+
+        The requested value (from procedure YAML) defaults to
+        llm.max_concurrency and is clamped by the per-model cap
+        (llm.model_concurrency) and the organization cap
+        (``llm_max_concurrency`` in organization settings), whichever is lower.
+
+        Args:
+            model: Resolved model name for the requests
+            organization_id: Organization UUID for the org cap lookup
+            session: Database session for organization settings
+            requested: Concurrency requested by the caller
+
+        Returns:
+            Concurrency limit (always >= 1)
+        """
+        llm_config = config_loader.get_llm_config()
+        limit = requested or (llm_config.max_concurrency if llm_config else DEFAULT_MAX_CONCURRENCY)
+
+        if llm_config and llm_config.model_concurrency:
+            model_cap = llm_config.model_concurrency.get(model)
+            if model_cap:
+                limit = min(limit, model_cap)
+
+        if organization_id and session:
+            org_cap = await self._get_organization_concurrency(session, organization_id)
+            if org_cap:
+                limit = min(limit, org_cap)
+
+        return max(1, int(limit))
+
+    async def _get_organization_concurrency(
+        self,
+        session: AsyncSession,
+        organization_id: UUID,
+    ) -> Optional[int]:
+        """
+        Get the organization's cap on concurrent LLM requests.
+
+        Read from the ``llm_max_concurrency`` key of Organization.settings.
+
+        Returns:
+            Cap if configured, None otherwise
+        """
+        try:
+            from sqlalchemy import select
+
+            from app.core.database.models import Organization
+
+            result = await session.execute(
+                select(Organization.settings).where(Organization.id == organization_id)
+            )
+            settings = result.scalar_one_or_none() or {}
+            value = settings.get("llm_max_concurrency")
+            if isinstance(value, int) and value > 0:
+                return value
+        except Exception as e:
+            logger.debug(f"Could not get organization concurrency cap: {e}")
+
+        return None
+
     def get_task_type_for_function(self, function_name: str) -> LLMTaskType:
         """
         Get the default task type for a function.
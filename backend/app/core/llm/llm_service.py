@@ -25,9 +25,11 @@ from typing import Any, Dict, Optional
 from uuid import UUID
 
 from openai import OpenAI
+from openai.types.chat import ChatCompletion
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.connectors.adapters.llm_adapter import LLMAdapter, llm_adapter
+from app.core.llm.llm_response_cache import fingerprint, llm_response_cache
 from app.core.llm.llm_routing_service import llm_routing_service
 from app.core.models import LLMConnectionStatus, LLMEvaluation
 from app.core.models.llm_models import LLMTaskType
@@ -111,6 +113,56 @@ class LLMService:
         """Test the LLM connection and return detailed status information."""
         return await self._adapter.test_connection()
 
+    # ========================================================================
+    # Async completion API
+    # ========================================================================
+
+    async def chat_completion(
+        self, cache: Optional[bool] = None, **kwargs: Any
+    ) -> ChatCompletion:
+        """
+        Create a chat completion without blocking the event loop.
+
+        Drop-in async replacement for ``_client.chat.completions.create(...)``:
+        accepts the same keyword arguments and returns the same response
+        object. Requests go through the adapter's pooled AsyncOpenAI client,
+        so concurrent callers (parallel procedure steps, foreach branches)
+        overlap their LLM latency instead of serializing on the loop.
+
+        Responses can be served from the prompt-fingerprint response cache
+        (see llm_response_cache); caching is opt-in per call or per
+        procedure step (``cache: true``).
+
+        Args:
+            cache: Use the response cache; None defers to the enclosing
+                procedure step's setting
+            **kwargs: Arguments for chat.completions.create (model, messages,
+                temperature, max_tokens, response_format, ...)
+
+        Returns:
+            ChatCompletion: The provider response
+
+        Raises:
+            RuntimeError: If no LLM client is configured
+            openai.OpenAIError: If the request fails after retries
+        """
+        client = self._adapter.get_async_client()
+        if client is None:
+            raise RuntimeError("LLM client not available")
+
+        cache_key = None
+        if llm_response_cache.should_cache(cache) and not kwargs.get("stream"):
+            cache_key = fingerprint(kwargs)
+            cached = await llm_response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        response = await client.chat.completions.create(**kwargs)
+
+        if cache_key is not None:
+            await llm_response_cache.set(cache_key, response)
+        return response
+
     # ========================================================================
     # Business logic methods (unchanged)
     # ========================================================================
@@ -145,14 +197,13 @@ class LLMService:
             session=session,
         )
 
-        client = self._client
         model = task_config.model
 
-        if not client:
+        if not self.is_available:
             return {"content": "", "error": "LLM client not available"}
 
         try:
-            resp = client.chat.completions.create(
+            resp = await self.chat_completion(
                 model=model,
                 temperature=temperature,
                 messages=[
@@ -0,0 +1,270 @@
+# ============================================================================
+# backend/app/core/llm/packed_prompts.py
+# ============================================================================
+"""
+Packed Prompts for Curatore v2 - Many Items per LLM Request
+
+Collection-mode primitives (llm_classify, llm_extract, llm_decide) send one
+request per item, and every request repeats the same system prompt, category
+list or field list. On large collections that fixed overhead dominates the
+token bill. This module packs several items into one request and asks for a
+JSON array with one result per item.
+
+Packing:
+    - Items are packed greedily in order until the next item would exceed
+      the model's input budget (context window minus the output budget,
+      measured with DocumentChunker.count_tokens) or the item limit
+    - The item limit is the caller's batch_size, further bounded so the
+      expected output for the batch fits in PACKED_MAX_OUTPUT_TOKENS
+
+Failure handling:
+    - Unparseable responses split the batch in half and retry each half
+    - Items missing from an otherwise valid response are retried as a
+      smaller batch
+    - Items that end up alone are not sent packed; their slot is left as
+      None so the caller runs its normal single-item path (with its own
+      retries and per-item error reporting)
+
+Usage:
+    from app.core.llm.packed_prompts import run_packed_prompts
+
+    results = await run_packed_prompts(
+        llm_service,
+        texts=rendered_texts,
+        system_prompt=system_prompt,
+        task_prompt="Categories: ...",
+        model=model,
+        temperature=0.1,
+        batch_size=20,
+        item_output_tokens=200,
+        parse_item=validate_one,
+        semaphore=semaphore,
+    )
+    # results[i] is parse_item(...) for item i, or None -> use single-item path
+
+Author: Curatore v2 Development Team
+Version: 2.0.0
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.core.search.document_chunker import document_chunker
+
+logger = logging.getLogger("curatore.llm.packed_prompts")
+
+# Context window assumed when the task type does not configure one
+DEFAULT_CONTEXT_WINDOW = 32000
+
+# Upper bound on the response size of a packed request
+PACKED_MAX_OUTPUT_TOKENS = 4000
+
+# Tokens for the per-item wrapper (<item index="n"> ... </item>)
+ITEM_FRAME_TOKENS = 12
+
+PACKED_SYSTEM_SUFFIX = """
+
+BATCH MODE: The user message contains several ITEMS. Apply the instructions above to each item independently.
+Respond with ONLY a JSON array containing exactly one object per item, in item order.
+Each object MUST include an "index" field equal to the item's index, plus the fields described above."""
+
+
+def pack_batches(
+    token_counts: Sequence[int],
+    overhead_tokens: int,
+    max_items: int,
+    max_input_tokens: int,
+) -> List[List[int]]:
+    """
+    Greedily pack items into batches by token budget.
+
+    Args:
+        token_counts: Token count per item (None entries are skipped)
+        overhead_tokens: Tokens shared by every request (prompts, framing)
+        max_items: Maximum items per batch
+        max_input_tokens: Maximum input tokens per request
+
+    Returns:
+        Lists of item positions, in order
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = overhead_tokens
+    for position, count in enumerate(token_counts):
+        if count is None:
+            continue
+        cost = count + ITEM_FRAME_TOKENS
+        if current and (len(current) >= max_items or used + cost > max_input_tokens):
+            batches.append(current)
+            current = []
+            used = overhead_tokens
+        current.append(position)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_packed_prompt(task_prompt: str, texts: Sequence[str]) -> str:
+    """Build the user prompt for a batch of item texts."""
+    parts = [task_prompt.rstrip(), "", "ITEMS:"]
+    for index, text in enumerate(texts):
+        parts.append(f'<item index="{index}">\n{text}\n</item>')
+    parts.append("")
+    parts.append(
+        f"Return ONLY a JSON array of {len(texts)} objects, one per item, each with its \"index\":"
+    )
+    return "\n".join(parts)
+
+
+def parse_packed_response(response_text: str) -> Dict[int, Dict[str, Any]]:
+    """
+    Parse a packed response into {index: result}.
+
+    Accepts a bare JSON array or an object wrapping one array (some models
+    insist on returning an object), optionally inside a markdown code block.
+
+    Raises:
+        ValueError: If the response is not a JSON array of objects
+    """
+    text = response_text.strip()
+    if text.startswith("```"):
+        lines = [line for line in text.split("\n") if not line.startswith("```")]
+        text = "\n".join(lines)
+
+    data = json.loads(text)
+    if isinstance(data, dict):
+        arrays = [v for v in data.values() if isinstance(v, list)]
+        if len(arrays) != 1:
+            raise ValueError("Expected a JSON array of results")
+        data = arrays[0]
+    if not isinstance(data, list):
+        raise ValueError("Expected a JSON array of results")
+
+    parsed: Dict[int, Dict[str, Any]] = {}
+    for entry in data:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            index = int(entry.pop("index"))
+        except (KeyError, TypeError, ValueError):
+            continue
+        parsed.setdefault(index, entry)
+    return parsed
+
+
+async def run_packed_prompts(
+    llm_service: Any,
+    texts: Sequence[Optional[str]],
+    system_prompt: str,
+    task_prompt: str,
+    model: str,
+    temperature: float,
+    batch_size: int,
+    item_output_tokens: int,
+    parse_item: Callable[[Dict[str, Any]], Any],
+    context_window: Optional[int] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> List[Any]:
+    """
+    Run items through packed multi-item requests.
+
+    Args:
+        llm_service: Service exposing async chat_completion()
+        texts: Rendered text per item; None entries are not packed
+        system_prompt: System prompt describing the per-item output object
+        task_prompt: Shared user-prompt header (categories, fields, question)
+        model: Model to use
+        temperature: Sampling temperature
+        batch_size: Maximum items per request
+        item_output_tokens: Expected response tokens per item
+        parse_item: Validates/normalizes one result object; returns None or
+            raises if the result is unusable
+        context_window: Model context window in tokens
+        semaphore: Optional concurrency limiter shared with the caller
+
+    Returns:
+        List aligned with texts: parse_item() output, or None where the
+        caller should fall back to a single-item request
+    """
+    results: List[Any] = [None] * len(texts)
+
+    max_items = max(1, min(batch_size, PACKED_MAX_OUTPUT_TOKENS // max(1, item_output_tokens)))
+    if max_items < 2:
+        return results
+
+    packed_system_prompt = system_prompt + PACKED_SYSTEM_SUFFIX
+    overhead = (
+        document_chunker.count_tokens(packed_system_prompt)
+        + document_chunker.count_tokens(build_packed_prompt(task_prompt, []))
+    )
+    max_input_tokens = (context_window or DEFAULT_CONTEXT_WINDOW) - PACKED_MAX_OUTPUT_TOKENS
+    token_counts = [
+        document_chunker.count_tokens(text) if text is not None else None
+        for text in texts
+    ]
+
+    async def request(positions: List[int]) -> Dict[int, Dict[str, Any]]:
+        kwargs = dict(
+            model=model,
+            messages=[
+                {"role": "system", "content": packed_system_prompt},
+                {"role": "user", "content": build_packed_prompt(
+                    task_prompt, [texts[p] for p in positions]
+                )},
+            ],
+            temperature=temperature,
+            max_tokens=min(PACKED_MAX_OUTPUT_TOKENS, item_output_tokens * len(positions) + 100),
+        )
+        if semaphore:
+            async with semaphore:
+                response = await llm_service.chat_completion(**kwargs)
+        else:
+            response = await llm_service.chat_completion(**kwargs)
+        return parse_packed_response(response.choices[0].message.content or "")
+
+    async def run_batch(positions: List[int]) -> None:
+        if len(positions) < 2:
+            return  # Single items use the caller's normal path
+
+        try:
+            parsed = await request(positions)
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.info(f"Packed response for {len(positions)} items unparseable, splitting: {e}")
+            parsed = None
+        except Exception as e:
+            logger.warning(f"Packed request for {len(positions)} items failed: {e}")
+            return
+
+        missing: List[int] = []
+        if parsed is not None:
+            for local_index, position in enumerate(positions):
+                value = None
+                entry = parsed.get(local_index)
+                if entry is not None:
+                    try:
+                        value = parse_item(entry)
+                    except Exception:
+                        value = None
+                if value is None:
+                    missing.append(position)
+                else:
+                    results[position] = value
+
+        if parsed is None or len(missing) == len(positions):
+            middle = len(positions) // 2
+            await asyncio.gather(run_batch(positions[:middle]), run_batch(positions[middle:]))
+        elif missing:
+            await run_batch(missing)
+
+    batches = pack_batches(token_counts, overhead, max_items, max_input_tokens)
+    await asyncio.gather(*(run_batch(batch) for batch in batches))
+
+    packed_count = sum(1 for r in results if r is not None)
+    logger.info(
+        f"Packed {packed_count}/{len(texts)} items into {len(batches)} requests "
+        f"(batch_size={max_items})"
+    )
+    return results
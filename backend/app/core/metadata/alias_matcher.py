@@ -0,0 +1,107 @@
+# backend/app/core/metadata/alias_matcher.py
+"""
+Alias Matcher — precomputed fuzzy-matching index over a facet's aliases.
+
+Built once per (organization, facet) reverse index and reused until the
+reference data changes, instead of re-scoring every alias in a Python loop
+on each lookup.
+
+Scoring is unchanged: rapidfuzz ``fuzz.ratio`` when installed (scored over
+the contiguous alias list in C with ``process.extractOne``), otherwise
+difflib ``SequenceMatcher.ratio``. The difflib path keeps one prepared
+matcher per alias (the alias side is what difflib preprocesses) and skips
+aliases whose cheap upper bounds (length, character multiset) are below the
+threshold.
+
+Values that found no match are remembered with the threshold they failed,
+so bulk indexing does not rescan all aliases for the same unmapped agency on
+every document.
+"""
+
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - exercised only without rapidfuzz
+    fuzz = None
+    process = None
+
+# Unmatched values remembered per matcher (oldest evicted first)
+NEGATIVE_CACHE_SIZE = 10000
+
+
+class AliasMatcher:
+    """
+    Fuzzy-match index for one reverse index ({alias_lower: [aliases]}).
+
+    Attributes:
+        source: The reverse index this matcher was built from (identity is
+            used to detect that the reference data was reloaded)
+        aliases: Lowercased aliases in reverse-index order
+    """
+
+    def __init__(self, reverse_index: Dict[str, List[str]]):
+        self.source = reverse_index
+        self.aliases: List[str] = list(reverse_index)
+        self._matchers: List[SequenceMatcher] = []
+        if process is None:
+            for alias in self.aliases:
+                matcher = SequenceMatcher(None)
+                matcher.set_seq2(alias)
+                self._matchers.append(matcher)
+        # value_lower -> lowest threshold it is known to fail
+        self._unmatched: "OrderedDict[str, float]" = OrderedDict()
+
+    def _best_rapidfuzz(self, value_lower: str, threshold: float) -> Tuple[Optional[str], float]:
+        result = process.extractOne(
+            value_lower, self.aliases, scorer=fuzz.ratio, score_cutoff=threshold * 100.0
+        )
+        if result is None:
+            return None, 0.0
+        alias, score, _ = result
+        return alias, score / 100.0
+
+    def _best_difflib(self, value_lower: str, threshold: float) -> Tuple[Optional[str], float]:
+        best_score = 0.0
+        best_alias = None
+        for alias, matcher in zip(self.aliases, self._matchers):
+            matcher.set_seq1(value_lower)
+            # Cheap upper bounds first: aliases that cannot reach the
+            # threshold or beat the current best skip the full ratio()
+            floor = max(threshold, best_score)
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            score = matcher.ratio()
+            if score > best_score:
+                best_score = score
+                best_alias = alias
+        return best_alias, best_score
+
+    def match(self, value: str, threshold: float) -> Optional[Tuple[str, float]]:
+        """
+        Return (alias_lower, score) of the best alias scoring >= threshold, else None.
+        """
+        if not self.aliases:
+            return None
+        value_lower = value.lower()
+
+        failed_at = self._unmatched.get(value_lower)
+        if failed_at is not None and threshold >= failed_at:
+            return None
+
+        if process is not None:
+            alias, score = self._best_rapidfuzz(value_lower, threshold)
+        else:
+            alias, score = self._best_difflib(value_lower, threshold)
+
+        if alias is not None and score >= threshold:
+            return alias, score
+
+        # Nothing reaches this threshold, so nothing reaches a higher one
+        self._unmatched[value_lower] = threshold
+        self._unmatched.move_to_end(value_lower)
+        while len(self._unmatched) > NEGATIVE_CACHE_SIZE:
+            self._unmatched.popitem(last=False)
+        return None
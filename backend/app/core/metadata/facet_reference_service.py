@@ -12,14 +12,13 @@ Key methods:
     check_and_resolve_value — index-time: resolve + detect unmapped values
     autocomplete — prefix search across canonical values, labels, and aliases
     load_baseline — YAML → DB seeding (idempotent)
-    discover_unmapped — find values in search_chunks not yet in reference data
+    discover_unmapped — find values in search_documents not yet in reference data
     suggest_groupings — LLM-powered grouping of unmapped values
 """
 
 from __future__ import annotations
 
 import logging
-import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
@@ -28,6 +27,9 @@ import yaml
 from sqlalchemy import and_, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..shared.shared_cache import SharedCache
+from .alias_matcher import AliasMatcher
+
 logger = logging.getLogger(__name__)
 
 # Cache TTL in seconds
@@ -41,9 +43,11 @@ class FacetReferenceService:
         self._yaml_data: Dict[str, Any] = {}
         self._yaml_loaded = False
 
-        # In-memory reverse index: (org_id_str, facet_name) → {alias_lower: [all_aliases_for_canonical]}
-        self._cache: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
-        self._cache_ts: Dict[Tuple[str, str], float] = {}
+        # Reverse index per facet, scoped by org_id ("global" for the baseline):
+        # facet_name → {alias_lower: [all_aliases_for_canonical]}
+        self._cache = SharedCache("facet_reference", ttl=_CACHE_TTL)
+        # Fuzzy-match index per (scope, facet), rebuilt when the reverse index changes
+        self._matchers: Dict[Tuple[str, str], AliasMatcher] = {}
 
     # =========================================================================
     # YAML Loading
@@ -154,12 +158,8 @@ class FacetReferenceService:
     # Cache Management
     # =========================================================================
 
-    def _cache_key(self, org_id: Optional[UUID], facet_name: str) -> Tuple[str, str]:
-        return (str(org_id) if org_id else "global", facet_name)
-
-    def _cache_valid(self, key: Tuple[str, str]) -> bool:
-        ts = self._cache_ts.get(key, 0)
-        return (time.time() - ts) < _CACHE_TTL
+    def _cache_scope(self, org_id: Optional[UUID]) -> str:
+        return str(org_id) if org_id else "global"
 
     async def _build_cache(
         self, session: AsyncSession, org_id: Optional[UUID], facet_name: str
@@ -219,30 +219,25 @@ class FacetReferenceService:
             for alias in all_vals:
                 reverse_index[alias.lower()] = all_vals
 
-        key = self._cache_key(org_id, facet_name)
-        self._cache[key] = reverse_index
-        self._cache_ts[key] = time.time()
-
         return reverse_index
 
     async def _get_reverse_index(
         self, session: AsyncSession, org_id: Optional[UUID], facet_name: str
     ) -> Dict[str, List[str]]:
-        key = self._cache_key(org_id, facet_name)
-        if key in self._cache and self._cache_valid(key):
-            return self._cache[key]
-        return await self._build_cache(session, org_id, facet_name)
+        return await self._cache.get_or_load(
+            self._cache_scope(org_id),
+            facet_name,
+            lambda: self._build_cache(session, org_id, facet_name),
+        )
 
     def invalidate_cache(self, org_id: Optional[UUID] = None) -> None:
-        """Clear cached reference data."""
+        """Clear cached reference data in every process."""
+        self._matchers.clear()
         if org_id is None:
-            self._cache.clear()
-            self._cache_ts.clear()
+            self._cache.invalidate()
         else:
-            keys_to_remove = [k for k in self._cache if k[0] == str(org_id) or k[0] == "global"]
-            for k in keys_to_remove:
-                self._cache.pop(k, None)
-                self._cache_ts.pop(k, None)
+            self._cache.invalidate(str(org_id))
+            self._cache.invalidate("global")
 
     # =========================================================================
     # Resolve Aliases (Search Hot Path)
@@ -313,42 +308,30 @@ class FacetReferenceService:
         Attempt fuzzy matching against cached aliases.
 
         Returns match info dict if a high-confidence match is found, else None.
-        Uses rapidfuzz if available, falls back to difflib.
+        Scores with rapidfuzz if available, falls back to difflib (see
+        AliasMatcher); values already known not to match are answered
+        without rescanning the aliases.
         """
         index = await self._get_reverse_index(session, org_id, facet_name)
         if not index:
             return None
 
-        value_lower = value.lower()
+        key = (self._cache_scope(org_id), facet_name)
+        matcher = self._matchers.get(key)
+        if matcher is None or matcher.source is not index:
+            matcher = AliasMatcher(index)
+            self._matchers[key] = matcher
 
-        # Try rapidfuzz first (faster), fall back to difflib
-        try:
-            from rapidfuzz import fuzz
-            best_score = 0.0
-            best_key = None
-            for alias_lower in index:
-                score = fuzz.ratio(value_lower, alias_lower) / 100.0
-                if score > best_score:
-                    best_score = score
-                    best_key = alias_lower
-        except ImportError:
-            from difflib import SequenceMatcher
-            best_score = 0.0
-            best_key = None
-            for alias_lower in index:
-                score = SequenceMatcher(None, value_lower, alias_lower).ratio()
-                if score > best_score:
-                    best_score = score
-                    best_key = alias_lower
-
-        if best_key and best_score >= threshold:
-            return {
-                "matched_alias": best_key,
-                "confidence": best_score,
-                "all_aliases": index[best_key],
-            }
+        match = matcher.match(value, threshold)
+        if match is None:
+            return None
 
-        return None
+        best_key, best_score = match
+        return {
+            "matched_alias": best_key,
+            "confidence": best_score,
+            "all_aliases": index[best_key],
+        }
 
     async def auto_add_alias(
         self,
@@ -508,7 +491,7 @@ class FacetReferenceService:
         facet_name: str,
     ) -> List[Dict[str, Any]]:
         """
-        Find distinct facet values in search_chunks that are not yet mapped
+        Find distinct facet values in search_documents that are not yet mapped
         in reference data.
 
         Uses a single UNION ALL query across all content type mappings
@@ -536,7 +519,7 @@ class FacetReferenceService:
             ns, field = parts
             union_parts.append(
                 f"SELECT metadata->'{ns}'->>'{field}' AS val "
-                f"FROM search_chunks "
+                f"FROM search_documents "
                 f"WHERE metadata->'{ns}'->>'{field}' IS NOT NULL {org_clause}"
             )
 
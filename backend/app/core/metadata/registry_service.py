@@ -17,15 +17,16 @@ Usage:
 """
 
 import logging
-import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 import yaml
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..shared.shared_cache import SharedCache
+
 logger = logging.getLogger("curatore.core.metadata.registry")
 
 # Data source types that are managed per-org (disabled by default, must be
@@ -47,7 +48,7 @@ class MetadataRegistryService:
     - YAML baseline loading and DB seeding
     - Effective registry resolution (global + org overrides)
     - Facet-to-JSON-path resolution for search queries
-    - In-memory cache with TTL
+    - Two-tier cache (in-process + Redis) with cross-process invalidation
     """
 
     CACHE_TTL = 300  # 5 minutes
@@ -59,10 +60,9 @@ class MetadataRegistryService:
         self._data_sources: Dict[str, Dict[str, Any]] = {}  # source_type → definition
         self._loaded = False
 
-        # Cache: org_id → (timestamp, effective_registry)
-        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
-        # Separate cache for data source catalog: org_id → (timestamp, catalog)
-        self._ds_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Shared caches scoped by org_id ("__global__" for the baseline):
+        # effective registry under key "registry", data source catalog under "ds"
+        self._cache = SharedCache("metadata_registry", ttl=self.CACHE_TTL)
 
     # =========================================================================
     # YAML Loading
@@ -229,17 +229,11 @@ class MetadataRegistryService:
         """
         self._ensure_loaded()
 
-        cache_key = str(organization_id) if organization_id else "__global__"
-        now = time.time()
-
-        if cache_key in self._cache:
-            cached_at, cached_registry = self._cache[cache_key]
-            if now - cached_at < self.CACHE_TTL:
-                return cached_registry
-
-        registry = await self._build_effective_registry(session, organization_id)
-        self._cache[cache_key] = (now, registry)
-        return registry
+        return await self._cache.get_or_load(
+            self._cache_scope(organization_id),
+            "registry",
+            lambda: self._build_effective_registry(session, organization_id),
+        )
 
     async def _build_effective_registry(
         self,
@@ -730,17 +724,11 @@ class MetadataRegistryService:
         """
         self._ensure_loaded()
 
-        cache_key = f"ds_{organization_id}" if organization_id else "ds___global__"
-        now = time.time()
-
-        if cache_key in self._ds_cache:
-            cached_at, cached_catalog = self._ds_cache[cache_key]
-            if now - cached_at < self.CACHE_TTL:
-                return cached_catalog
-
-        catalog = await self._build_data_source_catalog(session, organization_id)
-        self._ds_cache[cache_key] = (now, catalog)
-        return catalog
+        return await self._cache.get_or_load(
+            self._cache_scope(organization_id),
+            "ds",
+            lambda: self._build_data_source_catalog(session, organization_id),
+        )
 
     async def _build_data_source_catalog(
         self,
@@ -842,7 +830,7 @@ class MetadataRegistryService:
             session.add(record)
 
         await session.flush()
-        self._ds_cache.pop(f"ds_{organization_id}", None)
+        self.invalidate_cache(organization_id)
 
         return {
             "source_type": source_type,
@@ -1020,20 +1008,18 @@ class MetadataRegistryService:
     # Cache Management
     # =========================================================================
 
+    @staticmethod
+    def _cache_scope(organization_id: Optional[UUID]) -> str:
+        return str(organization_id) if organization_id else "__global__"
+
     def invalidate_cache(self, organization_id: Optional[UUID] = None) -> None:
-        """Clear cached effective registry for an organization (or all)."""
-        if organization_id is None:
-            self._cache.clear()
-            self._ds_cache.clear()
-        else:
-            self._cache.pop(str(organization_id), None)
-            self._ds_cache.pop(f"ds_{organization_id}", None)
+        """Clear cached effective registry for an organization (or all), in every process."""
+        self._cache.invalidate(str(organization_id) if organization_id else None)
 
     def reload_yaml(self) -> None:
         """Force-reload YAML baseline files and clear all caches."""
         self._loaded = False
-        self._cache.clear()
-        self._ds_cache.clear()
+        self._cache.invalidate()
         self._load_yaml()
 
 
@@ -52,6 +52,12 @@ class LLMTaskTypeConfig(BaseModel):
         le=600,
         description="Request timeout in seconds (overrides parent)"
     )
+    context_window: Optional[int] = Field(
+        default=None,
+        ge=1024,
+        le=10_000_000,
+        description="Model context window in tokens (used to size packed multi-item prompts)"
+    )
     dimensions: Optional[int] = Field(
         default=None,
         ge=1,
@@ -121,6 +127,32 @@ class LLMConfig(BaseModel):
         default=None,
         description="Task-type-specific model configuration (embedding, quick, standard, quality, bulk, reasoning)"
     )
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Default number of concurrent LLM requests for collection-mode primitives"
+    )
+    model_concurrency: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Per-model caps on concurrent LLM requests (model name -> limit)"
+    )
+    response_cache_enabled: bool = Field(
+        default=True,
+        description="Allow opt-in caching of LLM responses (steps with cache: true)"
+    )
+    response_cache_ttl_hours: int = Field(
+        default=24,
+        ge=1,
+        le=8760,
+        description="Hours a cached LLM response stays valid"
+    )
+    response_cache_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        le=10_000_000,
+        description="Maximum number of cached LLM responses (oldest evicted first)"
+    )
 
 
 class OCRConfig(BaseModel):
@@ -691,6 +723,82 @@ class SearchConfig(BaseModel):
         le=500,
         description="Character overlap between consecutive chunks"
     )
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse embeddings for byte-identical text via the Redis embedding cache"
+    )
+    embedding_cache_ttl_days: int = Field(
+        default=30,
+        ge=1,
+        le=365,
+        description="Days an unused cached embedding is kept (refreshed on every hit)"
+    )
+    embedding_cache_local_size: int = Field(
+        default=10000,
+        ge=0,
+        le=1000000,
+        description="Maximum embeddings held in the per-process LRU in front of Redis"
+    )
+    hybrid_fusion: Literal["rrf", "weighted"] = Field(
+        default="rrf",
+        description=(
+            "How hybrid search fuses keyword and semantic candidates: reciprocal-rank "
+            "fusion (rank-based, robust to score scales) or a weighted sum of raw scores"
+        )
+    )
+    hybrid_rrf_k: int = Field(
+        default=60,
+        ge=1,
+        le=1000,
+        description="RRF damping constant (higher = flatter contribution across ranks)"
+    )
+    hybrid_keyword_candidates: int = Field(
+        default=1000,
+        ge=50,
+        le=10000,
+        description="Top keyword-matching chunks considered per hybrid query"
+    )
+    hybrid_semantic_candidates: int = Field(
+        default=200,
+        ge=50,
+        le=5000,
+        description="Nearest-neighbor chunks considered per hybrid query"
+    )
+    ann_index_method: Literal["ivfflat", "hnsw"] = Field(
+        default="ivfflat",
+        description="ANN index type built by the search.ann_rebuild task for search_chunks.embedding"
+    )
+    ann_hnsw_m: int = Field(
+        default=16,
+        ge=2,
+        le=100,
+        description="HNSW: max connections per graph node (higher = better recall, larger index)"
+    )
+    ann_hnsw_ef_construction: int = Field(
+        default=64,
+        ge=4,
+        le=1000,
+        description="HNSW: candidate list size during build (higher = better graph, slower build)"
+    )
+    ann_hnsw_ef_search: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        description="HNSW: default candidate list size per query (None = pgvector default of 40)"
+    )
+    ann_ivfflat_probes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=32768,
+        description="IVFFlat: default lists probed per query (None = sqrt(lists) of the index)"
+    )
+    ann_partial_index_org_ids: List[str] = Field(
+        default_factory=list,
+        description=(
+            "Organizations that get their own partial ANN index, so their queries "
+            "do not probe lists dominated by other tenants' chunks"
+        )
+    )
 
 
 class MinIOConfig(BaseModel):
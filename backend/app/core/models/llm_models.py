@@ -43,11 +43,13 @@ class LLMTaskConfig(BaseModel):
         temperature: Sampling temperature (0.0-2.0, lower = more deterministic)
         max_tokens: Maximum tokens in response
         timeout: Request timeout in seconds
+        context_window: Model context window in tokens
     """
     model: str = Field(..., description="Model identifier")
     temperature: Optional[float] = Field(None, ge=0.0, le=2.0, description="Sampling temperature")
     max_tokens: Optional[int] = Field(None, gt=0, description="Maximum response tokens")
     timeout: Optional[int] = Field(None, gt=0, description="Request timeout in seconds")
+    context_window: Optional[int] = Field(None, gt=0, description="Model context window in tokens")
 
     class Config:
         extra = "allow"  # Allow additional provider-specific fields
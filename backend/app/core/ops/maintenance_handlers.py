@@ -1094,13 +1094,21 @@ async def handle_search_reindex(
                         heartbeat_callback=_send_heartbeat,
                     )
 
+                    # Write all successfully prepared assets in one bulk write
+                    prepared_results = await pg_index_service.index_assets_prepared(
+                        session,
+                        [
+                            (batch_result["prepared"], batch_result["embeddings"])
+                            for batch_result in batch_results
+                            if batch_result is not None
+                        ],
+                    )
+
                     for item, batch_result in zip(items, batch_results):
                         try:
                             if batch_result is not None:
-                                success = await pg_index_service.index_asset_prepared(
-                                    session,
-                                    batch_result["prepared"],
-                                    batch_result["embeddings"],
+                                success = prepared_results.get(
+                                    batch_result["prepared"]["asset_id"], False
                                 )
                             else:
                                 # Fallback to original single-asset path
@@ -1683,6 +1691,188 @@ async def _index_item(
     return False
 
 
+# =============================================================================
+# Handler: Search ANN Index Rebuild
+# =============================================================================
+
+
+@register(
+    task_type="search.ann_rebuild",
+    name="search_ann_rebuild",
+    display_name="Search ANN Index Rebuild",
+    description="Rebuild the pgvector ANN indexes on search chunks concurrently: re-size and re-cluster IVFFlat lists (or build HNSW), and maintain per-organization partial indexes.",
+    schedule_expression="0 4 * * 0",  # Weekly on Sunday at 4 AM UTC (after search_reindex)
+    enabled=False,  # Disabled by default
+    config={},
+)
+async def handle_search_ann_rebuild(
+    session: AsyncSession,
+    run: Run,
+    config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Rebuild approximate-nearest-neighbor indexes on search_chunks.embedding.
+
+    Each index is built with CREATE INDEX CONCURRENTLY under a temporary
+    name and swapped in, so search stays available during the rebuild.
+    Partial indexes of organizations no longer selected are dropped.
+
+    Args:
+        session: Database session
+        run: Run context for tracking
+        config: Task configuration:
+            - method: "ivfflat" or "hnsw" (default: search.ann_index_method)
+            - organization_ids: Organizations that get a partial index
+              (default: search.ann_partial_index_org_ids)
+            - rebuild_global: Rebuild the global index (default: True)
+
+    Returns:
+        Dict with per-index rebuild results
+    """
+    from app.core.search.ann_index_service import ANN_METHODS, ann_index_service
+    from app.core.shared.config_loader import config_loader
+
+    run_id = run.id
+    search_config = config_loader.get_search_config()
+
+    method = config.get("method") or (search_config.ann_index_method if search_config else "ivfflat")
+    if method not in ANN_METHODS:
+        raise ValueError(f"Unknown ANN index method: {method}")
+
+    org_ids = config.get("organization_ids")
+    if org_ids is None:
+        org_ids = search_config.ann_partial_index_org_ids if search_config else []
+    org_ids = [str(UUID(str(org_id))) for org_id in org_ids]
+    rebuild_global = config.get("rebuild_global", True)
+
+    await _log_event(
+        session, run_id, "INFO", "progress",
+        f"Starting ANN index rebuild (method={method}, "
+        f"global={rebuild_global}, partial indexes={len(org_ids)})"
+    )
+
+    rebuilt: List[Dict[str, Any]] = []
+    errors: List[str] = []
+
+    targets: List[Optional[str]] = ([None] if rebuild_global else []) + org_ids
+    for org_id in targets:
+        label = f"organization {org_id}" if org_id else "global index"
+        try:
+            result = await ann_index_service.rebuild_index(organization_id=org_id, method=method)
+            rebuilt.append(result)
+            await _log_event(
+                session, run_id, "INFO", "progress",
+                f"Rebuilt ANN index for {label}: {result['rows']} rows, "
+                f"{result['options']} in {result['elapsed_seconds']}s",
+                result,
+            )
+        except Exception as e:
+            logger.error(f"ANN index rebuild failed for {label}: {e}")
+            errors.append(f"{label}: {e}")
+            await _log_event(
+                session, run_id, "ERROR", "progress",
+                f"ANN index rebuild failed for {label}: {e}",
+            )
+
+    # Drop partial indexes for organizations that are no longer selected
+    dropped: List[str] = []
+    for index in await ann_index_service.list_indexes(session):
+        if index["organization_id"] and index["organization_id"] not in org_ids:
+            dropped.append(await ann_index_service.drop_org_index(index["organization_id"]))
+
+    summary = {
+        "status": "completed" if not errors else "completed_with_errors",
+        "method": method,
+        "indexes_rebuilt": rebuilt,
+        "indexes_dropped": dropped,
+        "errors": errors,
+    }
+
+    await _log_event(
+        session, run_id, "WARN" if errors else "INFO", "summary",
+        f"ANN index rebuild completed: {len(rebuilt)} rebuilt, "
+        f"{len(dropped)} dropped, {len(errors)} failed",
+        context=summary,
+    )
+
+    return summary
+
+
+# =============================================================================
+# Handler: Search Facet Counts Rebuild
+# =============================================================================
+
+
+@register(
+    task_type="search.facet_counts_rebuild",
+    name="search_facet_counts_rebuild",
+    display_name="Search Facet Counts Rebuild",
+    description="Sync registry facet paths and recompute the precomputed per-organization facet counts used by browse pages.",
+    schedule_expression="30 4 * * 0",  # Weekly on Sunday at 4:30 AM UTC (after search_ann_rebuild)
+    enabled=False,  # Disabled by default
+    config={},
+)
+async def handle_search_facet_counts_rebuild(
+    session: AsyncSession,
+    run: Run,
+    config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Recompute search_facet_counts from search_documents.
+
+    The counts are maintained incrementally by triggers on search_documents;
+    this rebuild repairs drift and removes zero-count rows. Facet paths are
+    synced from the metadata registry first.
+
+    Args:
+        session: Database session
+        run: Run context for tracking
+        config: Task configuration:
+            - organization_ids: Rebuild only these organizations (default: all)
+
+    Returns:
+        Dict with sync and rebuild results
+    """
+    from app.core.search.facet_service import facet_service
+
+    run_id = run.id
+    org_ids = [UUID(str(org_id)) for org_id in (config.get("organization_ids") or [])]
+
+    await _log_event(
+        session, run_id, "INFO", "start",
+        f"Starting facet counts rebuild "
+        f"({'all organizations' if not org_ids else f'{len(org_ids)} organizations'})"
+    )
+
+    # A path change rebuilds every organization as part of the sync
+    sync = await facet_service.sync_facet_paths(session)
+    rows = sync["rows"]
+    if not sync["changed"]:
+        if org_ids:
+            for org_id in org_ids:
+                rows += await facet_service.rebuild_counts(session, org_id)
+        else:
+            rows = await facet_service.rebuild_counts(session)
+    await session.commit()
+
+    summary = {
+        "status": "completed",
+        "paths": sync["paths"],
+        "paths_changed": sync["changed"],
+        "organizations": [str(org_id) for org_id in org_ids] or "all",
+        "rows": rows,
+    }
+
+    await _log_event(
+        session, run_id, "INFO", "summary",
+        f"Facet counts rebuild completed: {rows} count rows, "
+        f"{sync['paths']} facet paths{' (changed)' if sync['changed'] else ''}",
+        context=summary,
+    )
+
+    return summary
+
+
 # =============================================================================
 # Stale Run Cleanup Handler
 # =============================================================================
@@ -1750,6 +1940,7 @@ async def handle_stale_run_cleanup(
         "stale_pending_reset": 0,
         "orphaned_maintenance_timed_out": 0,
         "failed_max_retries": 0,
+        "log_events_recovered": 0,
         "errors": 0,
         "dry_run": dry_run,
     }
@@ -1891,12 +2082,22 @@ async def handle_stale_run_cleanup(
         logger.error(f"Stale run cleanup failed: {e}")
         results["errors"] += 1
 
+    # Run log events buffered by workers that died before flushing them
+    if not dry_run:
+        try:
+            from app.core.shared.run_telemetry import run_telemetry
+            results["log_events_recovered"] = await run_telemetry.recover()
+        except Exception as e:
+            logger.warning(f"Run log event recovery failed: {e}")
+            results["errors"] += 1
+
     await _log_event(
         session, run.id, "INFO", "complete",
         f"Stale run cleanup complete: {results['stale_submitted_reset']} submitted reset, "
         f"{results['stale_running_reset']} running reset, {results['stale_pending_reset']} pending reset, "
         f"{results['orphaned_maintenance_timed_out']} orphaned maintenance timed out, "
-        f"{results['failed_max_retries']} failed (max retries)",
+        f"{results['failed_max_retries']} failed (max retries), "
+        f"{results['log_events_recovered']} log events recovered",
         results
     )
 
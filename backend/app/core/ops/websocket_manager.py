@@ -21,29 +21,59 @@ Architecture:
     - Thread-safe connection management with asyncio locks
     - Integrates with Redis pub/sub for distributed message handling
     - Supports graceful connection lifecycle management
+    - Each connection has a bounded outbound queue drained by its own writer
+      task, so a slow client never delays other clients or the publisher
+    - Messages are JSON encoded once per broadcast; queued run_progress
+      messages are coalesced per run (latest wins)
+    - Connections that fall MAX_QUEUED_MESSAGES behind, or whose send stalls
+      for SEND_TIMEOUT_SECONDS, are closed as slow consumers
 """
 
 import asyncio
 import json
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional, Set
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 from uuid import UUID
 
 from fastapi import WebSocket
 
 logger = logging.getLogger("curatore.websocket_manager")
 
+# Messages a connection may have waiting before it is dropped as a slow consumer
+MAX_QUEUED_MESSAGES = 500
+
+# Seconds a single send (or the slow-consumer close) may take before giving up
+SEND_TIMEOUT_SECONDS = 10.0
+
+# Close code for slow consumers (RFC 6455 "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Message types where only the latest queued message per run is delivered
+COALESCED_MESSAGE_TYPES = {"run_progress"}
+
 
 @dataclass
 class ConnectionInfo:
-    """Information about a WebSocket connection."""
+    """
+    Information about a WebSocket connection.
+
+    The outbox holds (coalesce_key, text) entries. Coalesced entries carry
+    no text; their latest payload lives in ``latest`` until the writer
+    sends it, so newer progress for the same run replaces it in place.
+    """
 
     websocket: WebSocket
     user_id: UUID
     organization_id: Optional[UUID]
     connected_at: datetime = field(default_factory=datetime.utcnow)
+    outbox: Deque[Tuple[Optional[str], Optional[str]]] = field(default_factory=deque)
+    latest: Dict[str, str] = field(default_factory=dict)
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    writer: Optional[asyncio.Task] = None
+    overflowed: bool = False
 
 
 class WebSocketManager:
@@ -57,6 +87,9 @@ class WebSocketManager:
         _connections: Mapping of organization_id -> set of WebSocket connections
         _connection_info: Mapping of WebSocket -> ConnectionInfo
         _lock: Async lock for thread-safe connection management
+
+    Sending never awaits the client: messages are queued on the connection
+    and written by its writer task.
     """
 
     def __init__(self):
@@ -91,12 +124,14 @@ class WebSocketManager:
                     self._connections[organization_id] = set()
                 self._connections[organization_id].add(websocket)
 
-            # Store connection info
-            self._connection_info[websocket] = ConnectionInfo(
+            # Store connection info and start its writer
+            info = ConnectionInfo(
                 websocket=websocket,
                 user_id=user_id,
                 organization_id=organization_id,
             )
+            info.writer = asyncio.create_task(self._write_messages(info))
+            self._connection_info[websocket] = info
 
             org_count = len(self._connections.get(organization_id, set())) if organization_id else 0
             logger.info(
@@ -124,8 +159,10 @@ class WebSocketManager:
                 if info:
                     organization_id = info.organization_id
 
-            # Remove from connection info
+            # Remove from connection info and stop its writer
             info = self._connection_info.pop(websocket, None)
+            if info and info.writer and info.writer is not asyncio.current_task():
+                info.writer.cancel()
 
             # Remove from org's connection set
             if organization_id is not None and organization_id in self._connections:
@@ -148,36 +185,28 @@ class WebSocketManager:
         """
         Broadcast a message to all connections in an organization.
 
+        The message is encoded once and queued on every connection; this
+        does not wait for any client to receive it.
+
         Args:
             organization_id: The organization to broadcast to
             message: The message to send (will be JSON encoded)
 
         Returns:
-            Number of connections the message was sent to
+            Number of connections the message was queued for
         """
         async with self._lock:
-            connections = self._connections.get(organization_id, set()).copy()
+            infos = [
+                self._connection_info[websocket]
+                for websocket in self._connections.get(organization_id, set())
+                if websocket in self._connection_info
+            ]
 
-        if not connections:
+        if not infos:
             return 0
 
-        message_json = json.dumps(message)
-        sent_count = 0
-        failed_connections: Set[WebSocket] = set()
-
-        for websocket in connections:
-            try:
-                await websocket.send_text(message_json)
-                sent_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to send message to WebSocket: {e}")
-                failed_connections.add(websocket)
-
-        # Clean up failed connections
-        for websocket in failed_connections:
-            await self.disconnect(websocket, organization_id)
-
-        return sent_count
+        key, message_json = self._encode(message)
+        return sum(1 for info in infos if self._enqueue(info, key, message_json))
 
     async def send_to_connection(
         self,
@@ -187,21 +216,122 @@ class WebSocketManager:
         """
         Send a message to a specific connection.
 
+        Registered connections get the message queued for their writer;
+        unregistered ones are sent to directly.
+
         Args:
             websocket: The WebSocket connection to send to
             message: The message to send (will be JSON encoded)
 
         Returns:
-            True if sent successfully, False otherwise
+            True if queued or sent successfully, False otherwise
         """
+        info = self._connection_info.get(websocket)
         try:
-            message_json = json.dumps(message)
+            key, message_json = self._encode(message)
+            if info is not None:
+                return self._enqueue(info, key, message_json)
             await websocket.send_text(message_json)
             return True
         except Exception as e:
             logger.warning(f"Failed to send message to WebSocket: {e}")
             return False
 
+    async def wait_closed(self, websocket: WebSocket) -> None:
+        """
+        Wait until the manager stops writing to a connection.
+
+        Returns when the connection is disconnected, its send fails, or it
+        is dropped as a slow consumer.
+        """
+        info = self._connection_info.get(websocket)
+        if info is not None and info.writer is not None:
+            await asyncio.wait([info.writer])
+
+    @staticmethod
+    def _encode(message: Dict[str, Any]) -> Tuple[Optional[str], str]:
+        """Encode a message, returning its coalesce key (if any) and JSON text."""
+        key = None
+        if message.get("type") in COALESCED_MESSAGE_TYPES:
+            run_id = (message.get("data") or {}).get("run_id")
+            if run_id:
+                key = f"{message['type']}:{run_id}"
+        return key, json.dumps(message)
+
+    def _enqueue(self, info: ConnectionInfo, key: Optional[str], message_json: str) -> bool:
+        """
+        Queue an encoded message on a connection without blocking.
+
+        Returns False if the connection is closing or its queue is full; a
+        full queue marks the connection as a slow consumer.
+        """
+        if info.overflowed or info.writer is None or info.writer.done():
+            return False
+
+        if key is not None and key in info.latest:
+            # Replace the pending message for this run in place
+            info.latest[key] = message_json
+            return True
+
+        if len(info.outbox) >= MAX_QUEUED_MESSAGES:
+            info.overflowed = True
+            info.ready.set()
+            return False
+
+        if key is not None:
+            info.latest[key] = message_json
+            info.outbox.append((key, None))
+        else:
+            info.outbox.append((None, message_json))
+        info.ready.set()
+        return True
+
+    async def _write_messages(self, info: ConnectionInfo) -> None:
+        """Writer task: send queued messages to one connection in order."""
+        websocket = info.websocket
+        reason = None
+        try:
+            while True:
+                if info.overflowed:
+                    reason = f"more than {MAX_QUEUED_MESSAGES} messages behind"
+                    break
+                if not info.outbox:
+                    info.ready.clear()
+                    await info.ready.wait()
+                    continue
+
+                key, message_json = info.outbox.popleft()
+                if key is not None:
+                    message_json = info.latest.pop(key)
+
+                try:
+                    await asyncio.wait_for(websocket.send_text(message_json), SEND_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    reason = f"send stalled for {SEND_TIMEOUT_SECONDS}s"
+                    break
+                except Exception as e:
+                    logger.warning(f"Failed to send message to WebSocket: {e}")
+                    await self.disconnect(websocket, info.organization_id)
+                    return
+        except asyncio.CancelledError:
+            return
+
+        logger.warning(
+            f"Dropping slow WebSocket consumer: user={info.user_id}, "
+            f"org={info.organization_id}, {reason}"
+        )
+        info.overflowed = True
+        info.outbox.clear()
+        info.latest.clear()
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Client too slow"),
+                SEND_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            logger.debug(f"Error closing slow WebSocket: {e}")
+        await self.disconnect(websocket, info.organization_id)
+
     def get_org_connection_count(self, organization_id: UUID) -> int:
         """
         Get the number of connections for an organization.
@@ -0,0 +1,461 @@
+# ============================================================================
+# backend/app/core/search/ann_index_service.py
+# ============================================================================
+"""
+ANN Index Service for Curatore v2 - pgvector Index Management for search_chunks
+
+The initial migration creates a single ``ivfflat (lists = 100)`` index on
+search_chunks.embedding. IVFFlat clusters are fixed at build time, so as the
+table grows the lists become too coarse and recall/latency degrade. This
+module manages the approximate-nearest-neighbor indexes instead of leaving
+them at migration defaults.
+
+Key Features:
+    - IVFFlat or HNSW, selected by configuration
+    - Automatic ``lists`` sizing from the current row count (pgvector guidance:
+      rows / 1000 up to 1M rows, sqrt(rows) above)
+    - Concurrent rebuilds: the new index is built with CREATE INDEX
+      CONCURRENTLY under a temporary name and swapped in, so search keeps
+      working during the rebuild
+    - Per-organization partial indexes (``WHERE organization_id = '...'``) so
+      a small tenant's queries do not probe lists dominated by large tenants
+    - Per-query tuning (``ivfflat.probes`` / ``hnsw.ef_search``) applied with
+      transaction-local set_config() before semantic and hybrid queries
+
+Partial indexes and prepared statements:
+    The planner can only use a partial index when it can prove the predicate,
+    which requires the organization id as a known value. asyncpg prepares
+    statements, and PostgreSQL switches prepared statements to generic plans
+    after a few executions. For organizations with a partial index,
+    apply_query_settings() sets ``plan_cache_mode = force_custom_plan`` for the
+    transaction so the bound organization id is always visible to the planner.
+
+Usage:
+    from app.core.search.ann_index_service import ann_index_service
+
+    # Before an ANN query (done by PgSearchService)
+    await ann_index_service.apply_query_settings(session, org_id, ef_search=100)
+
+    # Maintenance (search.ann_rebuild task)
+    await ann_index_service.rebuild_index()
+    await ann_index_service.rebuild_index(organization_id=org_id)
+
+Configuration (config.yml):
+    search:
+      ann_index_method: hnsw          # ivfflat | hnsw
+      ann_hnsw_m: 16
+      ann_hnsw_ef_construction: 64
+      ann_hnsw_ef_search: 80          # optional per-query default
+      ann_ivfflat_probes: 10          # optional, default sqrt(lists)
+      ann_partial_index_org_ids: []
+
+Author: Curatore v2 Development Team
+Version: 2.0.0
+"""
+
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Union
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger("curatore.search.ann_index")
+
+TABLE_NAME = "search_chunks"
+INDEX_NAME = "ix_search_chunks_embedding"
+ORG_INDEX_PREFIX = "ix_search_emb_org_"
+REBUILD_SUFFIX = "_rebuild"
+
+# Per-org prefix used before names were shortened; with the org hex it
+# already filled the identifier limit, so rebuilds could not rename into it
+LEGACY_ORG_INDEX_PREFIX = "ix_search_chunks_embedding_org_"
+
+# PostgreSQL truncates identifiers longer than NAMEDATALEN - 1 bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+# IVFFlat lists bounds (pgvector caps lists at 32768)
+MIN_LISTS = 10
+MAX_LISTS = 32768
+
+# Seconds the index catalog snapshot is reused by apply_query_settings()
+INDEX_INFO_TTL = 300
+
+ANN_METHODS = ("ivfflat", "hnsw")
+
+
+def recommended_lists(row_count: int) -> int:
+    """
+    IVFFlat list count for a table size (pgvector guidance).
+
+    Args:
+        row_count: Rows with a non-null embedding
+
+    Returns:
+        rows / 1000 up to 1M rows, sqrt(rows) above, clamped to
+        [MIN_LISTS, MAX_LISTS]
+    """
+    if row_count <= 1_000_000:
+        lists = row_count // 1000
+    else:
+        lists = int(math.sqrt(row_count))
+    return max(MIN_LISTS, min(MAX_LISTS, lists))
+
+
+def recommended_probes(lists: int) -> int:
+    """IVFFlat probes for a list count: sqrt(lists), at least 1."""
+    return max(1, round(math.sqrt(lists)))
+
+
+def org_index_name(organization_id: Union[UUID, str]) -> str:
+    """
+    Name of the partial ANN index for an organization.
+
+    Short enough that the name plus REBUILD_SUFFIX stays within
+    MAX_IDENTIFIER_LENGTH, so the temporary rebuild index never collides
+    with the live one.
+    """
+    return ORG_INDEX_PREFIX + UUID(str(organization_id)).hex
+
+
+def _legacy_org_index_name(organization_id: Union[UUID, str]) -> str:
+    """Name an organization's partial index had under LEGACY_ORG_INDEX_PREFIX."""
+    return LEGACY_ORG_INDEX_PREFIX + UUID(str(organization_id)).hex
+
+
+def _index_organization_id(index_name: str) -> Optional[str]:
+    """Organization id encoded in a per-org index name, or None."""
+    if index_name.endswith(REBUILD_SUFFIX):
+        return None
+    for prefix in (ORG_INDEX_PREFIX, LEGACY_ORG_INDEX_PREFIX):
+        if index_name.startswith(prefix):
+            try:
+                return str(UUID(index_name[len(prefix):]))
+            except ValueError:
+                return None
+    return None
+
+
+def build_index_sql(
+    index_name: str,
+    method: str,
+    row_count: int = 0,
+    organization_id: Optional[Union[UUID, str]] = None,
+    hnsw_m: int = 16,
+    hnsw_ef_construction: int = 64,
+) -> str:
+    """
+    Build the CREATE INDEX CONCURRENTLY statement for an ANN index.
+
+    DDL cannot take bind parameters, so the organization id is validated as a
+    UUID before being inlined into the partial-index predicate.
+
+    Args:
+        index_name: Name of the index to create
+        method: "ivfflat" or "hnsw"
+        row_count: Rows the index will cover (sizes IVFFlat lists)
+        organization_id: Restrict the index to one organization
+        hnsw_m: HNSW max connections per node
+        hnsw_ef_construction: HNSW build candidate list size
+
+    Returns:
+        SQL statement
+
+    Raises:
+        ValueError: If method is unknown or organization_id is not a UUID
+    """
+    if method == "hnsw":
+        options = f"m = {int(hnsw_m)}, ef_construction = {int(hnsw_ef_construction)}"
+    elif method == "ivfflat":
+        options = f"lists = {recommended_lists(row_count)}"
+    else:
+        raise ValueError(f"Unknown ANN index method: {method}")
+
+    sql = (
+        f"CREATE INDEX CONCURRENTLY {index_name} ON {TABLE_NAME} "
+        f"USING {method} (embedding vector_cosine_ops) WITH ({options})"
+    )
+    if organization_id is not None:
+        sql += f" WHERE organization_id = '{UUID(str(organization_id))}'"
+    return sql
+
+
+def _parse_reloptions(reloptions: Optional[List[str]]) -> Dict[str, int]:
+    """Parse pg_class.reloptions (['lists=100']) into {'lists': 100}."""
+    options: Dict[str, int] = {}
+    for option in reloptions or []:
+        key, _, value = option.partition("=")
+        try:
+            options[key] = int(value)
+        except ValueError:
+            continue
+    return options
+
+
+class AnnIndexService:
+    """
+    Manages pgvector ANN indexes on search_chunks.embedding.
+
+    Index metadata is read from the system catalogs, so indexes created by
+    migrations, by this service or by hand are all recognized.
+    """
+
+    def __init__(self):
+        """Initialize the service with an empty index snapshot."""
+        self._index_info: Optional[List[Dict[str, Any]]] = None
+        self._index_info_at = 0.0
+
+    # =====================================================================
+    # Configuration
+    # =====================================================================
+
+    def _get_search_config(self):
+        try:
+            from app.core.shared.config_loader import config_loader
+            return config_loader.get_search_config()
+        except Exception:
+            return None
+
+    # =====================================================================
+    # Index Catalog
+    # =====================================================================
+
+    async def list_indexes(self, conn: Any) -> List[Dict[str, Any]]:
+        """
+        List ANN indexes on search_chunks.
+
+        Args:
+            conn: AsyncSession or AsyncConnection
+
+        Returns:
+            List of dicts: name, method, options, organization_id (for
+            partial per-org indexes), valid
+        """
+        result = await conn.execute(text("""
+            SELECT c.relname AS name,
+                   am.amname AS method,
+                   c.reloptions AS reloptions,
+                   i.indisvalid AS valid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_am am ON am.oid = c.relam
+            WHERE i.indrelid = to_regclass(:table_name)
+            AND am.amname IN ('ivfflat', 'hnsw')
+            ORDER BY c.relname
+        """), {"table_name": TABLE_NAME})
+
+        indexes = []
+        for row in result.fetchall():
+            indexes.append({
+                "name": row.name,
+                "method": row.method,
+                "options": _parse_reloptions(row.reloptions),
+                "organization_id": _index_organization_id(row.name),
+                "valid": bool(row.valid),
+            })
+        return indexes
+
+    async def _get_index_info(self, session: AsyncSession) -> List[Dict[str, Any]]:
+        """Cached list_indexes() snapshot (refreshed every INDEX_INFO_TTL)."""
+        now = time.monotonic()
+        if self._index_info is None or now - self._index_info_at > INDEX_INFO_TTL:
+            self._index_info = await self.list_indexes(session)
+            self._index_info_at = now
+        return self._index_info
+
+    def invalidate(self) -> None:
+        """Drop the cached index snapshot (after a rebuild or drop)."""
+        self._index_info = None
+
+    # =====================================================================
+    # Query Tuning
+    # =====================================================================
+
+    def _resolve_query_settings(
+        self,
+        indexes: List[Dict[str, Any]],
+        organization_id: Optional[str],
+        ef_search: Optional[int],
+        probes: Optional[int],
+    ) -> Dict[str, str]:
+        """
+        Decide which settings to apply for a query.
+
+        Returns:
+            Dict of {setting: value}
+        """
+        valid = [ix for ix in indexes if ix["valid"]]
+        org_index = next(
+            (ix for ix in valid if organization_id and ix["organization_id"] == organization_id),
+            None,
+        )
+        index = org_index or next((ix for ix in valid if ix["organization_id"] is None), None)
+
+        config = self._get_search_config()
+        settings: Dict[str, str] = {}
+
+        if probes is None and config is not None:
+            probes = config.ann_ivfflat_probes
+        if probes is None and index and index["method"] == "ivfflat" and "lists" in index["options"]:
+            probes = recommended_probes(index["options"]["lists"])
+        if probes:
+            settings["ivfflat.probes"] = str(int(probes))
+
+        if ef_search is None and config is not None:
+            ef_search = config.ann_hnsw_ef_search
+        if ef_search:
+            settings["hnsw.ef_search"] = str(int(ef_search))
+
+        if org_index is not None:
+            settings["plan_cache_mode"] = "force_custom_plan"
+
+        return settings
+
+    async def apply_query_settings(
+        self,
+        session: AsyncSession,
+        organization_id: Optional[Union[UUID, str]] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """
+        Apply ANN tuning for the rest of the current transaction.
+
+        Explicit ef_search/probes win over configured defaults; without
+        either, IVFFlat probes default to sqrt(lists) of the index the query
+        will use. Settings are transaction-local (set_config(..., true)).
+
+        Args:
+            session: Database session the ANN query will run on
+            organization_id: Organization being searched
+            ef_search: HNSW candidate list size for this query
+            probes: IVFFlat lists to probe for this query
+
+        Returns:
+            The settings that were applied
+        """
+        org_id = str(organization_id) if organization_id else None
+        try:
+            indexes = await self._get_index_info(session)
+        except Exception as e:
+            logger.debug(f"Could not read ANN index catalog: {e}")
+            indexes = []
+
+        settings = self._resolve_query_settings(indexes, org_id, ef_search, probes)
+        if not settings:
+            return settings
+
+        columns = []
+        params: Dict[str, str] = {}
+        for idx, (name, value) in enumerate(settings.items()):
+            columns.append(f"set_config(:name_{idx}, :value_{idx}, true)")
+            params[f"name_{idx}"] = name
+            params[f"value_{idx}"] = value
+        await session.execute(text("SELECT " + ", ".join(columns)), params)
+        return settings
+
+    # =====================================================================
+    # Maintenance
+    # =====================================================================
+
+    async def rebuild_index(
+        self,
+        organization_id: Optional[Union[UUID, str]] = None,
+        method: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Rebuild (or create) an ANN index without blocking search.
+
+        The replacement is built concurrently under a temporary name, then
+        the old index is dropped concurrently and the new one renamed into
+        place. IVFFlat indexes are re-clustered from the current data and
+        their lists re-sized from the current row count.
+
+        Args:
+            organization_id: Build the partial index for this organization
+                instead of the global index
+            method: "ivfflat" or "hnsw" (default: search.ann_index_method)
+
+        Returns:
+            Dict with index name, method, rows, options and elapsed seconds
+        """
+        from app.core.shared.database_service import database_service
+
+        config = self._get_search_config()
+        method = method or (config.ann_index_method if config else "ivfflat")
+        hnsw_m = config.ann_hnsw_m if config else 16
+        hnsw_ef_construction = config.ann_hnsw_ef_construction if config else 64
+
+        index_name = org_index_name(organization_id) if organization_id else INDEX_NAME
+        temp_name = index_name + REBUILD_SUFFIX
+        started = time.monotonic()
+
+        async with database_service.get_autocommit_connection() as conn:
+            if organization_id:
+                count_result = await conn.execute(text(f"""
+                    SELECT COUNT(*) FROM {TABLE_NAME}
+                    WHERE organization_id = CAST(:org_id AS UUID)
+                    AND embedding IS NOT NULL
+                """), {"org_id": str(organization_id)})
+            else:
+                count_result = await conn.execute(text(
+                    f"SELECT COUNT(*) FROM {TABLE_NAME} WHERE embedding IS NOT NULL"
+                ))
+            row_count = count_result.scalar() or 0
+
+            # A failed earlier rebuild leaves an INVALID index behind
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {temp_name}"))
+            await conn.execute(text(build_index_sql(
+                temp_name, method, row_count, organization_id,
+                hnsw_m=hnsw_m, hnsw_ef_construction=hnsw_ef_construction,
+            )))
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+            await conn.execute(text(f"ALTER INDEX {temp_name} RENAME TO {index_name}"))
+            if organization_id:
+                # Replaces any index left under the legacy (too long) name
+                legacy_name = _legacy_org_index_name(organization_id)
+                await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {legacy_name}"))
+
+        self.invalidate()
+        options = (
+            {"m": hnsw_m, "ef_construction": hnsw_ef_construction}
+            if method == "hnsw" else {"lists": recommended_lists(row_count)}
+        )
+        elapsed = round(time.monotonic() - started, 1)
+        logger.info(
+            f"Rebuilt ANN index {index_name} ({method}, {row_count} rows, "
+            f"{options}) in {elapsed}s"
+        )
+        return {
+            "index": index_name,
+            "method": method,
+            "organization_id": str(organization_id) if organization_id else None,
+            "rows": row_count,
+            "options": options,
+            "elapsed_seconds": elapsed,
+        }
+
+    async def drop_org_index(self, organization_id: Union[UUID, str]) -> str:
+        """
+        Drop an organization's partial ANN index (its queries fall back to
+        the global index).
+
+        Returns:
+            Name of the dropped index
+        """
+        from app.core.shared.database_service import database_service
+
+        index_name = org_index_name(organization_id)
+        async with database_service.get_autocommit_connection() as conn:
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+            legacy_name = _legacy_org_index_name(organization_id)
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {legacy_name}"))
+        self.invalidate()
+        logger.info(f"Dropped ANN index {index_name}")
+        return index_name
+
+
+# Global service instance
+ann_index_service = AnnIndexService()
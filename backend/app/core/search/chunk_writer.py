@@ -0,0 +1,475 @@
+# ============================================================================
+# backend/app/core/search/chunk_writer.py
+# ============================================================================
+"""
+Bulk Chunk Writer for Curatore v2 - Set-Based Writes to search_chunks
+
+This module writes many search_chunks rows in a constant number of database
+round-trips instead of one INSERT per chunk. It is used by PgIndexService for
+single assets and for whole reindex batches.
+
+Write Strategy:
+    asyncpg (production):
+        1. Ensure a session-local staging table exists (TEMP, ON COMMIT DELETE ROWS)
+        2. Stream all rows into it with a binary COPY
+           (embeddings are sent in pgvector's binary format, not "[...]" text)
+        3. INSERT ... SELECT from staging with ON CONFLICT DO UPDATE, then TRUNCATE
+
+    Other drivers (tests, tooling):
+        Multi-row INSERT ... ON CONFLICT statements in batches of
+        INSERT_BATCH_SIZE rows, with embeddings as pgvector text literals.
+
+    Both paths preserve the upsert semantics of the previous per-chunk insert:
+    existing rows are overwritten.
+
+Document Metadata:
+    Namespaced metadata is stored once per source in search_documents, not on
+    every chunk. write_documents() upserts those rows, replacing the stored
+    metadata the same way a re-index used to rewrite it on every chunk.
+
+Incremental Updates:
+    diff_chunks() compares freshly chunked content against the rows already
+    stored for a source, keyed by md5(content). Only new chunks need
+    embeddings and inserts; unchanged chunks keep their row and embedding,
+    moved chunks only get a new chunk_index, and vanished chunks are deleted.
+    Hashes are computed in SQL with md5(content), so no extra column or
+    backfill is needed.
+
+Usage:
+    from app.core.search.chunk_writer import ChunkRow, DocumentRow, write_chunks, write_documents
+
+    rows = [ChunkRow(source_type="asset", source_id=..., ...), ...]
+    written = await write_chunks(session, rows)
+    await write_documents(session, [DocumentRow(source_type="asset", ...)])
+
+Author: Curatore v2 Development Team
+Version: 2.0.0
+"""
+
+import hashlib
+import json
+import logging
+import struct
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger("curatore.search.chunk_writer")
+
+# Rows per statement on the multi-row INSERT fallback path
+INSERT_BATCH_SIZE = 100
+
+# Rows per CopyData message on the binary COPY path
+COPY_ROWS_PER_MESSAGE = 64
+
+STAGING_TABLE = "search_chunks_stage"
+
+# Column order shared by COPY, the staging INSERT ... SELECT and the fallback INSERT
+CHUNK_COLUMNS = (
+    "source_type",
+    "source_id",
+    "organization_id",
+    "chunk_index",
+    "content",
+    "title",
+    "filename",
+    "url",
+    "embedding",
+    "source_type_filter",
+    "content_type",
+    "collection_id",
+    "sync_config_id",
+)
+
+_UPSERT_CLAUSE = """
+    ON CONFLICT (source_type, source_id, chunk_index)
+    DO UPDATE SET
+        content = EXCLUDED.content,
+        title = EXCLUDED.title,
+        filename = EXCLUDED.filename,
+        url = EXCLUDED.url,
+        embedding = EXCLUDED.embedding,
+        source_type_filter = EXCLUDED.source_type_filter,
+        content_type = EXCLUDED.content_type,
+        collection_id = EXCLUDED.collection_id,
+        sync_config_id = EXCLUDED.sync_config_id
+"""
+
+# PostgreSQL binary COPY framing
+_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_COPY_HEADER = _COPY_SIGNATURE + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+_NULL_FIELD = struct.pack(">i", -1)
+
+
+def sanitize_text(val: Optional[str]) -> Optional[str]:
+    """
+    Remove null bytes from a text value.
+
+    PostgreSQL rejects null bytes (\\x00) in TEXT columns. These can appear
+    in content extracted from corrupted PDFs.
+    """
+    if val and "\x00" in val:
+        return val.replace("\x00", "")
+    return val
+
+
+@dataclass
+class ChunkRow:
+    """
+    One row destined for the search_chunks table.
+
+    Attributes mirror the search_chunks columns written at index time.
+    Text fields are sanitized on construction.
+    """
+
+    source_type: str
+    source_id: UUID
+    organization_id: UUID
+    chunk_index: int
+    content: str
+    title: Optional[str] = None
+    filename: Optional[str] = None
+    url: Optional[str] = None
+    embedding: Optional[Sequence[float]] = None
+    source_type_filter: Optional[str] = None
+    content_type: Optional[str] = None
+    collection_id: Optional[UUID] = None
+    sync_config_id: Optional[UUID] = None
+
+    def __post_init__(self) -> None:
+        self.content = sanitize_text(self.content) or ""
+        self.title = sanitize_text(self.title)
+        self.filename = sanitize_text(self.filename)
+        self.url = sanitize_text(self.url)
+
+
+@dataclass
+class DocumentRow:
+    """
+    One row destined for the search_documents table.
+
+    Holds the namespaced metadata shared by all chunks of a source.
+    """
+
+    source_type: str
+    source_id: UUID
+    organization_id: UUID
+    metadata: Optional[Dict[str, Any]] = None
+
+
+# =========================================================================
+# Incremental diff
+# =========================================================================
+
+
+def content_hash(content: str) -> str:
+    """
+    Hash chunk content the same way PostgreSQL's md5(content) does.
+
+    Content is sanitized first so the hash matches what is stored.
+    """
+    return hashlib.md5((sanitize_text(content) or "").encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ChunkDiff:
+    """
+    Changes needed to turn a source's stored chunks into a new chunk list.
+
+    Attributes:
+        keep: Existing row id -> new chunk_index for reused chunks
+            (includes unchanged and moved rows)
+        moved: Subset of keep whose chunk_index changes
+        insert: Positions in the new chunk list that need new rows
+        delete: Existing row ids whose content no longer appears
+    """
+
+    keep: Dict[Any, int] = field(default_factory=dict)
+    moved: Dict[Any, int] = field(default_factory=dict)
+    insert: List[int] = field(default_factory=list)
+    delete: List[Any] = field(default_factory=list)
+
+
+def diff_chunks(
+    existing: Iterable[Tuple[Any, int, str]],
+    new_contents: Sequence[str],
+) -> ChunkDiff:
+    """
+    Diff new chunk contents against existing rows by content hash.
+
+    Duplicate contents are matched pairwise in chunk order, and a row that
+    already sits at the right index is preferred so unchanged documents
+    produce no moves at all.
+
+    Args:
+        existing: (row_id, chunk_index, md5_hash) for each stored row
+        new_contents: New chunk contents in chunk order
+
+    Returns:
+        ChunkDiff describing the minimal set of changes
+    """
+    by_hash: Dict[str, List[Tuple[int, Any]]] = defaultdict(list)
+    for row_id, chunk_index, digest in existing:
+        by_hash[digest].append((chunk_index, row_id))
+    for rows in by_hash.values():
+        rows.sort(key=lambda r: r[0])
+
+    diff = ChunkDiff()
+    for new_index, content in enumerate(new_contents):
+        candidates = by_hash.get(content_hash(content))
+        if not candidates:
+            diff.insert.append(new_index)
+            continue
+        pick = next(
+            (i for i, (idx, _) in enumerate(candidates) if idx == new_index), 0
+        )
+        old_index, row_id = candidates.pop(pick)
+        diff.keep[row_id] = new_index
+        if old_index != new_index:
+            diff.moved[row_id] = new_index
+
+    for rows in by_hash.values():
+        diff.delete.extend(row_id for _, row_id in rows)
+    return diff
+
+
+# =========================================================================
+# Binary encoding
+# =========================================================================
+
+
+def encode_vector(embedding: Sequence[float]) -> bytes:
+    """
+    Encode an embedding in pgvector's binary wire format.
+
+    Layout: int16 dimension, int16 unused (0), then float4 values,
+    all big-endian.
+    """
+    dim = len(embedding)
+    return struct.pack(f">HH{dim}f", dim, 0, *embedding)
+
+
+def _as_uuid(value: Any) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _field(payload: Optional[bytes]) -> bytes:
+    if payload is None:
+        return _NULL_FIELD
+    return struct.pack(">i", len(payload)) + payload
+
+
+def _text_field(value: Optional[str]) -> bytes:
+    return _field(value.encode("utf-8") if value is not None else None)
+
+
+def _uuid_field(value: Any) -> bytes:
+    return _field(_as_uuid(value).bytes if value is not None else None)
+
+
+def encode_copy_row(row: ChunkRow) -> bytes:
+    """Encode a single ChunkRow as a binary COPY tuple (CHUNK_COLUMNS order)."""
+    embedding = encode_vector(row.embedding) if row.embedding else None
+    return b"".join((
+        struct.pack(">h", len(CHUNK_COLUMNS)),
+        _text_field(row.source_type),
+        _uuid_field(row.source_id),
+        _uuid_field(row.organization_id),
+        _field(struct.pack(">i", row.chunk_index)),
+        _text_field(row.content),
+        _text_field(row.title),
+        _text_field(row.filename),
+        _text_field(row.url),
+        _field(embedding),
+        _text_field(row.source_type_filter),
+        _text_field(row.content_type),
+        _uuid_field(row.collection_id),
+        _uuid_field(row.sync_config_id),
+    ))
+
+
+def iter_copy_payload(rows: Iterable[ChunkRow]) -> Iterable[bytes]:
+    """
+    Yield a complete binary COPY stream for rows.
+
+    Rows are grouped into messages of COPY_ROWS_PER_MESSAGE tuples so the
+    stream never needs to hold the whole batch in memory at once.
+    """
+    yield _COPY_HEADER
+    buffer: List[bytes] = []
+    for row in rows:
+        buffer.append(encode_copy_row(row))
+        if len(buffer) >= COPY_ROWS_PER_MESSAGE:
+            yield b"".join(buffer)
+            buffer = []
+    if buffer:
+        yield b"".join(buffer)
+    yield _COPY_TRAILER
+
+
+async def _aiter_copy_payload(rows: Iterable[ChunkRow]) -> AsyncIterator[bytes]:
+    for part in iter_copy_payload(rows):
+        yield part
+
+
+# =========================================================================
+# Writers
+# =========================================================================
+
+
+async def write_chunks(session: AsyncSession, rows: List[ChunkRow]) -> int:
+    """
+    Upsert rows into search_chunks using the fastest path the driver supports.
+
+    The caller owns the transaction; nothing is committed here. On asyncpg
+    the caller must already have executed a statement in the transaction
+    (PgIndexService always deletes old chunks first) so the COPY runs inside
+    it rather than in autocommit mode.
+
+    Args:
+        session: Database session
+        rows: Chunk rows to write
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    conn = await session.connection()
+    if conn.dialect.driver == "asyncpg":
+        return await _copy_chunks(conn, rows)
+    return await _insert_chunks(session, rows)
+
+
+async def _copy_chunks(conn, rows: List[ChunkRow]) -> int:
+    """Binary COPY into the staging table, then upsert into search_chunks."""
+    raw = await conn.get_raw_connection()
+    pg = raw.driver_connection
+
+    await pg.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} "
+        f"(LIKE search_chunks INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+    )
+    await pg.copy_to_table(
+        STAGING_TABLE,
+        source=_aiter_copy_payload(rows),
+        columns=list(CHUNK_COLUMNS),
+        format="binary",
+    )
+
+    columns = ", ".join(CHUNK_COLUMNS)
+    await pg.execute(
+        f"INSERT INTO search_chunks ({columns}) "
+        f"SELECT {columns} FROM {STAGING_TABLE} "
+        f"{_UPSERT_CLAUSE}; "
+        f"TRUNCATE {STAGING_TABLE}"
+    )
+    logger.debug(f"Copied {len(rows)} chunks into search_chunks")
+    return len(rows)
+
+
+async def _insert_chunks(session: AsyncSession, rows: List[ChunkRow]) -> int:
+    """Multi-row INSERT ... ON CONFLICT fallback for non-asyncpg drivers."""
+    written = 0
+    columns = ", ".join(CHUNK_COLUMNS)
+
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        batch = rows[i : i + INSERT_BATCH_SIZE]
+
+        values_parts = []
+        params: Dict[str, Any] = {}
+        for j, row in enumerate(batch):
+            p = f"r{j}"
+            # Use CAST() syntax instead of :: to avoid conflicts with SQLAlchemy named params
+            values_parts.append(
+                f"(:{p}_source_type, CAST(:{p}_source_id AS UUID), "
+                f"CAST(:{p}_organization_id AS UUID), :{p}_chunk_index, "
+                f":{p}_content, :{p}_title, :{p}_filename, :{p}_url, "
+                f"CAST(:{p}_embedding AS vector), :{p}_source_type_filter, "
+                f":{p}_content_type, CAST(:{p}_collection_id AS UUID), "
+                f"CAST(:{p}_sync_config_id AS UUID))"
+            )
+            params[f"{p}_source_type"] = row.source_type
+            params[f"{p}_source_id"] = str(row.source_id)
+            params[f"{p}_organization_id"] = str(row.organization_id)
+            params[f"{p}_chunk_index"] = row.chunk_index
+            params[f"{p}_content"] = row.content
+            params[f"{p}_title"] = row.title
+            params[f"{p}_filename"] = row.filename
+            params[f"{p}_url"] = row.url
+            params[f"{p}_embedding"] = (
+                "[" + ",".join(str(f) for f in row.embedding) + "]"
+                if row.embedding
+                else None
+            )
+            params[f"{p}_source_type_filter"] = row.source_type_filter
+            params[f"{p}_content_type"] = row.content_type
+            params[f"{p}_collection_id"] = str(row.collection_id) if row.collection_id else None
+            params[f"{p}_sync_config_id"] = str(row.sync_config_id) if row.sync_config_id else None
+
+        values_sql = ",\n".join(values_parts)
+        sql = f"""
+            INSERT INTO search_chunks ({columns})
+            VALUES {values_sql}
+            {_UPSERT_CLAUSE}
+        """
+        await session.execute(text(sql), params)
+        written += len(batch)
+
+    return written
+
+
+async def write_documents(session: AsyncSession, docs: List[DocumentRow]) -> int:
+    """
+    Upsert search_documents rows with multi-row INSERT ... ON CONFLICT.
+
+    Stored metadata is replaced; namespaces owned by propagate_* calls
+    (e.g. custom) are re-applied by the indexing paths afterwards. If a
+    source appears more than once, the last row wins. The caller owns the
+    transaction.
+
+    Args:
+        session: Database session
+        docs: Document rows to write
+
+    Returns:
+        Number of rows written
+    """
+    unique = list({(d.source_type, str(d.source_id)): d for d in docs}.values())
+    written = 0
+
+    for i in range(0, len(unique), INSERT_BATCH_SIZE):
+        batch = unique[i : i + INSERT_BATCH_SIZE]
+
+        values_parts = []
+        params: Dict[str, Any] = {}
+        for j, doc in enumerate(batch):
+            p = f"d{j}"
+            values_parts.append(
+                f"(:{p}_source_type, CAST(:{p}_source_id AS UUID), "
+                f"CAST(:{p}_organization_id AS UUID), CAST(:{p}_metadata AS jsonb))"
+            )
+            params[f"{p}_source_type"] = doc.source_type
+            params[f"{p}_source_id"] = str(doc.source_id)
+            params[f"{p}_organization_id"] = str(doc.organization_id)
+            params[f"{p}_metadata"] = json.dumps(doc.metadata or {})
+
+        values_sql = ",\n".join(values_parts)
+        await session.execute(text(f"""
+            INSERT INTO search_documents (source_type, source_id, organization_id, metadata)
+            VALUES {values_sql}
+            ON CONFLICT (source_type, source_id)
+            DO UPDATE SET
+                organization_id = EXCLUDED.organization_id,
+                metadata = EXCLUDED.metadata,
+                updated_at = now()
+        """), params)
+        written += len(batch)
+
+    return written
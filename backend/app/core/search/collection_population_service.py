@@ -226,9 +226,11 @@ class CollectionPopulationService:
                 sc.chunk_index,
                 sc.content,
                 sc.title,
-                sc.metadata,
+                sd.metadata,
                 sc.embedding::text AS embedding_text
             FROM search_chunks sc
+            LEFT JOIN search_documents sd
+                ON sd.source_type = sc.source_type AND sd.source_id = sc.source_id
             WHERE sc.organization_id = :org_id
               AND sc.source_type = 'asset'
               AND sc.source_id = ANY(:asset_ids)
@@ -0,0 +1,288 @@
+# ============================================================================
+# backend/app/core/search/embedding_cache.py
+# ============================================================================
+"""
+Embedding Cache for Curatore v2 - Content-Hash Keyed Embedding Reuse
+
+This module caches embeddings by (model, dimensions, sha256(text)) so that
+byte-identical text is only ever sent to the embedding provider once.
+Re-extraction, reindexing, metadata-only refreshes and SAM description
+refreshes re-embed mostly unchanged chunks; with the cache those become
+Redis lookups instead of API calls.
+
+Architecture:
+    - Two tiers: a small in-process LRU in front of Redis; both hold packed
+      float32 bytes (~6 KB per 1536-dim vector instead of ~50 KB of floats)
+    - Redis DB 3 (Celery broker uses DB 0/1, pub/sub uses DB 2)
+    - Key pattern: curatore:emb:{model}:{dims}:{sha256}
+    - Values are packed float32 arrays (pgvector stores float4 anyway)
+    - TTL eviction; the TTL is refreshed on every hit, so entries that keep
+      being reused stay cached (approximate LRU across the cluster)
+    - Best-effort: any Redis failure is logged and treated as a miss, and
+      Redis is skipped for a short cooldown so indexing never waits on it
+
+Usage:
+    from app.core.search.embedding_cache import embedding_cache
+
+    cached = await embedding_cache.get_many(model, dims, texts)
+    await embedding_cache.set_many(model, dims, {text: embedding, ...})
+
+Configuration (config.yml):
+    search:
+      embedding_cache_enabled: true
+      embedding_cache_ttl_days: 30
+      embedding_cache_local_size: 10000
+
+Author: Curatore v2 Development Team
+Version: 2.0.0
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+import redis.asyncio as redis
+
+logger = logging.getLogger("curatore.search.embedding_cache")
+
+KEY_PREFIX = "curatore:emb:"
+
+# Seconds to skip Redis after a connection/command failure
+REDIS_COOLDOWN_SECONDS = 60.0
+
+DEFAULT_TTL_DAYS = 30
+DEFAULT_LOCAL_SIZE = 10000
+
+
+def _cache_redis_url() -> str:
+    """Build the Redis URL for the embedding cache (DB 3 on the broker host)."""
+    explicit = os.getenv("EMBEDDING_CACHE_REDIS_URL")
+    if explicit:
+        return explicit
+    base_redis_url = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
+    head, _, tail = base_redis_url.rpartition("/")
+    if head and tail.isdigit():
+        return f"{head}/3"
+    return base_redis_url.rstrip("/") + "/3"
+
+
+def encode_embedding(embedding: Sequence[float]) -> bytes:
+    """Pack an embedding as a float32 byte string."""
+    return array("f", embedding).tobytes()
+
+
+def decode_embedding(data: bytes) -> List[float]:
+    """Unpack a float32 byte string into a list of floats."""
+    values = array("f")
+    values.frombytes(data)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """
+    Two-tier (in-process LRU + Redis) embedding cache.
+
+    Attributes:
+        hits: Number of texts served from cache since process start
+        misses: Number of texts not found in cache since process start
+    """
+
+    def __init__(self):
+        """Initialize the cache; Redis is connected lazily per event loop."""
+        self._redis: Optional[redis.Redis] = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_disabled_until = 0.0
+        # Packed float32 values, decoded on hit
+        self._local: "OrderedDict[str, bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # =====================================================================
+    # Configuration
+    # =====================================================================
+
+    def _get_search_config(self):
+        try:
+            from app.core.shared.config_loader import config_loader
+            return config_loader.get_search_config()
+        except Exception:
+            return None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache should be consulted."""
+        config = self._get_search_config()
+        return config.embedding_cache_enabled if config else True
+
+    @property
+    def ttl_seconds(self) -> int:
+        config = self._get_search_config()
+        days = config.embedding_cache_ttl_days if config else DEFAULT_TTL_DAYS
+        return days * 86400
+
+    @property
+    def local_size(self) -> int:
+        config = self._get_search_config()
+        return config.embedding_cache_local_size if config else DEFAULT_LOCAL_SIZE
+
+    # =====================================================================
+    # Keys
+    # =====================================================================
+
+    @staticmethod
+    def make_key(model: str, dimensions: int, text: str) -> str:
+        """Build the cache key for a text under a given model and dimension."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}{model}:{dimensions}:{digest}"
+
+    # =====================================================================
+    # Redis
+    # =====================================================================
+
+    async def _get_redis(self) -> Optional[redis.Redis]:
+        """Get the Redis client for the current loop, or None during cooldown."""
+        if time.monotonic() < self._redis_disabled_until:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            # Clients are bound to the loop that created them; Celery tasks run
+            # each task in a fresh loop, so abandon the old client.
+            self._redis_loop = loop
+            self._redis = redis.from_url(
+                _cache_redis_url(),
+                decode_responses=False,
+                socket_connect_timeout=0.5,
+                socket_timeout=2.0,
+            )
+        return self._redis
+
+    def _redis_failed(self, error: Exception) -> None:
+        logger.debug(f"Embedding cache Redis unavailable, skipping for "
+                     f"{REDIS_COOLDOWN_SECONDS:.0f}s: {error}")
+        self._redis_disabled_until = time.monotonic() + REDIS_COOLDOWN_SECONDS
+        self._redis = None
+        self._redis_loop = None
+
+    # =====================================================================
+    # Local LRU
+    # =====================================================================
+
+    def _local_get(self, key: str) -> Optional[List[float]]:
+        value = self._local.get(key)
+        if value is None:
+            return None
+        self._local.move_to_end(key)
+        return decode_embedding(value)
+
+    def _local_put(self, key: str, value: bytes) -> None:
+        self._local[key] = value
+        self._local.move_to_end(key)
+        limit = self.local_size
+        while len(self._local) > limit:
+            self._local.popitem(last=False)
+
+    # =====================================================================
+    # Public API
+    # =====================================================================
+
+    async def get_many(
+        self, model: str, dimensions: int, texts: Sequence[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        Look up cached embeddings for texts.
+
+        Args:
+            model: Embedding model name
+            dimensions: Embedding output dimensions
+            texts: Texts exactly as they would be sent to the provider
+
+        Returns:
+            List aligned with texts; each entry is an embedding or None on miss
+        """
+        keys = [self.make_key(model, dimensions, t) for t in texts]
+        results: List[Optional[List[float]]] = [self._local_get(k) for k in keys]
+
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            client = await self._get_redis()
+            if client is not None:
+                try:
+                    missing_keys = [keys[i] for i in missing]
+                    values = await client.mget(missing_keys)
+                    hit_keys = []
+                    for i, value in zip(missing, values):
+                        if value is not None:
+                            results[i] = decode_embedding(value)
+                            self._local_put(keys[i], value)
+                            hit_keys.append(keys[i])
+                    if hit_keys:
+                        # Sliding TTL: entries that keep being reused stay cached
+                        ttl = self.ttl_seconds
+                        async with client.pipeline(transaction=False) as pipe:
+                            for key in hit_keys:
+                                pipe.expire(key, ttl)
+                            await pipe.execute()
+                except Exception as e:
+                    self._redis_failed(e)
+
+        hit_count = sum(1 for r in results if r is not None)
+        self.hits += hit_count
+        self.misses += len(results) - hit_count
+        return results
+
+    async def set_many(
+        self, model: str, dimensions: int, embeddings: Dict[str, List[float]]
+    ) -> None:
+        """
+        Store embeddings keyed by the text they were generated from.
+
+        All-zero vectors (the fallback for failed API calls) are never cached.
+
+        Args:
+            model: Embedding model name
+            dimensions: Embedding output dimensions
+            embeddings: Mapping of text to embedding
+        """
+        entries = {
+            self.make_key(model, dimensions, text): encode_embedding(embedding)
+            for text, embedding in embeddings.items()
+            if embedding and any(embedding)
+        }
+        if not entries:
+            return
+
+        for key, data in entries.items():
+            self._local_put(key, data)
+
+        client = await self._get_redis()
+        if client is None:
+            return
+        try:
+            ttl = self.ttl_seconds
+            async with client.pipeline(transaction=False) as pipe:
+                for key, data in entries.items():
+                    pipe.set(key, data, ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+
+    def clear_local(self) -> None:
+        """Drop the in-process tier (Redis entries expire on their own)."""
+        self._local.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and local tier size for this process."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "local_entries": len(self._local),
+        }
+
+
+# Global cache instance
+embedding_cache = EmbeddingCache()
@@ -8,8 +8,12 @@ This module provides embedding generation using OpenAI's text-embedding API
 for semantic search capabilities. Uses the model configured in llm.models.embedding.
 
 Key Features:
-    - Fast API-based embedding generation
-    - Batch processing for efficient indexing
+    - Native asyncio client (AsyncOpenAI over a shared httpx connection pool)
+    - Token-budgeted batches sized with document_chunker.count_tokens
+    - AIMD concurrency control: in-flight batches grow until the provider
+      returns 429s, then back off using the provider's retry-after hint
+    - Content-hash embedding cache (see embedding_cache) so unchanged text
+      is never re-embedded
     - Uses LLM connection settings from config.yml
     - Cost-effective (~$0.02 per 1M tokens for text-embedding-3-small)
 
@@ -40,9 +44,15 @@ Version: 2.0.0
 import asyncio
 import logging
 import os
-import time
 from functools import lru_cache
-from typing import List, Optional
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+import httpx
+
+from app.core.utils.http_clients import close_at_loop_shutdown
+
+from .document_chunker import document_chunker
+from .embedding_cache import embedding_cache
 
 logger = logging.getLogger("curatore.embedding_service")
 
@@ -52,6 +62,21 @@ INITIAL_BACKOFF_SECONDS = 0.5
 MAX_BACKOFF_SECONDS = 10.0
 BACKOFF_MULTIPLIER = 2.0
 
+# Adaptive (AIMD) concurrency constants
+INITIAL_CONCURRENCY = 4
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 32
+CONCURRENCY_DECREASE_FACTOR = 0.5
+
+# Request sizing: OpenAI accepts up to 2048 inputs and ~300K tokens per request.
+# Stay well under the token limit so one request never dominates the quota.
+MAX_BATCH_TOKENS = 100_000
+MAX_BATCH_ITEMS = 2048
+
+# Shared connection pool for embedding requests
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE = 32
+
 # Known embedding dimensions for common models
 EMBEDDING_DIMENSIONS = {
     "text-embedding-3-small": 1536,
@@ -59,6 +84,94 @@ EMBEDDING_DIMENSIONS = {
     "text-embedding-ada-002": 1536,
 }
 
+# Per-text character limits applied before embedding
+# Single requests: ~4 chars per token, 8191 token limit, so ~30000 chars is safe
+SINGLE_MAX_CHARS = 30000
+# Batch requests: 8000 chars leaves room for batching under the request token limit
+BATCH_MAX_CHARS = 8000
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Additive-increase / multiplicative-decrease limit on in-flight requests.
+
+    Each successful request raises the limit by 1/limit (about +1 per round
+    of requests); a rate-limited request halves it and pauses new requests
+    until the provider's retry-after has elapsed. Only requests started after
+    the last decrease can trigger another one, so a burst of 429s from one
+    congestion event shrinks the window once, not once per request.
+
+    Instances bind to the event loop they are first used on.
+    """
+
+    def __init__(
+        self,
+        initial: int = INITIAL_CONCURRENCY,
+        minimum: int = MIN_CONCURRENCY,
+        maximum: int = MAX_CONCURRENCY,
+    ):
+        self._limit = float(initial)
+        self._min = minimum
+        self._max = maximum
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._last_decrease = 0.0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self._min, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot and any active rate-limit pause.
+
+        Returns:
+            Loop time at which the request started (pass to release())
+        """
+        loop = asyncio.get_running_loop()
+        async with self._cond:
+            while self._in_flight >= self.limit:
+                await self._cond.wait()
+            self._in_flight += 1
+        delay = self._resume_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return loop.time()
+
+    async def release(
+        self, started: float, rate_limited: bool = False, retry_after: float = 0.0
+    ) -> None:
+        """
+        Free a slot and adjust the limit based on the request outcome.
+
+        Args:
+            started: Value returned by acquire()
+            rate_limited: Whether the provider rejected the request with a 429
+            retry_after: Seconds the provider asked us to wait
+        """
+        now = asyncio.get_running_loop().time()
+        async with self._cond:
+            self._in_flight -= 1
+            if rate_limited:
+                if started >= self._last_decrease:
+                    self._limit = max(
+                        float(self._min), self._limit * CONCURRENCY_DECREASE_FACTOR
+                    )
+                    self._last_decrease = now
+                    logger.info(
+                        f"Embedding rate limited, concurrency reduced to {self.limit}"
+                    )
+                self._resume_at = max(self._resume_at, now + retry_after)
+            else:
+                self._limit = min(float(self._max), self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
 
 class EmbeddingService:
     """
@@ -71,8 +184,10 @@ class EmbeddingService:
         model_name: OpenAI model identifier (from llm.models.embedding.model)
         embedding_dim: Dimension of output embeddings (auto-detected)
 
-    Thread Safety:
-        The service uses the OpenAI sync client with asyncio executor.
+    Concurrency:
+        Requests run on the event loop via AsyncOpenAI. A per-loop
+        AdaptiveConcurrencyLimiter bounds in-flight requests across all
+        callers in the process; no executor threads are used.
     """
 
     DEFAULT_MODEL = "text-embedding-3-small"
@@ -81,6 +196,9 @@ class EmbeddingService:
     def __init__(self):
         """Initialize the embedding service."""
         self._client = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client_closer: Optional[AsyncIterator[None]] = None
+        self._limiter: Optional[AdaptiveConcurrencyLimiter] = None
         self._model_name = None
         self._embedding_dim = None
         self._configured_dimensions = None
@@ -131,7 +249,18 @@ class EmbeddingService:
         )
 
     def _get_retry_after(self, error: Exception) -> float:
-        """Extract retry-after time from error message if available."""
+        """Extract retry-after time from response headers or error message."""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers:
+            try:
+                if headers.get("retry-after-ms"):
+                    return float(headers["retry-after-ms"]) / 1000.0
+                if headers.get("retry-after"):
+                    return float(headers["retry-after"])
+            except (TypeError, ValueError):
+                pass
+
         error_str = str(error)
         # Look for patterns like "try again in 1.049s" or "retry after 2 seconds"
         import re
@@ -146,24 +275,37 @@ class EmbeddingService:
 
     def _get_client(self):
         """
-        Get or create the OpenAI client using LLM config.
+        Get or create the AsyncOpenAI client for the running event loop.
+
+        The client shares one httpx connection pool across all requests on
+        the loop. Celery tasks run each task in a fresh loop (asyncio.run),
+        and httpx clients cannot be reused across loops, so a new client and
+        limiter are created whenever the loop changes. Each client is closed
+        when its loop shuts down, so finished tasks do not leak connections.
+
+        SDK-level retries are disabled so that 429s reach the AIMD limiter.
 
         Returns:
-            OpenAI client instance
+            AsyncOpenAI client instance
         """
-        if self._client is None:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
             try:
-                from openai import OpenAI
+                from openai import AsyncOpenAI
 
                 llm_config = self._get_config()
 
                 # Get API key from config or environment
                 api_key = None
                 base_url = None
+                timeout = 60
+                verify_ssl = True
 
                 if llm_config:
                     api_key = llm_config.api_key
                     base_url = llm_config.base_url
+                    timeout = llm_config.timeout
+                    verify_ssl = llm_config.verify_ssl
 
                 # Fallback to environment variables
                 if not api_key:
@@ -176,13 +318,29 @@ class EmbeddingService:
                         "OPENAI_API_KEY not set. Configure in config.yml or environment."
                     )
 
+                http_client = httpx.AsyncClient(
+                    verify=verify_ssl,
+                    timeout=timeout,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                    ),
+                )
+
                 # Create client with configured endpoint
-                client_kwargs = {"api_key": api_key}
+                client_kwargs = {
+                    "api_key": api_key,
+                    "http_client": http_client,
+                    "max_retries": 0,
+                }
                 if base_url:
                     client_kwargs["base_url"] = base_url
 
-                self._client = OpenAI(**client_kwargs)
-                logger.info(f"OpenAI client initialized for embeddings (model: {self._get_model_name()})")
+                self._client = AsyncOpenAI(**client_kwargs)
+                self._client_loop = loop
+                self._client_closer = close_at_loop_shutdown(http_client)
+                self._limiter = AdaptiveConcurrencyLimiter()
+                logger.info(f"AsyncOpenAI client initialized for embeddings (model: {self._get_model_name()})")
 
             except ImportError:
                 logger.error("openai package not installed. Run: pip install openai")
@@ -193,179 +351,188 @@ class EmbeddingService:
 
         return self._client
 
-    def _generate_embedding_sync(self, text: str) -> List[float]:
-        """
-        Generate embedding synchronously.
-
-        Args:
-            text: Text to embed
-
-        Returns:
-            List of floats representing the embedding
-        """
-        client = self._get_client()
-        model = self._get_model_name()
+    def _get_limiter(self) -> AdaptiveConcurrencyLimiter:
+        """Get the concurrency limiter bound to the current client's loop."""
+        self._get_client()
+        return self._limiter
 
-        # Truncate very long texts (OpenAI has 8191 token limit)
-        # ~4 chars per token, so ~30000 chars is safe
-        max_chars = 30000
+    @staticmethod
+    def _clean_text(text: str, max_chars: int) -> str:
+        """Truncate text to max_chars and replace blank text with a placeholder."""
         if len(text) > max_chars:
             text = text[:max_chars]
-
-        # Handle empty text
         if not text.strip():
             text = "empty"
+        return text
 
-        response = client.embeddings.create(**self._embedding_kwargs(model, text))
-        return response.data[0].embedding
-
-    def _generate_embeddings_batch_sync(self, texts: List[str]) -> List[List[float]]:
+    async def _with_cache(
+        self,
+        texts: List[str],
+        embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> List[List[float]]:
         """
-        Generate embeddings for multiple texts synchronously.
-
-        OpenAI supports batching up to 2048 inputs per request, but also has
-        a token limit per request (~300K tokens). We use smaller batches to
-        stay safely under the limit.
+        Serve embeddings from the content-hash cache, embedding only misses.
 
-        Includes exponential backoff retry for rate limit errors.
+        Texts must already be cleaned so the cache key matches exactly what
+        is sent to the provider. Duplicate texts within one call are embedded
+        once. Cache failures degrade to calling the provider for everything.
 
         Args:
-            texts: List of texts to embed
+            texts: Cleaned texts to embed
+            embed: Coroutine function that embeds a list of texts via the API
 
         Returns:
-            List of embeddings, one per input text
+            List of embeddings, one per input text, in the same order
         """
-        client = self._get_client()
+        if not embedding_cache.enabled:
+            return await embed(texts)
+
         model = self._get_model_name()
+        dims = self.embedding_dim
+        cached = await embedding_cache.get_many(model, dims, texts)
+
+        missing = list(dict.fromkeys(t for t, c in zip(texts, cached) if c is None))
+        fresh = {}
+        if missing:
+            fresh = dict(zip(missing, await embed(missing)))
+            await embedding_cache.set_many(model, dims, fresh)
+            logger.debug(
+                f"Embedding cache: {len(texts) - len(missing)} hits, "
+                f"{len(missing)} texts sent to provider"
+            )
+
+        return [c if c is not None else fresh[t] for t, c in zip(texts, cached)]
+
+    def _token_batches(self, texts: List[str]) -> List[Tuple[int, List[str]]]:
+        """
+        Split texts into request batches bounded by token count.
 
-        # Truncate texts more aggressively to avoid token limits
-        # ~4 chars per token, 8000 tokens per text max = ~32000 chars
-        # But use 8000 chars to be safe and leave room for batching
-        max_chars = 8000
-        cleaned_texts = []
-        for t in texts:
-            if len(t) > max_chars:
-                t = t[:max_chars]
-            if not t.strip():
-                t = "empty"
-            cleaned_texts.append(t)
-
-        # Use smaller batch size to stay under token limits
-        # 50 texts * 8000 chars / 4 chars/token = ~100K tokens per batch (safe)
-        all_embeddings = []
-        batch_size = 50
-
-        for i in range(0, len(cleaned_texts), batch_size):
-            batch = cleaned_texts[i : i + batch_size]
-            batch_embeddings = self._embed_batch_with_retry(client, model, batch)
-            all_embeddings.extend(batch_embeddings)
-
-        return all_embeddings
-
-    def _embed_batch_with_retry(
-        self, client, model: str, batch: List[str]
-    ) -> List[List[float]]:
+        Token counts come from document_chunker.count_tokens, so a batch of
+        short SAM descriptions can carry far more items than a batch of full
+        PDF chunks while both stay under MAX_BATCH_TOKENS.
+
+        Returns:
+            List of (start_offset, batch_texts) tuples covering texts in order
+        """
+        batches: List[Tuple[int, List[str]]] = []
+        current: List[str] = []
+        current_tokens = 0
+        start = 0
+
+        for i, text in enumerate(texts):
+            tokens = max(1, document_chunker.count_tokens(text))
+            if current and (
+                current_tokens + tokens > MAX_BATCH_TOKENS
+                or len(current) >= MAX_BATCH_ITEMS
+            ):
+                batches.append((start, current))
+                current, current_tokens, start = [], 0, i
+            current.append(text)
+            current_tokens += tokens
+
+        if current:
+            batches.append((start, current))
+        return batches
+
+    async def _request_embeddings(self, input_data) -> List[List[float]]:
         """
-        Embed a batch of texts with exponential backoff retry for rate limits.
+        Make one embeddings request under the adaptive limiter.
+
+        Rate-limited requests are retried with backoff (honouring the
+        provider's retry-after); other errors are raised to the caller.
 
         Args:
-            client: OpenAI client
-            model: Model name
-            batch: List of texts to embed
+            input_data: A single text or a list of texts
 
         Returns:
-            List of embeddings for the batch
+            List of embeddings in input order
         """
+        client = self._get_client()
+        limiter = self._get_limiter()
+        model = self._get_model_name()
         backoff = INITIAL_BACKOFF_SECONDS
 
         for attempt in range(MAX_RETRIES):
+            started = await limiter.acquire()
             try:
-                response = client.embeddings.create(**self._embedding_kwargs(model, batch))
-                # Response data is in same order as input
-                return [item.embedding for item in response.data]
+                response = await client.embeddings.create(
+                    **self._embedding_kwargs(model, input_data)
+                )
+            except Exception as e:
+                if self._is_rate_limit_error(e) and attempt < MAX_RETRIES - 1:
+                    # Get retry time from error or use exponential backoff
+                    wait_time = self._get_retry_after(e)
+                    wait_time = min(max(wait_time, backoff), MAX_BACKOFF_SECONDS)
+                    await limiter.release(started, rate_limited=True, retry_after=wait_time)
+                    logger.warning(
+                        f"Rate limit hit, waiting {wait_time:.1f}s before retry "
+                        f"(attempt {attempt + 1}/{MAX_RETRIES}, "
+                        f"concurrency={limiter.limit})"
+                    )
+                    backoff = min(backoff * BACKOFF_MULTIPLIER, MAX_BACKOFF_SECONDS)
+                    continue
+                await limiter.release(started, rate_limited=self._is_rate_limit_error(e))
+                raise
+            await limiter.release(started)
+            # Response data is in same order as input
+            return [item.embedding for item in response.data]
+
+        raise RuntimeError(f"Rate limit persists after {MAX_RETRIES} retries")
+
+    async def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embed one batch, falling back to one-at-a-time requests on failure.
 
+        Texts that still fail individually get a zero vector so callers
+        always receive one embedding per input.
+        """
+        try:
+            return await self._request_embeddings(batch)
+        except Exception as e:
+            logger.warning(
+                f"Batch embedding failed ({len(batch)} texts), "
+                f"falling back to individual requests: {e}"
+            )
+
+        async def _embed_one(text: str) -> List[float]:
+            try:
+                return (await self._request_embeddings(text))[0]
             except Exception as e:
-                if self._is_rate_limit_error(e):
-                    if attempt < MAX_RETRIES - 1:
-                        # Get retry time from error or use exponential backoff
-                        wait_time = self._get_retry_after(e)
-                        wait_time = max(wait_time, backoff)
-                        wait_time = min(wait_time, MAX_BACKOFF_SECONDS)
-
-                        logger.warning(
-                            f"Rate limit hit, waiting {wait_time:.1f}s before retry "
-                            f"(attempt {attempt + 1}/{MAX_RETRIES})"
-                        )
-                        time.sleep(wait_time)
-                        backoff = min(backoff * BACKOFF_MULTIPLIER, MAX_BACKOFF_SECONDS)
-                        continue
-                    else:
-                        logger.error(
-                            f"Rate limit persists after {MAX_RETRIES} retries, "
-                            f"falling back to individual requests"
-                        )
-                else:
-                    logger.warning(f"Batch embedding failed: {e}")
-
-                # Fall back to one-at-a-time processing
-                return self._embed_individually_with_retry(client, model, batch)
-
-        # Should not reach here, but return zeros as fallback
-        return [[0.0] * self.embedding_dim for _ in batch]
-
-    def _embed_individually_with_retry(
-        self, client, model: str, texts: List[str]
+                logger.error(f"Single embedding failed: {e}")
+                # Use zero vector for failed embeddings
+                return [0.0] * self.embedding_dim
+
+        return list(await asyncio.gather(*(_embed_one(t) for t in batch)))
+
+    async def _embed_texts(
+        self, texts: List[str], max_concurrent: Optional[int] = None
     ) -> List[List[float]]:
         """
-        Embed texts one at a time with rate limit handling.
+        Embed cleaned texts with token-sized batches fired concurrently.
+
+        Concurrency is governed by the shared AIMD limiter; max_concurrent
+        additionally caps how many of this call's batches are in flight.
 
         Args:
-            client: OpenAI client
-            model: Model name
-            texts: List of texts to embed
+            texts: Cleaned texts to embed
+            max_concurrent: Optional per-call cap on in-flight batches
 
         Returns:
-            List of embeddings
+            List of embeddings, one per input text, in the same order
         """
-        results = []
-        backoff = INITIAL_BACKOFF_SECONDS
-
-        for text in texts:
-            embedding = None
-
-            for attempt in range(MAX_RETRIES):
-                try:
-                    response = client.embeddings.create(**self._embedding_kwargs(model, text))
-                    embedding = response.data[0].embedding
-                    # Reset backoff on success
-                    backoff = INITIAL_BACKOFF_SECONDS
-                    break
-
-                except Exception as e:
-                    if self._is_rate_limit_error(e):
-                        if attempt < MAX_RETRIES - 1:
-                            wait_time = self._get_retry_after(e)
-                            wait_time = max(wait_time, backoff)
-                            wait_time = min(wait_time, MAX_BACKOFF_SECONDS)
-
-                            logger.debug(
-                                f"Rate limit on single embed, waiting {wait_time:.1f}s"
-                            )
-                            time.sleep(wait_time)
-                            backoff = min(
-                                backoff * BACKOFF_MULTIPLIER, MAX_BACKOFF_SECONDS
-                            )
-                            continue
-                    else:
-                        logger.error(f"Single embedding failed: {e}")
-                        break
-
-            if embedding is None:
-                # Use zero vector for failed embeddings
-                embedding = [0.0] * self.embedding_dim
-
-            results.append(embedding)
+        batches = self._token_batches(texts)
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+
+        async def _run(start: int, batch: List[str]) -> None:
+            if semaphore:
+                async with semaphore:
+                    embeddings = await self._embed_batch(batch)
+            else:
+                embeddings = await self._embed_batch(batch)
+            results[start:start + len(batch)] = embeddings
 
+        await asyncio.gather(*(_run(start, batch) for start, batch in batches))
         return results
 
     async def get_embedding(self, text: str) -> List[float]:
@@ -382,8 +549,8 @@ class EmbeddingService:
             ValueError: If API key is not configured
             Exception: If API call fails
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._generate_embedding_sync, text)
+        cleaned = self._clean_text(text, SINGLE_MAX_CHARS)
+        return (await self._with_cache([cleaned], self._request_embeddings))[0]
 
     async def get_embeddings_batch(
         self, texts: List[str], batch_size: int = 100
@@ -391,26 +558,25 @@ class EmbeddingService:
         """
         Generate embeddings for multiple texts efficiently.
 
-        OpenAI's API supports batching natively, making this very efficient.
+        Texts are packed into token-budgeted requests that run concurrently
+        under the adaptive limiter. Texts already present in the embedding
+        cache are not sent to the API.
 
         Args:
             texts: List of texts to embed
-            batch_size: Ignored (OpenAI handles batching internally)
+            batch_size: Ignored (batches are sized by token count)
 
         Returns:
             List of embeddings, one per input text
 
         Raises:
             ValueError: If API key is not configured
-            Exception: If API call fails
         """
         if not texts:
             return []
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self._generate_embeddings_batch_sync, texts
-        )
+        cleaned = [self._clean_text(t, BATCH_MAX_CHARS) for t in texts]
+        return await self._with_cache(cleaned, self._embed_texts)
 
     async def get_embeddings_batch_concurrent(
         self,
@@ -419,17 +585,17 @@ class EmbeddingService:
         batch_size: int = 50,
     ) -> List[List[float]]:
         """
-        Generate embeddings for many texts using concurrent API calls.
+        Generate embeddings for many texts with a per-call concurrency cap.
 
-        Splits texts into sub-batches and fires them concurrently (bounded
-        by a semaphore) via run_in_executor. This achieves true concurrency
-        since each call runs in its own thread. Useful for large re-index
-        operations where hundreds/thousands of texts need embedding.
+        Same as get_embeddings_batch, but at most max_concurrent of this
+        call's requests are in flight at once (the shared adaptive limiter
+        still applies). Useful for large re-index operations where
+        hundreds/thousands of texts need embedding.
 
         Args:
             texts: List of texts to embed
-            max_concurrent: Maximum number of concurrent API calls
-            batch_size: Number of texts per API call (default 50)
+            max_concurrent: Maximum number of concurrent API calls for this call
+            batch_size: Ignored (batches are sized by token count)
 
         Returns:
             List of embeddings, one per input text, in the same order
@@ -437,52 +603,11 @@ class EmbeddingService:
         if not texts:
             return []
 
-        # Split into sub-batches
-        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
-        results: List[Optional[List[List[float]]]] = [None] * len(batches)
-
-        loop = asyncio.get_event_loop()
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def _embed_batch(idx: int, batch: List[str]):
-            async with semaphore:
-                try:
-                    embeddings = await loop.run_in_executor(
-                        None, self._generate_embeddings_batch_sync, batch
-                    )
-                    results[idx] = embeddings
-                except Exception as e:
-                    logger.warning(
-                        f"Concurrent batch {idx} failed ({len(batch)} texts): {e}"
-                    )
-                    results[idx] = None
-
-        # Fire all batches concurrently
-        tasks = [_embed_batch(i, batch) for i, batch in enumerate(batches)]
-        await asyncio.gather(*tasks)
-
-        # Collect results; retry failed batches sequentially as fallback
-        all_embeddings: List[List[float]] = []
-        for idx, batch_result in enumerate(results):
-            if batch_result is not None:
-                all_embeddings.extend(batch_result)
-            else:
-                # Retry this batch sequentially
-                logger.info(f"Retrying batch {idx} sequentially")
-                batch = batches[idx]
-                try:
-                    fallback = await loop.run_in_executor(
-                        None, self._generate_embeddings_batch_sync, batch
-                    )
-                    all_embeddings.extend(fallback)
-                except Exception as e:
-                    logger.error(f"Sequential retry of batch {idx} also failed: {e}")
-                    # Use zero vectors for the entire failed batch
-                    all_embeddings.extend(
-                        [[0.0] * self.embedding_dim for _ in batch]
-                    )
+        async def _embed(missing: List[str]) -> List[List[float]]:
+            return await self._embed_texts(missing, max_concurrent=max_concurrent)
 
-        return all_embeddings
+        cleaned = [self._clean_text(t, BATCH_MAX_CHARS) for t in texts]
+        return await self._with_cache(cleaned, _embed)
 
     @property
     def embedding_dim(self) -> int:
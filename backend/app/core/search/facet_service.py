@@ -0,0 +1,500 @@
+# ============================================================================
+# backend/app/core/search/facet_service.py
+# ============================================================================
+"""
+Facet Service for Curatore v2 - Faceted Aggregations for Search and Browse
+
+Computes facet buckets (value -> document count) for search result sidebars
+and browse pages.
+
+Key Features:
+    - Single scan: every requested facet is aggregated from one pass over the
+      matching documents (one CROSS JOIN LATERAL row per facet value),
+      instead of one aggregation query per facet
+    - Registry facets: any facet from the metadata registry (agency,
+      notice_type, set_aside, ...) resolves to its JSON path per source type
+      and is read from search_documents.metadata
+    - Precomputed browse counts: search_facet_counts holds per-organization
+      counts per (source_type, facet, value), kept current by triggers on
+      search_documents, so browse facets are a small indexed read
+    - Result cache per (organization, filter hash), shared across processes
+      (SharedCache) and dropped by PgSearchService.invalidate_metadata_cache()
+
+Facet Paths:
+    The triggers read facet paths from search_facet_paths. sync_facet_paths()
+    writes the registry's facet mappings there and rebuilds the counts when
+    they changed; browse reads call it lazily, on a session of its own,
+    whenever the registry's mappings differ from the last sync in this
+    process.
+
+Usage:
+    from app.core.search.facet_service import facet_service
+
+    # Facets for a search query (source_type, content_type, registry facets)
+    facets = await facet_service.get_search_facets(
+        session, org_id, fts_query, ["source_type", "agency"], facet_size=10
+    )
+
+    # Browse facets from precomputed counts
+    facets = await facet_service.get_browse_facets(
+        session, org_id, ["agency", "notice_type"], source_types=["sam_notice"]
+    )
+
+Author: Curatore v2 Development Team
+Version: 2.0.0
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.shared.shared_cache import SharedCache
+
+from .pg_search_service import Facet, FacetBucket
+
+logger = logging.getLogger("curatore.search.facet_service")
+
+# Facets computed by search_with_facets() when none are requested
+DEFAULT_SEARCH_FACETS = ["source_type", "content_type"]
+
+# Seconds a cached facet result is reused
+FACET_CACHE_TTL = 60
+
+# Cached facet results kept in process (least recently used evicted first)
+FACET_CACHE_MAX_ENTRIES = 2048
+
+# Built-in facets computed from search_chunks columns
+_SOURCE_TYPE_EXPR = """CASE
+                WHEN m.source_type = 'asset' THEN m.source_type_filter
+                WHEN m.source_type IN ('ag_forecast', 'apfs_forecast', 'state_forecast') THEN 'forecast'
+                WHEN m.source_type = 'salesforce_account' THEN 'Accounts'
+                WHEN m.source_type = 'salesforce_contact' THEN 'Contacts'
+                WHEN m.source_type = 'salesforce_opportunity' THEN 'Opportunities'
+            END"""
+_CONTENT_TYPE_EXPR = "CASE WHEN m.source_type = 'asset' THEN m.content_type END"
+
+# Top buckets per facet, plus one row per facet with the remaining count
+_TOP_BUCKETS_SQL = """
+    WITH counts AS ({counts_sql}),
+    ranked AS (
+        SELECT facet_name, value, count,
+               ROW_NUMBER() OVER (PARTITION BY facet_name ORDER BY count DESC, value) AS rn
+        FROM counts
+    )
+    SELECT facet_name, value, count, false AS is_other
+    FROM ranked WHERE rn <= :facet_size
+    UNION ALL
+    SELECT facet_name, NULL, SUM(count), true
+    FROM ranked WHERE rn > :facet_size
+    GROUP BY facet_name
+"""
+
+
+def facet_cache_key(**parts: Any) -> str:
+    """Stable hash of the inputs that determine a facet result."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_facets(rows: List[Any], facet_names: List[str]) -> Dict[str, Facet]:
+    """
+    Turn _TOP_BUCKETS_SQL rows into Facet objects.
+
+    Every requested facet is present in the result, possibly with no buckets.
+    """
+    facets = {name: Facet(field=name, buckets=[]) for name in facet_names}
+    for row in rows:
+        facet = facets.get(row.facet_name)
+        if facet is None:
+            continue
+        if row.is_other:
+            facet.total_other = int(row.count or 0)
+        else:
+            facet.buckets.append(FacetBucket(value=row.value, count=int(row.count)))
+    return facets
+
+
+def _encode_facets(facets: Dict[str, Facet]) -> Dict[str, Any]:
+    return {
+        name: {
+            "buckets": [[b.value, b.count] for b in facet.buckets],
+            "total_other": facet.total_other,
+        }
+        for name, facet in facets.items()
+    }
+
+
+def _decode_facets(data: Dict[str, Any]) -> Dict[str, Facet]:
+    return {
+        name: Facet(
+            field=name,
+            buckets=[FacetBucket(value=v, count=c) for v, c in facet["buckets"]],
+            total_other=facet["total_other"],
+        )
+        for name, facet in data.items()
+    }
+
+
+class FacetService:
+    """
+    Faceted aggregation over search_chunks / search_documents.
+
+    Results are cached per organization (shared across processes);
+    invalidate() drops an organization's entries after its index or
+    metadata changes.
+    """
+
+    def __init__(self):
+        """Initialize the service with empty caches."""
+        self._cache = SharedCache(
+            "search_facets",
+            ttl=FACET_CACHE_TTL,
+            max_entries=FACET_CACHE_MAX_ENTRIES,
+            encode=_encode_facets,
+            decode=_decode_facets,
+        )
+        self._synced_paths: Optional[List[Tuple[str, str, str]]] = None
+
+    def invalidate(self, organization_id: Optional[UUID] = None) -> None:
+        """Drop cached facet results for an organization (or all), in every process."""
+        self._cache.invalidate(str(organization_id) if organization_id else None)
+
+    # =====================================================================
+    # Registry Paths
+    # =====================================================================
+
+    def _registry_paths(self) -> List[Tuple[str, str, str]]:
+        """(facet_name, source_type, json_path) for every registry facet mapping."""
+        from app.core.metadata.registry_service import metadata_registry_service
+
+        paths = []
+        for facet_name, facet_def in metadata_registry_service.get_facet_definitions().items():
+            for source_type, json_path in (facet_def.get("mappings") or {}).items():
+                if json_path and "." in json_path:
+                    paths.append((facet_name, source_type, json_path))
+        return sorted(paths)
+
+    def _registry_facet_expr(
+        self,
+        facet_name: str,
+        params: Dict[str, Any],
+        paths: List[Tuple[str, str, str]],
+    ) -> Optional[str]:
+        """CASE expression reading a registry facet from sd.metadata (bound params)."""
+        whens = []
+        for facet, source_type, json_path in paths:
+            if facet != facet_name:
+                continue
+            idx = len([k for k in params if k.startswith("fst_")])
+            namespace, field = json_path.split(".", 1)
+            params[f"fst_{idx}"] = source_type
+            params[f"fns_{idx}"] = namespace
+            params[f"ffield_{idx}"] = field
+            whens.append(
+                f"WHEN m.source_type = :fst_{idx} "
+                f"THEN sd.metadata -> CAST(:fns_{idx} AS text) ->> CAST(:ffield_{idx} AS text)"
+            )
+        if not whens:
+            return None
+        return "CASE " + " ".join(whens) + " END"
+
+    async def sync_facet_paths(
+        self,
+        session: AsyncSession,
+        force_rebuild: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Write the registry's facet paths to search_facet_paths.
+
+        When the stored paths differ (or force_rebuild is set), the counts of
+        every organization are rebuilt in the same transaction. The caller
+        commits.
+
+        Returns:
+            Dict with changed flag, path count and rebuilt row count
+        """
+        desired = self._registry_paths()
+        result = await session.execute(text(
+            "SELECT facet_name, source_type, json_path FROM search_facet_paths"
+        ))
+        current = sorted((r.facet_name, r.source_type, r.json_path) for r in result.fetchall())
+
+        changed = current != desired
+        rebuilt = 0
+        if changed:
+            await session.execute(text("DELETE FROM search_facet_paths"))
+            if desired:
+                await session.execute(
+                    text("""
+                        INSERT INTO search_facet_paths (facet_name, source_type, json_path)
+                        SELECT * FROM unnest(
+                            CAST(:facets AS text[]), CAST(:source_types AS text[]),
+                            CAST(:paths AS text[])
+                        )
+                    """),
+                    {
+                        "facets": [p[0] for p in desired],
+                        "source_types": [p[1] for p in desired],
+                        "paths": [p[2] for p in desired],
+                    },
+                )
+        if changed or force_rebuild:
+            rebuilt = await self.rebuild_counts(session)
+
+        self._synced_paths = desired
+        if changed:
+            logger.info(f"Synced {len(desired)} facet paths, rebuilt {rebuilt} facet count rows")
+        return {"changed": changed, "paths": len(desired), "rows": rebuilt}
+
+    async def _ensure_paths_synced(self) -> None:
+        """
+        Sync paths if the registry changed since this process last synced.
+
+        Runs and commits on its own session so a read never commits the
+        caller's pending changes.
+        """
+        if self._synced_paths == self._registry_paths():
+            return
+        from app.core.shared.database_service import database_service
+
+        try:
+            async with database_service.get_session() as sync_session:
+                await self.sync_facet_paths(sync_session)
+        except Exception:
+            # Not committed; retry on the next read
+            self._synced_paths = None
+            raise
+
+    # =====================================================================
+    # Precomputed Counts
+    # =====================================================================
+
+    async def rebuild_counts(
+        self,
+        session: AsyncSession,
+        organization_id: Optional[UUID] = None,
+    ) -> int:
+        """
+        Recompute search_facet_counts from search_documents.
+
+        Takes a lock that blocks the count triggers until the caller commits,
+        so concurrent indexing cannot interleave with the rebuild.
+
+        Args:
+            session: Database session (caller commits)
+            organization_id: Rebuild one organization (default: all)
+
+        Returns:
+            Number of count rows written
+        """
+        await session.execute(text(
+            "LOCK TABLE search_facet_counts IN SHARE ROW EXCLUSIVE MODE"
+        ))
+
+        org_clause = ""
+        params: Dict[str, Any] = {}
+        if organization_id is not None:
+            org_clause = "WHERE organization_id = CAST(:org_id AS UUID)"
+            params["org_id"] = str(organization_id)
+
+        await session.execute(text(f"DELETE FROM search_facet_counts {org_clause}"), params)
+        result = await session.execute(text(f"""
+            INSERT INTO search_facet_counts
+                (organization_id, source_type, facet_name, value, doc_count)
+            SELECT d.organization_id, d.source_type, f.facet_name, f.value, COUNT(*)
+            FROM search_documents d,
+                 search_document_facet_values(d.source_type, d.metadata) f
+            {org_clause.replace('organization_id', 'd.organization_id')}
+            GROUP BY 1, 2, 3, 4
+        """), params)
+
+        self.invalidate(organization_id)
+        return result.rowcount or 0
+
+    async def get_browse_facets(
+        self,
+        session: AsyncSession,
+        organization_id: UUID,
+        facet_names: List[str],
+        source_types: Optional[List[str]] = None,
+        facet_size: int = 20,
+    ) -> Dict[str, Facet]:
+        """
+        Facet counts over all indexed documents (no query) from search_facet_counts.
+
+        Args:
+            session: Database session
+            organization_id: Organization UUID
+            facet_names: Registry facet names (e.g. ["agency", "notice_type"])
+            source_types: Restrict to these internal source types
+                (e.g. ["sam_notice", "sam_solicitation"])
+            facet_size: Buckets per facet
+
+        Returns:
+            Dict of facet name -> Facet
+        """
+        if not facet_names:
+            return {}
+
+        key = facet_cache_key(
+            kind="browse", facets=sorted(facet_names),
+            source_types=sorted(source_types or []), size=facet_size,
+        )
+        return await self._cache.get_or_load(
+            str(organization_id),
+            key,
+            lambda: self._load_browse_facets(
+                session, organization_id, facet_names, source_types, facet_size
+            ),
+        )
+
+    async def _load_browse_facets(
+        self,
+        session: AsyncSession,
+        organization_id: UUID,
+        facet_names: List[str],
+        source_types: Optional[List[str]],
+        facet_size: int,
+    ) -> Dict[str, Facet]:
+        """Read browse facets from search_facet_counts (uncached)."""
+        await self._ensure_paths_synced()
+
+        params: Dict[str, Any] = {
+            "org_id": str(organization_id),
+            "facet_names": list(facet_names),
+            "facet_size": facet_size,
+        }
+        source_clause = ""
+        if source_types:
+            source_clause = "AND source_type = ANY(:source_types)"
+            params["source_types"] = list(source_types)
+
+        counts_sql = f"""
+            SELECT facet_name, value, SUM(doc_count) AS count
+            FROM search_facet_counts
+            WHERE organization_id = CAST(:org_id AS UUID)
+            AND facet_name = ANY(:facet_names)
+            {source_clause}
+            AND doc_count > 0
+            GROUP BY facet_name, value
+        """
+        result = await session.execute(
+            text(_TOP_BUCKETS_SQL.format(counts_sql=counts_sql)), params
+        )
+        return build_facets(result.fetchall(), list(facet_names))
+
+    # =====================================================================
+    # Query Facets
+    # =====================================================================
+
+    async def get_search_facets(
+        self,
+        session: AsyncSession,
+        organization_id: UUID,
+        fts_query: str,
+        facet_names: Optional[List[str]] = None,
+        facet_size: int = 10,
+    ) -> Dict[str, Facet]:
+        """
+        Facet counts over the documents matching a full-text query.
+
+        All facets are aggregated in one statement: matching chunks are
+        collapsed to documents once, joined to search_documents, and each
+        document contributes one (facet, value) row per requested facet.
+
+        Args:
+            session: Database session
+            organization_id: Organization UUID
+            fts_query: Escaped tsquery string
+            facet_names: "source_type", "content_type" and/or registry facet
+                names (default: DEFAULT_SEARCH_FACETS)
+            facet_size: Buckets per facet
+
+        Returns:
+            Dict of facet name -> Facet (unknown facet names are skipped)
+        """
+        facet_names = list(facet_names or DEFAULT_SEARCH_FACETS)
+
+        key = facet_cache_key(
+            kind="search", query=fts_query, facets=facet_names, size=facet_size,
+        )
+        return await self._cache.get_or_load(
+            str(organization_id),
+            key,
+            lambda: self._load_search_facets(
+                session, organization_id, fts_query, facet_names, facet_size
+            ),
+        )
+
+    async def _load_search_facets(
+        self,
+        session: AsyncSession,
+        organization_id: UUID,
+        fts_query: str,
+        facet_names: List[str],
+        facet_size: int,
+    ) -> Dict[str, Facet]:
+        """Run the single-scan facet aggregation (uncached)."""
+        params: Dict[str, Any] = {
+            "org_id": str(organization_id),
+            "fts_query": fts_query,
+            "facet_size": facet_size,
+        }
+        paths = self._registry_paths()
+        values: List[str] = []
+        known: List[str] = []
+        for name in facet_names:
+            if name == "source_type":
+                expr: Optional[str] = _SOURCE_TYPE_EXPR
+            elif name == "content_type":
+                expr = _CONTENT_TYPE_EXPR
+            else:
+                expr = self._registry_facet_expr(name, params, paths)
+            if expr is None:
+                logger.warning(f"Unknown facet: {name}, skipping")
+                continue
+            params[f"fname_{len(known)}"] = name
+            values.append(f"(CAST(:fname_{len(known)} AS text), {expr})")
+            known.append(name)
+
+        if not known:
+            return {}
+
+        needs_documents = any(name not in ("source_type", "content_type") for name in known)
+        document_join = (
+            "LEFT JOIN search_documents sd "
+            "ON sd.source_type = m.source_type AND sd.source_id = m.source_id"
+            if needs_documents else ""
+        )
+        values_sql = ",\n                ".join(values)
+        counts_sql = f"""
+            WITH matched AS (
+                SELECT DISTINCT ON (sc.source_type, sc.source_id)
+                    sc.source_type, sc.source_id, sc.source_type_filter, sc.content_type
+                FROM search_chunks sc
+                WHERE sc.organization_id = :org_id
+                AND sc.search_vector @@ to_tsquery('english', :fts_query)
+                ORDER BY sc.source_type, sc.source_id
+            )
+            SELECT f.facet_name, f.value, COUNT(*) AS count
+            FROM matched m
+            {document_join}
+            CROSS JOIN LATERAL (VALUES
+                {values_sql}
+            ) AS f(facet_name, value)
+            WHERE f.value IS NOT NULL AND f.value <> ''
+            GROUP BY f.facet_name, f.value
+        """
+        result = await session.execute(
+            text(_TOP_BUCKETS_SQL.format(counts_sql=counts_sql)), params
+        )
+        return build_facets(result.fetchall(), known)
+
+
+# Global service instance
+facet_service = FacetService()
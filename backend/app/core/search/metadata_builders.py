@@ -5,7 +5,7 @@
 Metadata Builder Registry for Curatore v2 - Standardized Namespaced Metadata
 
 Provides a registry of metadata builders for all indexable source types.
-Each builder produces namespaced JSONB metadata for the search_chunks table,
+Each builder produces namespaced JSONB metadata for the search_documents table,
 ensuring consistent structure across all source types.
 
 Namespace convention:
@@ -56,7 +56,7 @@ class MetadataBuilder:
 
     @abstractmethod
     def build_metadata(self, **kwargs) -> Dict[str, Any]:
-        """Build the namespaced metadata dict for search_chunks."""
+        """Build the namespaced metadata dict for search_documents."""
 
     def build(self, **kwargs) -> Tuple[str, Dict[str, Any]]:
         """Build both content and metadata. Returns (content, metadata_dict)."""
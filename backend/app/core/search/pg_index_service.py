@@ -31,9 +31,10 @@ Author: Curatore v2 Development Team
 Version: 2.0.0
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, text, update
@@ -44,6 +45,7 @@ from app.core.database.models import Asset
 from app.core.shared.asset_service import asset_service
 from app.core.storage.minio_service import get_minio_service
 
+from .chunk_writer import ChunkRow, DocumentRow, diff_chunks, write_chunks, write_documents
 from .chunking_service import DocumentChunk, chunking_service
 from .embedding_service import embedding_service
 from .metadata_builders import metadata_builder_registry
@@ -71,11 +73,12 @@ class PgIndexService:
         2. Download markdown content from MinIO
         3. Split content into chunks using ChunkingService
         4. Generate embeddings for each chunk using EmbeddingService
-        5. Insert/update chunks in search_chunks table
+        5. Replace the source's chunks in search_chunks with one bulk write
+           (binary COPY on asyncpg, see chunk_writer)
 
     Thread Safety:
         The service uses async operations throughout. Embedding generation
-        is offloaded to a thread pool to avoid blocking.
+        runs on the event loop via EmbeddingService's async client.
     """
 
     async def index_asset(
@@ -87,7 +90,9 @@ class PgIndexService:
         Index an asset to the search_chunks table after extraction.
 
         Downloads the extracted markdown content, splits it into chunks,
-        generates embeddings, and inserts into the search_chunks table.
+        and reconciles them with the asset's existing search_chunks rows:
+        only chunks whose content is new are embedded and inserted, so a
+        re-extraction that changes a few paragraphs costs O(change).
 
         Args:
             session: Database session
@@ -124,11 +129,11 @@ class PgIndexService:
                 minio = get_minio_service()
                 if minio:
                     try:
-                        content_bytes = minio.get_object(
+                        content = await asyncio.to_thread(
+                            minio.read_object_text,
                             extraction.extracted_bucket,
                             extraction.extracted_object_key,
                         )
-                        content = content_bytes.getvalue().decode("utf-8")
                         # Remove null bytes - they're invalid in PostgreSQL TEXT columns
                         # but can appear in some PDF extractions
                         if "\x00" in content:
@@ -145,9 +150,6 @@ class PgIndexService:
                 asset
             )
 
-            # Delete existing chunks for this asset
-            await self._delete_chunks(session, "asset", asset_id)
-
             # Chunk the content
             chunks = chunking_service.chunk_document(content, title=title)
 
@@ -159,31 +161,22 @@ class PgIndexService:
                     title=title,
                 )]
 
-            # Generate embeddings in batch for efficiency
-            chunk_texts = [chunk.content for chunk in chunks]
-            embeddings = await embedding_service.get_embeddings_batch(chunk_texts)
-
-            # Insert chunks
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                await self._insert_chunk(
-                    session=session,
-                    source_type="asset",
-                    source_id=asset_id,
-                    organization_id=asset.organization_id,
-                    chunk_index=i,
-                    content=chunk.content,
-                    title=title,
-                    filename=asset.original_filename,
-                    url=url,
-                    embedding=embedding,
-                    source_type_filter=asset.source_type,
-                    content_type=asset.content_type,
-                    collection_id=collection_id,
-                    sync_config_id=sync_config_id,
-                    metadata=metadata,
-                )
+            # Diff against existing chunks; only new chunks are embedded and written
+            changes = await self._apply_chunk_diff(session, {
+                "asset_id": asset_id,
+                "organization_id": asset.organization_id,
+                "original_filename": asset.original_filename,
+                "source_type": asset.source_type,
+                "content_type": asset.content_type,
+                "title": title,
+                "url": url,
+                "collection_id": collection_id,
+                "sync_config_id": sync_config_id,
+                "metadata": metadata,
+                "chunks": chunks,
+            })
 
-            # Propagate canonical AssetMetadata into search_chunks.metadata.custom
+            # Propagate canonical AssetMetadata into search_documents.metadata.custom
             await self.propagate_asset_metadata(session, asset_id)
 
             # Update asset.indexed_at timestamp
@@ -202,7 +195,11 @@ class PgIndexService:
             from .pg_search_service import pg_search_service
             pg_search_service.invalidate_metadata_cache(asset.organization_id)
 
-            logger.info(f"Indexed asset {asset_id} with {len(chunks)} chunks")
+            logger.info(
+                f"Indexed asset {asset_id} with {len(chunks)} chunks "
+                f"(inserted={changes['inserted']}, reused={changes['reused']}, "
+                f"moved={changes['moved']}, deleted={changes['deleted']})"
+            )
             return True
 
         except Exception as e:
@@ -256,11 +253,11 @@ class PgIndexService:
                 minio = get_minio_service()
                 if minio:
                     try:
-                        content_bytes = minio.get_object(
+                        content = await asyncio.to_thread(
+                            minio.read_object_text,
                             extraction.extracted_bucket,
                             extraction.extracted_object_key,
                         )
-                        content = content_bytes.getvalue().decode("utf-8")
                         # Remove null bytes - they're invalid in PostgreSQL TEXT columns
                         # but can appear in some PDF extractions
                         if "\x00" in content:
@@ -312,7 +309,8 @@ class PgIndexService:
         Write a prepared asset to the search index with pre-computed embeddings.
 
         This is the write phase counterpart to prepare_asset_for_indexing().
-        It deletes old chunks, inserts new ones, and updates the asset timestamp.
+        It replaces old chunks with a single bulk write and updates the
+        asset timestamp.
 
         Args:
             session: Database session
@@ -324,31 +322,14 @@ class PgIndexService:
         """
         asset_id = prepared["asset_id"]
         try:
-            # Delete existing chunks for this asset
-            await self._delete_chunks(session, "asset", asset_id)
-
-            # Insert chunks with pre-computed embeddings
+            # Replace existing chunks with pre-computed embeddings
             chunks = prepared["chunks"]
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                await self._insert_chunk(
-                    session=session,
-                    source_type="asset",
-                    source_id=asset_id,
-                    organization_id=prepared["organization_id"],
-                    chunk_index=i,
-                    content=chunk.content,
-                    title=prepared["title"],
-                    filename=prepared["original_filename"],
-                    url=prepared["url"],
-                    embedding=embedding,
-                    source_type_filter=prepared["source_type"],
-                    content_type=prepared["content_type"],
-                    collection_id=prepared["collection_id"],
-                    sync_config_id=prepared["sync_config_id"],
-                    metadata=prepared["metadata"],
-                )
+            rows = self._asset_chunk_rows(prepared, embeddings)
+            await self._replace_chunks(
+                session, "asset", [asset_id], rows, [self._asset_document_row(prepared)]
+            )
 
-            # Propagate canonical AssetMetadata into search_chunks.metadata.custom
+            # Propagate canonical AssetMetadata into search_documents.metadata.custom
             await self.propagate_asset_metadata(session, asset_id)
 
             # Update asset.indexed_at timestamp
@@ -373,6 +354,118 @@ class PgIndexService:
             await session.rollback()
             return False
 
+    async def index_assets_prepared(
+        self,
+        session: AsyncSession,
+        batch: List[Tuple[Dict[str, Any], List[List[float]]]],
+    ) -> Dict[UUID, bool]:
+        """
+        Write a batch of prepared assets to the search index in one transaction.
+
+        All chunks of all assets are written with a single bulk write and
+        committed once. If the batch write fails, each asset is retried
+        individually via index_asset_prepared() so one bad asset does not
+        fail the whole batch.
+
+        Args:
+            session: Database session
+            batch: List of (prepared, embeddings) pairs, where prepared is the
+                dict returned by prepare_asset_for_indexing()
+
+        Returns:
+            Dict mapping asset_id to whether it was indexed successfully
+        """
+        if not batch:
+            return {}
+
+        asset_ids = [prepared["asset_id"] for prepared, _ in batch]
+        try:
+            rows: List[ChunkRow] = []
+            documents: List[DocumentRow] = []
+            for prepared, embeddings in batch:
+                rows.extend(self._asset_chunk_rows(prepared, embeddings))
+                documents.append(self._asset_document_row(prepared))
+            await self._replace_chunks(session, "asset", asset_ids, rows, documents)
+
+            for asset_id in asset_ids:
+                await self.propagate_asset_metadata(session, asset_id)
+
+            _now = datetime.utcnow()
+            await session.execute(
+                update(Asset)
+                .where(Asset.id.in_(asset_ids))
+                .values(indexed_at=_now, updated_at=_now)
+            )
+
+            await session.commit()
+
+            from .pg_search_service import pg_search_service
+            for org_id in {prepared["organization_id"] for prepared, _ in batch}:
+                pg_search_service.invalidate_metadata_cache(org_id)
+
+            logger.info(f"Indexed {len(asset_ids)} assets with {len(rows)} chunks")
+            return {asset_id: True for asset_id in asset_ids}
+
+        except Exception as e:
+            logger.warning(
+                f"Batch index of {len(asset_ids)} assets failed, "
+                f"retrying individually: {e}"
+            )
+            await session.rollback()
+
+        results: Dict[UUID, bool] = {}
+        for prepared, embeddings in batch:
+            results[prepared["asset_id"]] = await self.index_asset_prepared(
+                session, prepared, embeddings
+            )
+        return results
+
+    def _asset_chunk_rows(
+        self,
+        prepared: Dict[str, Any],
+        embeddings: List[List[float]],
+        positions: Optional[List[int]] = None,
+    ) -> List[ChunkRow]:
+        """
+        Build search_chunks rows for a prepared asset and its embeddings.
+
+        Args:
+            prepared: Dict returned by prepare_asset_for_indexing()
+            embeddings: One embedding per row to build
+            positions: Chunk positions to build rows for (default: all chunks);
+                embeddings align with this list
+        """
+        chunks = prepared["chunks"]
+        if positions is None:
+            positions = list(range(len(chunks)))
+        return [
+            ChunkRow(
+                source_type="asset",
+                source_id=prepared["asset_id"],
+                organization_id=prepared["organization_id"],
+                chunk_index=i,
+                content=chunks[i].content,
+                title=prepared["title"],
+                filename=prepared["original_filename"],
+                url=prepared["url"],
+                embedding=embedding,
+                source_type_filter=prepared["source_type"],
+                content_type=prepared["content_type"],
+                collection_id=prepared["collection_id"],
+                sync_config_id=prepared["sync_config_id"],
+            )
+            for i, embedding in zip(positions, embeddings)
+        ]
+
+    def _asset_document_row(self, prepared: Dict[str, Any]) -> DocumentRow:
+        """Build the search_documents row for a prepared asset."""
+        return DocumentRow(
+            source_type="asset",
+            source_id=prepared["asset_id"],
+            organization_id=prepared["organization_id"],
+            metadata=prepared["metadata"],
+        )
+
     def _derive_storage_folder(self, raw_object_key: Optional[str]) -> str:
         """Derive storage_folder from raw_object_key.
 
@@ -445,7 +538,7 @@ class PgIndexService:
         asset_id: UUID,
     ) -> bool:
         """
-        Merge canonical AssetMetadata into search_chunks.metadata.custom.
+        Merge canonical AssetMetadata into search_documents.metadata.custom.
 
         This bridges the AssetMetadata table (written by update_metadata /
         bulk_update_metadata functions) into the search index so that
@@ -480,14 +573,11 @@ class PgIndexService:
                 type_key = record.metadata_type.replace(".", "_")
                 custom[type_key] = record.metadata_content
 
+            # One row per asset, however many chunks it has
             sql = text("""
-                UPDATE search_chunks
-                SET metadata = jsonb_set(
-                    COALESCE(metadata, '{}'::jsonb),
-                    '{custom}',
-                    CAST(:custom AS jsonb),
-                    true
-                )
+                UPDATE search_documents
+                SET metadata = jsonb_set(metadata, '{custom}', CAST(:custom AS jsonb), true),
+                    updated_at = now()
                 WHERE source_type = 'asset' AND source_id = CAST(:aid AS UUID)
             """)
             await session.execute(sql, {
@@ -519,7 +609,7 @@ class PgIndexService:
         asset_id: UUID,
     ) -> bool:
         """
-        Merge Asset.source_metadata into search_chunks.metadata namespaces.
+        Merge Asset.source_metadata into search_documents.metadata namespaces.
 
         This bridges the Asset.source_metadata column (written by connectors
         and backfill operations) into the search index so that connector-
@@ -553,24 +643,29 @@ class PgIndexService:
             if not isinstance(source_metadata, dict):
                 return True
 
-            # Propagate each namespace (skip 'custom' — managed by propagate_asset_metadata)
-            for namespace, fields in source_metadata.items():
-                if namespace == "custom" or not isinstance(fields, dict) or not fields:
-                    continue
+            # Skip 'custom' — managed by propagate_asset_metadata
+            namespaces = {
+                namespace: fields
+                for namespace, fields in source_metadata.items()
+                if namespace != "custom" and isinstance(fields, dict) and fields
+            }
 
+            if namespaces:
+                # Merge every namespace into the asset's single document row
                 sql = text("""
-                    UPDATE search_chunks
-                    SET metadata = jsonb_set(
-                        COALESCE(metadata, '{}'::jsonb),
-                        ARRAY[:ns]::text[],
-                        COALESCE(metadata->:ns, '{}'::jsonb) || CAST(:fields AS jsonb),
-                        true
-                    )
-                    WHERE source_type = 'asset' AND source_id = CAST(:aid AS UUID)
+                    UPDATE search_documents sd
+                    SET metadata = sd.metadata || (
+                            SELECT jsonb_object_agg(
+                                ns.key,
+                                COALESCE(sd.metadata->ns.key, '{}'::jsonb) || ns.value
+                            )
+                            FROM jsonb_each(CAST(:namespaces AS jsonb)) AS ns
+                        ),
+                        updated_at = now()
+                    WHERE sd.source_type = 'asset' AND sd.source_id = CAST(:aid AS UUID)
                 """)
                 await session.execute(sql, {
-                    "ns": namespace,
-                    "fields": json.dumps(fields),
+                    "namespaces": json.dumps(namespaces),
                     "aid": str(asset_id),
                 })
 
@@ -659,104 +754,167 @@ class PgIndexService:
             # Never let detection failure block indexing
             logger.debug(f"Facet value detection skipped: {e}")
 
-    async def _insert_chunk(
+    async def _apply_chunk_diff(
         self,
         session: AsyncSession,
-        source_type: str,
-        source_id: UUID,
-        organization_id: UUID,
-        chunk_index: int,
-        content: str,
-        title: Optional[str],
-        filename: Optional[str],
-        url: Optional[str],
-        embedding: List[float],
-        source_type_filter: Optional[str] = None,
-        content_type: Optional[str] = None,
-        collection_id: Optional[UUID] = None,
-        sync_config_id: Optional[UUID] = None,
-        metadata: Optional[Dict] = None,
-    ) -> None:
-        """Insert a single chunk into search_chunks table."""
-        import json
+        prepared: Dict[str, Any],
+    ) -> Dict[str, int]:
+        """
+        Reconcile a prepared asset's chunks with its stored search_chunks rows.
+
+        Existing rows are matched to new chunks by md5(content) (see
+        chunk_writer.diff_chunks). Unchanged rows keep their embedding, moved
+        rows only get a new chunk_index, vanished rows are deleted, and only
+        genuinely new chunks are embedded and bulk-written. Asset-level
+        columns (title, url, ...) are refreshed on all kept rows and the
+        metadata is written once to the asset's search_documents row.
+        The caller owns the transaction.
+
+        Args:
+            session: Database session
+            prepared: Dict in the shape returned by prepare_asset_for_indexing()
 
-        # Sanitize text fields — PostgreSQL rejects null bytes (\x00) in TEXT columns.
-        # These can appear in content extracted from corrupted PDFs.
-        def _sanitize(val: str | None) -> str | None:
-            if val and "\x00" in val:
-                return val.replace("\x00", "")
-            return val
+        Returns:
+            Dict with inserted, reused, moved and deleted counts
+        """
+        asset_id = prepared["asset_id"]
+        chunks = prepared["chunks"]
 
-        content = _sanitize(content)
-        title = _sanitize(title)
-        filename = _sanitize(filename)
-        url = _sanitize(url)
+        result = await session.execute(text("""
+            SELECT id, chunk_index, md5(content) AS content_hash
+            FROM search_chunks
+            WHERE source_type = 'asset' AND source_id = CAST(:aid AS UUID)
+        """), {"aid": str(asset_id)})
+        existing = [(row.id, row.chunk_index, row.content_hash) for row in result.fetchall()]
+
+        diff = diff_chunks(existing, [chunk.content for chunk in chunks])
 
-        # Detect unmapped facet values (non-blocking, first chunk only)
-        if metadata and chunk_index == 0:
-            await self._detect_facet_values(session, organization_id, metadata, content_type)
+        # Embed only the new chunks
+        new_chunks = [chunks[i] for i in diff.insert]
+        embeddings = (
+            await embedding_service.get_embeddings_batch([c.content for c in new_chunks])
+            if new_chunks else []
+        )
 
-        # Format embedding as pgvector string: '[0.1, 0.2, ...]'
-        embedding_str = "[" + ",".join(str(f) for f in embedding) + "]"
-        metadata_json = json.dumps(metadata) if metadata else None
+        if diff.delete:
+            await session.execute(text("""
+                DELETE FROM search_chunks WHERE id = ANY(CAST(:ids AS UUID[]))
+            """), {"ids": [str(i) for i in diff.delete]})
 
-        # Use CAST() syntax instead of :: to avoid conflicts with SQLAlchemy named params
-        sql = text("""
-            INSERT INTO search_chunks (
-                source_type, source_id, organization_id, chunk_index,
-                content, title, filename, url, embedding,
-                source_type_filter, content_type, collection_id, sync_config_id, metadata
-            ) VALUES (
-                :source_type, CAST(:source_id AS UUID), CAST(:organization_id AS UUID), :chunk_index,
-                :content, :title, :filename, :url, CAST(:embedding AS vector),
-                :source_type_filter, :content_type, CAST(:collection_id AS UUID), CAST(:sync_config_id AS UUID), CAST(:metadata AS jsonb)
+        if diff.keep:
+            # Refresh asset-level columns; park moved rows at negative indexes
+            # first so reassigning indexes never trips the unique constraint
+            await session.execute(text("""
+                UPDATE search_chunks
+                SET title = :title,
+                    filename = :filename,
+                    url = :url,
+                    source_type_filter = :source_type_filter,
+                    content_type = :content_type,
+                    collection_id = CAST(:collection_id AS UUID),
+                    sync_config_id = CAST(:sync_config_id AS UUID),
+                    chunk_index = CASE
+                        WHEN id = ANY(CAST(:moved_ids AS UUID[])) THEN -1 - chunk_index
+                        ELSE chunk_index
+                    END
+                WHERE id = ANY(CAST(:ids AS UUID[]))
+            """), {
+                "title": prepared["title"],
+                "filename": prepared["original_filename"],
+                "url": prepared["url"],
+                "source_type_filter": prepared["source_type"],
+                "content_type": prepared["content_type"],
+                "collection_id": str(prepared["collection_id"]) if prepared["collection_id"] else None,
+                "sync_config_id": str(prepared["sync_config_id"]) if prepared["sync_config_id"] else None,
+                "moved_ids": [str(i) for i in diff.moved],
+                "ids": [str(i) for i in diff.keep],
+            })
+
+        if diff.moved:
+            await session.execute(text("""
+                UPDATE search_chunks AS sc
+                SET chunk_index = v.chunk_index
+                FROM unnest(CAST(:ids AS UUID[]), CAST(:indexes AS INTEGER[]))
+                    AS v(id, chunk_index)
+                WHERE sc.id = v.id
+            """), {
+                "ids": [str(i) for i in diff.moved],
+                "indexes": list(diff.moved.values()),
+            })
+
+        await write_documents(session, [self._asset_document_row(prepared)])
+
+        if prepared["metadata"]:
+            await self._detect_facet_values(
+                session, prepared["organization_id"], prepared["metadata"],
+                prepared["content_type"],
             )
-            ON CONFLICT (source_type, source_id, chunk_index)
-            DO UPDATE SET
-                content = EXCLUDED.content,
-                title = EXCLUDED.title,
-                filename = EXCLUDED.filename,
-                url = EXCLUDED.url,
-                embedding = EXCLUDED.embedding,
-                source_type_filter = EXCLUDED.source_type_filter,
-                content_type = EXCLUDED.content_type,
-                collection_id = EXCLUDED.collection_id,
-                sync_config_id = EXCLUDED.sync_config_id,
-                metadata = COALESCE(search_chunks.metadata, '{}'::jsonb) || EXCLUDED.metadata
-        """)
 
+        if new_chunks:
+            rows = self._asset_chunk_rows(prepared, embeddings, positions=diff.insert)
+            await write_chunks(session, rows)
+
+        return {
+            "inserted": len(diff.insert),
+            "reused": len(diff.keep),
+            "moved": len(diff.moved),
+            "deleted": len(diff.delete),
+        }
+
+    async def _replace_chunks(
+        self,
+        session: AsyncSession,
+        source_type: str,
+        source_ids: List[UUID],
+        rows: List[ChunkRow],
+        documents: List[DocumentRow],
+    ) -> None:
+        """
+        Replace all chunks for the given sources with rows.
+
+        Deletes existing chunks for every source in one statement, upserts
+        one search_documents row per source, then writes all rows with a
+        single bulk write (see chunk_writer). The caller owns the transaction.
+        """
+        sql = text("""
+            DELETE FROM search_chunks
+            WHERE source_type = :source_type
+            AND source_id = ANY(CAST(:source_ids AS UUID[]))
+        """)
         await session.execute(sql, {
             "source_type": source_type,
-            "source_id": str(source_id),
-            "organization_id": str(organization_id),
-            "chunk_index": chunk_index,
-            "content": content,
-            "title": title,
-            "filename": filename,
-            "url": url,
-            "embedding": embedding_str,
-            "source_type_filter": source_type_filter,
-            "content_type": content_type,
-            "collection_id": str(collection_id) if collection_id else None,
-            "sync_config_id": str(sync_config_id) if sync_config_id else None,
-            "metadata": metadata_json,
+            "source_ids": [str(sid) for sid in source_ids],
         })
 
+        await write_documents(session, documents)
+
+        # Detect unmapped facet values (non-blocking, once per document)
+        content_types = {row.source_id: row.content_type for row in rows if row.chunk_index == 0}
+        for doc in documents:
+            if doc.metadata:
+                await self._detect_facet_values(
+                    session, doc.organization_id, doc.metadata,
+                    content_types.get(doc.source_id),
+                )
+
+        await write_chunks(session, rows)
+
     async def _delete_chunks(
         self,
         session: AsyncSession,
         source_type: str,
         source_id: UUID,
     ) -> None:
-        """Delete all chunks for a source."""
-        sql = text("""
+        """Delete all chunks and the document row for a source."""
+        params = {"source_type": source_type, "source_id": str(source_id)}
+        await session.execute(text("""
             DELETE FROM search_chunks
             WHERE source_type = :source_type AND source_id = :source_id
-        """)
-        await session.execute(sql, {
-            "source_type": source_type,
-            "source_id": str(source_id),
-        })
+        """), params)
+        await session.execute(text("""
+            DELETE FROM search_documents
+            WHERE source_type = :source_type AND source_id = :source_id
+        """), params)
 
     async def delete_asset_index(
         self,
@@ -779,16 +937,19 @@ class PgIndexService:
             return True
 
         try:
-            sql = text("""
+            params = {"asset_id": str(asset_id), "org_id": str(organization_id)}
+            await session.execute(text("""
                 DELETE FROM search_chunks
                 WHERE source_type = 'asset'
                 AND source_id = :asset_id
                 AND organization_id = :org_id
-            """)
-            await session.execute(sql, {
-                "asset_id": str(asset_id),
-                "org_id": str(organization_id),
-            })
+            """), params)
+            await session.execute(text("""
+                DELETE FROM search_documents
+                WHERE source_type = 'asset'
+                AND source_id = :asset_id
+                AND organization_id = :org_id
+            """), params)
             await session.commit()
             logger.info(f"Deleted index for asset {asset_id}")
             return True
@@ -828,13 +989,15 @@ class PgIndexService:
             )
             if embedding is None:
                 embedding = await embedding_service.get_embedding(content)
-            await self._delete_chunks(session, "sam_notice", notice_id)
-            await self._insert_chunk(
-                session=session, source_type="sam_notice", source_id=notice_id,
+            await self._replace_chunks(session, "sam_notice", [notice_id], [ChunkRow(
+                source_type="sam_notice", source_id=notice_id,
                 organization_id=organization_id, chunk_index=0, content=content,
                 title=title, filename=sam_notice_id, url=url, embedding=embedding,
-                source_type_filter="sam_gov", content_type=notice_type, metadata=metadata,
-            )
+                source_type_filter="sam_gov", content_type=notice_type,
+            )], [DocumentRow(
+                source_type="sam_notice", source_id=notice_id,
+                organization_id=organization_id, metadata=metadata,
+            )])
             from app.core.database.models import SamNotice as SamNoticeModel
             await session.execute(
                 update(SamNoticeModel).where(SamNoticeModel.id == notice_id)
@@ -870,13 +1033,15 @@ class PgIndexService:
             )
             if embedding is None:
                 embedding = await embedding_service.get_embedding(content)
-            await self._delete_chunks(session, "sam_solicitation", solicitation_id)
-            await self._insert_chunk(
-                session=session, source_type="sam_solicitation", source_id=solicitation_id,
+            await self._replace_chunks(session, "sam_solicitation", [solicitation_id], [ChunkRow(
+                source_type="sam_solicitation", source_id=solicitation_id,
                 organization_id=organization_id, chunk_index=0, content=content,
                 title=title, filename=solicitation_number, url=url, embedding=embedding,
-                source_type_filter="sam_gov", content_type="solicitation", metadata=metadata,
-            )
+                source_type_filter="sam_gov", content_type="solicitation",
+            )], [DocumentRow(
+                source_type="sam_solicitation", source_id=solicitation_id,
+                organization_id=organization_id, metadata=metadata,
+            )])
             from app.core.database.models import SamSolicitation as SamSolicitationModel
             _now = datetime.utcnow()
             await session.execute(
@@ -946,14 +1111,15 @@ class PgIndexService:
             )
             if embedding is None:
                 embedding = await embedding_service.get_embedding(content)
-            await self._delete_chunks(session, internal_source_type, forecast_id)
-            await self._insert_chunk(
-                session=session, source_type=internal_source_type, source_id=forecast_id,
+            await self._replace_chunks(session, internal_source_type, [forecast_id], [ChunkRow(
+                source_type=internal_source_type, source_id=forecast_id,
                 organization_id=organization_id, chunk_index=0, content=content,
                 title=title, filename=source_id, url=url, embedding=embedding,
                 source_type_filter=internal_source_type, content_type="forecast",
-                metadata=metadata,
-            )
+            )], [DocumentRow(
+                source_type=internal_source_type, source_id=forecast_id,
+                organization_id=organization_id, metadata=metadata,
+            )])
             await session.commit()
             logger.debug(f"Indexed forecast {forecast_id} ({source_type})")
             return True
@@ -1001,14 +1167,15 @@ class PgIndexService:
             )
             if embedding is None:
                 embedding = await embedding_service.get_embedding(content)
-            await self._delete_chunks(session, "salesforce_account", account_id)
-            await self._insert_chunk(
-                session=session, source_type="salesforce_account", source_id=account_id,
+            await self._replace_chunks(session, "salesforce_account", [account_id], [ChunkRow(
+                source_type="salesforce_account", source_id=account_id,
                 organization_id=organization_id, chunk_index=0, content=content,
                 title=name, filename=salesforce_id, url=None, embedding=embedding,
                 source_type_filter="salesforce_account", content_type="account",
-                metadata=metadata,
-            )
+            )], [DocumentRow(
+                source_type="salesforce_account", source_id=account_id,
+                organization_id=organization_id, metadata=metadata,
+            )])
             await session.commit()
             logger.debug(f"Indexed Salesforce account {account_id}")
             return True
@@ -1049,14 +1216,15 @@ class PgIndexService:
             )
             if embedding is None:
                 embedding = await embedding_service.get_embedding(content)
-            await self._delete_chunks(session, "salesforce_contact", contact_id)
-            await self._insert_chunk(
-                session=session, source_type="salesforce_contact", source_id=contact_id,
+            await self._replace_chunks(session, "salesforce_contact", [contact_id], [ChunkRow(
+                source_type="salesforce_contact", source_id=contact_id,
                 organization_id=organization_id, chunk_index=0, content=content,
                 title=full_name, filename=salesforce_id, url=None, embedding=embedding,
                 source_type_filter="salesforce_contact", content_type="contact",
-                metadata=metadata,
-            )
+            )], [DocumentRow(
+                source_type="salesforce_contact", source_id=contact_id,
+                organization_id=organization_id, metadata=metadata,
+            )])
             await session.commit()
             logger.debug(f"Indexed Salesforce contact {contact_id}")
             return True
@@ -1097,14 +1265,15 @@ class PgIndexService:
             )
             if embedding is None:
                 embedding = await embedding_service.get_embedding(content)
-            await self._delete_chunks(session, "salesforce_opportunity", opportunity_id)
-            await self._insert_chunk(
-                session=session, source_type="salesforce_opportunity", source_id=opportunity_id,
+            await self._replace_chunks(session, "salesforce_opportunity", [opportunity_id], [ChunkRow(
+                source_type="salesforce_opportunity", source_id=opportunity_id,
                 organization_id=organization_id, chunk_index=0, content=content,
                 title=name, filename=salesforce_id, url=None, embedding=embedding,
                 source_type_filter="salesforce_opportunity", content_type="opportunity",
-                metadata=metadata,
-            )
+            )], [DocumentRow(
+                source_type="salesforce_opportunity", source_id=opportunity_id,
+                organization_id=organization_id, metadata=metadata,
+            )])
             await session.commit()
             logger.debug(f"Indexed Salesforce opportunity {opportunity_id}")
             return True
@@ -1183,22 +1352,20 @@ class PgIndexService:
                     stats["failed"] += len(prepared_list)
                     continue
 
-                # Distribute embeddings back to prepared assets and index
+                # Distribute embeddings back to prepared assets
+                write_batch = []
                 embedding_offset = 0
                 for prepared, count in zip(prepared_list, chunk_counts):
                     asset_embeddings = all_embeddings[embedding_offset : embedding_offset + count]
                     embedding_offset += count
+                    write_batch.append((prepared, asset_embeddings))
 
-                    try:
-                        success = await self.index_asset_prepared(
-                            session, prepared, asset_embeddings
-                        )
-                        if success:
-                            stats["indexed"] += 1
-                        else:
-                            stats["failed"] += 1
-                    except Exception as e:
-                        logger.error(f"Failed to index asset {prepared['asset_id']}: {e}")
+                # Write the whole batch with one bulk write and commit
+                results = await self.index_assets_prepared(session, write_batch)
+                for success in results.values():
+                    if success:
+                        stats["indexed"] += 1
+                    else:
                         stats["failed"] += 1
 
             logger.info(f"Reindex complete for org {organization_id}: {stats}")
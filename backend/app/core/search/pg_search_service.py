@@ -11,14 +11,22 @@ Key Features:
     - Full-text search using PostgreSQL tsvector + GIN indexes
     - Semantic search using pgvector for embedding similarity
     - Hybrid search combining both for optimal results
-    - Faceted search with aggregations
+    - Faceted search with aggregations (single-scan, see facet_service)
     - Organization-scoped search for multi-tenancy
     - Highlighted search results with snippets
 
 Search Modes:
     - keyword: Full-text search only (fast, exact matches)
     - semantic: Vector similarity search only (finds related content)
-    - hybrid: Combines both with configurable weighting (default, best quality)
+    - hybrid: Combines both with configurable weighting (default, best quality).
+      Runs as one query over bounded keyword/ANN candidate sets fused with
+      reciprocal-rank fusion (or a weighted sum); the total counts candidates
+      and is flagged total_capped when a candidate limit was reached
+
+Metadata Filters:
+    Namespaced metadata lives in search_documents (one row per source), not
+    on search_chunks. Filters on metadata are written against ``sd.metadata``
+    and wrapped with document_filter(), which correlates them to the chunk.
 
 Adding New Data Sources:
     To add search for a new data source (e.g., "widgets"):
@@ -41,7 +49,6 @@ Version: 2.1.0
 import json
 import logging
 import re
-import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -50,10 +57,18 @@ from uuid import UUID
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.shared.shared_cache import SharedCache
+
+from .ann_index_service import ann_index_service
 from .embedding_service import embedding_service
 
 logger = logging.getLogger("curatore.pg_search_service")
 
+# Hybrid search defaults when config.yml has no search section
+HYBRID_RRF_K = 60
+HYBRID_KEYWORD_CANDIDATES = 1000
+HYBRID_SEMANTIC_CANDIDATES = 200
+
 
 # =============================================================================
 # Display Type Mappers - Define friendly names for each source type
@@ -85,6 +100,27 @@ def _identity_mapper(source_type: str) -> str:
     return source_type
 
 
+def document_filter(conditions: List[str]) -> str:
+    """
+    Turn metadata conditions into a search_chunks filter.
+
+    Metadata is stored once per source in search_documents (alias ``sd``),
+    so conditions are evaluated against that row and a chunk matches when
+    its document does.
+
+    Args:
+        conditions: SQL conditions referencing sd.metadata
+
+    Returns:
+        EXISTS clause correlated on sc.source_type / sc.source_id
+    """
+    return (
+        "EXISTS (SELECT 1 FROM search_documents sd "
+        "WHERE sd.source_type = sc.source_type AND sd.source_id = sc.source_id "
+        f"AND {' AND '.join(conditions)})"
+    )
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -123,10 +159,15 @@ class SearchHit:
 
 @dataclass
 class SearchResults:
-    """Container for search results."""
+    """Container for search results.
+
+    total_capped is True when total is a lower bound (hybrid search only
+    counts its bounded candidate sets); display it as e.g. "1000+".
+    """
     total: int
     hits: List[SearchHit]
     facets: Optional[Dict[str, Facet]] = None
+    total_capped: bool = False
 
 
 @dataclass
@@ -180,13 +221,13 @@ class PgSearchService:
         "source": ["asset"],
     }
 
-    # Schema cache: {org_id: (timestamp, schema_dict)}
+    # Schema and doc-count caches, shared across processes, scoped by org_id
     SCHEMA_CACHE_TTL = 300  # 5 minutes
 
     def __init__(self):
         """Initialize the PostgreSQL search service."""
-        self._metadata_schema_cache: Dict[str, Tuple[float, dict]] = {}
-        self._doc_counts_cache: Dict[str, Tuple[float, dict]] = {}
+        self._metadata_schema_cache = SharedCache("search_metadata_schema", ttl=self.SCHEMA_CACHE_TTL)
+        self._doc_counts_cache = SharedCache("search_doc_counts", ttl=self.SCHEMA_CACHE_TTL)
 
     # =========================================================================
     # Helper Methods
@@ -238,6 +279,8 @@ class PgSearchService:
         limit: int,
         offset: int,
         display_type_mapper: Callable[[str], str] = _identity_mapper,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
     ) -> SearchResults:
         """
         Execute a typed search with the specified mode.
@@ -256,10 +299,17 @@ class PgSearchService:
             limit: Max results
             offset: Pagination offset
             display_type_mapper: Function to map source_type to display name
+            ef_search: HNSW candidate list size for the ANN scan
+            probes: IVFFlat lists to probe for the ANN scan
 
         Returns:
             SearchResults with hits and total count
         """
+        if search_mode != "keyword":
+            await ann_index_service.apply_query_settings(
+                session, params.get("org_id"), ef_search=ef_search, probes=probes
+            )
+
         if search_mode == "keyword":
             return await self._keyword_search_generic(
                 session, filter_clause, params, limit, offset, display_type_mapper
@@ -306,7 +356,6 @@ class PgSearchService:
                     sc.url,
                     sc.created_at,
                     sc.content,
-                    sc.metadata,
                     ts_rank(sc.search_vector, to_tsquery('english', :fts_query)) as keyword_score,
                     ROW_NUMBER() OVER (
                         PARTITION BY sc.source_id
@@ -315,28 +364,34 @@ class PgSearchService:
                 FROM search_chunks sc
                 WHERE {filter_clause}
                 AND sc.search_vector @@ to_tsquery('english', :fts_query)
+            ),
+            page AS (
+                SELECT * FROM ranked_chunks
+                WHERE rn = 1
+                ORDER BY keyword_score DESC
+                LIMIT :limit OFFSET :offset
             )
             SELECT
-                source_id,
-                title,
-                filename,
-                source_type,
-                source_type_filter,
-                content_type,
-                url,
-                created_at::text,
-                keyword_score as score,
-                metadata,
+                p.source_id,
+                p.title,
+                p.filename,
+                p.source_type,
+                p.source_type_filter,
+                p.content_type,
+                p.url,
+                p.created_at::text,
+                p.keyword_score as score,
+                sd.metadata,
                 ts_headline(
                     'english',
-                    content,
+                    p.content,
                     to_tsquery('english', :fts_query),
                     'StartSel=<mark>, StopSel=</mark>, MaxWords=50, MinWords=25, MaxFragments=3'
                 ) as highlight
-            FROM ranked_chunks
-            WHERE rn = 1
-            ORDER BY keyword_score DESC
-            LIMIT :limit OFFSET :offset
+            FROM page p
+            LEFT JOIN search_documents sd
+                ON sd.source_type = p.source_type AND sd.source_id = p.source_id
+            ORDER BY p.keyword_score DESC
         """
         params["limit"] = limit
         params["offset"] = offset
@@ -395,7 +450,6 @@ class PgSearchService:
                     sc.url,
                     sc.created_at,
                     sc.content,
-                    sc.metadata,
                     1 - (sc.embedding <=> CAST(:embedding AS vector)) as semantic_score
                 FROM search_chunks sc
                 WHERE {filter_clause}
@@ -410,24 +464,30 @@ class PgSearchService:
                         ORDER BY semantic_score DESC
                     ) as rn
                 FROM top_candidates
+            ),
+            page AS (
+                SELECT * FROM ranked_chunks
+                WHERE rn = 1
+                AND semantic_score > :similarity_threshold
+                ORDER BY semantic_score DESC
+                LIMIT :limit OFFSET :offset
             )
             SELECT
-                source_id,
-                title,
-                filename,
-                source_type,
-                source_type_filter,
-                content_type,
-                url,
-                created_at::text,
-                semantic_score as score,
-                metadata,
-                LEFT(content, 500) as snippet
-            FROM ranked_chunks
-            WHERE rn = 1
-            AND semantic_score > :similarity_threshold
-            ORDER BY semantic_score DESC
-            LIMIT :limit OFFSET :offset
+                p.source_id,
+                p.title,
+                p.filename,
+                p.source_type,
+                p.source_type_filter,
+                p.content_type,
+                p.url,
+                p.created_at::text,
+                p.semantic_score as score,
+                sd.metadata,
+                LEFT(p.content, 500) as snippet
+            FROM page p
+            LEFT JOIN search_documents sd
+                ON sd.source_type = p.source_type AND sd.source_id = p.source_id
+            ORDER BY p.semantic_score DESC
         """
         params["limit"] = limit
         params["offset"] = offset
@@ -470,7 +530,17 @@ class PgSearchService:
         offset: int,
         display_type_mapper: Callable[[str], str],
     ) -> SearchResults:
-        """Execute hybrid search combining keyword and semantic results."""
+        """
+        Execute hybrid search combining keyword and semantic results.
+
+        Single query over bounded candidate sets: the top keyword-matching
+        chunks (by ts_rank) and the nearest-neighbor chunks (ANN index) are
+        collapsed to one row per document, fused, and only the final page is
+        joined back to search_chunks and search_documents for content,
+        metadata and ts_headline. The total is
+        the number of fused candidates; when either side filled its candidate
+        limit it is a lower bound and total_capped is set.
+        """
         # Generate query embedding — fall back to keyword search on failure
         try:
             query_embedding = await embedding_service.get_embedding(query)
@@ -479,115 +549,137 @@ class PgSearchService:
             return await self._keyword_search_generic(
                 session, filter_clause, params, limit, offset, display_type_mapper
             )
+
+        fusion, rrf_k, keyword_candidates, semantic_candidates = self._get_hybrid_settings()
         params["embedding"] = "[" + ",".join(str(f) for f in query_embedding) + "]"
         params["keyword_weight"] = 1 - semantic_weight
         params["semantic_weight"] = semantic_weight
+        params["similarity_threshold"] = 0.3
+        params["keyword_candidates"] = max(keyword_candidates, offset + limit)
+        params["semantic_candidates"] = max(semantic_candidates, offset + limit)
+        params["limit"] = limit
+        params["offset"] = offset
+
+        if fusion == "rrf":
+            # Normalized so a document ranked first on both sides scores 1.0
+            params["rrf_k"] = rrf_k
+            score_expr = """(
+                    :keyword_weight * COALESCE(1.0 / (:rrf_k + k.keyword_rank), 0) +
+                    :semantic_weight * COALESCE(1.0 / (:rrf_k + s.semantic_rank), 0)
+                ) * (:rrf_k + 1)"""
+        else:
+            score_expr = """
+                    :keyword_weight * COALESCE(k.keyword_score, 0) +
+                    :semantic_weight * COALESCE(s.semantic_score, 0)"""
 
         search_sql = f"""
-            WITH keyword_results AS (
+            WITH keyword_chunks AS (
                 SELECT
+                    sc.id,
                     sc.source_id,
-                    sc.title,
-                    sc.filename,
-                    sc.source_type,
-                    sc.source_type_filter,
-                    sc.content_type,
-                    sc.url,
-                    sc.created_at,
-                    sc.content,
-                    sc.metadata,
-                    ts_rank(sc.search_vector, to_tsquery('english', :fts_query)) as keyword_score,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY sc.source_id
-                        ORDER BY ts_rank(sc.search_vector, to_tsquery('english', :fts_query)) DESC
-                    ) as rn
+                    ts_rank(sc.search_vector, to_tsquery('english', :fts_query)) as keyword_score
                 FROM search_chunks sc
                 WHERE {filter_clause}
                 AND sc.search_vector @@ to_tsquery('english', :fts_query)
+                ORDER BY keyword_score DESC
+                LIMIT :keyword_candidates
             ),
-            semantic_candidates AS (
+            keyword_ranked AS (
+                SELECT *, ROW_NUMBER() OVER (ORDER BY keyword_score DESC, source_id) as keyword_rank
+                FROM (
+                    SELECT DISTINCT ON (source_id) id, source_id, keyword_score
+                    FROM keyword_chunks
+                    ORDER BY source_id, keyword_score DESC
+                ) best
+            ),
+            semantic_chunks AS (
                 SELECT
+                    sc.id,
                     sc.source_id,
-                    sc.title,
-                    sc.filename,
-                    sc.source_type,
-                    sc.source_type_filter,
-                    sc.content_type,
-                    sc.url,
-                    sc.created_at,
-                    sc.content,
-                    sc.metadata,
                     1 - (sc.embedding <=> CAST(:embedding AS vector)) as semantic_score
                 FROM search_chunks sc
                 WHERE {filter_clause}
                 AND sc.embedding IS NOT NULL
                 ORDER BY sc.embedding <=> CAST(:embedding AS vector)
-                LIMIT 200
+                LIMIT :semantic_candidates
             ),
-            semantic_results AS (
-                SELECT *,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY source_id
-                        ORDER BY semantic_score DESC
-                    ) as rn
-                FROM semantic_candidates
+            semantic_ranked AS (
+                SELECT *, ROW_NUMBER() OVER (ORDER BY semantic_score DESC, source_id) as semantic_rank
+                FROM (
+                    SELECT DISTINCT ON (source_id) id, source_id, semantic_score
+                    FROM semantic_chunks
+                    WHERE semantic_score > :similarity_threshold
+                    ORDER BY source_id, semantic_score DESC
+                ) best
             ),
-            keyword_top AS (
-                SELECT * FROM keyword_results WHERE rn = 1
+            fused AS (
+                SELECT
+                    COALESCE(k.source_id, s.source_id) as source_id,
+                    COALESCE(k.id, s.id) as chunk_id,
+                    k.keyword_score,
+                    s.semantic_score,
+                    {score_expr} as score
+                FROM keyword_ranked k
+                FULL OUTER JOIN semantic_ranked s ON k.source_id = s.source_id
             ),
-            semantic_top AS (
-                SELECT * FROM semantic_results WHERE rn = 1 AND semantic_score > 0.3
+            page AS (
+                SELECT * FROM fused
+                ORDER BY score DESC, source_id
+                LIMIT :limit OFFSET :offset
             ),
-            combined AS (
+            stats AS (
                 SELECT
-                    COALESCE(k.source_id, s.source_id) as source_id,
-                    COALESCE(k.title, s.title) as title,
-                    COALESCE(k.filename, s.filename) as filename,
-                    COALESCE(k.source_type, s.source_type) as source_type,
-                    COALESCE(k.source_type_filter, s.source_type_filter) as source_type_filter,
-                    COALESCE(k.content_type, s.content_type) as content_type,
-                    COALESCE(k.url, s.url) as url,
-                    COALESCE(k.created_at, s.created_at) as created_at,
-                    COALESCE(k.content, s.content) as content,
-                    COALESCE(k.metadata, s.metadata) as metadata,
-                    COALESCE(k.keyword_score, 0) as keyword_score,
-                    COALESCE(s.semantic_score, 0) as semantic_score,
-                    :keyword_weight * COALESCE(k.keyword_score, 0) +
-                    :semantic_weight * COALESCE(s.semantic_score, 0) as combined_score
-                FROM keyword_top k
-                FULL OUTER JOIN semantic_top s ON k.source_id = s.source_id
+                    (SELECT COUNT(*) FROM fused) as candidate_total,
+                    (SELECT COUNT(*) FROM keyword_chunks) >= :keyword_candidates
+                    OR (
+                        SELECT COUNT(*) FROM semantic_chunks
+                        WHERE semantic_score > :similarity_threshold
+                    ) >= :semantic_candidates as truncated
             )
             SELECT
-                source_id,
-                title,
-                filename,
-                source_type,
-                source_type_filter,
-                content_type,
-                url,
-                created_at::text,
-                combined_score as score,
-                keyword_score,
-                semantic_score,
-                metadata,
-                ts_headline(
-                    'english',
-                    content,
-                    to_tsquery('english', :fts_query),
-                    'StartSel=<mark>, StopSel=</mark>, MaxWords=50, MinWords=25, MaxFragments=3'
-                ) as highlight
-            FROM combined
-            ORDER BY combined_score DESC
-            LIMIT :limit OFFSET :offset
+                st.candidate_total,
+                st.truncated,
+                r.*
+            FROM stats st
+            LEFT JOIN LATERAL (
+                SELECT
+                    p.source_id,
+                    sc.title,
+                    sc.filename,
+                    sc.source_type,
+                    sc.source_type_filter,
+                    sc.content_type,
+                    sc.url,
+                    sc.created_at::text as created_at,
+                    p.score,
+                    p.keyword_score,
+                    p.semantic_score,
+                    sd.metadata,
+                    ts_headline(
+                        'english',
+                        sc.content,
+                        to_tsquery('english', :fts_query),
+                        'StartSel=<mark>, StopSel=</mark>, MaxWords=50, MinWords=25, MaxFragments=3'
+                    ) as highlight
+                FROM page p
+                JOIN search_chunks sc ON sc.id = p.chunk_id
+                LEFT JOIN search_documents sd
+                    ON sd.source_type = sc.source_type AND sd.source_id = sc.source_id
+            ) r ON true
+            ORDER BY r.score DESC NULLS LAST, r.source_id
         """
-        params["limit"] = limit
-        params["offset"] = offset
 
         result = await session.execute(text(search_sql), params)
         rows = result.fetchall()
 
+        total = int(rows[0].candidate_total) if rows else 0
+        total_capped = bool(rows[0].truncated) if rows else False
+
         hits = []
         for row in rows:
+            if row.source_id is None:
+                continue  # Page past the last candidate: only the stats row
+
             display_type = display_type_mapper(row.source_type)
             if display_type == row.source_type and row.source_type_filter:
                 display_type = row.source_type_filter
@@ -607,40 +699,38 @@ class PgSearchService:
                 metadata=dict(row.metadata) if row.metadata else None,
             ))
 
-        # Get total count
-        count_sql = f"""
-            WITH keyword_results AS (
-                SELECT DISTINCT sc.source_id
-                FROM search_chunks sc
-                WHERE {filter_clause}
-                AND sc.search_vector @@ to_tsquery('english', :fts_query)
-            ),
-            semantic_results AS (
-                SELECT DISTINCT sc.source_id
-                FROM search_chunks sc
-                WHERE {filter_clause}
-                AND sc.embedding IS NOT NULL
-                AND 1 - (sc.embedding <=> CAST(:embedding AS vector)) > 0.3
-            )
-            SELECT COUNT(*) FROM (
-                SELECT source_id FROM keyword_results
-                UNION
-                SELECT source_id FROM semantic_results
-            ) combined
-        """
-        count_result = await session.execute(text(count_sql), params)
-        total = count_result.scalar() or 0
+        return SearchResults(total=total, hits=hits, total_capped=total_capped)
 
-        return SearchResults(total=total, hits=hits)
+    def _get_hybrid_settings(self) -> Tuple[str, int, int, int]:
+        """Return (fusion, rrf_k, keyword_candidates, semantic_candidates) from config."""
+        try:
+            from app.core.shared.config_loader import config_loader
+            config = config_loader.get_search_config()
+        except Exception:
+            config = None
+        if config is None:
+            return (
+                "rrf", HYBRID_RRF_K,
+                HYBRID_KEYWORD_CANDIDATES, HYBRID_SEMANTIC_CANDIDATES,
+            )
+        return (
+            config.hybrid_fusion, config.hybrid_rrf_k,
+            config.hybrid_keyword_candidates, config.hybrid_semantic_candidates,
+        )
 
     # =========================================================================
     # Metadata Schema Discovery
     # =========================================================================
 
     def invalidate_metadata_cache(self, organization_id: UUID) -> None:
-        """Invalidate the cached metadata schema for an organization."""
+        """Invalidate the cached metadata schema, doc counts and facets for an organization."""
         cache_key = str(organization_id)
-        self._metadata_schema_cache.pop(cache_key, None)
+        self._metadata_schema_cache.invalidate(cache_key)
+        self._doc_counts_cache.invalidate(cache_key)
+
+        from .facet_service import facet_service
+
+        facet_service.invalidate(organization_id)
         logger.debug(f"Invalidated metadata schema cache for org {organization_id}")
 
     async def get_doc_counts(
@@ -655,23 +745,28 @@ class PgSearchService:
         queries entirely. Intended for the metadata catalog endpoint which
         only needs counts. Cached for SCHEMA_CACHE_TTL seconds.
         """
-        cache_key = str(organization_id)
-        now = time.time()
-
-        if cache_key in self._doc_counts_cache:
-            cached_at, cached = self._doc_counts_cache[cache_key]
-            if now - cached_at < self.SCHEMA_CACHE_TTL:
-                return cached
+        return await self._doc_counts_cache.get_or_load(
+            str(organization_id),
+            "counts",
+            lambda: self._build_doc_counts(session, organization_id),
+        )
 
+    async def _build_doc_counts(
+        self,
+        session: AsyncSession,
+        organization_id: UUID,
+    ) -> Dict[str, Any]:
+        """Query namespace doc counts for get_doc_counts()."""
         from app.core.metadata.registry_service import metadata_registry_service
 
         org_id_str = str(organization_id)
         ns_source_types_map = metadata_registry_service.get_namespace_source_types()
         registry_namespaces = metadata_registry_service.get_namespaces()
 
+        # One search_documents row per indexed source (no DISTINCT over chunks)
         count_sql = text("""
-            SELECT source_type, COUNT(DISTINCT source_id) as doc_count
-            FROM search_chunks
+            SELECT source_type, COUNT(*) as doc_count
+            FROM search_documents
             WHERE organization_id = :org_id
             GROUP BY source_type
         """)
@@ -690,12 +785,10 @@ class PgSearchService:
             )
             namespaces[ns] = {"doc_count": ns_doc_count}
 
-        counts = {
+        return {
             "namespaces": namespaces,
             "total_indexed_docs": total_docs,
         }
-        self._doc_counts_cache[cache_key] = (now, counts)
-        return counts
 
     async def get_metadata_schema(
         self,
@@ -717,21 +810,14 @@ class PgSearchService:
         Returns:
             Dict with namespaces, total_indexed_docs, cached_at
         """
-        cache_key = str(organization_id)
-        now = time.time()
-
-        # Check cache
-        if cache_key in self._metadata_schema_cache:
-            cached_at, cached_schema = self._metadata_schema_cache[cache_key]
-            if now - cached_at < self.SCHEMA_CACHE_TTL:
-                return cached_schema
-
         try:
-            schema = await self._build_metadata_schema(
-                session, organization_id, max_sample_values
+            return await self._metadata_schema_cache.get_or_load(
+                str(organization_id),
+                "schema",
+                lambda: self._build_metadata_schema(
+                    session, organization_id, max_sample_values
+                ),
             )
-            self._metadata_schema_cache[cache_key] = (now, schema)
-            return schema
         except Exception as e:
             logger.error(f"Failed to build metadata schema: {e}")
             return {
@@ -845,11 +931,11 @@ class PgSearchService:
         """Get sample distinct values for a specific metadata field."""
         try:
             sql = text("""
-                SELECT DISTINCT sc.metadata->:namespace->>:field as val
-                FROM search_chunks sc
-                WHERE sc.organization_id = :org_id
-                  AND sc.source_type = ANY(:source_types)
-                  AND sc.metadata->:namespace->>:field IS NOT NULL
+                SELECT DISTINCT sd.metadata->:namespace->>:field as val
+                FROM search_documents sd
+                WHERE sd.organization_id = :org_id
+                  AND sd.source_type = ANY(:source_types)
+                  AND sd.metadata->:namespace->>:field IS NOT NULL
                 LIMIT :max_sample
             """)
             result = await session.execute(sql, {
@@ -874,10 +960,10 @@ class PgSearchService:
         try:
             sql = text("""
                 SELECT DISTINCT f.key, jsonb_typeof(f.value) as value_type
-                FROM search_chunks sc,
-                     jsonb_each(sc.metadata->'custom') AS f
-                WHERE sc.organization_id = :org_id
-                  AND sc.metadata ? 'custom'
+                FROM search_documents sd,
+                     jsonb_each(sd.metadata->'custom') AS f
+                WHERE sd.organization_id = :org_id
+                  AND sd.metadata ? 'custom'
                 LIMIT 50
             """)
             result = await session.execute(sql, {"org_id": org_id_str})
@@ -942,6 +1028,8 @@ class PgSearchService:
         facet_filters: Optional[Dict[str, Any]] = None,
         limit: int = 20,
         offset: int = 0,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
     ) -> SearchResults:
         """
         Execute a search query with optional filters.
@@ -965,6 +1053,10 @@ class PgSearchService:
                 Example: {"agency": ["GSA", "DOD"], "naics_code": "541512"}
             limit: Maximum results to return
             offset: Offset for pagination
+            ef_search: HNSW candidate list size for semantic/hybrid modes
+                (higher = better recall, slower). Default: search.ann_hnsw_ef_search
+            probes: IVFFlat lists probed for semantic/hybrid modes.
+                Default: search.ann_ivfflat_probes, else sqrt(lists)
 
         Returns:
             SearchResults with total count and matching hits
@@ -972,6 +1064,7 @@ class PgSearchService:
         try:
             # Build filter conditions
             filters, params = self._build_base_filters(organization_id)
+            doc_filters: List[str] = []
 
             # Map display names to source_type values for Salesforce
             salesforce_display_map = {
@@ -1076,15 +1169,15 @@ class PgSearchService:
                 slugified = "/".join(slugify(p) for p in clean.split("/") if p)
 
                 if folder_match_mode == "contains":
-                    filters.append("sc.metadata->'source'->>'storage_folder' LIKE :folder_path_prefix")
+                    doc_filters.append("sd.metadata->'source'->>'storage_folder' LIKE :folder_path_prefix")
                     params["folder_path_prefix"] = f"%{slugified}%"
                 else:
                     # Default: prefix match
-                    filters.append("sc.metadata->'source'->>'storage_folder' LIKE :folder_path_prefix")
+                    doc_filters.append("sd.metadata->'source'->>'storage_folder' LIKE :folder_path_prefix")
                     params["folder_path_prefix"] = f"{slugified}%"
 
             if metadata_filters:
-                filters.append("sc.metadata @> CAST(:metadata_filter AS jsonb)")
+                doc_filters.append("sd.metadata @> CAST(:metadata_filter AS jsonb)")
                 params["metadata_filter"] = json.dumps(metadata_filters)
 
             # Resolve facet_filters via registry service (with alias expansion)
@@ -1129,14 +1222,16 @@ class PgSearchService:
 
                         param_key = f"facet_{facet_idx}"
                         facet_clauses.append(
-                            f"sc.metadata->'{ns}'->>'{ field}' = ANY(:{param_key})"
+                            f"sd.metadata->'{ns}'->>'{ field}' = ANY(:{param_key})"
                         )
                         params[param_key] = expanded_values
                         facet_idx += 1
 
                     if facet_clauses:
-                        filters.append("(" + " OR ".join(facet_clauses) + ")")
+                        doc_filters.append("(" + " OR ".join(facet_clauses) + ")")
 
+            if doc_filters:
+                filters.append(document_filter(doc_filters))
             filter_clause = " AND ".join(filters)
 
             # Escape query for FTS
@@ -1156,7 +1251,8 @@ class PgSearchService:
 
             return await self._execute_typed_search(
                 session, filter_clause, params, query, search_mode,
-                semantic_weight, limit, offset, combined_mapper
+                semantic_weight, limit, offset, combined_mapper,
+                ef_search=ef_search, probes=probes,
             )
 
         except Exception as e:
@@ -1217,6 +1313,7 @@ class PgSearchService:
 
         try:
             filters, params = self._build_base_filters(organization_id)
+            doc_filters: List[str] = []
 
             # SAM-specific source types
             if source_types:
@@ -1239,7 +1336,7 @@ class PgSearchService:
                     filters.append("sc.source_type IN ('sam_notice', 'sam_solicitation')")
 
             if notice_types:
-                filters.append("sc.metadata->'sam'->>'notice_type' = ANY(:notice_types)")
+                doc_filters.append("sd.metadata->'sam'->>'notice_type' = ANY(:notice_types)")
                 params["notice_types"] = notice_types
 
             if agencies:
@@ -1253,12 +1350,12 @@ class PgSearchService:
                         )
                     )
                 expanded_agencies = list(set(expanded_agencies))
-                filters.append("sc.metadata->'sam'->>'agency' = ANY(:agencies)")
+                doc_filters.append("sd.metadata->'sam'->>'agency' = ANY(:agencies)")
                 params["agencies"] = expanded_agencies
 
             # NAICS code filter (check metadata field)
             if naics_codes:
-                filters.append("sc.metadata->'sam'->>'naics_code' = ANY(:naics_codes)")
+                doc_filters.append("sd.metadata->'sam'->>'naics_code' = ANY(:naics_codes)")
                 params["naics_codes"] = naics_codes
 
             # Set-aside filter (with alias expansion + partial match fallback)
@@ -1276,17 +1373,17 @@ class PgSearchService:
                 set_aside_conditions = []
                 for i, sa_val in enumerate(expanded_set_asides):
                     param_name = f"set_aside_{i}"
-                    set_aside_conditions.append(f"sc.metadata->'sam'->>'set_aside' ILIKE :{param_name}")
+                    set_aside_conditions.append(f"sd.metadata->'sam'->>'set_aside' ILIKE :{param_name}")
                     params[param_name] = f"%{sa_val}%"
                 if set_aside_conditions:
-                    filters.append(f"({' OR '.join(set_aside_conditions)})")
+                    doc_filters.append(f"({' OR '.join(set_aside_conditions)})")
 
             # Posted within days filter
             if posted_within_days:
                 cutoff_date = (datetime.utcnow() - timedelta(days=posted_within_days)).replace(
                     hour=0, minute=0, second=0, microsecond=0
                 )
-                filters.append("(sc.metadata->'sam'->>'posted_date')::timestamp >= :posted_cutoff")
+                doc_filters.append("(sd.metadata->'sam'->>'posted_date')::timestamp >= :posted_cutoff")
                 params["posted_cutoff"] = cutoff_date
 
             # Response deadline filter
@@ -1295,7 +1392,7 @@ class PgSearchService:
                     deadline_date = datetime.utcnow().date()
                 else:
                     deadline_date = datetime.strptime(response_deadline_after, "%Y-%m-%d").date()
-                filters.append("(sc.metadata->'sam'->>'response_deadline')::date >= :deadline_date")
+                doc_filters.append("(sd.metadata->'sam'->>'response_deadline')::date >= :deadline_date")
                 params["deadline_date"] = deadline_date
 
             if date_from:
@@ -1306,6 +1403,8 @@ class PgSearchService:
                 filters.append("sc.created_at <= :date_to")
                 params["date_to"] = date_to
 
+            if doc_filters:
+                filters.append(document_filter(doc_filters))
             filter_clause = " AND ".join(filters)
 
             fts_query = self._escape_fts_query(query)
@@ -1361,6 +1460,7 @@ class PgSearchService:
         """
         try:
             filters, params = self._build_base_filters(organization_id)
+            doc_filters: List[str] = []
 
             # Salesforce-specific source types
             if entity_types:
@@ -1380,13 +1480,15 @@ class PgSearchService:
                 filters.append("sc.source_type IN ('salesforce_account', 'salesforce_contact', 'salesforce_opportunity')")
 
             if account_types:
-                filters.append("sc.metadata->'salesforce'->>'account_type' = ANY(:account_types)")
+                doc_filters.append("sd.metadata->'salesforce'->>'account_type' = ANY(:account_types)")
                 params["account_types"] = account_types
 
             if stages:
-                filters.append("sc.metadata->'salesforce'->>'stage_name' = ANY(:stages)")
+                doc_filters.append("sd.metadata->'salesforce'->>'stage_name' = ANY(:stages)")
                 params["stages"] = stages
 
+            if doc_filters:
+                filters.append(document_filter(doc_filters))
             filter_clause = " AND ".join(filters)
 
             fts_query = self._escape_fts_query(query)
@@ -1444,6 +1546,7 @@ class PgSearchService:
         """
         try:
             filters, params = self._build_base_filters(organization_id)
+            doc_filters: List[str] = []
 
             # Map user-facing source types to internal source_type values
             forecast_type_map = {
@@ -1460,7 +1563,7 @@ class PgSearchService:
                 filters.append("sc.source_type IN ('ag_forecast', 'apfs_forecast', 'state_forecast')")
 
             if fiscal_year:
-                filters.append("(sc.metadata->'forecast'->>'fiscal_year')::int = :fiscal_year")
+                doc_filters.append("(sd.metadata->'forecast'->>'fiscal_year')::int = :fiscal_year")
                 params["fiscal_year"] = fiscal_year
 
             if agency_name:
@@ -1471,21 +1574,23 @@ class PgSearchService:
                 )
                 if len(expanded_agency) > 1:
                     # Reference data found — use exact match with expanded list
-                    filters.append("sc.metadata->'forecast'->>'agency_name' = ANY(:agency_names)")
+                    doc_filters.append("sd.metadata->'forecast'->>'agency_name' = ANY(:agency_names)")
                     params["agency_names"] = expanded_agency
                 else:
                     # No reference data match — fall back to ILIKE partial match
-                    filters.append("sc.metadata->'forecast'->>'agency_name' ILIKE :agency_pattern")
+                    doc_filters.append("sd.metadata->'forecast'->>'agency_name' ILIKE :agency_pattern")
                     params["agency_pattern"] = f"%{agency_name}%"
 
             if naics_code:
-                filters.append("""(
-                    sc.metadata->'forecast'->>'naics_codes' LIKE :naics_pattern
-                    OR sc.metadata->'forecast'->>'naics_code' = :naics_code
+                doc_filters.append("""(
+                    sd.metadata->'forecast'->>'naics_codes' LIKE :naics_pattern
+                    OR sd.metadata->'forecast'->>'naics_code' = :naics_code
                 )""")
                 params["naics_pattern"] = f"%{naics_code}%"
                 params["naics_code"] = naics_code
 
+            if doc_filters:
+                filters.append(document_filter(doc_filters))
             filter_clause = " AND ".join(filters)
 
             fts_query = self._escape_fts_query(query)
@@ -1526,11 +1631,17 @@ class PgSearchService:
         limit: int = 20,
         offset: int = 0,
         facet_size: int = 10,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        facet_fields: Optional[List[str]] = None,
     ) -> SearchResults:
         """
         Execute search with faceted aggregations.
 
-        Returns search results plus facet counts for filtering.
+        Returns search results plus facet counts for filtering. Facets cover
+        the documents matching the query text within the organization;
+        facet_fields selects "source_type", "content_type" and/or registry
+        facet names (default: source_type and content_type).
         """
         # First, get search results
         results = await self.search(
@@ -1549,90 +1660,20 @@ class PgSearchService:
             facet_filters=facet_filters,
             limit=limit,
             offset=offset,
+            ef_search=ef_search,
+            probes=probes,
         )
 
-        # Build facets
+        # Build facets (all facets in one scan, cached per org + query)
         fts_query = self._escape_fts_query(query)
         if not fts_query:
             return results
 
-        params: Dict[str, Any] = {
-            "org_id": str(organization_id),
-            "fts_query": fts_query,
-            "facet_size": facet_size,
-        }
+        from .facet_service import facet_service
 
-        # Source type facet
-        source_type_sql = """
-            WITH asset_facets AS (
-                SELECT sc.source_type_filter as value, COUNT(DISTINCT sc.source_id) as count
-                FROM search_chunks sc
-                WHERE sc.organization_id = :org_id
-                AND sc.source_type = 'asset'
-                AND sc.search_vector @@ to_tsquery('english', :fts_query)
-                AND sc.source_type_filter IS NOT NULL
-                GROUP BY sc.source_type_filter
-            ),
-            forecast_facets AS (
-                SELECT 'forecast' as value, COUNT(DISTINCT sc.source_id) as count
-                FROM search_chunks sc
-                WHERE sc.organization_id = :org_id
-                AND sc.source_type IN ('ag_forecast', 'apfs_forecast', 'state_forecast')
-                AND sc.search_vector @@ to_tsquery('english', :fts_query)
-            ),
-            salesforce_facets AS (
-                SELECT
-                    CASE sc.source_type
-                        WHEN 'salesforce_account' THEN 'Accounts'
-                        WHEN 'salesforce_contact' THEN 'Contacts'
-                        WHEN 'salesforce_opportunity' THEN 'Opportunities'
-                    END as value,
-                    COUNT(DISTINCT sc.source_id) as count
-                FROM search_chunks sc
-                WHERE sc.organization_id = :org_id
-                AND sc.source_type IN ('salesforce_account', 'salesforce_contact', 'salesforce_opportunity')
-                AND sc.search_vector @@ to_tsquery('english', :fts_query)
-                GROUP BY sc.source_type
-            )
-            SELECT value, count FROM asset_facets WHERE count > 0
-            UNION ALL
-            SELECT value, count FROM forecast_facets WHERE count > 0
-            UNION ALL
-            SELECT value, count FROM salesforce_facets WHERE count > 0
-            ORDER BY count DESC
-            LIMIT :facet_size
-        """
-        source_result = await session.execute(text(source_type_sql), params)
-        source_buckets = [
-            FacetBucket(value=row.value, count=row.count)
-            for row in source_result.fetchall()
-        ]
-
-        # Content type facet
-        base_filter = """
-            sc.organization_id = :org_id
-            AND sc.source_type = 'asset'
-            AND sc.search_vector @@ to_tsquery('english', :fts_query)
-        """
-        content_type_sql = f"""
-            SELECT sc.content_type as value, COUNT(DISTINCT sc.source_id) as count
-            FROM search_chunks sc
-            WHERE {base_filter}
-            AND sc.content_type IS NOT NULL
-            GROUP BY sc.content_type
-            ORDER BY count DESC
-            LIMIT :facet_size
-        """
-        content_result = await session.execute(text(content_type_sql), params)
-        content_buckets = [
-            FacetBucket(value=row.value, count=row.count)
-            for row in content_result.fetchall()
-        ]
-
-        results.facets = {
-            "source_type": Facet(field="source_type", buckets=source_buckets),
-            "content_type": Facet(field="content_type", buckets=content_buckets),
-        }
+        results.facets = await facet_service.get_search_facets(
+            session, organization_id, fts_query, facet_fields, facet_size
+        )
 
         return results
 
@@ -295,6 +295,43 @@ class ArtifactService:
         )
         return list(result.scalars().all())
 
+    async def get_artifacts_by_documents(
+        self,
+        session: AsyncSession,
+        document_ids: List[str],
+        artifact_type: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Dict[str, List[Artifact]]:
+        """
+        Get artifacts for many documents with batched IN queries.
+
+        Args:
+            session: Database session
+            document_ids: Document identifiers
+            artifact_type: Optional artifact type filter
+            batch_size: Maximum document IDs per query
+
+        Returns:
+            Dict of document_id to artifacts (oldest first); documents
+            without artifacts are omitted
+        """
+        by_document: Dict[str, List[Artifact]] = {}
+        document_ids = list(dict.fromkeys(document_ids))
+        for i in range(0, len(document_ids), batch_size):
+            conditions = [
+                Artifact.document_id.in_(document_ids[i:i + batch_size]),
+                Artifact.deleted_at.is_(None),
+            ]
+            if artifact_type:
+                conditions.append(Artifact.artifact_type == artifact_type)
+
+            result = await session.execute(
+                select(Artifact).where(and_(*conditions)).order_by(Artifact.created_at)
+            )
+            for artifact in result.scalars().all():
+                by_document.setdefault(artifact.document_id, []).append(artifact)
+        return by_document
+
     # NOTE: get_artifact_by_document_and_job and list_artifacts_by_job have been removed.
     # The Job system was deprecated - use Run-based tracking instead.
 
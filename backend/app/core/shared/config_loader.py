@@ -331,7 +331,8 @@ class ConfigLoader:
                 model=config.model,
                 temperature=config.temperature if config.temperature is not None else DEFAULT_TEMPERATURES.get(task_type, 0.5),
                 max_tokens=config.max_tokens,
-                timeout=config.timeout
+                timeout=config.timeout,
+                context_window=config.context_window,
             )
 
         # Fallback to default model with recommended temperature
@@ -35,6 +35,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -70,6 +71,7 @@ class DatabaseService:
 
     Methods:
         get_session(): Get async database session (context manager)
+        get_autocommit_connection(): Get AUTOCOMMIT connection (context manager)
         init_db(): Initialize database (create all tables)
         health_check(): Check database connectivity
         close(): Close database engine and connections
@@ -214,6 +216,30 @@ class DatabaseService:
                 await session.rollback()
                 raise
 
+    @asynccontextmanager
+    async def get_autocommit_connection(self) -> AsyncGenerator[AsyncConnection, None]:
+        """
+        Get a connection in AUTOCOMMIT mode as context manager.
+
+        Needed for statements PostgreSQL refuses to run inside a transaction
+        block, such as CREATE INDEX CONCURRENTLY.
+
+        Usage:
+            async with database_service.get_autocommit_connection() as conn:
+                await conn.execute(text("CREATE INDEX CONCURRENTLY ..."))
+
+        Yields:
+            AsyncConnection: Connection with isolation_level=AUTOCOMMIT
+
+        Raises:
+            RuntimeError: If database engine is not initialized
+        """
+        if not self._engine:
+            raise RuntimeError("Database engine not initialized")
+
+        async with self._engine.connect() as conn:
+            yield await conn.execution_options(isolation_level="AUTOCOMMIT")
+
     async def init_db(self) -> None:
         """
         Initialize database by creating all tables.
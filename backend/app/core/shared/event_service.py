@@ -6,26 +6,169 @@ Provides a central event emission and subscription system for triggering
 procedures and pipelines based on system events.
 
 Events are lightweight triggers - the actual execution happens via Celery tasks.
+
+Key Features:
+- Trigger routing table: active event triggers of an organization are loaded
+  once into a SharedCache (event_name -> routes with compiled filters), so
+  events without subscribers cost no database round-trips
+- Batched dispatch: runs for all matching triggers of a batch of events are
+  created in one transaction with a single commit, and their Celery tasks are
+  submitted as one group
+- Outbox: emit(..., defer=True) records the event in event_outbox and returns;
+  the outbox dispatcher task drains pending events in batches
+
+Usage:
+    from app.core.shared.event_service import event_service
+
+    # Hot paths (extraction, connector syncs): queue for batched dispatch
+    await event_service.emit(session, "sam_pull.completed", org_id, payload, defer=True)
+
+    # Dispatch now and return the triggered runs
+    result = await event_service.emit(session, "custom.event", org_id, payload)
+
+    # After changing triggers or their procedures/pipelines
+    event_service.invalidate_triggers(org_id)
 """
 
 import logging
+import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, case, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database.procedures import (
+    EventOutbox,
     Pipeline,
     PipelineRun,
     PipelineTrigger,
     Procedure,
     ProcedureTrigger,
 )
+from app.core.shared.shared_cache import SharedCache
 
 logger = logging.getLogger("curatore.services.event_service")
 
+# Outbox events dispatched per transaction
+OUTBOX_BATCH_SIZE = 200
+
+# Dispatch attempts before an outbox event is marked failed
+OUTBOX_MAX_ATTEMPTS = 5
+
+# Seconds the dispatcher waits after a deferred emit, so events emitted in a
+# burst are dispatched together
+OUTBOX_DISPATCH_DELAY = 1
+
+
+def _compile_filter(filter_spec: Optional[Dict[str, Any]]) -> List[Tuple[List[str], str, Any]]:
+    """Compile an event filter into (path parts, operator, expected) checks."""
+    checks = []
+    for key, expected in (filter_spec or {}).items():
+        parts = key.split(".")
+        if isinstance(expected, dict):
+            if "$contains" in expected:
+                checks.append((parts, "$contains", expected["$contains"]))
+            elif "$in" in expected:
+                checks.append((parts, "$in", expected["$in"]))
+            elif "$ne" in expected:
+                checks.append((parts, "$ne", expected["$ne"]))
+            else:
+                # Nested dict comparison
+                checks.append((parts, "$eq", expected))
+        else:
+            checks.append((parts, "$eq", expected))
+    return checks
+
+
+def _get_path(data: Dict[str, Any], parts: List[str]) -> Any:
+    current = data
+    for part in parts:
+        if isinstance(current, dict):
+            current = current.get(part)
+        else:
+            return None
+    return current
+
+
+def _matches_compiled(payload: Dict[str, Any], checks: List[Tuple[List[str], str, Any]]) -> bool:
+    for parts, op, expected in checks:
+        actual = _get_path(payload, parts)
+        if op == "$contains":
+            if not isinstance(actual, list) or expected not in actual:
+                return False
+        elif op == "$in":
+            if actual not in expected:
+                return False
+        elif op == "$ne":
+            if actual == expected:
+                return False
+        elif actual != expected:
+            return False
+    return True
+
+
+class TriggerRoute:
+    """
+    One active event trigger of a procedure or pipeline.
+
+    Attributes:
+        kind: 'procedure' or 'pipeline'
+        trigger_id: ProcedureTrigger/PipelineTrigger id
+        target_id: Procedure/Pipeline id
+        slug: Procedure/pipeline slug
+        event_filter: Filter spec as stored on the trigger
+        trigger_params: Parameters merged under the event payload
+    """
+
+    __slots__ = ("kind", "trigger_id", "target_id", "slug", "event_filter", "trigger_params", "_checks")
+
+    def __init__(
+        self,
+        kind: str,
+        trigger_id: str,
+        target_id: str,
+        slug: str,
+        event_filter: Optional[Dict[str, Any]] = None,
+        trigger_params: Optional[Dict[str, Any]] = None,
+    ):
+        self.kind = kind
+        self.trigger_id = trigger_id
+        self.target_id = target_id
+        self.slug = slug
+        self.event_filter = event_filter
+        self.trigger_params = trigger_params
+        self._checks = _compile_filter(event_filter)
+
+    def matches(self, payload: Dict[str, Any]) -> bool:
+        """Check the event payload against the compiled filter."""
+        return _matches_compiled(payload, self._checks)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "trigger_id": self.trigger_id,
+            "target_id": self.target_id,
+            "slug": self.slug,
+            "event_filter": self.event_filter,
+            "trigger_params": self.trigger_params,
+        }
+
+
+def _encode_routes(routes: Dict[str, List[TriggerRoute]]) -> Dict[str, List[Dict[str, Any]]]:
+    return {name: [route.to_dict() for route in items] for name, items in routes.items()}
+
+
+def _decode_routes(data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[TriggerRoute]]:
+    return {name: [TriggerRoute(**item) for item in items] for name, items in data.items()}
+
+
+# Per-organization routing table (event_name -> routes)
+_trigger_cache = SharedCache(
+    "event_triggers", ttl=300, encode=_encode_routes, decode=_decode_routes
+)
+
 
 class EventService:
     """
@@ -49,6 +192,7 @@ class EventService:
         organization_id: UUID,
         payload: Dict[str, Any],
         source_run_id: Optional[UUID] = None,
+        defer: bool = False,
     ) -> Dict[str, Any]:
         """
         Emit an event and trigger matching procedures/pipelines.
@@ -59,214 +203,431 @@ class EventService:
             organization_id: Organization UUID
             payload: Event payload to pass to triggered items
             source_run_id: Optional run ID that triggered this event
+            defer: Record the event in the outbox for batched dispatch
+                instead of creating runs now (triggered lists are empty
+                and "queued" is True)
 
         Returns:
             Dict with triggered procedures and pipelines
         """
         logger.info(f"Event emitted: {event_name} for org {organization_id}")
 
-        triggered_procedures = await self._trigger_procedures(
-            session, event_name, organization_id, payload, source_run_id
-        )
+        result = {
+            "event_name": event_name,
+            "procedures_triggered": [],
+            "pipelines_triggered": [],
+        }
 
-        triggered_pipelines = await self._trigger_pipelines(
-            session, event_name, organization_id, payload, source_run_id
-        )
+        routes = await self._match_routes(session, organization_id, event_name, payload)
+        if not routes:
+            return result
+
+        if defer:
+            session.add(EventOutbox(
+                organization_id=organization_id,
+                event_name=event_name,
+                payload=payload,
+                source_run_id=source_run_id,
+            ))
+            await session.commit()
+            self._schedule_outbox_dispatch()
+            result["queued"] = True
+            logger.info(f"Event {event_name} queued for {len(routes)} triggers")
+            return result
 
-        total_triggered = len(triggered_procedures) + len(triggered_pipelines)
+        dispatched = await self._dispatch(
+            session, [(event_name, organization_id, payload, source_run_id, routes)]
+        )
+        result.update(dispatched[0])
+        total_triggered = len(result["procedures_triggered"]) + len(result["pipelines_triggered"])
         logger.info(f"Event {event_name} triggered {total_triggered} items")
+        return result
 
-        return {
-            "event_name": event_name,
-            "procedures_triggered": triggered_procedures,
-            "pipelines_triggered": triggered_pipelines,
-        }
+    # =========================================================================
+    # Trigger routing table
+    # =========================================================================
 
-    async def _trigger_procedures(
+    async def get_trigger_routes(
         self,
         session: AsyncSession,
-        event_name: str,
         organization_id: UUID,
-        payload: Dict[str, Any],
-        source_run_id: Optional[UUID],
-    ) -> List[Dict[str, Any]]:
-        """Find and trigger matching procedure triggers."""
-        from .run_service import run_service
-
-        # Find matching triggers
-        query = select(ProcedureTrigger).join(Procedure).where(
-            and_(
-                ProcedureTrigger.organization_id == organization_id,
-                ProcedureTrigger.trigger_type == "event",
-                ProcedureTrigger.event_name == event_name,
-                ProcedureTrigger.is_active == True,
-                Procedure.is_active == True,
+    ) -> Dict[str, List[TriggerRoute]]:
+        """Return the organization's active event triggers grouped by event name."""
+        return await _trigger_cache.get_or_load(
+            str(organization_id),
+            "routes",
+            lambda: self._load_trigger_routes(session, organization_id),
+        )
+
+    async def _load_trigger_routes(
+        self,
+        session: AsyncSession,
+        organization_id: UUID,
+    ) -> Dict[str, List[TriggerRoute]]:
+        routes: Dict[str, List[TriggerRoute]] = {}
+
+        procedure_rows = await session.execute(
+            select(
+                ProcedureTrigger.id,
+                ProcedureTrigger.event_name,
+                ProcedureTrigger.event_filter,
+                ProcedureTrigger.trigger_params,
+                Procedure.id,
+                Procedure.slug,
+            )
+            .join(Procedure, Procedure.id == ProcedureTrigger.procedure_id)
+            .where(
+                and_(
+                    ProcedureTrigger.organization_id == organization_id,
+                    ProcedureTrigger.trigger_type == "event",
+                    ProcedureTrigger.is_active == True,
+                    Procedure.is_active == True,
+                )
             )
         )
+        for trigger_id, event_name, event_filter, trigger_params, target_id, slug in procedure_rows:
+            routes.setdefault(event_name, []).append(TriggerRoute(
+                "procedure", str(trigger_id), str(target_id), slug, event_filter, trigger_params
+            ))
+
+        pipeline_rows = await session.execute(
+            select(
+                PipelineTrigger.id,
+                PipelineTrigger.event_name,
+                PipelineTrigger.event_filter,
+                PipelineTrigger.trigger_params,
+                Pipeline.id,
+                Pipeline.slug,
+            )
+            .join(Pipeline, Pipeline.id == PipelineTrigger.pipeline_id)
+            .where(
+                and_(
+                    PipelineTrigger.organization_id == organization_id,
+                    PipelineTrigger.trigger_type == "event",
+                    PipelineTrigger.is_active == True,
+                    Pipeline.is_active == True,
+                )
+            )
+        )
+        for trigger_id, event_name, event_filter, trigger_params, target_id, slug in pipeline_rows:
+            routes.setdefault(event_name, []).append(TriggerRoute(
+                "pipeline", str(trigger_id), str(target_id), slug, event_filter, trigger_params
+            ))
 
-        result = await session.execute(query)
-        triggers = result.scalars().all()
+        return routes
 
-        triggered = []
+    async def _match_routes(
+        self,
+        session: AsyncSession,
+        organization_id: UUID,
+        event_name: str,
+        payload: Dict[str, Any],
+    ) -> List[TriggerRoute]:
+        routes = await self.get_trigger_routes(session, organization_id)
+        return [route for route in routes.get(event_name, []) if route.matches(payload)]
 
-        for trigger in triggers:
-            # Check event filter if specified
-            if trigger.event_filter:
-                if not self._matches_filter(payload, trigger.event_filter):
-                    continue
+    def invalidate_triggers(self, organization_id: Optional[UUID] = None) -> None:
+        """
+        Invalidate the trigger routing table of an organization (or all).
 
-            # Get procedure
-            proc_query = select(Procedure).where(Procedure.id == trigger.procedure_id)
-            proc_result = await session.execute(proc_query)
-            procedure = proc_result.scalar_one_or_none()
+        Call after creating, deleting or toggling triggers, or changing the
+        procedures/pipelines they belong to.
+        """
+        _trigger_cache.invalidate(str(organization_id) if organization_id else None)
 
-            if not procedure:
-                continue
+    # =========================================================================
+    # Dispatch
+    # =========================================================================
 
-            # Merge trigger params with event payload
-            params = {**(trigger.trigger_params or {}), **payload}
+    async def _dispatch(
+        self,
+        session: AsyncSession,
+        events: List[Tuple[str, UUID, Dict[str, Any], Optional[UUID], List[TriggerRoute]]],
+    ) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Create runs for a batch of matched events and queue their tasks.
 
-            # Create run
-            run = await run_service.create_run(
-                session=session,
-                organization_id=organization_id,
-                run_type="procedure",
-                origin="event",
-                config={
-                    "procedure_slug": procedure.slug,
-                    "params": params,
-                    "triggered_by_event": event_name,
-                    "source_run_id": str(source_run_id) if source_run_id else None,
-                },
-            )
+        All runs are created in the session's current transaction, which is
+        committed once; the Celery tasks are then submitted as one group.
 
-            # Update run with procedure reference
-            run.procedure_id = procedure.id
-            run.procedure_version = procedure.version
+        Args:
+            session: Database session
+            events: (event_name, organization_id, payload, source_run_id, routes)
 
-            # Update trigger
-            trigger.last_triggered_at = datetime.utcnow()
-            trigger.trigger_count = (trigger.trigger_count or 0) + 1
+        Returns:
+            Per event, dict with procedures_triggered and pipelines_triggered
+        """
+        from celery import group
+
+        from app.core.database.models import Run
+        from app.core.tasks import execute_pipeline_task, execute_procedure_task
+
+        results = []
+        run_ids = []
+        signatures = []
+        fired: Dict[Tuple[str, str], int] = {}
+
+        for event_name, organization_id, payload, source_run_id, routes in events:
+            procedures_triggered = []
+            pipelines_triggered = []
+
+            for route in routes:
+                # Merge trigger params with event payload
+                params = {**(route.trigger_params or {}), **payload}
+
+                run = Run(
+                    id=uuid.uuid4(),
+                    organization_id=organization_id,
+                    run_type=route.kind,
+                    origin="event",
+                    status="pending",
+                    config={
+                        f"{route.kind}_slug": route.slug,
+                        "params": params,
+                        "triggered_by_event": event_name,
+                        "source_run_id": str(source_run_id) if source_run_id else None,
+                    },
+                    input_asset_ids=[],
+                )
+                session.add(run)
+                run_ids.append(run.id)
+                fired[(route.kind, route.trigger_id)] = fired.get((route.kind, route.trigger_id), 0) + 1
+
+                if route.kind == "procedure":
+                    signatures.append(execute_procedure_task.si(
+                        str(run.id),
+                        str(organization_id),
+                        route.slug,
+                        params,
+                        None,  # user_id
+                    ))
+                    procedures_triggered.append({
+                        "procedure_slug": route.slug,
+                        "run_id": str(run.id),
+                        "trigger_id": route.trigger_id,
+                    })
+                else:
+                    pipeline_run = PipelineRun(
+                        id=uuid.uuid4(),
+                        pipeline_id=UUID(route.target_id),
+                        run_id=run.id,
+                        organization_id=organization_id,
+                        current_stage=0,
+                    )
+                    session.add(pipeline_run)
+                    signatures.append(execute_pipeline_task.si(
+                        run_id=str(run.id),
+                        pipeline_run_id=str(pipeline_run.id),
+                        organization_id=str(organization_id),
+                        pipeline_slug=route.slug,
+                        params=params,
+                    ))
+                    pipelines_triggered.append({
+                        "pipeline_slug": route.slug,
+                        "run_id": str(run.id),
+                        "pipeline_run_id": str(pipeline_run.id),
+                        "trigger_id": route.trigger_id,
+                    })
+
+                logger.info(f"Triggered {route.kind} {route.slug} from event {event_name}")
+
+            results.append({
+                "procedures_triggered": procedures_triggered,
+                "pipelines_triggered": pipelines_triggered,
+            })
 
+        if not signatures:
+            return results
+
+        await self._record_trigger_fires(session, fired)
+        await session.commit()
+
+        try:
+            group(signatures).apply_async()
+        except Exception as e:
+            logger.error(f"Failed to queue {len(signatures)} triggered runs: {e}")
+            await session.execute(
+                update(Run)
+                .where(Run.id.in_(run_ids))
+                .values(
+                    status="failed",
+                    error_message=f"Failed to queue triggered run: {e}",
+                    completed_at=datetime.utcnow(),
+                )
+            )
             await session.commit()
+            raise
 
-            # Queue Celery task
-            from app.core.tasks import execute_procedure_task
+        return results
 
-            execute_procedure_task.delay(
-                str(run.id),
-                str(organization_id),
-                procedure.slug,
+    async def _record_trigger_fires(
+        self,
+        session: AsyncSession,
+        fired: Dict[Tuple[str, str], int],
+    ) -> None:
+        """Bump trigger_count/last_triggered_at with one executemany per trigger table."""
+        now = datetime.utcnow()
+        for kind, model in (("procedure", ProcedureTrigger), ("pipeline", PipelineTrigger)):
+            params = [
+                {"trigger_id": UUID(trigger_id), "fired": count, "fired_at": now}
+                for (route_kind, trigger_id), count in fired.items()
+                if route_kind == kind
+            ]
+            if not params:
+                continue
+            table = model.__table__
+            await session.execute(
+                table.update()
+                .where(table.c.id == bindparam("trigger_id"))
+                .values(
+                    trigger_count=table.c.trigger_count + bindparam("fired"),
+                    last_triggered_at=bindparam("fired_at"),
+                ),
                 params,
-                None,  # user_id
             )
 
-            triggered.append({
-                "procedure_slug": procedure.slug,
-                "run_id": str(run.id),
-                "trigger_id": str(trigger.id),
-            })
+    # =========================================================================
+    # Outbox
+    # =========================================================================
+
+    def _schedule_outbox_dispatch(self) -> None:
+        """Queue the outbox dispatcher (at most one pending kick per delay window)."""
+        try:
+            from app.core.shared.pubsub_service import pubsub_service
+
+            client = pubsub_service.get_sync_client()
+            if not client.set(
+                "curatore:event_outbox:dispatch_scheduled", "1",
+                nx=True, ex=OUTBOX_DISPATCH_DELAY,
+            ):
+                return
+        except Exception as e:
+            logger.debug(f"Outbox dispatch debounce unavailable: {e}")
+
+        try:
+            from app.core.tasks import dispatch_event_outbox_task
+
+            dispatch_event_outbox_task.apply_async(countdown=OUTBOX_DISPATCH_DELAY)
+        except Exception as e:
+            # The periodic dispatcher picks the event up
+            logger.warning(f"Failed to schedule event outbox dispatch: {e}")
+
+    async def dispatch_outbox(
+        self,
+        session: AsyncSession,
+        limit: int = OUTBOX_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Dispatch pending outbox events in one batch.
 
-            logger.info(f"Triggered procedure {procedure.slug} from event {event_name}")
+        Rows are locked with SKIP LOCKED, so concurrent dispatchers split the
+        backlog. Dispatched rows are deleted in the transaction that creates
+        their runs. If the batch fails, events are retried one at a time so a
+        single bad event cannot hold back the others.
 
-        return triggered
+        Args:
+            session: Database session
+            limit: Maximum events to dispatch
 
-    async def _trigger_pipelines(
+        Returns:
+            Dict with dispatched, triggered and failed counts
+        """
+        rows = await self._lock_outbox_rows(session, limit=limit)
+        if not rows:
+            return {"dispatched": 0, "triggered": 0, "failed": 0}
+
+        row_ids = [row.id for row in rows]
+        try:
+            triggered = await self._dispatch_outbox_rows(session, rows)
+            return {"dispatched": len(row_ids), "triggered": triggered, "failed": 0}
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"Batched outbox dispatch failed, retrying events individually: {e}")
+
+        stats = {"dispatched": 0, "triggered": 0, "failed": 0}
+        for row_id in row_ids:
+            try:
+                rows = await self._lock_outbox_rows(session, row_id=row_id)
+                if not rows:
+                    continue
+                stats["triggered"] += await self._dispatch_outbox_rows(session, rows)
+                stats["dispatched"] += 1
+            except Exception as e:
+                await session.rollback()
+                await self._record_outbox_failure(session, row_id, e)
+                stats["failed"] += 1
+        return stats
+
+    async def _lock_outbox_rows(
         self,
         session: AsyncSession,
-        event_name: str,
-        organization_id: UUID,
-        payload: Dict[str, Any],
-        source_run_id: Optional[UUID],
-    ) -> List[Dict[str, Any]]:
-        """Find and trigger matching pipeline triggers."""
-        from .run_service import run_service
-
-        # Find matching triggers
-        query = select(PipelineTrigger).join(Pipeline).where(
-            and_(
-                PipelineTrigger.organization_id == organization_id,
-                PipelineTrigger.trigger_type == "event",
-                PipelineTrigger.event_name == event_name,
-                PipelineTrigger.is_active == True,
-                Pipeline.is_active == True,
-            )
+        limit: int = OUTBOX_BATCH_SIZE,
+        row_id: Optional[UUID] = None,
+    ) -> List[EventOutbox]:
+        query = select(EventOutbox).where(EventOutbox.status == "pending")
+        if row_id is not None:
+            query = query.where(EventOutbox.id == row_id)
+        query = (
+            query.order_by(EventOutbox.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
-
         result = await session.execute(query)
-        triggers = result.scalars().all()
-
-        triggered = []
-
-        for trigger in triggers:
-            # Check event filter if specified
-            if trigger.event_filter:
-                if not self._matches_filter(payload, trigger.event_filter):
-                    continue
-
-            # Get pipeline
-            pipe_query = select(Pipeline).where(Pipeline.id == trigger.pipeline_id)
-            pipe_result = await session.execute(pipe_query)
-            pipeline = pipe_result.scalar_one_or_none()
-
-            if not pipeline:
-                continue
+        return list(result.scalars().all())
 
-            # Merge trigger params with event payload
-            params = {**(trigger.trigger_params or {}), **payload}
-
-            # Create run
-            run = await run_service.create_run(
-                session=session,
-                organization_id=organization_id,
-                run_type="pipeline",
-                origin="event",
-                config={
-                    "pipeline_slug": pipeline.slug,
-                    "params": params,
-                    "triggered_by_event": event_name,
-                    "source_run_id": str(source_run_id) if source_run_id else None,
-                },
-            )
-
-            # Create pipeline run
-            pipeline_run = PipelineRun(
-                pipeline_id=pipeline.id,
-                run_id=run.id,
-                organization_id=organization_id,
-                status="pending",
-                current_stage=0,
-                input_params=params,
+    async def _dispatch_outbox_rows(
+        self,
+        session: AsyncSession,
+        rows: List[EventOutbox],
+    ) -> int:
+        """Match, delete and dispatch locked outbox rows; returns runs triggered."""
+        events = []
+        for row in rows:
+            # Matched against the current routing table
+            routes = await self._match_routes(
+                session, row.organization_id, row.event_name, row.payload or {}
             )
-            session.add(pipeline_run)
-
-            # Update trigger
-            trigger.last_triggered_at = datetime.utcnow()
-            trigger.trigger_count = (trigger.trigger_count or 0) + 1
+            if routes:
+                events.append((
+                    row.event_name, row.organization_id, row.payload or {}, row.source_run_id, routes
+                ))
 
+        await session.execute(
+            delete(EventOutbox).where(EventOutbox.id.in_([row.id for row in rows]))
+        )
+        if not events:
             await session.commit()
+            return 0
 
-            # Queue Celery task
-            from app.core.tasks import execute_pipeline_task
+        results = await self._dispatch(session, events)
+        return sum(
+            len(r["procedures_triggered"]) + len(r["pipelines_triggered"]) for r in results
+        )
 
-            execute_pipeline_task.delay(
-                run_id=str(run.id),
-                pipeline_run_id=str(pipeline_run.id),
-                organization_id=str(organization_id),
-                pipeline_slug=pipeline.slug,
-                params=params,
+    async def _record_outbox_failure(
+        self,
+        session: AsyncSession,
+        row_id: UUID,
+        error: Exception,
+    ) -> None:
+        logger.error(f"Failed to dispatch outbox event {row_id}: {error}")
+        await session.execute(
+            update(EventOutbox)
+            .where(EventOutbox.id == row_id)
+            .values(
+                attempts=EventOutbox.attempts + 1,
+                error_message=str(error),
+                status=case(
+                    (EventOutbox.attempts + 1 >= OUTBOX_MAX_ATTEMPTS, "failed"),
+                    else_="pending",
+                ),
             )
+        )
+        await session.commit()
 
-            triggered.append({
-                "pipeline_slug": pipeline.slug,
-                "run_id": str(run.id),
-                "pipeline_run_id": str(pipeline_run.id),
-                "trigger_id": str(trigger.id),
-            })
-
-            logger.info(f"Triggered pipeline {pipeline.slug} from event {event_name}")
-
-        return triggered
+    # =========================================================================
+    # Filters
+    # =========================================================================
 
     def _matches_filter(self, payload: Dict[str, Any], filter_spec: Dict[str, Any]) -> bool:
         """
@@ -277,44 +638,11 @@ class EventService:
         - Nested paths: {"run.status": "completed"}
         - List contains: {"tags": {"$contains": "important"}}
         """
-        for key, expected in filter_spec.items():
-            # Get value from payload using dot notation
-            actual = self._get_nested(payload, key)
-
-            if isinstance(expected, dict):
-                # Handle operators
-                if "$contains" in expected:
-                    if not isinstance(actual, list):
-                        return False
-                    if expected["$contains"] not in actual:
-                        return False
-                elif "$in" in expected:
-                    if actual not in expected["$in"]:
-                        return False
-                elif "$ne" in expected:
-                    if actual == expected["$ne"]:
-                        return False
-                else:
-                    # Nested dict comparison
-                    if actual != expected:
-                        return False
-            else:
-                # Simple equality
-                if actual != expected:
-                    return False
-
-        return True
+        return _matches_compiled(payload, _compile_filter(filter_spec))
 
     def _get_nested(self, data: Dict[str, Any], path: str) -> Any:
         """Get a nested value from a dict using dot notation."""
-        parts = path.split(".")
-        current = data
-        for part in parts:
-            if isinstance(current, dict):
-                current = current.get(part)
-            else:
-                return None
-        return current
+        return _get_path(data, path.split("."))
 
 
 # Global singleton
@@ -23,6 +23,9 @@ Architecture:
     - Channel pattern: curatore:org:{organization_id}:jobs
     - Multi-tenant isolation enforced at channel level
     - Each organization gets its own channel for job updates
+    - Cache invalidations are broadcast on curatore:cache:invalidate (see
+      app.core.shared.shared_cache), using a synchronous client so they can
+      be sent from any context (API, Celery tasks, sync code)
 """
 
 import asyncio
@@ -30,13 +33,17 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Callable, Dict, Iterator, Optional
 from uuid import UUID
 
+import redis as sync_redis
 import redis.asyncio as redis
 
 logger = logging.getLogger("curatore.pubsub_service")
 
+# Channel for shared cache invalidation messages (all processes subscribe)
+CACHE_INVALIDATION_CHANNEL = "curatore:cache:invalidate"
+
 
 def _serialize_uuid(obj: Any) -> Any:
     """Convert UUIDs to strings for JSON serialization."""
@@ -80,6 +87,7 @@ class PubSubService:
         self._publisher: Optional[redis.Redis] = None
         self._connected = False
         self._lock = asyncio.Lock()
+        self._sync_client: Optional[sync_redis.Redis] = None
 
     def _get_channel_name(self, organization_id: UUID) -> str:
         """
@@ -270,6 +278,83 @@ class PubSubService:
             await subscriber.close()
             logger.info(f"Unsubscribed from pattern: {pattern}")
 
+    # =========================================================================
+    # Cache Invalidation
+    # =========================================================================
+
+    def get_sync_client(self) -> sync_redis.Redis:
+        """
+        Return a synchronous Redis client for the pub/sub database.
+
+        The client is not bound to an event loop, so it can be shared by
+        Celery tasks (one event loop per task), API requests and threads.
+        Short timeouts keep callers from blocking when Redis is down.
+        """
+        if self._sync_client is None:
+            self._sync_client = sync_redis.Redis.from_url(
+                self._redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._sync_client
+
+    def publish_cache_invalidation(self, message: Dict[str, Any]) -> bool:
+        """
+        Broadcast a cache invalidation message to all processes.
+
+        Args:
+            message: Invalidation payload (cache name, scope, origin)
+
+        Returns:
+            True if published successfully, False otherwise
+        """
+        try:
+            self.get_sync_client().publish(
+                CACHE_INVALIDATION_CHANNEL, json.dumps(_serialize_uuid(message))
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Failed to publish cache invalidation: {e}")
+            return False
+
+    def listen_cache_invalidations(
+        self,
+        on_subscribed: Optional[Callable[[], None]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Block and yield cache invalidation messages (for a listener thread).
+
+        Uses a dedicated connection without a read timeout. Raises on
+        connection errors; callers reconnect.
+
+        Args:
+            on_subscribed: Called once the subscription is established
+        """
+        subscriber = sync_redis.Redis.from_url(
+            self._redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            socket_connect_timeout=2,
+            health_check_interval=30,
+        )
+        pubsub = subscriber.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+            if on_subscribed:
+                on_subscribed()
+            for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                try:
+                    yield json.loads(message["data"])
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse cache invalidation: {e}")
+        finally:
+            pubsub.close()
+            subscriber.close()
+
     async def close(self) -> None:
         """Close the publisher connection."""
         async with self._lock:
@@ -31,6 +31,15 @@ Usage:
 
     # When child fails:
     await run_group_service.child_failed(session, child_run_id)
+
+    # When the parent is done creating children:
+    await run_group_service.finalize_group(session, group.id)
+
+Child accounting is atomic: counters are incremented with UPDATE ... RETURNING
+on the group row, and the group completes (emitting its event once) only
+after finalize_group() and when every registered child has finished. Each
+child is counted once: a child failed by a timeout and later completed by
+its worker only contributes its first result.
 """
 
 import logging
@@ -38,7 +47,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database.models import Run, RunGroup
@@ -148,19 +157,38 @@ class RunGroupService:
         child_run.group_id = group_id
         child_run.is_group_parent = False
 
-        # Increment total_children count
-        group_query = select(RunGroup).where(RunGroup.id == group_id)
-        result = await session.execute(group_query)
-        group = result.scalar_one_or_none()
-
-        if group:
-            group.total_children += 1
-            if group.status == "pending":
-                group.status = "running"
-                group.started_at = datetime.utcnow()
+        await self.register_children(session, group_id)
 
         logger.debug(f"Added child {child_run_id} to group {group_id}")
 
+    async def register_children(
+        self,
+        session: AsyncSession,
+        group_id: UUID,
+        count: int = 1,
+    ) -> None:
+        """
+        Atomically add children to a group's total and mark it running.
+
+        Called when child runs are linked to the group (the extraction queue
+        does this for every child it creates).
+
+        Args:
+            session: Database session
+            group_id: Group UUID
+            count: Number of children to add
+        """
+        await session.execute(
+            update(RunGroup)
+            .where(RunGroup.id == group_id)
+            .values(
+                total_children=RunGroup.total_children + count,
+                status=case((RunGroup.status == "pending", "running"), else_=RunGroup.status),
+                started_at=func.coalesce(RunGroup.started_at, datetime.utcnow()),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     async def set_expected_children(
         self,
         session: AsyncSession,
@@ -171,15 +199,17 @@ class RunGroupService:
         Set the expected number of children for a group.
         Useful when you know upfront how many children will be created.
         """
-        query = select(RunGroup).where(RunGroup.id == group_id)
-        result = await session.execute(query)
-        group = result.scalar_one_or_none()
-
-        if group:
-            group.total_children = count
-            if group.status == "pending" and count > 0:
-                group.status = "running"
-                group.started_at = datetime.utcnow()
+        values = {"total_children": count}
+        if count > 0:
+            values["status"] = case((RunGroup.status == "pending", "running"), else_=RunGroup.status)
+            values["started_at"] = func.coalesce(RunGroup.started_at, datetime.utcnow())
+
+        await session.execute(
+            update(RunGroup)
+            .where(RunGroup.id == group_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
 
     async def child_completed(
         self,
@@ -196,29 +226,7 @@ class RunGroupService:
         Returns:
             RunGroup if group is now complete, None otherwise
         """
-        # Get the run and its group
-        run_query = select(Run).where(Run.id == child_run_id)
-        result = await session.execute(run_query)
-        run = result.scalar_one_or_none()
-
-        if not run or not run.group_id:
-            return None
-
-        # Get group
-        group = await self.get_group(session, run.group_id)
-        if not group:
-            return None
-
-        # Increment completed count
-        group.completed_children += 1
-
-        logger.debug(
-            f"Child {child_run_id} completed in group {group.id} "
-            f"({group.completed_children + group.failed_children}/{group.total_children})"
-        )
-
-        # Check if group is complete
-        return await self._check_group_completion(session, group)
+        return await self._record_child_result(session, child_run_id, failed=False)
 
     async def child_failed(
         self,
@@ -237,62 +245,120 @@ class RunGroupService:
         Returns:
             RunGroup if group is now complete, None otherwise
         """
-        # Get the run and its group
-        run_query = select(Run).where(Run.id == child_run_id)
-        result = await session.execute(run_query)
-        run = result.scalar_one_or_none()
+        return await self._record_child_result(session, child_run_id, failed=True)
 
-        if not run or not run.group_id:
+    async def _record_child_result(
+        self,
+        session: AsyncSession,
+        child_run_id: UUID,
+        failed: bool,
+    ) -> Optional[RunGroup]:
+        """
+        Increment the group's completed/failed counter for a child run.
+
+        The child is first claimed by setting group_result_recorded_at only
+        while it is unset, so a repeated report for the same child (e.g. a
+        worker finishing after the timeout sweep failed it) changes nothing.
+        The counter is then bumped with a single UPDATE ... RETURNING on the
+        group row: concurrent children serialize on the row lock instead of
+        overwriting each other's counts, and the returned counters decide
+        whether completion is attempted.
+        """
+        claim = await session.execute(
+            update(Run)
+            .where(
+                Run.id == child_run_id,
+                Run.group_id.isnot(None),
+                Run.group_result_recorded_at.is_(None),
+            )
+            .values(group_result_recorded_at=datetime.utcnow())
+            .returning(Run.group_id)
+            .execution_options(synchronize_session=False)
+        )
+        group_id = claim.scalar_one_or_none()
+        if group_id is None:
+            logger.debug(f"Child {child_run_id} has no group or was already counted")
             return None
 
-        # Get group
-        group = await self.get_group(session, run.group_id)
-        if not group:
+        counter = RunGroup.failed_children if failed else RunGroup.completed_children
+        result = await session.execute(
+            update(RunGroup)
+            .where(RunGroup.id == group_id)
+            .values({counter.key: counter + 1})
+            .returning(
+                RunGroup.id,
+                RunGroup.status,
+                RunGroup.total_children,
+                RunGroup.completed_children,
+                RunGroup.failed_children,
+                RunGroup.finalized_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+        if row is None:
             return None
 
-        # Increment failed count
-        group.failed_children += 1
-
+        processed = row.completed_children + row.failed_children
         logger.debug(
-            f"Child {child_run_id} failed in group {group.id} "
-            f"({group.completed_children + group.failed_children}/{group.total_children})"
+            f"Child {child_run_id} {'failed' if failed else 'completed'} in group {row.id} "
+            f"({processed}/{row.total_children})"
         )
 
-        # Check if group is complete
-        return await self._check_group_completion(session, group)
+        if (
+            row.finalized_at is None
+            or row.status not in ("pending", "running")
+            or processed < row.total_children
+        ):
+            return None
+
+        return await self._check_group_completion(session, row.id)
 
     async def _check_group_completion(
         self,
         session: AsyncSession,
-        group: RunGroup,
+        group_id: UUID,
     ) -> Optional[RunGroup]:
         """
-        Check if a group is complete and update status accordingly.
+        Complete a group if it is finalized and all children are processed.
+
+        The status transition is a conditional UPDATE, so exactly one caller
+        completes the group (and emits its event) even when the last children
+        and the parent's finalize_group() race.
 
         Returns the group if it just completed, None otherwise.
         """
-        processed = group.completed_children + group.failed_children
-
-        # Not all children processed yet
-        if processed < group.total_children:
+        result = await session.execute(
+            update(RunGroup)
+            .where(
+                RunGroup.id == group_id,
+                RunGroup.status.in_(("pending", "running")),
+                RunGroup.finalized_at.isnot(None),
+                RunGroup.completed_children + RunGroup.failed_children >= RunGroup.total_children,
+            )
+            .values(
+                status=case(
+                    (RunGroup.failed_children == 0, "completed"),
+                    (RunGroup.completed_children == 0, "failed"),
+                    else_="partial",
+                ),
+                completed_at=datetime.utcnow(),
+            )
+            .returning(RunGroup)
+            .execution_options(populate_existing=True)
+        )
+        group = result.scalars().first()
+        if group is None:
             return None
 
-        # Group is complete - determine final status
-        group.completed_at = datetime.utcnow()
-
-        if group.failed_children == 0:
-            group.status = "completed"
-        elif group.completed_children == 0:
-            group.status = "failed"
-        else:
-            group.status = "partial"
-
         group.results_summary = {
             "total_children": group.total_children,
             "completed_children": group.completed_children,
             "failed_children": group.failed_children,
             "status": group.status,
         }
+        if group.total_children == 0:
+            group.results_summary["message"] = "No children to process"
 
         logger.info(
             f"Group {group.id} completed: {group.status} "
@@ -336,6 +402,7 @@ class RunGroupService:
                 organization_id=group.organization_id,
                 payload=payload,
                 source_run_id=group.parent_run_id,
+                defer=True,
             )
             logger.info(f"Emitted {event_name} for group {group.id}")
         except Exception as e:
@@ -436,30 +503,22 @@ class RunGroupService:
         """
         Finalize a group - call this when parent job is done creating children.
 
-        If all children are already complete, this will trigger group completion.
-        This handles the case where children complete before the parent finishes
-        registering them.
+        Until a group is finalized it cannot complete, so children finishing
+        while the parent is still spawning do not end the group early. If all
+        children are already complete (or there are none), this triggers
+        group completion.
         """
-        group = await self.get_group(session, group_id)
-        if not group:
+        result = await session.execute(
+            update(RunGroup)
+            .where(RunGroup.id == group_id)
+            .values(finalized_at=func.coalesce(RunGroup.finalized_at, datetime.utcnow()))
+            .returning(RunGroup.id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.first() is None:
             return None
 
-        # If group has no children, complete it immediately
-        if group.total_children == 0:
-            group.status = "completed"
-            group.completed_at = datetime.utcnow()
-            group.results_summary = {
-                "total_children": 0,
-                "completed_children": 0,
-                "failed_children": 0,
-                "status": "completed",
-                "message": "No children to process",
-            }
-            await self._emit_group_event(session, group)
-            return group
-
-        # Check if already complete
-        return await self._check_group_completion(session, group)
+        return await self._check_group_completion(session, group_id)
 
     async def should_spawn_children(
         self,
@@ -32,21 +32,30 @@ Usage:
         message="Failed to extract document",
         context={"document_id": "123", "error": "Unsupported format"},
     )
+
+Events are written behind (see app.core.shared.run_telemetry): log_event
+returns immediately and the events are inserted in batches. Read methods
+flush this process's buffer first.
 """
 
 import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database.models import Run, RunLogEvent
 
+from .run_telemetry import run_telemetry
+
 logger = logging.getLogger("curatore.run_log_service")
 
+# Runs whose organization id is remembered for publishing log events
+RUN_ORG_CACHE_SIZE = 10_000
+
 
 class RunLogService:
     """
@@ -57,6 +66,10 @@ class RunLogService:
     by system for debugging and auditing.
     """
 
+    def __init__(self):
+        # Organization of each run seen, for publishing without a lookup
+        self._run_orgs: Dict[UUID, Optional[UUID]] = {}
+
     # =========================================================================
     # CREATE OPERATIONS
     # =========================================================================
@@ -73,6 +86,10 @@ class RunLogService:
         """
         Create a structured log event for a run.
 
+        The event is buffered and inserted with other events shortly after
+        (or when the run's status changes); the session is only used to
+        look up the run's organization the first time a run logs.
+
         Args:
             session: Database session
             run_id: Run UUID
@@ -82,25 +99,22 @@ class RunLogService:
             context: Machine-readable context dict
 
         Returns:
-            Created RunLogEvent instance
+            Created RunLogEvent instance (not attached to the session)
         """
         event = RunLogEvent(
+            id=uuid4(),
             run_id=run_id,
             level=level,
             event_type=event_type,
             message=message,
             context=context,
+            created_at=datetime.utcnow(),
         )
 
-        session.add(event)
-
-        # Update run's last_activity_at for activity-based timeout tracking
-        run = await session.get(Run, run_id)
-        if run and run.status in ("submitted", "running"):
-            run.last_activity_at = datetime.utcnow()
-
-        await session.commit()
-        await session.refresh(event)
+        # Also updates the run's last_activity_at for activity-based timeouts.
+        # Never flushes inline: the caller's transaction may hold run rows
+        # the flush updates; a full buffer wakes the flusher instead.
+        run_telemetry.add_event(event)
 
         # Also log to application logger at appropriate level
         log_func = {
@@ -112,15 +126,25 @@ class RunLogService:
         log_func(f"[Run {run_id}] {message}")
 
         # Publish log event to WebSocket clients via pub/sub
-        if run and run.organization_id:
+        organization_id = await self._get_run_organization(session, run_id)
+        if organization_id:
             self._publish_log_event(
-                organization_id=run.organization_id,
+                organization_id=organization_id,
                 event=event,
                 run_id=run_id,
             )
 
         return event
 
+    async def _get_run_organization(self, session: AsyncSession, run_id: UUID) -> Optional[UUID]:
+        """Return a run's organization id, loading it once per run."""
+        if run_id not in self._run_orgs:
+            if len(self._run_orgs) >= RUN_ORG_CACHE_SIZE:
+                self._run_orgs.clear()
+            result = await session.execute(select(Run.organization_id).where(Run.id == run_id))
+            self._run_orgs[run_id] = result.scalar_one_or_none()
+        return self._run_orgs[run_id]
+
     def _publish_log_event(
         self,
         organization_id: UUID,
@@ -368,6 +392,8 @@ class RunLogService:
         Returns:
             List of RunLogEvent instances (ordered by created_at asc)
         """
+        await run_telemetry.flush()
+
         query = select(RunLogEvent).where(RunLogEvent.run_id == run_id)
 
         if level:
@@ -401,6 +427,8 @@ class RunLogService:
         Returns:
             List of recent RunLogEvent instances (ordered by created_at desc)
         """
+        await run_telemetry.flush()
+
         result = await session.execute(
             select(RunLogEvent)
             .where(RunLogEvent.run_id == run_id)
@@ -445,6 +473,8 @@ class RunLogService:
         Returns:
             Dict mapping level to count (e.g., {"INFO": 10, "ERROR": 2})
         """
+        await run_telemetry.flush()
+
         result = await session.execute(
             select(
                 RunLogEvent.level,
@@ -471,6 +501,8 @@ class RunLogService:
         Returns:
             True if run has errors, False otherwise
         """
+        await run_telemetry.flush()
+
         result = await session.execute(
             select(func.count(RunLogEvent.id))
             .where(
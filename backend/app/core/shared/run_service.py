@@ -42,6 +42,10 @@ WebSocket Integration:
     Event types:
     - run_status: Published on status changes (pending, running, completed, failed, etc.)
     - run_progress: Published on progress updates
+
+Progress updates are written behind (see app.core.shared.run_telemetry):
+each run's latest progress is written and published on the next telemetry
+flush, and every status change flushes first.
 """
 
 import asyncio
@@ -56,6 +60,8 @@ from sqlalchemy.orm import selectinload
 
 from app.core.database.models import Run
 
+from .run_telemetry import run_telemetry
+
 logger = logging.getLogger("curatore.run_service")
 
 
@@ -89,6 +95,8 @@ def _get_display_name_for_run(run: "Run") -> str:
         task_name = config.get("scheduled_task_name", "Maintenance Task")
         task_labels = {
             "search_reindex": "Search Index Rebuild",
+            "search_ann_rebuild": "Search ANN Index Rebuild",
+            "search_facet_counts_rebuild": "Search Facet Counts Rebuild",
             "queue_pending_assets": "Queue Pending Assets",
             "stale_run_cleanup": "Stale Run Cleanup",
             "system_health_report": "System Health Report",
@@ -470,6 +478,9 @@ class RunService:
         Raises:
             ValueError: If status transition is invalid
         """
+        # Buffered log events and progress land before the status change
+        await run_telemetry.flush()
+
         run = await self.get_run(session, run_id)
         if not run:
             return None
@@ -539,10 +550,14 @@ class RunService:
         unit: str = "items",
         phase: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
-    ) -> Optional[Run]:
+    ) -> None:
         """
         Update run progress tracking.
 
+        Progress is coalesced per run in memory: only the latest value is
+        written (with last_activity_at) and published as run_progress on the
+        next telemetry flush, so frequent ticks cost no database round trip.
+
         Args:
             session: Database session
             run_id: Run UUID
@@ -552,9 +567,6 @@ class RunService:
             phase: Current execution phase (e.g., "scanning", "processing", "finalizing")
             details: Additional progress details (e.g., {"new_files": 5, "errors": 1})
 
-        Returns:
-            Updated Run instance or None if not found
-
         Example progress structures:
 
             # Simple progress
@@ -573,10 +585,6 @@ class RunService:
                 "errors": 0
             }
         """
-        run = await self.get_run(session, run_id)
-        if not run:
-            return None
-
         # Calculate percentage if total is known
         percent = None
         if total and total > 0:
@@ -598,22 +606,8 @@ class RunService:
         if details:
             progress.update(details)
 
-        run.progress = progress
-
-        # Track activity for timeout detection
-        run.last_activity_at = datetime.utcnow()
-
-        await session.commit()
-        await session.refresh(run)
-
-        # Publish progress update to WebSocket clients
-        await _publish_run_event(
-            organization_id=run.organization_id,
-            event_type="run_progress",
-            run=run,
-        )
-
-        return run
+        # Also tracks activity for timeout detection
+        run_telemetry.set_progress(run_id, progress)
 
     async def start_run(
         self,
@@ -0,0 +1,499 @@
+"""
+Write-Behind Buffer for Run Log Events and Progress.
+
+RunLogService.log_event and RunService.update_run_progress used to run a
+database transaction for every call, so a long SharePoint sync or SAM pull
+logging thousands of lines spent much of its time committing. They now hand
+their writes to this buffer, which persists them in batches on a session of
+its own.
+
+Features:
+- Per-run coalescing of progress and last_activity_at (latest value wins)
+- Log events written with batched INSERTs every FLUSH_INTERVAL_SECONDS or
+  once FLUSH_MAX_EVENTS are buffered; logging only wakes the flusher and
+  never waits on a flush
+- RunService flushes before every status change, so a completed or failed
+  run's log and progress are complete
+- Flushes never wait on run rows locked by the caller's own transaction:
+  locked runs are skipped (FOR NO KEY UPDATE SKIP LOCKED) and their
+  progress retried on the next flush, and other waits give up after
+  FLUSH_LOCK_TIMEOUT_MS
+- Events of a run created in a transaction that has not committed yet
+  stay buffered for up to UNSEEN_RUN_GRACE_SECONDS instead of being
+  dropped as events of a deleted run
+- Crash safety: buffered events are appended to a Redis stream within
+  JOURNAL_INTERVAL_SECONDS (one pipelined, off-loop round trip per batch)
+  and removed once inserted; recover() inserts the entries left behind by
+  a process that died before flushing
+
+Usage:
+    from app.core.shared.run_telemetry import run_telemetry
+
+    run_telemetry.add_event(event)
+    run_telemetry.set_progress(run_id, progress)
+
+    # Persist everything buffered so far
+    await run_telemetry.flush()
+
+    # Replay events stranded in the Redis stream (startup, maintenance)
+    await run_telemetry.recover()
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.database.models import Run, RunLogEvent
+
+logger = logging.getLogger("curatore.run_telemetry")
+
+# Buffered writes are flushed at least this often while a run is logging
+FLUSH_INTERVAL_SECONDS = 1.0
+
+# Flush as soon as this many log events are buffered
+FLUSH_MAX_EVENTS = 200
+
+# A flush gives up (and keeps its writes buffered) rather than wait longer
+# than this for a lock held by another transaction
+FLUSH_LOCK_TIMEOUT_MS = 2000
+
+# Events of a run not visible to the flush session (created by a caller
+# that has not committed yet) are retried for this long before they are
+# treated as events of a deleted run
+UNSEEN_RUN_GRACE_SECONDS = 300
+
+# Buffered events are journaled to the Redis stream at least this often;
+# events logged in the last window are the only ones a crash can lose
+JOURNAL_INTERVAL_SECONDS = 0.1
+
+# Events kept in memory while the database is unreachable; older ones are
+# left to recover() from the Redis stream
+MAX_BUFFERED_EVENTS = 10_000
+
+# Rows per INSERT statement
+INSERT_CHUNK_SIZE = 1000
+
+# Redis stream holding events that are not yet in the database
+TELEMETRY_STREAM = "curatore:run_telemetry"
+
+# Approximate cap on the stream length (oldest entries are trimmed)
+TELEMETRY_STREAM_MAXLEN = 100_000
+
+# After a Redis error, skip the stream for this long instead of waiting on
+# a connection timeout for every event
+STREAM_RETRY_SECONDS = 30.0
+
+# recover() only replays entries at least this old, leaving recent entries
+# to the live process that is about to flush them
+RECOVERY_MIN_AGE_SECONDS = 60
+
+
+@dataclass
+class _BufferedEvent:
+    """A log event row waiting to be inserted, with its stream entry id once journaled."""
+
+    row: Dict[str, Any]
+    entry_id: Optional[str] = None
+
+
+def _event_row(event: RunLogEvent) -> Dict[str, Any]:
+    """Column values of a log event for a bulk INSERT."""
+    return {
+        "id": event.id,
+        "run_id": event.run_id,
+        "level": event.level,
+        "event_type": event.event_type,
+        "message": event.message,
+        "context": event.context,
+        "created_at": event.created_at,
+    }
+
+
+def _encode_row(row: Dict[str, Any]) -> str:
+    """Serialize an event row for the Redis stream."""
+    return json.dumps({
+        **row,
+        "id": str(row["id"]),
+        "run_id": str(row["run_id"]),
+        "created_at": row["created_at"].isoformat(),
+    }, default=str)
+
+
+def _decode_row(data: str) -> Dict[str, Any]:
+    """Parse an event row stored in the Redis stream."""
+    row = json.loads(data)
+    row["id"] = UUID(row["id"])
+    row["run_id"] = UUID(row["run_id"])
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+class RunTelemetryBuffer:
+    """
+    Buffers run log events, progress and activity timestamps.
+
+    The buffer itself is plain data, so it works across the event loops of
+    Celery tasks (one asyncio.run per task). A flusher task is started on
+    the current loop whenever something is buffered; it journals new events
+    every JOURNAL_INTERVAL_SECONDS, flushes every FLUSH_INTERVAL_SECONDS,
+    exits once the buffer is empty, and flushes a last time if its loop
+    shuts down.
+    """
+
+    def __init__(self):
+        # Pending log events, and the subset not yet in the Redis stream
+        self._events: List[_BufferedEvent] = []
+        self._unjournaled: List[_BufferedEvent] = []
+        self._progress: Dict[UUID, Dict[str, Any]] = {}
+        self._activity: Dict[UUID, datetime] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+        self._stream_disabled_until = 0.0
+
+    # =========================================================================
+    # BUFFERING
+    # =========================================================================
+
+    def add_event(self, event: RunLogEvent) -> None:
+        """
+        Buffer a log event for insertion.
+
+        The event must have its id and created_at set. Also records activity
+        for the run's last_activity_at. No I/O happens here: the flusher
+        journals and inserts the event later.
+        """
+        buffered = _BufferedEvent(_event_row(event))
+        self._events.append(buffered)
+        self._unjournaled.append(buffered)
+        self._activity[event.run_id] = event.created_at
+        self._schedule_flush()
+
+    def set_progress(self, run_id: UUID, progress: Dict[str, Any]) -> None:
+        """Buffer a run's progress, replacing any progress not yet written."""
+        self._progress[run_id] = progress
+        self._activity[run_id] = datetime.utcnow()
+        self._schedule_flush()
+
+    def should_flush(self) -> bool:
+        """Whether the event buffer has reached its size threshold (the flusher checks this)."""
+        return len(self._events) >= FLUSH_MAX_EVENTS
+
+    def has_pending(self) -> bool:
+        """Whether anything is waiting to be written."""
+        return bool(self._events or self._progress or self._activity)
+
+    def _schedule_flush(self) -> None:
+        """Start the flusher task on the running loop if it is not running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flusher is None or self._flusher.done() or self._flusher.get_loop() is not loop:
+            self._flusher = loop.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        try:
+            last_flush = time.monotonic()
+            # A full buffer triggers an early flush unless the last one failed
+            healthy = True
+            while self.has_pending():
+                await asyncio.sleep(JOURNAL_INTERVAL_SECONDS)
+                due = time.monotonic() - last_flush >= FLUSH_INTERVAL_SECONDS
+                if due or (healthy and self.should_flush()):
+                    healthy = await self.flush()
+                    last_flush = time.monotonic()
+                else:
+                    await self.journal()
+        except asyncio.CancelledError:
+            # Loop shutdown (e.g. the end of a Celery task's asyncio.run)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Final run telemetry flush failed: {e}")
+            raise
+
+    # =========================================================================
+    # FLUSHING
+    # =========================================================================
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Flush lock for the running loop (asyncio locks are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            self._locks = {known: existing for known, existing in self._locks.items() if not known.is_closed()}
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    async def flush(self) -> bool:
+        """
+        Write all buffered events, progress and activity to the database.
+
+        On failure the writes are put back into the buffer for the next
+        flush; events also remain in the Redis stream for recover(). Writes
+        the database could not take yet (locked or not yet visible runs)
+        are also kept for the next flush.
+
+        Returns:
+            False if the flush failed
+        """
+        async with self._get_lock():
+            if not self.has_pending():
+                return True
+            # Events inserted now no longer need journaling
+            events, self._events, self._unjournaled = self._events, [], []
+            progress, self._progress = self._progress, {}
+            activity, self._activity = self._activity, {}
+
+            try:
+                held, busy = await self._write(events, progress, activity)
+            except Exception as e:
+                logger.warning(f"Failed to flush run telemetry ({len(events)} events): {e}")
+                self._events[:0] = events
+                if len(self._events) > MAX_BUFFERED_EVENTS:
+                    dropped = len(self._events) - MAX_BUFFERED_EVENTS
+                    del self._events[:dropped]
+                    logger.warning(f"Dropped {dropped} buffered run log events (kept in {TELEMETRY_STREAM})")
+                self._unjournaled = [event for event in self._events if event.entry_id is None]
+                for run_id, value in progress.items():
+                    self._progress.setdefault(run_id, value)
+                for run_id, value in activity.items():
+                    self._activity.setdefault(run_id, value)
+                return False
+
+            if held:
+                self._events[:0] = held
+                self._unjournaled[:0] = [event for event in held if event.entry_id is None]
+            for run_id in busy:
+                if run_id in progress:
+                    self._progress.setdefault(run_id, progress.pop(run_id))
+                if run_id in activity:
+                    self._activity.setdefault(run_id, activity[run_id])
+
+        held_ids = {id(event) for event in held}
+        await self._remove_from_stream(
+            [event.entry_id for event in events if event.entry_id and id(event) not in held_ids]
+        )
+        if progress:
+            await self._publish_progress(list(progress))
+        return True
+
+    async def _write(
+        self,
+        events: List[_BufferedEvent],
+        progress: Dict[UUID, Dict[str, Any]],
+        activity: Dict[UUID, datetime],
+    ) -> Tuple[List[_BufferedEvent], Set[UUID]]:
+        """
+        Write one flush's batch on a session of its own.
+
+        Returns the events held back because their run is not visible yet,
+        and the runs whose progress/activity was skipped because another
+        transaction has their row locked.
+        """
+        from .database_service import database_service
+
+        runs = Run.__table__
+        held: List[_BufferedEvent] = []
+        busy: Set[UUID] = set()
+        async with database_service.get_session() as session:
+            await session.execute(text(f"SET LOCAL lock_timeout = '{FLUSH_LOCK_TIMEOUT_MS}ms'"))
+
+            if events:
+                unseen = await self._insert_events(session, [event.row for event in events])
+                cutoff = datetime.utcnow() - timedelta(seconds=UNSEEN_RUN_GRACE_SECONDS)
+                held = [event for event in events if event.row["run_id"] in unseen and event.row["created_at"] >= cutoff]
+
+            run_ids = set(progress) | set(activity)
+            if run_ids:
+                # Rows locked by another transaction (e.g. the caller's, in
+                # the middle of changing statuses) are skipped, not waited on
+                result = await session.execute(
+                    select(runs.c.id).where(runs.c.id.in_(run_ids)).with_for_update(skip_locked=True, key_share=True)
+                )
+                lockable = set(result.scalars().all())
+                if lockable != run_ids:
+                    result = await session.execute(select(runs.c.id).where(runs.c.id.in_(run_ids - lockable)))
+                    busy = set(result.scalars().all())
+                progress = {run_id: value for run_id, value in progress.items() if run_id in lockable}
+                activity = {run_id: at for run_id, at in activity.items() if run_id in lockable}
+
+            if progress:
+                await session.execute(
+                    update(runs)
+                    .where(runs.c.id == bindparam("b_id"))
+                    .values(progress=bindparam("b_progress"), last_activity_at=bindparam("b_activity")),
+                    [
+                        {"b_id": run_id, "b_progress": value, "b_activity": activity.get(run_id, datetime.utcnow())}
+                        for run_id, value in progress.items()
+                    ],
+                )
+
+            # Log activity only counts while the run is active
+            active = [(run_id, at) for run_id, at in activity.items() if run_id not in progress]
+            if active:
+                await session.execute(
+                    update(runs)
+                    .where(runs.c.id == bindparam("b_id"), runs.c.status.in_(("submitted", "running")))
+                    .values(last_activity_at=bindparam("b_activity")),
+                    [{"b_id": run_id, "b_activity": at} for run_id, at in active],
+                )
+        return held, busy
+
+    @staticmethod
+    async def _insert_events(session, rows: List[Dict[str, Any]]) -> Set[UUID]:
+        """
+        Insert event rows, skipping duplicates and events of runs the session cannot see.
+
+        Returns:
+            Ids of the runs not found (deleted, or not committed yet)
+        """
+        run_ids = {row["run_id"] for row in rows}
+        result = await session.execute(select(Run.id).where(Run.id.in_(run_ids)))
+        existing = set(result.scalars().all())
+        rows = [row for row in rows if row["run_id"] in existing]
+
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            statement = insert(RunLogEvent).values(rows[start:start + INSERT_CHUNK_SIZE])
+            await session.execute(statement.on_conflict_do_nothing(index_elements=["id"]))
+        return run_ids - existing
+
+    async def _publish_progress(self, run_ids: List[UUID]) -> None:
+        """Publish run_progress for runs whose progress was just written."""
+        from .database_service import database_service
+        from .run_service import _publish_run_event
+
+        try:
+            async with database_service.get_session() as session:
+                result = await session.execute(select(Run).where(Run.id.in_(run_ids)))
+                for run in result.scalars().all():
+                    await _publish_run_event(
+                        organization_id=run.organization_id,
+                        event_type="run_progress",
+                        run=run,
+                    )
+        except Exception as e:
+            logger.debug(f"Failed to publish run progress: {e}")
+
+    # =========================================================================
+    # CRASH SAFETY
+    # =========================================================================
+
+    def _stream_client(self):
+        """Redis client for the telemetry stream, or None while Redis is failing."""
+        if time.monotonic() < self._stream_disabled_until:
+            return None
+        from .pubsub_service import pubsub_service
+        return pubsub_service.get_sync_client()
+
+    def _stream_failed(self, e: Exception) -> None:
+        logger.warning(f"Run telemetry stream unavailable, retrying in {STREAM_RETRY_SECONDS:.0f}s: {e}")
+        self._stream_disabled_until = time.monotonic() + STREAM_RETRY_SECONDS
+
+    async def journal(self) -> None:
+        """
+        Append buffered events that are not yet in the Redis stream.
+
+        The XADDs for the whole batch are pipelined into one round trip and
+        run in a worker thread, so logging never waits on Redis.
+        """
+        async with self._get_lock():
+            client = self._stream_client() if self._unjournaled else None
+            if client is None:
+                return
+            batch, self._unjournaled = self._unjournaled, []
+            try:
+                entry_ids = await asyncio.to_thread(
+                    self._append_to_stream, client, [event.row for event in batch]
+                )
+            except Exception as e:
+                # Still buffered; flush() inserts them without a stream entry
+                self._stream_failed(e)
+                return
+            for event, entry_id in zip(batch, entry_ids):
+                event.entry_id = entry_id
+
+    @staticmethod
+    def _append_to_stream(client, rows: List[Dict[str, Any]]) -> List[str]:
+        """Blocking pipelined XADD of event rows; returns their entry ids."""
+        pipe = client.pipeline(transaction=False)
+        for row in rows:
+            pipe.xadd(
+                TELEMETRY_STREAM,
+                {"event": _encode_row(row)},
+                maxlen=TELEMETRY_STREAM_MAXLEN,
+                approximate=True,
+            )
+        return pipe.execute()
+
+    async def _remove_from_stream(self, entry_ids: List[str]) -> None:
+        """Drop stream entries whose events are now in the database."""
+        client = self._stream_client() if entry_ids else None
+        if client is None:
+            return
+        try:
+            await asyncio.to_thread(client.xdel, TELEMETRY_STREAM, *entry_ids)
+        except Exception as e:
+            self._stream_failed(e)
+
+    async def recover(self, min_age_seconds: int = RECOVERY_MIN_AGE_SECONDS) -> int:
+        """
+        Insert events left in the Redis stream by processes that died before flushing.
+
+        Only entries older than min_age_seconds are replayed. Inserts skip
+        events already in the database, so replaying an entry a live
+        process also flushes is harmless.
+
+        Returns:
+            Number of stream entries processed
+        """
+        from .database_service import database_service
+
+        client = self._stream_client()
+        if client is None:
+            return 0
+
+        cutoff = str(int((time.time() - min_age_seconds) * 1000))
+        recovered = 0
+        while True:
+            try:
+                entries = await asyncio.to_thread(
+                    client.xrange, TELEMETRY_STREAM, "-", cutoff, count=INSERT_CHUNK_SIZE
+                )
+            except Exception as e:
+                self._stream_failed(e)
+                break
+            if not entries:
+                break
+
+            rows = []
+            for _, fields in entries:
+                try:
+                    rows.append(_decode_row(fields["event"]))
+                except (KeyError, ValueError) as e:
+                    logger.warning(f"Dropping malformed run telemetry entry: {e}")
+
+            if rows:
+                async with database_service.get_session() as session:
+                    await self._insert_events(session, rows)
+
+            await self._remove_from_stream([entry_id for entry_id, _ in entries])
+            recovered += len(entries)
+            if self._stream_client() is None:
+                break
+
+        if recovered:
+            logger.info(f"Recovered {recovered} run log events from {TELEMETRY_STREAM}")
+        return recovered
+
+
+# Singleton instance
+run_telemetry = RunTelemetryBuffer()
@@ -0,0 +1,329 @@
+"""
+Two-tier shared cache (in-process LRU + Redis) for Curatore v2.
+
+Registry, reference-data and search-schema caches used to be per-process
+dicts: every uvicorn worker and Celery process rebuilt them independently,
+and an invalidation in the process that changed the data never reached the
+others. SharedCache keeps a small in-process LRU in front of Redis and
+broadcasts invalidations over pub/sub.
+
+Key Features:
+- L1: per-process LRU with TTL (no I/O on a hit)
+- L2: Redis (pub/sub DB), shared by all processes and surviving deploys,
+  so new processes start warm
+- Versioned keys: values are stored under the scope's current version;
+  invalidation bumps the version, so a value computed before the
+  invalidation can never be written back as current
+- Invalidations are published on curatore:cache:invalidate; a listener
+  thread per process drops the matching L1 entries immediately
+- Redis is optional: on connection errors the cache degrades to L1 only
+  and retries Redis after a short back-off
+- L2 round trips on an L1 miss run in a worker thread (asyncio.to_thread),
+  so a slow Redis never stalls the event loop
+
+Usage:
+    from app.core.shared.shared_cache import SharedCache
+
+    _schema_cache = SharedCache("search_schema", ttl=300)
+
+    schema = await _schema_cache.get_or_load(
+        str(org_id), "schema", lambda: build_schema(session, org_id)
+    )
+
+    _schema_cache.invalidate(str(org_id))   # one scope, all processes
+    _schema_cache.invalidate()              # everything in this cache
+
+Redis Key Format (pub/sub DB):
+    curatore:cache:{name}:epoch              bumped by invalidate()
+    curatore:cache:{name}:ver:{scope}        bumped by invalidate(scope)
+    curatore:cache:{name}:{epoch}.{ver}:{scope}:{key}   value (JSON, EX ttl)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("curatore.services.shared_cache")
+
+# Seconds to skip Redis after a connection error
+REDIS_RETRY_INTERVAL = 30
+
+# Identifies this process in invalidation messages
+_ORIGIN = uuid.uuid4().hex
+
+# name -> SharedCache, used to route invalidation messages
+_caches: Dict[str, "SharedCache"] = {}
+
+_redis_down_until = 0.0
+
+
+def _get_redis():
+    """Return the sync Redis client, or None while Redis is backing off."""
+    if time.time() < _redis_down_until:
+        return None
+    from app.core.shared.pubsub_service import pubsub_service
+
+    return pubsub_service.get_sync_client()
+
+
+def _mark_redis_down(error: Exception) -> None:
+    global _redis_down_until
+    if time.time() >= _redis_down_until:
+        logger.warning(
+            f"Shared cache Redis unavailable, using in-process cache only "
+            f"for {REDIS_RETRY_INTERVAL}s: {error}"
+        )
+    _redis_down_until = time.time() + REDIS_RETRY_INTERVAL
+
+
+class SharedCache:
+    """
+    Named two-tier cache of JSON-serializable values, grouped by scope.
+
+    A scope is the unit of invalidation (typically an organization id);
+    keys distinguish entries within a scope.
+
+    Attributes:
+        name: Cache name (unique per process; used in Redis keys and messages)
+        ttl: Seconds a value lives in either tier
+        max_entries: L1 capacity (least recently used entries are evicted)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: int,
+        max_entries: int = 1024,
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Create a cache and register it for invalidation messages.
+
+        Args:
+            name: Cache name
+            ttl: Time to live in seconds
+            max_entries: Maximum L1 entries
+            encode: Convert a value to JSON-serializable data for Redis
+            decode: Convert data read from Redis back to a value
+        """
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._encode = encode or (lambda value: value)
+        self._decode = decode or (lambda data: data)
+        self._local: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every drop, so loads that raced an invalidation are not kept
+        self._generation = 0
+        _caches[name] = self
+
+    def _redis_key(self, suffix: str) -> str:
+        return f"curatore:cache:{self.name}:{suffix}"
+
+    # =========================================================================
+    # L1 (in-process)
+    # =========================================================================
+
+    def get_local(self, scope: str, key: str) -> Optional[Any]:
+        """Return the L1 value, or None if absent or expired."""
+        with self._lock:
+            entry = self._local.get((scope, key))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.time() >= expires_at:
+                del self._local[(scope, key)]
+                return None
+            self._local.move_to_end((scope, key))
+            return value
+
+    def set_local(self, scope: str, key: str, value: Any) -> None:
+        """Store a value in L1 only."""
+        with self._lock:
+            self._local[(scope, key)] = (time.time() + self.ttl, value)
+            self._local.move_to_end((scope, key))
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def drop_local(self, scope: Optional[str] = None) -> None:
+        """Drop L1 entries of one scope (or all)."""
+        with self._lock:
+            self._generation += 1
+            if scope is None:
+                self._local.clear()
+            else:
+                for cache_key in [k for k in self._local if k[0] == scope]:
+                    del self._local[cache_key]
+
+    # =========================================================================
+    # Two-tier access
+    # =========================================================================
+
+    def _read_version(self, client, scope: str) -> str:
+        epoch, version = client.mget(
+            self._redis_key("epoch"), self._redis_key(f"ver:{scope}")
+        )
+        return f"{epoch or 0}.{version or 0}"
+
+    def _read_l2(self, client, scope: str, key: str) -> Tuple[str, Optional[str]]:
+        """Blocking L2 read: the versioned value key and its stored JSON."""
+        version = self._read_version(client, scope)
+        value_key = self._redis_key(f"{version}:{scope}:{key}")
+        return value_key, client.get(value_key)
+
+    async def get_or_load(
+        self,
+        scope: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return a cached value, loading and storing it on a miss.
+
+        The version is read before the loader runs, so if the scope is
+        invalidated while loading, the result is written under the old
+        version and is never served from Redis.
+
+        Args:
+            scope: Invalidation scope (e.g. organization id)
+            key: Entry key within the scope
+            loader: Coroutine factory computing the value
+
+        Returns:
+            Cached or freshly loaded value (loader errors propagate)
+        """
+        value = self.get_local(scope, key)
+        if value is not None:
+            return value
+
+        generation = self._generation
+        client = _get_redis()
+        value_key = None
+        if client is not None:
+            try:
+                value_key, raw = await asyncio.to_thread(self._read_l2, client, scope, key)
+                if raw is not None:
+                    value = self._decode(json.loads(raw))
+                    self.set_local(scope, key, value)
+                    return value
+            except Exception as e:
+                _mark_redis_down(e)
+                value_key = None
+
+        value = await loader()
+
+        if value_key is not None:
+            try:
+                await asyncio.to_thread(
+                    client.set,
+                    value_key,
+                    json.dumps(self._encode(value), default=str),
+                    ex=self.ttl,
+                )
+            except Exception as e:
+                _mark_redis_down(e)
+        if generation == self._generation:
+            self.set_local(scope, key, value)
+        return value
+
+    def invalidate(self, scope: Optional[str] = None) -> None:
+        """
+        Invalidate one scope (or the whole cache) in every process.
+
+        Drops local entries, bumps the Redis version so stored values are
+        unreachable, and broadcasts the invalidation to other processes.
+        """
+        self.drop_local(scope)
+        invalidate_shared_cache(self.name, scope)
+
+
+def invalidate_shared_cache(name: str, scope: Optional[str] = None) -> bool:
+    """
+    Invalidate a shared cache by name in Redis and in every listening process.
+
+    Also usable for caches owned by other services that follow the same key
+    layout (e.g. the MCP gateway's "mcp_contracts").
+
+    Returns:
+        True if the invalidation reached Redis
+    """
+    client = _get_redis()
+    if client is None:
+        return False
+    try:
+        suffix = "epoch" if scope is None else f"ver:{scope}"
+        client.incr(f"curatore:cache:{name}:{suffix}")
+    except Exception as e:
+        _mark_redis_down(e)
+        return False
+
+    from app.core.shared.pubsub_service import pubsub_service
+
+    return pubsub_service.publish_cache_invalidation(
+        {"cache": name, "scope": scope, "origin": _ORIGIN}
+    )
+
+
+# =============================================================================
+# Invalidation listener
+# =============================================================================
+
+_listener_pid: Optional[int] = None
+
+
+def handle_invalidation_message(message: Dict[str, Any]) -> None:
+    """Drop L1 entries named by an invalidation message from another process."""
+    if message.get("origin") == _ORIGIN:
+        return
+    cache = _caches.get(message.get("cache"))
+    if cache is not None:
+        cache.drop_local(message.get("scope"))
+
+
+def _listen_forever() -> None:
+    from app.core.shared.pubsub_service import pubsub_service
+
+    state = {"reconnect": False}
+
+    def on_subscribed() -> None:
+        # Anything published while disconnected was missed
+        if state["reconnect"]:
+            for cache in list(_caches.values()):
+                cache.drop_local()
+        state["reconnect"] = True
+
+    backoff = 1
+    while True:
+        try:
+            for message in pubsub_service.listen_cache_invalidations(on_subscribed):
+                backoff = 1
+                handle_invalidation_message(message)
+        except Exception as e:
+            logger.debug(f"Cache invalidation listener disconnected: {e}")
+        time.sleep(backoff)
+        backoff = min(backoff * 2, REDIS_RETRY_INTERVAL)
+
+
+def start_invalidation_listener() -> None:
+    """
+    Start the invalidation listener thread for this process (idempotent).
+
+    Called at API startup and in each Celery worker process. Tracks the
+    pid so forked children start their own listener.
+    """
+    global _listener_pid
+    if _listener_pid == os.getpid():
+        return
+    _listener_pid = os.getpid()
+    thread = threading.Thread(
+        target=_listen_forever, name="shared-cache-invalidation", daemon=True
+    )
+    thread.start()
+    logger.info("Started shared cache invalidation listener")
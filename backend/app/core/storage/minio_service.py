@@ -5,12 +5,17 @@ Provides object storage operations using MinIO S3-compatible API.
 Integrated directly into backend (no separate microservice needed).
 """
 
+import asyncio
+import codecs
+import hashlib
 import logging
+import queue
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import lru_cache
 from io import BytesIO
-from typing import BinaryIO, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
 from minio import Minio
 from minio.commonconfig import ENABLED
@@ -22,6 +27,15 @@ from app.core.shared.config_loader import config_loader
 
 logger = logging.getLogger("curatore.minio")
 
+# Chunk size for streamed object reads
+STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Part size for multipart uploads of unknown length (MinIO minimum is 5 MB)
+MULTIPART_PART_SIZE = 16 * 1024 * 1024  # 16 MB
+
+# Chunks buffered between an async producer and the upload thread
+ASYNC_UPLOAD_QUEUE_SIZE = 16
+
 
 # =============================================================================
 # BUCKET CONFIGURATION
@@ -54,6 +68,100 @@ class ObjectInfo:
     metadata: Dict[str, str] = field(default_factory=dict)
 
 
+@dataclass
+class StreamedUpload:
+    """Result of a streamed upload with its content hash."""
+    etag: str
+    file_hash: str
+    file_size: int
+
+
+class HashingReader:
+    """
+    File-like wrapper that hashes and counts bytes as they are read.
+
+    Lets an upload be hashed in the same pass that streams it to storage.
+    """
+
+    def __init__(self, raw: BinaryIO, algorithm: str = "sha256"):
+        self._raw = raw
+        self._hash = hashlib.new(algorithm)
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self._hash.update(data)
+        self.size += len(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class _ChunkPipe:
+    """
+    Bounded hand-off from an async producer to a blocking reader.
+
+    The event loop puts chunks; the upload thread reads them as a file.
+    """
+
+    _EOF = object()
+
+    def __init__(self, maxsize: int = ASYNC_UPLOAD_QUEUE_SIZE):
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._buffer = bytearray()
+        self._done = False
+
+    async def put(self, item, consumer: asyncio.Future) -> None:
+        """Queue an item, waiting while the queue is full and the consumer is alive."""
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                if consumer.done():
+                    # Consumer stopped early; surface its error (if any)
+                    consumer.result()
+                    if item is self._EOF:
+                        return
+                    raise RuntimeError("Upload finished before the stream was consumed")
+                await asyncio.wait({consumer}, timeout=0.05)
+
+    async def close(self, consumer: asyncio.Future) -> None:
+        await self.put(self._EOF, consumer)
+
+    def fail(self, error: BaseException) -> None:
+        """Make the reader raise; drops queued chunks so the item always fits."""
+        while True:
+            try:
+                self._queue.put_nowait(error)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            item = self._queue.get()
+            if item is self._EOF:
+                self._done = True
+            elif isinstance(item, BaseException):
+                self._done = True
+                raise IOError(f"Upload stream failed: {item}") from item
+            else:
+                self._buffer += item
+        # bytearray appends are amortized O(1); slicing bytes would copy per chunk
+        if size < 0:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+
 @dataclass
 class BrowseResult:
     """Result of browsing a bucket/prefix."""
@@ -482,24 +590,33 @@ class MinIOService:
         bucket: str,
         key: str,
         data: BinaryIO,
-        length: int,
+        length: int = -1,
         content_type: str = "application/octet-stream",
         metadata: Optional[Dict[str, str]] = None,
+        part_size: int = 0,
     ) -> str:
         """
-        Upload an object.
+        Upload an object from a file-like object.
+
+        The data is read incrementally, so large files can be uploaded from a
+        file handle without loading them into memory. Pass ``length=-1`` when
+        the size is unknown; the upload then uses multipart parts of
+        ``part_size`` bytes (MULTIPART_PART_SIZE by default).
 
         Args:
             bucket: Bucket name
             key: Object key
             data: File-like object with content
-            length: Content length in bytes
+            length: Content length in bytes, or -1 if unknown
             content_type: MIME type
             metadata: User metadata
+            part_size: Multipart part size in bytes (0 = SDK default)
 
         Returns:
             Object ETag
         """
+        if length < 0 and not part_size:
+            part_size = MULTIPART_PART_SIZE
         result = self.client.put_object(
             bucket_name=bucket,
             object_name=key,
@@ -507,14 +624,135 @@ class MinIOService:
             length=length,
             content_type=content_type,
             metadata=metadata,
+            part_size=part_size,
+        )
+        logger.info(
+            f"Uploaded object {bucket}/{key} "
+            f"({length if length >= 0 else 'streamed'} bytes)"
+        )
+        return result.etag
+
+    def put_stream(
+        self,
+        bucket: str,
+        key: str,
+        data: BinaryIO,
+        length: int = -1,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> StreamedUpload:
+        """
+        Upload an object from a file-like object, hashing it while streaming.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            data: File-like object with content
+            length: Content length in bytes, or -1 if unknown
+            content_type: MIME type
+            metadata: User metadata
+
+        Returns:
+            StreamedUpload with ETag, SHA-256 hash and byte count
+        """
+        reader = HashingReader(data)
+        etag = self.put_object(
+            bucket=bucket,
+            key=key,
+            data=reader,
+            length=length,
+            content_type=content_type,
+            metadata=metadata,
+        )
+        return StreamedUpload(etag=etag, file_hash=reader.hexdigest(), file_size=reader.size)
+
+    async def put_async_stream(
+        self,
+        bucket: str,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        length: int = -1,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> StreamedUpload:
+        """
+        Upload an object from an async iterator of chunks, hashing while streaming.
+
+        The upload runs in a worker thread fed through a bounded queue, so a
+        network download can be piped straight into a multipart upload with
+        constant memory. If the iterator raises, the upload is aborted and the
+        error is re-raised.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            chunks: Async iterator of byte chunks (e.g. httpx aiter_bytes())
+            length: Content length in bytes, or -1 if unknown
+            content_type: MIME type
+            metadata: User metadata
+
+        Returns:
+            StreamedUpload with ETag, SHA-256 hash and byte count
+        """
+        pipe = _ChunkPipe()
+        upload = asyncio.ensure_future(asyncio.to_thread(
+            self.put_stream,
+            bucket=bucket,
+            key=key,
+            data=pipe,
+            length=length,
+            content_type=content_type,
+            metadata=metadata,
+        ))
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    await pipe.put(chunk, upload)
+            await pipe.close(upload)
+        except BaseException as e:
+            pipe.fail(e)
+            await asyncio.gather(upload, return_exceptions=True)
+            raise
+        return await upload
+
+    def fput_object(
+        self,
+        bucket: str,
+        key: str,
+        file_path: Union[str, Path],
+        content_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Upload an object from a local file.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            file_path: Path of the file to upload
+            content_type: MIME type
+            metadata: User metadata
+
+        Returns:
+            Object ETag
+        """
+        result = self.client.fput_object(
+            bucket_name=bucket,
+            object_name=key,
+            file_path=str(file_path),
+            content_type=content_type,
+            metadata=metadata,
         )
-        logger.info(f"Uploaded object {bucket}/{key} ({length} bytes)")
+        logger.info(f"Uploaded file {file_path} to {bucket}/{key}")
         return result.etag
 
     def get_object(self, bucket: str, key: str) -> BytesIO:
         """
         Download an object.
 
+        Reads the whole object into memory. Prefer iter_object(),
+        fget_object() or get_object_range() for files of arbitrary size.
+
         Args:
             bucket: Bucket name
             key: Object key
@@ -532,6 +770,150 @@ class MinIOService:
                 response.close()
                 response.release_conn()
 
+    def get_object_range(self, bucket: str, key: str, offset: int, length: int) -> bytes:
+        """
+        Download a byte range of an object.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            offset: Start of the range in bytes
+            length: Number of bytes to read
+
+        Returns:
+            Bytes of the requested range
+        """
+        response = None
+        try:
+            response = self.client.get_object(bucket, key, offset=offset, length=length)
+            return response.read()
+        finally:
+            if response:
+                response.close()
+                response.release_conn()
+
+    def iter_object(
+        self,
+        bucket: str,
+        key: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        offset: int = 0,
+        length: int = 0,
+    ) -> Iterator[bytes]:
+        """
+        Stream an object in chunks.
+
+        The request is issued immediately, so missing objects raise S3Error
+        here rather than on first iteration. The connection is released when
+        the iterator is exhausted or closed.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            chunk_size: Maximum bytes per chunk
+            offset: Start of the range in bytes
+            length: Number of bytes to read (0 = to the end of the object)
+
+        Returns:
+            Iterator over byte chunks
+        """
+        response = self.client.get_object(bucket, key, offset=offset, length=length)
+        return self._iter_response(response, chunk_size)
+
+    @staticmethod
+    def _iter_response(response, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from response.stream(chunk_size)
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def stream_object(
+        self,
+        bucket: str,
+        key: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        offset: int = 0,
+        length: int = 0,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream an object in chunks from async code.
+
+        Blocking reads run in a worker thread one chunk at a time, so the
+        event loop is never blocked and memory stays bounded by chunk_size.
+        Suitable for FastAPI StreamingResponse bodies.
+
+        Usage:
+            chunks = await minio.stream_object(bucket, key)
+            return StreamingResponse(chunks, media_type=content_type)
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            chunk_size: Maximum bytes per chunk
+            offset: Start of the range in bytes
+            length: Number of bytes to read (0 = to the end of the object)
+
+        Returns:
+            Async iterator over byte chunks
+        """
+        chunks = await asyncio.to_thread(
+            self.iter_object, bucket, key, chunk_size, offset, length
+        )
+        return self._aiter_chunks(chunks)
+
+    @staticmethod
+    async def _aiter_chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            await asyncio.to_thread(chunks.close)
+
+    def fget_object(self, bucket: str, key: str, file_path: Union[str, Path]) -> int:
+        """
+        Download an object straight to a local file.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            file_path: Destination path (parent directory must exist)
+
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with open(file_path, "wb") as f:
+            for chunk in self.iter_object(bucket, key):
+                f.write(chunk)
+                written += len(chunk)
+        return written
+
+    def read_object_text(
+        self, bucket: str, key: str, encoding: str = "utf-8", errors: str = "strict"
+    ) -> str:
+        """
+        Download an object and decode it as text.
+
+        Decodes chunk by chunk, so only the decoded string is held in full.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            encoding: Text encoding
+            errors: Decoder error handling
+
+        Returns:
+            Decoded object content
+        """
+        decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+        parts = [decoder.decode(chunk) for chunk in self.iter_object(bucket, key)]
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
+
     def delete_object(self, bucket: str, key: str) -> bool:
         """
         Delete an object.
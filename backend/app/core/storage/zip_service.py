@@ -13,7 +13,8 @@
 #   - Individual document ZIP archives with basic summaries
 #   - Combined markdown exports with adjusted header hierarchy
 #   - Detailed processing summaries with quality metrics
-#   - Temporary file management with automatic cleanup
+#   - Streaming archive generation with bounded concurrent prefetch
+#   - Optional multipart upload of archives to object storage
 #   - Flexible archive naming with timestamp generation
 #   - Processing result integration for metadata
 #   - RAG-ready file filtering and organization
@@ -28,29 +29,100 @@
 # Version: 2.0.0
 # ============================================================================
 
+import asyncio
+import io
 import os
 import re
 import tempfile
+import uuid
 import zipfile
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
 
+from app.config import settings
 from app.core.models import DownloadType, ProcessingResult
 from app.core.shared.artifact_service import artifact_service
 
 from .minio_service import get_minio_service
 from .storage_service import storage_service
 
+# Documents fetched ahead of the entry being written
+ZIP_PREFETCH = 4
+
+# Slice size when writing entry content into the archive
+ZIP_WRITE_CHUNK_SIZE = 64 * 1024  # 64 KB
+
+# Compressed bytes buffered before a chunk is emitted
+ZIP_FLUSH_SIZE = 256 * 1024  # 256 KB
+
+# Combined markdown is spooled in memory up to this size, then to disk
+COMBINED_SPOOL_SIZE = 8 * 1024 * 1024  # 8 MB
+
+
+class _ArchiveBuffer(io.RawIOBase):
+    """
+    Unseekable sink that collects the bytes ZipFile writes.
+
+    ZipFile detects the missing seek support and writes data descriptors
+    after each entry, so the archive can be emitted front to back.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        self.size += len(b)
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self.size = 0
+        return data
+
+
+class _IteratorReader:
+    """File-like reader over an iterator of byte chunks (for streamed uploads)."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        # Filled in place: growing a bytes buffer recopied the whole part per chunk
+        if size < 0:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
 
 class ZipService:
     """
     Service for creating and managing ZIP archives of processed documents.
 
-    This service provides multiple archive creation methods for different use cases,
-    from simple individual file collections to complex combined exports with
-    detailed processing summaries. All archives are created in the system
-    temporary directory and include automatic cleanup mechanisms.
+    Archives are generated as a stream: documents are fetched concurrently a
+    few ahead of the entry being written, and compressed bytes are emitted as
+    soon as they are produced. Streams can be served directly with a
+    StreamingResponse or uploaded to object storage as multipart uploads, so
+    memory and disk use stay constant regardless of archive size.
 
     Archive Organization:
         - Individual files are organized in subfolders (processed_documents/, individual_files/)
@@ -79,130 +151,173 @@ class ZipService:
         using artifact tracking from the database.
         """
         self.minio = get_minio_service()
-        self._artifact_cache = {}  # Cache for artifacts by document_id
 
-    def create_zip_archive(
+    def iter_archive(
         self,
         document_ids: List[str],
-        zip_name: Optional[str] = None,
-        include_summary: bool = True
-    ) -> Tuple[str, int]:
+        artifacts: Optional[Dict[str, Any]] = None,
+        results: Optional[List[ProcessingResult]] = None,
+        combined: bool = False,
+        include_summary: bool = True,
+        prefetch: int = ZIP_PREFETCH,
+    ) -> Iterator[bytes]:
         """
-        Create a standard ZIP archive containing processed documents with optional summary.
+        Generate a ZIP archive of processed documents as a stream of bytes.
 
-        Creates a basic ZIP archive with processed markdown files organized in a
-        'processed_documents' subfolder. Includes a basic processing summary if requested.
-        This is the standard archive type for simple bulk downloads.
+        Documents are downloaded on a thread pool up to ``prefetch`` ahead of
+        the entry being written, and compressed output is yielded as it is
+        produced. Memory stays bounded by the prefetch window; the combined
+        document is spooled to disk once it grows past COMBINED_SPOOL_SIZE.
 
-        Args:
-            document_ids (List[str]): List of document IDs to include in the archive
-            zip_name (Optional[str]): Custom name for the ZIP file. If None, generates
-                                    timestamp-based name: curatore_export_{timestamp}.zip
-            include_summary (bool): Whether to include a basic processing summary file
+        Blocking generator: iterate it from a thread (StreamingResponse does
+        this for sync iterators).
 
-        Returns:
-            Tuple[str, int]: Tuple containing:
-                - str: Full path to the created ZIP file in temporary directory
-                - int: Number of files successfully added to the archive
+        Args:
+            document_ids: Document IDs to include, in archive order
+            artifacts: Processed artifacts by document ID; documents without
+                one fall back to in-memory results from the storage service
+            results: Processing results for metadata and statistics
+            combined: Build a combined export (individual files, merged
+                markdown document and detailed summary)
+            include_summary: Include a summary file (standard archives)
+            prefetch: Number of documents fetched ahead
+
+        Yields:
+            Chunks of the ZIP archive
 
         Archive Structure:
             ```
-            curatore_export_20250827_143022.zip
-            +-- processed_documents/
-            |   +-- document1.md
-            |   +-- document2.md
-            |   +-- document3.md
-            +-- PROCESSING_SUMMARY_20250827_143022.md  # if include_summary=True
+            Standard:                          Combined:
+            +-- processed_documents/           +-- individual_files/
+            |   +-- document1.md               |   +-- document1.md
+            |   +-- document2.md               |   +-- document2.md
+            +-- PROCESSING_SUMMARY_{ts}.md     +-- COMBINED_EXPORT_{ts}.md
+                                               +-- PROCESSING_SUMMARY_{ts}.md
             ```
 
-        File Naming:
-            - Original filenames are restored by removing the document ID prefix
-            - Example: "user_guide_abc123.md" becomes "user_guide.md" in archive
-            - Preserves original file extensions and structure
-
         Error Handling:
             - Missing files are skipped with console logging
             - Invalid document IDs are ignored
-            - Returns actual file count for verification
-
-        Example:
-            >>> zip_path, count = zip_service.create_zip_archive(
-            >>>     document_ids=["doc1", "doc2", "doc3"],
-            >>>     zip_name="my_export.zip",
-            >>>     include_summary=True
-            >>> )
-            >>> print(f"Created archive with {count} files at {zip_path}")
         """
-        if not zip_name:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            zip_name = f"curatore_export_{timestamp}.zip"
-        elif not zip_name.endswith('.zip'):
-            zip_name += '.zip'
-
-        # Create temporary ZIP file
-        temp_dir = tempfile.gettempdir()
-        zip_path = os.path.join(temp_dir, zip_name)
-
+        artifacts = artifacts or {}
+        results = results or []
+        folder = "individual_files" if combined else "processed_documents"
+        buffer = _ArchiveBuffer()
         file_count = 0
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add processed documents from MinIO
-            for doc_id in document_ids:
-                # Download file from object storage
-                file_content, original_name = self._download_processed_file(doc_id)
-                if file_content:
-                    zipf.writestr(f"processed_documents/{original_name}", file_content)
-                    file_count += 1
+        combined_spool = None
+        if combined:
+            combined_spool = tempfile.SpooledTemporaryFile(max_size=COMBINED_SPOOL_SIZE)
+            self._write_lines(combined_spool, self._combined_header(results))
+        results_by_id = {r.document_id: r for r in results}
 
-            # Add summary file if requested
-            if include_summary and file_count > 0:
-                summary_content = self._generate_zip_summary(document_ids, file_count)
-                summary_filename = f"PROCESSING_SUMMARY_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-                zipf.writestr(summary_filename, summary_content)
+        try:
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
+                documents = self._prefetch_documents(document_ids, artifacts, prefetch)
+                for doc_id, file_content, original_name in documents:
+                    if not file_content:
+                        continue
+
+                    if combined_spool is not None:
+                        try:
+                            self._write_lines(
+                                combined_spool,
+                                self._combined_section(
+                                    file_content, original_name, results_by_id.get(doc_id)
+                                ),
+                            )
+                        except Exception as e:
+                            print(f"Error processing content for {doc_id}: {e}")
+
+                    data = file_content.encode("utf-8")
+                    with zipf.open(f"{folder}/{original_name}", "w") as entry:
+                        for i in range(0, len(data), ZIP_WRITE_CHUNK_SIZE):
+                            entry.write(data[i:i + ZIP_WRITE_CHUNK_SIZE])
+                            if buffer.size >= ZIP_FLUSH_SIZE:
+                                yield buffer.drain()
+                    file_count += 1
+                    if buffer.size:
+                        yield buffer.drain()
+
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+                # Add combined markdown file
+                if combined_spool is not None:
+                    combined_spool.seek(0)
+                    with zipf.open(f"COMBINED_EXPORT_{timestamp}.md", "w") as entry:
+                        for block in iter(lambda: combined_spool.read(ZIP_WRITE_CHUNK_SIZE), b""):
+                            entry.write(block)
+                            if buffer.size >= ZIP_FLUSH_SIZE:
+                                yield buffer.drain()
+
+                # Add summary file
+                if file_count > 0 and (combined or include_summary):
+                    if combined:
+                        summary_content = self._generate_detailed_zip_summary(
+                            document_ids, results, file_count
+                        )
+                    else:
+                        summary_content = self._generate_zip_summary(document_ids, file_count)
+                    zipf.writestr(f"PROCESSING_SUMMARY_{timestamp}.md", summary_content)
 
-        return zip_path, file_count
+            # Central directory is written when the archive closes
+            yield buffer.drain()
+        finally:
+            if combined_spool is not None:
+                combined_spool.close()
 
-    def create_combined_markdown_zip(
+    def _prefetch_documents(
         self,
         document_ids: List[str],
-        results: List[ProcessingResult],
-        zip_name: Optional[str] = None
-    ) -> Tuple[str, int]:
+        artifacts: Dict[str, Any],
+        prefetch: int,
+    ) -> Iterator[Tuple[str, Optional[str], str]]:
         """
-        Create a comprehensive ZIP archive with individual files, combined document, and detailed summary.
+        Download documents concurrently, yielding them in order.
 
-        Args:
-            document_ids (List[str]): List of document IDs to include in the archive
-            results (List[ProcessingResult]): Processing results for metadata and statistics
-            zip_name (Optional[str]): Custom name for the ZIP file.
+        At most ``prefetch`` downloads are in flight or waiting to be
+        consumed at any time.
 
-        Returns:
-            Tuple[str, int]: Tuple containing:
-                - str: Full path to the created ZIP file in temporary directory
-                - int: Number of individual files successfully added to the archive
+        Yields:
+            Tuples of (doc_id, file_content, original_filename)
         """
-        if not zip_name:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            zip_name = f"curatore_combined_export_{timestamp}.zip"
-        elif not zip_name.endswith('.zip'):
-            zip_name += '.zip'
+        prefetch = max(1, prefetch)
+        ids = iter(document_ids)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="zip-prefetch") as pool:
+            def submit(doc_id: str) -> None:
+                pending.append((
+                    doc_id,
+                    pool.submit(self._download_processed_file, doc_id, artifacts.get(doc_id)),
+                ))
 
-        # Create temporary ZIP file
-        temp_dir = tempfile.gettempdir()
-        zip_path = os.path.join(temp_dir, zip_name)
-
-        file_count = 0
-        combined_sections = []
+            try:
+                for doc_id in ids:
+                    submit(doc_id)
+                    if len(pending) >= prefetch:
+                        break
 
-        # Generate combined markdown header
+                while pending:
+                    doc_id, future = pending.popleft()
+                    next_id = next(ids, None)
+                    if next_id is not None:
+                        submit(next_id)
+                    file_content, original_name = future.result()
+                    yield doc_id, file_content, original_name
+            finally:
+                # Stop outstanding downloads if the consumer goes away
+                for _, future in pending:
+                    future.cancel()
+
+    def _combined_header(self, results: List[ProcessingResult]) -> List[str]:
+        """Build the heading and processing summary of the combined document."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         successful_results = [r for r in results if r.success]
-        rag_flag = lambda r: getattr(r, 'pass_all_thresholds', getattr(r, 'is_rag_ready', False))
-        rag_ready_results = [r for r in successful_results if rag_flag(r)]
+        rag_ready_results = [r for r in successful_results if self._passes_thresholds(r)]
         vector_optimized_results = [r for r in successful_results if r.vector_optimized]
         pass_rate = (len(rag_ready_results) / len(successful_results) * 100) if successful_results else 0
 
-        combined_sections.extend([
+        return [
             "# Curatore Processing Results - Combined Export",
             f"*Generated on {timestamp}*",
             "",
@@ -213,108 +328,89 @@ class ZipService:
             "",
             "---",
             ""
-        ])
+        ]
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add individual processed documents from MinIO
-            for doc_id in document_ids:
-                # Download file from object storage
-                file_content, original_name = self._download_processed_file(doc_id)
-                if file_content:
-                    try:
-                        # Decode content for combined file
-                        content = file_content if isinstance(file_content, str) else file_content.decode('utf-8')
-                        result = next((r for r in results if r.document_id == doc_id), None)
-
-                        # Add section header using result metadata when available
-                        section_title = None
-                        if result and getattr(result, 'filename', None):
-                            section_title = result.filename
-                        else:
-                            # Use original filename as fallback
-                            section_title = original_name
-                        combined_sections.append(f"# {section_title}")
-
-                        # Optional metadata when result is available
-                        if result:
-                            if result.document_summary:
-                                combined_sections.extend(["", f"*{result.document_summary}*"])
-
-                            status_emoji = "+" if rag_flag(result) else "!"
-                            optimized_emoji = " *" if result.vector_optimized else ""
-
-                            combined_sections.extend([
-                                "",
-                                f"**Processing Status:** {status_emoji} {'RAG Ready' if rag_flag(result) else 'Needs Improvement'}{optimized_emoji}",
-                                f"**Conversion Score:** {result.conversion_score}/100",
-                            ])
-
-                            if result.llm_evaluation:
-                                scores = [
-                                    f"Clarity: {result.llm_evaluation.clarity_score or 'N/A'}/10",
-                                    f"Completeness: {result.llm_evaluation.completeness_score or 'N/A'}/10",
-                                    f"Relevance: {result.llm_evaluation.relevance_score or 'N/A'}/10",
-                                    f"Markdown: {result.llm_evaluation.markdown_score or 'N/A'}/10",
-                                ]
-                                combined_sections.append(f"**Quality Scores:** {', '.join(scores)}")
-
-                        combined_sections.extend(["", "---", ""])
-
-                        # Adjust markdown hierarchy for combined document
-                        adjusted_content = self._adjust_markdown_hierarchy(content)
-                        combined_sections.extend([adjusted_content, "", "", "---", ""])
-
-                    except Exception as e:
-                        print(f"Error processing content for {doc_id}: {e}")
-
-                    # Add to ZIP as individual file using original filename
-                    zipf.writestr(f"individual_files/{original_name}", file_content)
-                    file_count += 1
+    def _combined_section(
+        self,
+        content: str,
+        original_name: str,
+        result: Optional[ProcessingResult],
+    ) -> List[str]:
+        """Build the combined-document section for one processed file."""
+        # Add section header using result metadata when available
+        if result and getattr(result, 'filename', None):
+            section_title = result.filename
+        else:
+            # Use original filename as fallback
+            section_title = original_name
+        section = [f"# {section_title}"]
 
-            # Add combined markdown file
-            if combined_sections:
-                combined_content = "\n".join(combined_sections)
-                combined_filename = f"COMBINED_EXPORT_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-                zipf.writestr(combined_filename, combined_content)
+        # Optional metadata when result is available
+        if result:
+            if result.document_summary:
+                section.extend(["", f"*{result.document_summary}*"])
+
+            rag_ready = self._passes_thresholds(result)
+            status_emoji = "+" if rag_ready else "!"
+            optimized_emoji = " *" if result.vector_optimized else ""
 
-            # Add summary file
-            if file_count > 0:
-                summary_content = self._generate_detailed_zip_summary(document_ids, results, file_count)
-                summary_filename = f"PROCESSING_SUMMARY_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-                zipf.writestr(summary_filename, summary_content)
+            section.extend([
+                "",
+                f"**Processing Status:** {status_emoji} {'RAG Ready' if rag_ready else 'Needs Improvement'}{optimized_emoji}",
+                f"**Conversion Score:** {result.conversion_score}/100",
+            ])
 
-        return zip_path, file_count
+            if result.llm_evaluation:
+                scores = [
+                    f"Clarity: {result.llm_evaluation.clarity_score or 'N/A'}/10",
+                    f"Completeness: {result.llm_evaluation.completeness_score or 'N/A'}/10",
+                    f"Relevance: {result.llm_evaluation.relevance_score or 'N/A'}/10",
+                    f"Markdown: {result.llm_evaluation.markdown_score or 'N/A'}/10",
+                ]
+                section.append(f"**Quality Scores:** {', '.join(scores)}")
+
+        section.extend(["", "---", ""])
+
+        # Adjust markdown hierarchy for combined document
+        section.extend([self._adjust_markdown_hierarchy(content), "", "", "---", ""])
+        return section
+
+    @staticmethod
+    def _passes_thresholds(result: ProcessingResult) -> bool:
+        return getattr(result, 'pass_all_thresholds', getattr(result, 'is_rag_ready', False))
+
+    @staticmethod
+    def _write_lines(spool, lines: List[str]) -> None:
+        for line in lines:
+            spool.write(line.encode("utf-8"))
+            spool.write(b"\n")
 
-    def _download_processed_file(self, doc_id: str) -> Tuple[Optional[str], str]:
+    def _download_processed_file(
+        self, doc_id: str, artifact: Optional[Any] = None
+    ) -> Tuple[Optional[str], str]:
         """
         Download the processed markdown file from object storage.
 
-        Uses cached artifact information (populated by async caller) or falls back
+        Uses the processed artifact (loaded by the async caller) or falls back
         to storage service for in-memory results.
 
         Args:
             doc_id: The document ID to download the processed file for
+            artifact: Processed artifact for the document, if any
 
         Returns:
             Tuple of (file_content, original_filename) where:
             - file_content: String content of the markdown file, or None if not found
             - original_filename: Original filename with .md extension
         """
-        # Try to use cached artifact (populated by async caller)
-        artifact = self._artifact_cache.get(doc_id)
         if artifact and self.minio and self.minio.enabled:
             try:
-                # Download from MinIO using cached artifact
-                file_obj = self.minio.get_object(artifact.bucket, artifact.object_key)
-                if file_obj:
-                    content = file_obj.read()
-                    # Decode if bytes
-                    if isinstance(content, bytes):
-                        content = content.decode('utf-8')
-
-                    # Get original filename
-                    original_name = self._get_original_filename_from_artifact(doc_id, artifact)
-                    return content, original_name
+                # Download from MinIO using the artifact location
+                content = self.minio.read_object_text(artifact.bucket, artifact.object_key)
+
+                # Get original filename
+                original_name = self._get_original_filename_from_artifact(doc_id, artifact)
+                return content, original_name
             except Exception as e:
                 print(f"Error downloading from MinIO for {doc_id}: {e}")
 
@@ -603,43 +699,53 @@ class ZipService:
         return deleted
 
     # -------------------- v2 async helpers --------------------
-    class ZipInfo:
-        def __init__(self, zip_path: Path, file_count: int):
-            self.zip_path = zip_path
-            self.file_count = file_count
+    class ZipStream:
+        """A ZIP archive ready to be streamed."""
+
+        def __init__(self, filename: str, chunks: Iterator[bytes], file_count: int):
+            self.filename = filename
+            self.chunks = chunks
+            self.file_count = file_count  # Documents selected for the archive
+
+    async def _load_processed_artifacts(self, document_ids: List[str]) -> Dict[str, Any]:
+        """Load the first processed artifact of each document (one query per batch)."""
+        from app.core.shared.database_service import database_service
+
+        try:
+            async with database_service.get_session() as session:
+                by_document = await artifact_service.get_artifacts_by_documents(
+                    session, document_ids, artifact_type="processed"
+                )
+        except Exception as e:
+            print(f"Failed to load artifacts: {e}")
+            # Continue anyway - will fall back to storage service
+            return {}
+        return {doc_id: artifacts[0] for doc_id, artifacts in by_document.items()}
 
-    async def create_bulk_download(
+    async def stream_bulk_download(
         self,
         document_ids: List[str],
         download_type: DownloadType,
         custom_filename: Optional[str] = None,
         include_summary: bool = True,
         include_combined: bool = False,
-    ) -> "ZipService.ZipInfo":
+        prefetch: int = ZIP_PREFETCH,
+    ) -> "ZipService.ZipStream":
         """
-        v2-compatible bulk download helper that returns a ZipInfo with a Path.
+        Prepare a streamed bulk download.
 
         Supports 'individual', 'combined', and 'rag_ready' download types.
+        Selection errors are raised here, before any archive bytes are
+        produced; the returned stream does the downloading and compression.
+
+        Usage:
+            archive = await zip_service.stream_bulk_download(ids, "individual")
+            return StreamingResponse(archive.chunks, media_type="application/zip")
         """
         if not document_ids:
             raise ValueError("No document IDs provided")
 
-        # Load artifacts for all documents into cache (for sync functions to use)
-        from app.core.shared.database_service import database_service
-        self._artifact_cache = {}
-        try:
-            async with database_service.get_session() as session:
-                for doc_id in document_ids:
-                    artifacts = await artifact_service.get_artifacts_by_document(
-                        session, doc_id
-                    )
-                    # Filter for processed artifacts
-                    processed = [a for a in artifacts if a.artifact_type == "processed"]
-                    if processed:
-                        self._artifact_cache[doc_id] = processed[0]  # Get first processed artifact
-        except Exception as e:
-            print(f"Failed to load artifacts: {e}")
-            # Continue anyway - will fall back to storage service
+        artifacts = await self._load_processed_artifacts(document_ids)
 
         # Gather processing results for provided IDs
         results: List[ProcessingResult] = []
@@ -662,25 +768,37 @@ class ZipService:
         else:
             filtered_ids = [r.document_id for r in results] if results else list(document_ids)
 
-        # Create archive (do not require results; filesystem fallback works)
-        if str(download_type) in {getattr(DownloadType, 'COMBINED', 'combined'), 'combined'} or include_combined:
-            zip_path_str, count = self.create_combined_markdown_zip(filtered_ids, results, custom_filename)
-        else:
-            zip_path_str, count = self.create_zip_archive(filtered_ids, custom_filename, include_summary)
-
-        # Clear artifact cache after use
-        self._artifact_cache = {}
-
-        zip_path = Path(zip_path_str)
-        return ZipService.ZipInfo(zip_path=zip_path, file_count=count)
-
-    async def create_rag_ready_download(
+        combined = (
+            str(download_type) in {getattr(DownloadType, 'COMBINED', 'combined'), 'combined'}
+            or include_combined
+        )
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_name = (
+            f"curatore_combined_export_{timestamp}.zip" if combined
+            else f"curatore_export_{timestamp}.zip"
+        )
+        chunks = self.iter_archive(
+            filtered_ids,
+            artifacts=artifacts,
+            results=results,
+            combined=combined,
+            include_summary=include_summary,
+            prefetch=prefetch,
+        )
+        return ZipService.ZipStream(
+            filename=self._archive_name(custom_filename, default_name),
+            chunks=chunks,
+            file_count=len(filtered_ids),
+        )
+
+    async def stream_rag_ready_download(
         self,
         custom_filename: Optional[str] = None,
         include_summary: bool = True,
-    ) -> "ZipService.ZipInfo":
+        prefetch: int = ZIP_PREFETCH,
+    ) -> "ZipService.ZipStream":
         """
-        v2-compatible helper to build an archive of all RAG-ready documents.
+        Prepare a streamed archive of all RAG-ready documents.
         """
         all_results: List[ProcessingResult] = list(storage_service.get_all_processing_results() or [])
         rag_ready = [r for r in all_results if r.success and getattr(r, "is_rag_ready", getattr(r, "pass_all_thresholds", False))]
@@ -688,30 +806,84 @@ class ZipService:
             raise ValueError("No RAG-ready documents found")
 
         ids = [r.document_id for r in rag_ready]
+        artifacts = await self._load_processed_artifacts(ids)
+
+        chunks = self.iter_archive(
+            ids, artifacts=artifacts, include_summary=include_summary, prefetch=prefetch
+        )
+        return ZipService.ZipStream(
+            filename=self._archive_name(custom_filename, "curatore_rag_ready_export.zip"),
+            chunks=chunks,
+            file_count=len(ids),
+        )
+
+    async def save_to_storage(
+        self,
+        archive: "ZipService.ZipStream",
+        organization_id: UUID,
+    ) -> Dict[str, Any]:
+        """
+        Upload a streamed archive to object storage as a temp artifact.
 
-        # Load artifacts for all documents into cache (for sync functions to use)
-        from app.core.shared.database_service import database_service
-        self._artifact_cache = {}
-        try:
-            async with database_service.get_session() as session:
-                for doc_id in ids:
-                    artifacts = await artifact_service.get_artifacts_by_document(
-                        session, doc_id
-                    )
-                    # Filter for processed artifacts
-                    processed = [a for a in artifacts if a.artifact_type == "processed"]
-                    if processed:
-                        self._artifact_cache[doc_id] = processed[0]  # Get first processed artifact
-        except Exception as e:
-            print(f"Failed to load artifacts: {e}")
-            # Continue anyway - will fall back to storage service
+        The archive is written with a multipart upload as it is generated,
+        so nothing is staged on local disk.
 
-        zip_path_str, count = self.create_zip_archive(ids, custom_filename or "curatore_rag_ready_export.zip", include_summary)
+        Args:
+            archive: Stream from stream_bulk_download/stream_rag_ready_download
+            organization_id: Organization that owns the export
 
-        # Clear artifact cache after use
-        self._artifact_cache = {}
+        Returns:
+            Dict with artifact_id, bucket, object_key, filename, file_size
+            and file_hash
+        """
+        from app.core.shared.database_service import database_service
 
-        return ZipService.ZipInfo(zip_path=Path(zip_path_str), file_count=count)
+        if not self.minio or not self.minio.enabled:
+            raise RuntimeError("Object storage is not available")
+
+        document_id = str(uuid.uuid4())
+        bucket = self.minio.bucket_temp
+        object_key = f"{organization_id}/exports/{document_id}-{archive.filename}"
+
+        upload = await asyncio.to_thread(
+            self.minio.put_stream,
+            bucket=bucket,
+            key=object_key,
+            data=_IteratorReader(archive.chunks),
+            content_type="application/zip",
+        )
+
+        async with database_service.get_session() as session:
+            artifact = await artifact_service.create_artifact(
+                session=session,
+                organization_id=organization_id,
+                document_id=document_id,
+                artifact_type="temp",
+                bucket=bucket,
+                object_key=object_key,
+                original_filename=archive.filename,
+                content_type="application/zip",
+                file_size=upload.file_size,
+                file_hash=upload.file_hash,
+                status="available",
+                expires_at=datetime.utcnow() + timedelta(days=settings.file_retention_temp_days),
+            )
+            await session.commit()
+
+        return {
+            "artifact_id": str(artifact.id),
+            "bucket": bucket,
+            "object_key": object_key,
+            "filename": archive.filename,
+            "file_size": upload.file_size,
+            "file_hash": upload.file_hash,
+        }
+
+    @staticmethod
+    def _archive_name(custom_filename: Optional[str], default_name: str) -> str:
+        if not custom_filename:
+            return default_name
+        return custom_filename if custom_filename.endswith('.zip') else f"{custom_filename}.zip"
 
 
 # ============================================================================
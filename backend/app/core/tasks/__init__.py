@@ -40,6 +40,7 @@ from app.core.tasks.maintenance import (
 
 # Procedure/Pipeline tasks
 from app.core.tasks.procedures import (
+    dispatch_event_outbox_task,
     execute_pipeline_task,
     execute_procedure_task,
 )
@@ -112,6 +113,7 @@ __all__ = [
     # Procedures/Pipelines
     "execute_procedure_task",
     "execute_pipeline_task",
+    "dispatch_event_outbox_task",
     # Forecasts
     "forecast_sync_task",
     # Maintenance
@@ -1046,8 +1046,9 @@ async def _enhance_extraction_async(
         temp_input_file = temp_dir / asset.original_filename
 
         try:
-            file_data = minio.get_object(asset.raw_bucket, asset.raw_object_key)
-            temp_input_file.write_bytes(file_data.getvalue())
+            await asyncio.to_thread(
+                minio.fget_object, asset.raw_bucket, asset.raw_object_key, temp_input_file
+            )
 
             # Extract using Docling via the document service
             start_time = time.time()
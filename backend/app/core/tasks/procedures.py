@@ -263,3 +263,43 @@ async def _fail_pipeline_run(run_id, pipeline_run_id, error: str) -> None:
 
         await run_service.fail_run(session, run_id, error)
         await session.commit()
+
+
+@celery_app.task(bind=True, name="app.tasks.dispatch_event_outbox_task")
+def dispatch_event_outbox_task(self) -> Dict[str, Any]:
+    """
+    Dispatch pending events from the event outbox.
+
+    Scheduled shortly after deferred emits and periodically by beat as a
+    safety net. Drains the outbox in batches until it is empty.
+
+    Returns:
+        Dict with dispatched, triggered and failed counts
+    """
+    logger = logging.getLogger("curatore.tasks.event_outbox")
+
+    try:
+        result = asyncio.run(_dispatch_event_outbox_async())
+        if result.get("dispatched", 0) > 0:
+            logger.info(
+                f"Dispatched {result['dispatched']} events "
+                f"({result['triggered']} runs triggered, {result['failed']} failed)"
+            )
+        return result
+    except Exception as e:
+        logger.error(f"Error dispatching event outbox: {e}", exc_info=True)
+        return {"status": "error", "error": str(e)}
+
+
+async def _dispatch_event_outbox_async() -> Dict[str, Any]:
+    """Async implementation of outbox dispatch."""
+    from app.core.shared.event_service import OUTBOX_BATCH_SIZE, event_service
+
+    totals = {"dispatched": 0, "triggered": 0, "failed": 0}
+    async with database_service.get_session() as session:
+        while True:
+            stats = await event_service.dispatch_outbox(session)
+            for key in totals:
+                totals[key] += stats[key]
+            if stats["dispatched"] + stats["failed"] < OUTBOX_BATCH_SIZE:
+                return totals
@@ -443,6 +443,7 @@ def sam_pull_task(
                                 "new_attachments": new_attachments,
                             },
                             source_run_id=run_uuid,
+                            defer=True,
                         )
                     except Exception as event_error:
                         logger.warning(f"Failed to emit sam_pull.completed event: {event_error}")
@@ -1500,10 +1501,7 @@ Respond ONLY with valid JSON, no additional text."""
                     model = llm_conn.config.get("model", model)
                     logger.info(f"Using database LLM connection for notice summary: {llm_conn.name}")
 
-                if not client:
-                    client = llm_service._client
-
-                if not client:
+                if not client and not llm_service.is_available:
                     logger.error(f"No LLM client available for notice {notice_id}")
                     notice.summary_status = "failed"
                     await session.commit()
@@ -1511,18 +1509,23 @@ Respond ONLY with valid JSON, no additional text."""
 
                 # Call LLM
                 try:
-                    response = client.chat.completions.create(
-                        model=model,
-                        messages=[
+                    request = {
+                        "model": model,
+                        "messages": [
                             {
                                 "role": "system",
                                 "content": "You are a Business Development analyst at a government contracting company. Provide accurate, professional analysis of federal notices.",
                             },
                             {"role": "user", "content": prompt},
                         ],
-                        temperature=0.3,
-                        max_tokens=4000,
-                    )
+                        "temperature": 0.3,
+                        "max_tokens": 4000,
+                    }
+                    if client:
+                        # Per-organization connections use their own sync client
+                        response = await asyncio.to_thread(client.chat.completions.create, **request)
+                    else:
+                        response = await llm_service.chat_completion(**request)
 
                     response_text = response.choices[0].message.content
                     if not response_text:
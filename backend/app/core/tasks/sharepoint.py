@@ -262,6 +262,7 @@ async def _sharepoint_sync_async(
                         "extractions_triggered": extraction_count,
                     },
                     source_run_id=run_id,
+                    defer=True,
                 )
             except Exception as event_error:
                 logger.warning(f"Failed to emit sharepoint_sync.completed event: {event_error}")
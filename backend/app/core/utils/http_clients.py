@@ -0,0 +1,47 @@
+"""
+Event-loop-scoped HTTP client utilities for Curatore v2.
+
+httpx.AsyncClient connection pools are bound to the event loop that opened
+them. Celery tasks run each task in a fresh loop (asyncio.run), so services
+that cache an async client per loop must close it when that loop ends or
+every task leaks a connection pool.
+
+Usage:
+    from app.core.utils.http_clients import close_at_loop_shutdown
+
+    http_client = httpx.AsyncClient(...)
+    # Keep a reference for as long as the client is cached
+    self._client_closer = close_at_loop_shutdown(http_client)
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+
+
+async def _close_on_finalize(http_client: httpx.AsyncClient) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+
+
+def close_at_loop_shutdown(http_client: httpx.AsyncClient) -> AsyncIterator[None]:
+    """
+    Close an httpx client when the running event loop shuts down.
+
+    Starts an async generator that closes the client when finalized.
+    asyncio.run() finalizes live async generators before closing its loop,
+    so the pool's connections are closed on the loop that owns them; the
+    loop's finalizer does the same if the generator is dropped while the
+    loop is still running.
+
+    Must be called from within a running event loop.
+
+    Returns:
+        The started generator; keep a reference while the client is in use
+    """
+    closer = _close_on_finalize(http_client)
+    asyncio.ensure_future(closer.__anext__())
+    return closer
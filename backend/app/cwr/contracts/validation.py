@@ -316,6 +316,17 @@ class ProcedureValidator:
                     details={"value": on_error, "valid_values": list(self.VALID_ON_ERROR_POLICIES)},
                 ))
 
+            # Validate foreach execution options
+            for option in ("concurrency", "batch_size", "max_failures"):
+                value = step.get(option)
+                if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+                    errors.append(ValidationError(
+                        code=ValidationErrorCode.INVALID_FIELD_TYPE,
+                        message=f"'{option}' must be a positive integer",
+                        path=f"{step_path}.{option}",
+                        details={"value": value},
+                    ))
+
             # Validate flow function branches
             if func_name in self.FLOW_FUNCTIONS:
                 branch_errors = self._validate_flow_branches(step, step_path)
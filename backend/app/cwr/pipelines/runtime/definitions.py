@@ -38,6 +38,12 @@ class StageDefinition:
     - transform: Modify items
     - enrich: Add derived metadata
     - output: Save/export results
+
+    Consecutive filter/transform/enrich stages stream items to each other;
+    concurrency sets how many items a stage works on at once. With batched
+    set, up to batch_size items are handed in one call to functions that
+    accept a list (FunctionMeta.batch_param); otherwise each item is its
+    own call.
     """
     name: str
     type: StageType
@@ -45,6 +51,8 @@ class StageDefinition:
     params: Dict[str, Any] = field(default_factory=dict)
     on_error: OnErrorPolicy = OnErrorPolicy.SKIP  # Skip failed items by default
     batch_size: int = 50
+    batched: bool = False  # Opt in to batch_size items per call
+    concurrency: int = 1
     description: str = ""
 
 
@@ -116,6 +124,8 @@ class PipelineDefinition:
                     "params": s.params,
                     "on_error": s.on_error.value,
                     "batch_size": s.batch_size,
+                    "batched": s.batched,
+                    "concurrency": s.concurrency,
                     "description": s.description,
                 }
                 for s in self.stages
@@ -156,6 +166,8 @@ class PipelineDefinition:
                 params=s.get("params", {}),
                 on_error=OnErrorPolicy(s.get("on_error", "skip")),
                 batch_size=s.get("batch_size", 50),
+                batched=s.get("batched", False),
+                concurrency=s.get("concurrency", 1),
                 description=s.get("description", ""),
             )
             for s in data.get("stages", [])
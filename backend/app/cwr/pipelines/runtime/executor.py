@@ -1,30 +1,112 @@
 # backend/app/pipelines/executor.py
 """
 Pipeline Executor - Execute pipeline definitions with per-item state tracking.
+
+Gather and output stages work on the full item list. A run of consecutive
+filter/transform/enrich stages executes as one streaming segment: each stage
+is a pool of workers reading from a bounded queue and writing to the next
+stage's queue, so an item moves on as soon as a stage is done with it and a
+slow stage holds back the stages feeding it.
+
+Features:
+- Per-stage concurrency (StageDefinition.concurrency) with backpressure
+- Batch hand-off of up to batch_size items to functions that declare a
+  FunctionMeta.batch_param, for stages that set batched
+- Per-item watermarks (index of the last completed stage) stored in
+  pipeline_item_states, so a resumed run skips the work each item finished
 """
 
+import asyncio
+import json
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from uuid import UUID
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.shared.database_service import database_service
 from app.cwr.tools import FunctionContext, FunctionResult, fn
+from app.cwr.tools.base import collection_entry_result
+from app.cwr.tools.templating import compile_params
 
 from ..store.loader import pipeline_loader
 from .definitions import OnErrorPolicy, PipelineDefinition, StageDefinition, StageType
 
 logger = logging.getLogger("curatore.pipelines.executor")
 
+# Stage types that process items one at a time and stream into each other
+STREAMING_STAGE_TYPES = (StageType.FILTER, StageType.TRANSFORM, StageType.ENRICH)
+
+# Minimum number of items buffered between two streaming stages
+STAGE_QUEUE_SIZE = 100
+
+# How long a batch-capable stage waits for more items before calling the
+# function with a partial batch
+BATCH_WAIT_SECONDS = 0.5
+
+# Item watermarks are written to the database in batches of this size
+ITEM_STATE_FLUSH_SIZE = 100
+
+# Marks the end of a stage's input queue
+_END = object()
+
+# Outcome of running a function on one item: (success, data, error)
+ItemOutcome = Tuple[bool, Any, Optional[str]]
+
+
+@dataclass
+class _PipelineItem:
+    """An item moving through the pipeline, with its watermark."""
+    seq: int  # Position in the gathered item list
+    data: Any
+    stage_idx: int  # Index of the last stage the item completed
+    stage_status: Dict[str, str] = field(default_factory=dict)
+    status: str = "processing"
+    error: Optional[str] = None
+    state_id: UUID = field(default_factory=uuid4)
+    persisted: bool = False
+
+
+class _ItemStateWriter:
+    """Buffers item watermarks and writes them to pipeline_item_states in batches."""
+
+    def __init__(self, executor: "PipelineExecutor", pipeline_run_id: UUID):
+        self._executor = executor
+        self._pipeline_run_id = pipeline_run_id
+        self._pending: Dict[int, _PipelineItem] = {}
+        self._lock = asyncio.Lock()
+
+    async def record(self, item: _PipelineItem) -> None:
+        """Queue an item's current state, writing once a batch is full."""
+        self._pending[item.seq] = item
+        if len(self._pending) >= ITEM_STATE_FLUSH_SIZE:
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """Write all queued item states. Returns False if some could not be written."""
+        async with self._lock:
+            if not self._pending:
+                return True
+            items, self._pending = list(self._pending.values()), {}
+            try:
+                await self._executor._write_item_states(self._pipeline_run_id, items)
+            except Exception as e:
+                logger.warning(f"Failed to save item watermarks: {e}")
+                for item in items:
+                    self._pending.setdefault(item.seq, item)
+                return False
+            return True
+
 
 class PipelineExecutor:
     """
     Executes pipeline definitions with per-item state tracking.
 
     Features:
-    - Processes items through stages
+    - Processes items through stages, streaming between per-item stages
     - Tracks per-item state for resume capability
     - Supports checkpointing after stages
     - Handles errors per-item (continue other items)
@@ -86,6 +168,15 @@ class PipelineExecutor:
             dry_run=dry_run,
         )
 
+        # Track state
+        items: List[_PipelineItem] = []
+        stage_results: Dict[str, Any] = {}
+        writer = _ItemStateWriter(self, pipeline_run_id) if pipeline_run_id else None
+
+        # Resumed runs pick up the items (and their watermarks) of the run
+        if resume_from_stage > 0 and pipeline_run_id:
+            items = await self._load_item_states(session, pipeline_run_id)
+
         # Log start
         await ctx.log_run_event(
             level="INFO",
@@ -95,58 +186,75 @@ class PipelineExecutor:
                 "pipeline_slug": definition.slug,
                 "stages": len(definition.stages),
                 "resume_from": resume_from_stage,
+                "resumed_items": len(items),
             },
         )
 
-        # Track state
-        items: List[Dict[str, Any]] = []
-        stage_results: Dict[str, Any] = {}
-        current_stage = resume_from_stage
-
-        # Execute stages
-        for stage_idx, stage in enumerate(definition.stages):
-            if stage_idx < resume_from_stage:
-                continue
-
-            current_stage = stage_idx
+        # Execute stages, one segment of streaming stages at a time
+        for segment in self._plan_segments(definition, resume_from_stage):
+            segment_stages = [definition.stages[idx] for idx in segment]
 
             try:
-                result = await self._execute_stage(ctx, stage, items, pipeline_run_id)
-                stage_results[stage.name] = result
-
-                # Update items based on stage type
-                if stage.type == StageType.GATHER:
-                    items = result.get("items", [])
-                elif stage.type == StageType.FILTER:
-                    items = result.get("items", items)
-                elif stage.type in (StageType.TRANSFORM, StageType.ENRICH):
-                    items = result.get("items", items)
+                if segment_stages[0].type in STREAMING_STAGE_TYPES:
+                    items, results, error = await self._execute_segment(ctx, definition, segment, items, writer)
+                else:
+                    stage_idx, stage = segment[0], segment_stages[0]
+                    result = await self._execute_stage(ctx, stage, [item.data for item in items])
+                    results, error = {stage.name: result}, None
+                    if stage.type == StageType.GATHER:
+                        items = [
+                            _PipelineItem(seq=seq, data=data, stage_idx=stage_idx)
+                            for seq, data in enumerate(result.get("items", []))
+                        ]
+                        # Every gathered item gets a state row at the gather
+                        # watermark, so a resume sees the items not yet finished
+                        if writer:
+                            for item in items:
+                                await writer.record(item)
+                            await writer.flush()
+                stage_results.update(results)
 
                 # Log stage completion
-                await ctx.log_run_event(
-                    level="INFO",
-                    event_type="stage_complete",
-                    message=f"Stage {stage.name} complete: {len(items)} items",
-                    context={
-                        "stage": stage.name,
-                        "items_count": len(items),
-                        "status": result.get("status"),
-                    },
-                )
+                for stage in segment_stages:
+                    result = results[stage.name]
+                    items_count = result.get("processed", len(items))
+                    await ctx.log_run_event(
+                        level="INFO",
+                        event_type="stage_complete",
+                        message=f"Stage {stage.name} complete: {items_count} items",
+                        context={
+                            "stage": stage.name,
+                            "items_count": items_count,
+                            "status": result.get("status"),
+                        },
+                    )
+
+                if error:
+                    logger.error(f"Pipeline {definition.slug} stopped: {error}")
+                    if definition.on_error == OnErrorPolicy.FAIL:
+                        break
+                    continue
 
                 # Checkpoint if configured
-                if stage.name in definition.checkpoint_after_stages:
+                checkpointed = [
+                    idx for idx in segment if definition.stages[idx].name in definition.checkpoint_after_stages
+                ]
+                if checkpointed:
                     await self._save_checkpoint(
-                        session, pipeline_run_id, stage_idx, items, stage_results
+                        session, pipeline_run_id, max(checkpointed), items, stage_results, writer
                     )
 
             except Exception as e:
-                logger.exception(f"Stage {stage.name} failed: {e}")
-                stage_results[stage.name] = {"status": "failed", "error": str(e)}
+                logger.exception(f"Stage {segment_stages[0].name} failed: {e}")
+                for stage in segment_stages:
+                    stage_results.setdefault(stage.name, {"status": "failed", "error": str(e)})
 
                 if definition.on_error == OnErrorPolicy.FAIL:
                     break
 
+        if writer:
+            await writer.flush()
+
         # Compute stats
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
         completed_stages = len([r for r in stage_results.values() if r.get("status") != "failed"])
@@ -174,18 +282,34 @@ class PipelineExecutor:
             "total_stages": len(definition.stages),
             "completed_stages": completed_stages,
             "items_processed": len(items),
-            "final_items": items,
+            "final_items": [item.data for item in items],
             "duration_ms": duration_ms,
         }
 
+    @staticmethod
+    def _plan_segments(definition: PipelineDefinition, start: int) -> List[List[int]]:
+        """
+        Group stage indexes from start into execution segments.
+
+        Gather and output stages are segments of their own; consecutive
+        filter/transform/enrich stages share one streaming segment.
+        """
+        segments: List[List[int]] = []
+        for idx in range(start, len(definition.stages)):
+            streaming = definition.stages[idx].type in STREAMING_STAGE_TYPES
+            if streaming and segments and definition.stages[segments[-1][-1]].type in STREAMING_STAGE_TYPES:
+                segments[-1].append(idx)
+            else:
+                segments.append([idx])
+        return segments
+
     async def _execute_stage(
         self,
         ctx: FunctionContext,
         stage: StageDefinition,
         items: List[Dict[str, Any]],
-        pipeline_run_id: Optional[UUID],
     ) -> Dict[str, Any]:
-        """Execute a single stage."""
+        """Execute a gather or output stage over the full item list."""
         logger.info(f"Executing stage: {stage.name} ({stage.type.value})")
 
         func = fn.get_or_none(stage.function)
@@ -205,58 +329,6 @@ class PipelineExecutor:
                 }
             return {"status": "failed", "error": result.error}
 
-        elif stage.type == StageType.FILTER:
-            # Filter stage - apply function to filter items
-            filtered_items = []
-            for item in items:
-                try:
-                    result = await func(ctx, item=item, **rendered_params)
-                    if result.success and result.data:
-                        filtered_items.append(item)
-                except Exception:
-                    if stage.on_error == OnErrorPolicy.FAIL:
-                        raise
-            return {"status": "success", "items": filtered_items}
-
-        elif stage.type in (StageType.TRANSFORM, StageType.ENRICH):
-            # Transform/Enrich - process items in batches
-            processed_items = []
-            failed_count = 0
-
-            for i in range(0, len(items), stage.batch_size):
-                batch = items[i:i + stage.batch_size]
-
-                for item in batch:
-                    try:
-                        result = await func(ctx, item=item, **rendered_params)
-                        if result.success:
-                            # Merge result data into item
-                            if isinstance(result.data, dict):
-                                processed_items.append({**item, **result.data})
-                            else:
-                                processed_items.append(item)
-                        else:
-                            failed_count += 1
-                            if stage.on_error == OnErrorPolicy.SKIP:
-                                continue
-                            elif stage.on_error == OnErrorPolicy.CONTINUE:
-                                processed_items.append(item)
-                            else:
-                                raise Exception(result.error)
-                    except Exception:
-                        failed_count += 1
-                        if stage.on_error == OnErrorPolicy.FAIL:
-                            raise
-                        elif stage.on_error == OnErrorPolicy.CONTINUE:
-                            processed_items.append(item)
-
-            return {
-                "status": "success" if failed_count == 0 else "partial",
-                "items": processed_items,
-                "processed": len(processed_items),
-                "failed": failed_count,
-            }
-
         elif stage.type == StageType.OUTPUT:
             # Output stage - save results
             result = await func(ctx, items=items, **rendered_params)
@@ -268,31 +340,378 @@ class PipelineExecutor:
 
         return {"status": "failed", "error": f"Unknown stage type: {stage.type}"}
 
+    async def _execute_segment(
+        self,
+        ctx: FunctionContext,
+        definition: PipelineDefinition,
+        segment: List[int],
+        items: List[_PipelineItem],
+        writer: Optional[_ItemStateWriter],
+    ) -> Tuple[List[_PipelineItem], Dict[str, Any], Optional[str]]:
+        """
+        Stream items through consecutive filter/transform/enrich stages.
+
+        Returns the surviving items in their original order, the result of
+        each stage, and an error if an item failure under on_error=fail
+        stopped the segment. A stopped segment returns its input items.
+        """
+        stages = [(idx, definition.stages[idx]) for idx in segment]
+        funcs = {}
+        batch_sizes = {}
+        rendered_params = {}
+        for idx, stage in stages:
+            logger.info(f"Executing stage: {stage.name} ({stage.type.value}, concurrency {stage.concurrency})")
+            func = fn.get_or_none(stage.function)
+            funcs[idx] = func
+            batch_sizes[idx] = (
+                stage.batch_size if stage.batched and func and func.meta.batch_param and stage.batch_size > 1 else None
+            )
+            if batch_sizes[idx]:
+                # Item templates are left for the function to render per item
+                plan = compile_params(stage.params, defer_item=True)
+                rendered_params[idx] = ctx.render_params(stage.params, plan=plan)
+            else:
+                rendered_params[idx] = ctx.render_params(stage.params)
+
+        queues = [
+            asyncio.Queue(maxsize=max(STAGE_QUEUE_SIZE, (batch_sizes[idx] or 1) * max(1, stage.concurrency)))
+            for idx, stage in stages
+        ]
+        stats = {idx: {"processed": 0, "failed": 0, "filtered": 0, "resumed": 0} for idx, _ in stages}
+        output: List[_PipelineItem] = []
+        # First item failure under on_error=fail: stage index and error
+        abort: Dict[str, Any] = {}
+
+        async def emit(pos: int, item: _PipelineItem) -> None:
+            if pos + 1 < len(stages):
+                await queues[pos + 1].put(item)
+            else:
+                output.append(item)
+
+        async def take(pos: int, limit: int) -> Optional[List[_PipelineItem]]:
+            # Up to limit items from the stage's queue; None once it is drained
+            unit = []
+            while len(unit) < limit:
+                if not unit:
+                    entry = await queues[pos].get()
+                else:
+                    try:
+                        entry = await asyncio.wait_for(queues[pos].get(), BATCH_WAIT_SECONDS)
+                    except asyncio.TimeoutError:
+                        break
+                if entry is _END:
+                    # Leave the marker for the stage's other workers
+                    await queues[pos].put(_END)
+                    break
+                unit.append(entry)
+            return unit or None
+
+        async def work(pos: int, worker_ctx: FunctionContext) -> None:
+            idx, stage = stages[pos]
+            func = funcs[idx]
+            while True:
+                unit = await take(pos, batch_sizes[idx] or 1)
+                if unit is None:
+                    return
+
+                todo = []
+                for item in unit:
+                    if func is None or item.stage_idx >= idx:
+                        # Missing function, or already done before a resume
+                        if func is not None:
+                            stats[idx]["resumed"] += 1
+                        await emit(pos, item)
+                    else:
+                        todo.append(item)
+                if not todo:
+                    continue
+
+                outcomes = await self._run_unit(
+                    worker_ctx, stage, func, rendered_params[idx], [item.data for item in todo], batch_sizes[idx]
+                )
+                for item, outcome in zip(todo, outcomes):
+                    keep = self._apply_outcome(stage, idx, item, outcome, stats[idx])
+                    if keep and pos == len(stages) - 1:
+                        item.status = "completed"
+                    if writer:
+                        await writer.record(item)
+                    if keep:
+                        await emit(pos, item)
+                    elif item.status == "failed" and stage.on_error == OnErrorPolicy.FAIL:
+                        abort.setdefault("idx", idx)
+                        abort.setdefault("error", item.error or "Item failed")
+                        raise RuntimeError(f"Stage {stage.name} failed: {item.error}")
+
+        # AsyncSession is not safe for concurrent use: with more than one
+        # worker in the segment, each worker gets its own session.
+        pooled = sum(max(1, stage.concurrency) for _, stage in stages) > 1
+
+        async def run_worker(pos: int) -> None:
+            if not pooled:
+                await work(pos, ctx)
+                return
+            async with database_service.get_session() as worker_session:
+                await work(pos, ctx.child_context(session=worker_session))
+
+        async def run_stage(pos: int) -> None:
+            await asyncio.gather(*(run_worker(pos) for _ in range(max(1, stages[pos][1].concurrency))))
+            if pos + 1 < len(stages):
+                await queues[pos + 1].put(_END)
+
+        async def feed() -> None:
+            for item in items:
+                await queues[0].put(item)
+            await queues[0].put(_END)
+
+        tasks = [asyncio.create_task(feed())]
+        tasks.extend(asyncio.create_task(run_stage(pos)) for pos in range(len(stages)))
+        try:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        error = next((task.exception() for task in done if task.exception()), None)
+        if error and not abort:
+            raise error
+
+        if writer:
+            await writer.flush()
+
+        results = {}
+        for idx, stage in stages:
+            if funcs[idx] is None:
+                results[stage.name] = {"status": "failed", "error": f"Function not found: {stage.function}"}
+            elif abort and idx == abort["idx"]:
+                results[stage.name] = {"status": "failed", "error": abort["error"], **stats[idx]}
+            elif abort and idx > abort["idx"]:
+                stopped_by = definition.stages[abort["idx"]].name
+                results[stage.name] = {"status": "failed", "error": f"Not completed: stage {stopped_by} failed"}
+            else:
+                results[stage.name] = self._stage_summary(stage, stats[idx])
+
+        if abort:
+            return items, results, str(error)
+        output.sort(key=lambda item: item.seq)
+        return output, results, None
+
+    async def _run_unit(
+        self,
+        ctx: FunctionContext,
+        stage: StageDefinition,
+        func: Any,
+        rendered_params: Dict[str, Any],
+        batch: List[Any],
+        batch_size: Optional[int],
+    ) -> List[ItemOutcome]:
+        """
+        Run a stage function on one item, or on a batch of items.
+
+        Batch-capable functions get the whole batch as their batch_param and
+        must return one result per item, in order; collection-mode entries
+        ({"item_id", "success", "error", ...}) are unpacked to the item's
+        result.
+        """
+        try:
+            if not batch_size:
+                result: FunctionResult = await func(ctx, item=batch[0], **rendered_params)
+                return [(result.success, result.data, result.error)]
+            result = await func(ctx, **{**rendered_params, func.meta.batch_param: batch})
+        except Exception as e:
+            logger.warning(f"Stage {stage.name} failed on {len(batch)} item(s): {e}")
+            return [(False, None, str(e))] * len(batch)
+
+        data = result.data
+        if not result.success or not isinstance(data, list) or len(data) != len(batch):
+            error = result.error if not result.success else (
+                f"{stage.function} returned {len(data) if isinstance(data, list) else type(data).__name__} "
+                f"results for a batch of {len(batch)}"
+            )
+            return [(False, None, error)] * len(batch)
+
+        outcomes = []
+        for entry in data:
+            if isinstance(entry, dict) and "success" in entry:
+                outcomes.append((bool(entry["success"]), collection_entry_result(entry), entry.get("error")))
+            else:
+                outcomes.append((True, entry, None))
+        return outcomes
+
+    @staticmethod
+    def _apply_outcome(
+        stage: StageDefinition,
+        stage_idx: int,
+        item: _PipelineItem,
+        outcome: ItemOutcome,
+        stats: Dict[str, int],
+    ) -> bool:
+        """
+        Update an item with a stage's outcome for it.
+
+        Returns True when the item continues to the next stage.
+        """
+        success, data, error = outcome
+
+        if success:
+            if stage.type == StageType.FILTER and not data:
+                stats["filtered"] += 1
+                item.stage_status[stage.name] = "skipped"
+                item.status = "skipped"
+                return False
+            if stage.type != StageType.FILTER and isinstance(data, dict) and isinstance(item.data, dict):
+                # Merge result data into item
+                item.data = {**item.data, **data}
+            stats["processed"] += 1
+            item.stage_status[stage.name] = "completed"
+            item.stage_idx = stage_idx
+            return True
+
+        stats["failed"] += 1
+        item.stage_status[stage.name] = "failed"
+        item.error = error
+        if stage.type != StageType.FILTER and stage.on_error == OnErrorPolicy.CONTINUE:
+            stats["processed"] += 1
+            item.stage_idx = stage_idx
+            return True
+        item.status = "failed"
+        return False
+
+    @staticmethod
+    def _stage_summary(stage: StageDefinition, stats: Dict[str, int]) -> Dict[str, Any]:
+        """Build the result of a streaming stage from its counters."""
+        summary = {
+            "status": "success" if stats["failed"] == 0 else "partial",
+            "processed": stats["processed"],
+            "failed": stats["failed"],
+        }
+        if stage.type == StageType.FILTER:
+            summary["filtered"] = stats["filtered"]
+        if stats["resumed"]:
+            summary["resumed"] = stats["resumed"]
+        return summary
+
+    async def _load_item_states(self, session: AsyncSession, pipeline_run_id: UUID) -> List[_PipelineItem]:
+        """Load the items still in flight for a pipeline run, with their watermarks."""
+        from app.core.database.procedures import PipelineItemState
+
+        query = select(PipelineItemState).where(
+            PipelineItemState.pipeline_run_id == pipeline_run_id,
+            PipelineItemState.status.in_(("processing", "completed")),
+        )
+        result = await session.execute(query)
+
+        items = []
+        for state in result.scalars().all():
+            stage_data = state.stage_data or {}
+            if "item" not in stage_data:
+                continue
+            items.append(_PipelineItem(
+                seq=stage_data.get("seq", 0),
+                data=stage_data["item"],
+                stage_idx=stage_data.get("stage_idx", -1),
+                stage_status=dict(state.stage_status or {}),
+                status=state.status,
+                state_id=state.id,
+                persisted=True,
+            ))
+        items.sort(key=lambda item: item.seq)
+        return items
+
+    async def _write_item_states(self, pipeline_run_id: UUID, items: List[_PipelineItem]) -> None:
+        """Insert or update the pipeline_item_states rows of the given items."""
+        from app.core.database.procedures import PipelineItemState
+
+        now = datetime.utcnow()
+        inserts = []
+        updates = []
+        for item in items:
+            row = {
+                "id": item.state_id,
+                "stage_status": dict(item.stage_status),
+                "stage_data": {
+                    "seq": item.seq,
+                    "stage_idx": item.stage_idx,
+                    "item": json.loads(json.dumps(item.data, default=str)),
+                },
+                "status": item.status,
+                "error_message": item.error,
+                "updated_at": now,
+            }
+            if item.persisted:
+                updates.append(row)
+            else:
+                inserts.append({
+                    **row,
+                    "pipeline_run_id": pipeline_run_id,
+                    "item_type": "item",
+                    "item_id": self._item_uuid(item),
+                    "created_at": now,
+                })
+
+        # Own session so watermarks are committed as the run progresses
+        async with database_service.get_session() as session:
+            if inserts:
+                await session.execute(insert(PipelineItemState), inserts)
+            if updates:
+                await session.execute(update(PipelineItemState), updates)
+
+        for item in items:
+            item.persisted = True
+
+    @staticmethod
+    def _item_uuid(item: _PipelineItem) -> UUID:
+        """Derive a stable UUID for an item from its id (or position)."""
+        item_id = item.data.get("id") if isinstance(item.data, dict) else None
+        if item_id is None:
+            return uuid5(NAMESPACE_URL, f"pipeline-item:{item.seq}")
+        try:
+            return UUID(str(item_id))
+        except ValueError:
+            return uuid5(NAMESPACE_URL, f"pipeline-item:{item_id}")
+
     async def _save_checkpoint(
         self,
         session: AsyncSession,
         pipeline_run_id: Optional[UUID],
         stage_idx: int,
-        items: List[Dict[str, Any]],
+        items: List[_PipelineItem],
         stage_results: Dict[str, Any],
+        writer: Optional[_ItemStateWriter] = None,
     ) -> None:
-        """Save checkpoint for resume capability."""
+        """
+        Save checkpoint for resume capability.
+
+        Pending item watermarks are written first, so every item state up to
+        the checkpoint is stored; if they cannot be written the checkpoint is
+        not advanced. checkpoint_data summarizes how many items sit at each
+        stage watermark.
+        """
         if not pipeline_run_id:
             return
 
         from app.core.database.procedures import PipelineRun
 
+        if writer and not await writer.flush():
+            logger.warning(f"Skipping checkpoint after stage {stage_idx}: item watermarks not saved")
+            return
+
         try:
             query = select(PipelineRun).where(PipelineRun.id == pipeline_run_id)
             result = await session.execute(query)
             pipeline_run = result.scalar_one_or_none()
 
             if pipeline_run:
+                watermarks: Dict[int, int] = {}
+                for item in items:
+                    watermarks[item.stage_idx] = watermarks.get(item.stage_idx, 0) + 1
+
                 pipeline_run.current_stage = stage_idx + 1
                 pipeline_run.stage_results = stage_results
                 pipeline_run.checkpoint_data = {
                     "stage_idx": stage_idx,
                     "items_count": len(items),
+                    "item_watermarks": {str(idx): count for idx, count in sorted(watermarks.items())},
                     "timestamp": datetime.utcnow().isoformat(),
                 }
                 await session.flush()
@@ -165,6 +165,9 @@ class PipelineDiscoveryService:
                     results["removed"] += 1
 
         await session.commit()
+        from app.core.shared.event_service import event_service
+
+        event_service.invalidate_triggers(organization_id)
         return results
 
     async def sync_triggers(
@@ -245,6 +248,9 @@ class PipelineDiscoveryService:
             deactivated += 1
 
         await session.commit()
+        from app.core.shared.event_service import event_service
+
+        event_service.invalidate_triggers(organization_id)
 
         return {
             "created": created,
@@ -23,7 +23,6 @@ Usage:
     )
 """
 
-import asyncio
 import json
 import logging
 import time
@@ -553,7 +552,7 @@ class ProcedureGeneratorService:
         Returns:
             Raw response object from the OpenAI-compatible client.
         """
-        if llm_service._client is None:
+        if not llm_service.is_available:
             raise RuntimeError("LLM client not initialized")
 
         task_config = config_loader.get_task_type_config(LLMTaskType.REASONING)
@@ -578,10 +577,7 @@ class ProcedureGeneratorService:
             kwargs["tools"] = self._apply_tools_caching(tools)
             kwargs["tool_choice"] = "auto"
 
-        def _sync_call():
-            return llm_service._client.chat.completions.create(**kwargs)
-
-        response = await asyncio.to_thread(_sync_call)
+        response = await llm_service.chat_completion(**kwargs)
 
         # Track cache hit metrics from the response
         if diagnostics and response.usage:
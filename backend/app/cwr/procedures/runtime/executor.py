@@ -18,15 +18,20 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.llm.llm_response_cache import llm_response_cache
 from app.core.shared.database_service import database_service
 from app.cwr.tools import FunctionContext, FunctionResult, fn
-from app.cwr.tools.base import FlowResult
+from app.cwr.tools.base import FlowResult, collection_entry_result
+from app.cwr.tools.templating import compile_condition, compile_params, steps_view
 
 from ..store.definitions import OnErrorPolicy, ProcedureDefinition, StepDefinition
 from ..store.loader import procedure_loader
 
 logger = logging.getLogger("curatore.procedures.executor")
 
+# Legacy foreach steps log a progress event at most every this many items
+FOREACH_PROGRESS_INTERVAL = 100
+
 
 class ProcedureExecutor:
     """
@@ -171,6 +176,9 @@ class ProcedureExecutor:
         params = params or {}
         start_time = datetime.utcnow()
 
+        # Compile step templates once (no-op for definitions loaded from JSON)
+        procedure_loader.precompile(definition)
+
         # Validate and apply default parameters
         validated_params = self._validate_params(definition, params)
 
@@ -366,15 +374,9 @@ class ProcedureExecutor:
     def _evaluate_condition(self, condition: str, ctx: FunctionContext) -> bool:
         """Evaluate a Jinja2 condition expression."""
         try:
-            from jinja2 import Template
-            template = Template("{{ " + condition + " }}")
-            result = template.render(
+            result = compile_condition(condition).render(
                 params=ctx.params,
-                steps={
-                    k.replace("steps.", ""): v
-                    for k, v in ctx.variables.items()
-                    if k.startswith("steps.")
-                },
+                steps=steps_view(ctx.variables),
                 # Add common Python functions for convenience
                 len=len,
                 str=str,
@@ -528,10 +530,16 @@ class ProcedureExecutor:
         func: Any,
         item: Any = None,
         item_index: int = None,
+        log_events: bool = True,
     ) -> Dict[str, Any]:
-        """Execute a single function call (optionally with item context)."""
+        """
+        Execute a single function call (optionally with item context).
+
+        log_events=False suppresses the step_start/step_complete events, for
+        callers that report aggregated progress instead (legacy foreach).
+        """
         # Render parameters with templates, including item if provided
-        rendered_params = ctx.render_params(step.params, item=item)
+        rendered_params = ctx.render_params(step.params, item=item, plan=step.render_plan)
 
         # Build log context
         log_context = {
@@ -543,7 +551,7 @@ class ProcedureExecutor:
             log_context["item_index"] = item_index
 
         # Log step start (only for non-foreach or first item)
-        if item_index is None or item_index == 0:
+        if log_events and (item_index is None or item_index == 0):
             await ctx.log_run_event(
                 level="INFO",
                 event_type="step_start",
@@ -554,7 +562,8 @@ class ProcedureExecutor:
         # Execute function
         try:
             step_start = time.monotonic()
-            result: FunctionResult = await func(ctx, **rendered_params)
+            with llm_response_cache.enabled_for(step.cache):
+                result: FunctionResult = await func(ctx, **rendered_params)
             step_duration_ms = int((time.monotonic() - step_start) * 1000)
 
             # Check if this is a FlowResult with branches to execute
@@ -570,12 +579,13 @@ class ProcedureExecutor:
                 }
                 if item_index is not None:
                     flow_log_context["item_index"] = item_index
-                await ctx.log_run_event(
-                    level="INFO" if flow_result.get("status") == "success" else "ERROR",
-                    event_type="step_complete",
-                    message=f"Step {step.name}: {flow_result.get('status')}" + (f" (item {item_index})" if item_index is not None else ""),
-                    context=flow_log_context,
-                )
+                if log_events:
+                    await ctx.log_run_event(
+                        level="INFO" if flow_result.get("status") == "success" else "ERROR",
+                        event_type="step_complete",
+                        message=f"Step {step.name}: {flow_result.get('status')}" + (f" (item {item_index})" if item_index is not None else ""),
+                        context=flow_log_context,
+                    )
                 return flow_result
 
             # Serialize data for storage and template access
@@ -595,12 +605,13 @@ class ProcedureExecutor:
             }
             if item_index is not None:
                 log_context["item_index"] = item_index
-            await ctx.log_run_event(
-                level="INFO" if result.success else "ERROR",
-                event_type="step_complete",
-                message=f"Step {step.name}: {result.status.value}" + (f" (item {item_index})" if item_index is not None else ""),
-                context=log_context,
-            )
+            if log_events:
+                await ctx.log_run_event(
+                    level="INFO" if result.success else "ERROR",
+                    event_type="step_complete",
+                    message=f"Step {step.name}: {result.status.value}" + (f" (item {item_index})" if item_index is not None else ""),
+                    context=log_context,
+                )
 
             # Return dict with full serialized data for subsequent steps
             return {
@@ -1003,15 +1014,9 @@ class ProcedureExecutor:
     ) -> bool:
         """Evaluate a Jinja2 condition with item context."""
         try:
-            from jinja2 import Template
-            template = Template("{{ " + condition + " }}")
-            result = template.render(
+            result = compile_condition(condition).render(
                 params=ctx.params,
-                steps={
-                    k.replace("steps.", ""): v
-                    for k, v in ctx.variables.items()
-                    if k.startswith("steps.")
-                },
+                steps=steps_view(ctx.variables),
                 item=item,
                 item_index=item_index,
                 len=len,
@@ -1072,58 +1077,123 @@ class ProcedureExecutor:
                 "items_failed": 0,
             }
 
-        # Execute for each item
-        results = []
-        failed_count = 0
-        total_duration_ms = 0
-        start_time = datetime.utcnow()
+        concurrency = max(1, step.concurrency or 1)
+        batch_param = func.meta.batch_param
+        batch_size = step.batch_size if batch_param else None
+        if step.batch_size and not batch_param:
+            logger.warning(
+                f"Step {step.name}: {step.function} does not accept batches, running items one at a time"
+            )
 
-        for idx, item in enumerate(items):
-            # Execute function with item in context
-            item_result = await self._execute_step_single(ctx, step, func, item=item, item_index=idx)
+        # Work units: (first item index, items). Single items unless batching.
+        unit_size = batch_size or 1
+        units = iter([(start, items[start:start + unit_size]) for start in range(0, len(items), unit_size)])
+        worker_count = min(concurrency, -(-len(items) // unit_size))
 
-            # Extract item ID if available
-            item_id = None
-            if isinstance(item, dict):
-                item_id = item.get("id") or item.get("item_id") or str(idx)
-            else:
-                item_id = str(idx)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        state = {"completed": 0, "failed": 0, "stopped": False, "next_progress": 0}
+        progress_interval = max(1, min(FOREACH_PROGRESS_INTERVAL, len(items) // 10))
+        start_time = datetime.utcnow()
 
-            # Collect result
-            results.append({
-                "item_id": item_id,
-                "success": item_result.get("status") == "success",
-                "result": item_result.get("data"),
-                "error": item_result.get("error"),
-            })
+        async def run_unit(unit_ctx: FunctionContext, start: int, unit_items: List[Any]) -> List[Dict[str, Any]]:
+            if batch_size:
+                return await self._execute_step_batch(unit_ctx, step, func, unit_items, start)
+            item_result = await self._execute_step_single(
+                unit_ctx, step, func, item=unit_items[0], item_index=start, log_events=False
+            )
+            return [self._foreach_entry(
+                unit_items[0],
+                start,
+                item_result.get("status") == "success",
+                item_result.get("data"),
+                item_result.get("error"),
+            )]
+
+        async def work(worker_ctx: FunctionContext) -> None:
+            # Workers pull from the shared unit iterator until it is drained
+            # or the failure threshold stops scheduling.
+            for start, unit_items in units:
+                if state["stopped"]:
+                    break
+                entries = await run_unit(worker_ctx, start, unit_items)
+                for offset, entry in enumerate(entries):
+                    results[start + offset] = entry
+                    if not entry["success"]:
+                        state["failed"] += 1
+                state["completed"] += len(entries)
+
+                if step.max_failures and state["failed"] >= step.max_failures and not state["stopped"]:
+                    state["stopped"] = True
+                    logger.warning(f"Step {step.name}: stopping foreach after {state['failed']} failures")
+
+                if state["completed"] >= state["next_progress"] and state["completed"] < len(items):
+                    state["next_progress"] = state["completed"] + progress_interval
+                    await worker_ctx.log_run_event(
+                        level="INFO",
+                        event_type="progress",
+                        message=f"Step {step.name}: {state['completed']}/{len(items)} items",
+                        context={
+                            "step": step.name,
+                            "completed": state["completed"],
+                            "failed": state["failed"],
+                            "total": len(items),
+                        },
+                    )
 
-            if item_result.get("status") != "success":
-                failed_count += 1
+        async def pooled_work() -> None:
+            # Each concurrent worker uses its own session (AsyncSession is not
+            # safe for concurrent use)
+            async with database_service.get_session() as worker_session:
+                await work(ctx.child_context(session=worker_session))
 
-            if item_result.get("duration_ms"):
-                total_duration_ms += item_result.get("duration_ms", 0)
+        if worker_count <= 1:
+            await work(ctx)
+        else:
+            await asyncio.gather(*(pooled_work() for _ in range(worker_count)))
+
+        # Items never scheduled because of the failure threshold
+        not_run = 0
+        for idx, entry in enumerate(results):
+            if entry is None:
+                not_run += 1
+                results[idx] = self._foreach_entry(
+                    items[idx], idx, False, None, "Not run: failure threshold reached"
+                )
+                results[idx]["skipped"] = True
 
-        # Calculate total duration
+        failed_count = state["failed"]
+        processed = state["completed"]
         total_duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
         # Determine overall status
-        if failed_count == len(items):
+        if state["stopped"] or failed_count == len(items):
             status = "failed"
         elif failed_count > 0:
             status = "partial"
         else:
             status = "success"
 
+        failed_items = [
+            {"item_id": entry["item_id"], "error": entry["error"]}
+            for entry in results
+            if not entry["success"] and not entry.get("skipped")
+        ][:10]
+
         # Log foreach completion
         await ctx.log_run_event(
             level="INFO" if status == "success" else "WARN" if status == "partial" else "ERROR",
             event_type="step_complete",
-            message=f"Step {step.name}: {status} ({len(items) - failed_count}/{len(items)} succeeded)",
+            message=f"Step {step.name}: {status} ({processed - failed_count}/{len(items)} succeeded)",
             context={
                 "step": step.name,
+                "function": step.function,
                 "status": status,
-                "items_processed": len(items),
+                "items_processed": processed,
                 "items_failed": failed_count,
+                "items_not_run": not_run,
+                "concurrency": concurrency,
+                "batch_size": batch_size,
+                "failed_items": failed_items,
                 "duration_ms": total_duration_ms,
             },
         )
@@ -1131,12 +1201,75 @@ class ProcedureExecutor:
         return {
             "status": status,
             "data": results,
-            "message": f"Processed {len(items) - failed_count}/{len(items)} items",
-            "items_processed": len(items),
+            "message": f"Processed {processed - failed_count}/{len(items)} items"
+            + (f" (stopped after {failed_count} failures)" if state["stopped"] else ""),
+            "items_processed": processed,
             "items_failed": failed_count,
             "duration_ms": total_duration_ms,
         }
 
+    async def _execute_step_batch(
+        self,
+        ctx: FunctionContext,
+        step: StepDefinition,
+        func: Any,
+        batch: List[Any],
+        start_index: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run one call of a batch-capable function over a batch of foreach items.
+
+        Params are rendered once per batch; strings referencing {{ item }} are
+        passed through unrendered for the function to render per item. The
+        function must return one result per item, in order.
+        """
+        try:
+            rendered_params = ctx.render_params(step.params, plan=compile_params(step.params, defer_item=True))
+            rendered_params[func.meta.batch_param] = batch
+            with llm_response_cache.enabled_for(step.cache):
+                result: FunctionResult = await func(ctx, **rendered_params)
+        except Exception as e:
+            logger.exception(f"Step {step.name} batch at item {start_index} failed: {e}")
+            return [self._foreach_entry(item, start_index + i, False, None, str(e)) for i, item in enumerate(batch)]
+
+        data = self._serialize_data(result.data)
+        if result.status.value == "failed" or not isinstance(data, list) or len(data) != len(batch):
+            error = result.error if result.status.value == "failed" else (
+                f"{step.function} returned {len(data) if isinstance(data, list) else type(data).__name__} "
+                f"results for a batch of {len(batch)}"
+            )
+            return [self._foreach_entry(item, start_index + i, False, None, error) for i, item in enumerate(batch)]
+
+        entries = []
+        for i, (item, item_data) in enumerate(zip(batch, data)):
+            if isinstance(item_data, dict) and "success" in item_data:
+                # Collection-mode entry: {item_id, success, error, ...result fields}
+                entries.append(self._foreach_entry(
+                    item,
+                    start_index + i,
+                    bool(item_data["success"]),
+                    collection_entry_result(item_data),
+                    item_data.get("error"),
+                ))
+            else:
+                entries.append(self._foreach_entry(item, start_index + i, True, item_data, None))
+        return entries
+
+    @staticmethod
+    def _foreach_entry(item: Any, index: int, success: bool, result: Any, error: Optional[str]) -> Dict[str, Any]:
+        """Build the per-item result entry of a legacy foreach step."""
+        # Extract item ID if available
+        if isinstance(item, dict):
+            item_id = item.get("id") or item.get("item_id") or str(index)
+        else:
+            item_id = str(index)
+        return {
+            "item_id": item_id,
+            "success": success,
+            "result": result,
+            "error": error,
+        }
+
     async def _update_trigger_timestamps(
         self,
         session: AsyncSession,
@@ -11,7 +11,7 @@ Defines the structure for procedure definitions including:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class OnErrorPolicy(str, Enum):
@@ -48,12 +48,28 @@ class StepDefinition:
     - foreach: Template expression that evaluates to a list (or single item)
     - When foreach is set, the step runs once per item
     - {{ item }} is available in params during each iteration
-    - Results are collected into a list
+    - Results are collected into a list, in item order
+    - concurrency: number of items processed at once (each worker gets its
+      own database session); defaults to 1
+    - batch_size: for functions declaring a batch_param (the LLM primitives),
+      pass items in batches of this size in one call; strings referencing
+      {{ item }} are then rendered per item by the function, with only item
+      in scope
+    - max_failures: stop scheduling further items once this many have failed
 
     Flow Control:
     - branches: Named step lists for flow functions (if_branch, switch_branch, parallel, foreach)
     - The flow function decides which branch(es) to execute
     - {{ item }} and {{ item_index }} available in foreach branches
+
+    Caching:
+    - cache: When true, LLM completions made by this step are served from
+      the prompt-fingerprint response cache when an identical request was
+      seen recently
+
+    Rendering:
+    - render_plan: params compiled once at load so per-item rendering only
+      evaluates templates (see app.cwr.tools.templating.compile_params)
     """
     name: str
     function: str
@@ -63,6 +79,12 @@ class StepDefinition:
     description: str = ""
     foreach: Optional[str] = None  # Template expression for iteration (legacy single-step)
     branches: Optional[Dict[str, List["StepDefinition"]]] = None  # For flow control functions
+    cache: bool = False  # Serve identical LLM requests from the response cache
+    concurrency: int = 1  # Foreach items processed at once
+    batch_size: Optional[int] = None  # Foreach items per call for batch-capable functions
+    max_failures: Optional[int] = None  # Foreach fail-fast threshold
+    # Compiled params (set by ProcedureLoader.precompile; not part of the definition)
+    render_plan: Optional[Callable[[Dict[str, Any]], Any]] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -163,6 +185,14 @@ class ProcedureDefinition:
             "description": step.description,
             "foreach": step.foreach,
         }
+        if step.cache:
+            step_dict["cache"] = True
+        if step.concurrency != 1:
+            step_dict["concurrency"] = step.concurrency
+        if step.batch_size:
+            step_dict["batch_size"] = step.batch_size
+        if step.max_failures is not None:
+            step_dict["max_failures"] = step.max_failures
         if step.branches:
             step_dict["branches"] = {
                 branch_name: [self._step_to_dict(s) for s in branch_steps]
@@ -188,6 +218,10 @@ class ProcedureDefinition:
             description=s.get("description", ""),
             foreach=s.get("foreach"),
             branches=branches,
+            cache=bool(s.get("cache", False)),
+            concurrency=int(s.get("concurrency") or 1),
+            batch_size=int(s["batch_size"]) if s.get("batch_size") else None,
+            max_failures=int(s["max_failures"]) if s.get("max_failures") is not None else None,
         )
 
     @classmethod
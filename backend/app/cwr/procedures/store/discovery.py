@@ -186,6 +186,9 @@ class ProcedureDiscoveryService:
                     results["removed"] += 1
 
         await session.commit()
+        from app.core.shared.event_service import event_service
+
+        event_service.invalidate_triggers(organization_id)
         return results
 
     async def sync_triggers(
@@ -275,6 +278,9 @@ class ProcedureDiscoveryService:
             deactivated += 1
 
         await session.commit()
+        from app.core.shared.event_service import event_service
+
+        event_service.invalidate_triggers(organization_id)
 
         return {
             "created": created,
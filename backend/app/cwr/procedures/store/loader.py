@@ -5,6 +5,7 @@ Procedure Loader - Load procedure definitions from JSON files.
 Supports:
 - JSON parsing with schema validation
 - Jinja2 templating in parameter values
+- Precompiling step templates into render plans at load
 - Automatic discovery of procedure files
 """
 
@@ -15,6 +16,8 @@ from typing import Any, Dict, List, Optional
 
 from jinja2 import BaseLoader, Environment
 
+from app.cwr.tools.templating import compile_condition, compile_params
+
 from .definitions import ProcedureDefinition, StepDefinition
 
 logger = logging.getLogger("curatore.procedures.loader")
@@ -81,6 +84,8 @@ class ProcedureLoader:
                 for error in errors:
                     logger.warning(f"Validation error in {path}: {error}")
 
+            self.precompile(definition)
+
             logger.debug(f"Loaded procedure: {definition.slug} from {path}")
             return definition
 
@@ -160,6 +165,35 @@ class ProcedureLoader:
 
         return render_value(params)
 
+    def precompile(self, definition: ProcedureDefinition) -> ProcedureDefinition:
+        """
+        Compile every step's params into a render plan, including nested branches.
+
+        Conditions and foreach expressions are compiled into the shared template
+        cache as well. Steps that already have a plan are skipped, so this is
+        safe to call on every execution. A step whose templates fail to compile
+        keeps no plan and reports the error when it is rendered.
+
+        Returns the same definition for chaining.
+        """
+        self._precompile_steps(definition.steps)
+        return definition
+
+    def _precompile_steps(self, steps: List[StepDefinition]) -> None:
+        """Compile render plans for a list of steps and their branches."""
+        for step in steps:
+            if step.render_plan is None:
+                try:
+                    step.render_plan = compile_params(step.params)
+                    if step.condition:
+                        compile_condition(step.condition)
+                    if step.foreach:
+                        compile_params(step.foreach)
+                except Exception as e:
+                    logger.warning(f"Failed to precompile templates for step '{step.name}': {e}")
+            for branch_steps in (step.branches or {}).values():
+                self._precompile_steps(branch_steps)
+
     def _validate_procedure_steps(self, steps: List[StepDefinition], path: str = "") -> List[str]:
         """
         Validate all steps in a procedure, including nested branches.
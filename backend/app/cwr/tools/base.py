@@ -77,6 +77,11 @@ class FunctionMeta:
     # Data source enforcement: if set, at least one of these source types must
     # be enabled for the org before the function can execute (OR logic).
     required_data_sources: Optional[List[str]] = None
+    # Batch execution: name of a list parameter that takes foreach items
+    # directly. Procedure foreach steps with batch_size (and pipeline stages
+    # with batched) pass whole batches here; the function must return one
+    # result per item, in order (see collection_entry_result).
+    batch_param: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses."""
@@ -97,6 +102,7 @@ class FunctionMeta:
             "payload_profile": self.payload_profile,
             "exposure_profile": self.exposure_profile,
             "required_data_sources": self.required_data_sources,
+            "batch_param": self.batch_param,
         }
 
     def to_contract_dict(self) -> Dict[str, Any]:
@@ -305,6 +311,24 @@ class FlowResult(FunctionResult):
         return result
 
 
+# Keys of a collection-mode entry that describe the call, not the item's result
+_COLLECTION_ENTRY_KEYS = ("item_id", "success", "error")
+
+
+def collection_entry_result(entry: Dict[str, Any]) -> Any:
+    """
+    Per-item result carried by a collection-mode entry.
+
+    Most batch-capable functions wrap it in "result"; others (llm_decide,
+    llm_route) put their fields (decision, route, confidence, ...) on the
+    entry itself, so the entry without item_id/success/error is the result,
+    matching the data the function returns for a single item.
+    """
+    if "result" in entry:
+        return entry["result"]
+    return {key: value for key, value in entry.items() if key not in _COLLECTION_ENTRY_KEYS}
+
+
 # Type variable for function context
 T = TypeVar("T")
 
@@ -252,7 +252,7 @@ Structure your response as:
 Return your analysis in markdown format."""
 
             # Generate analysis
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=ctx.llm_service._get_model(),
                 messages=[
                     {"role": "system", "content": system_prompt},
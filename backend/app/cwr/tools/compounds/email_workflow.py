@@ -67,7 +67,7 @@ def _process_email_body(body: str, format: str, subject: str) -> tuple:
         return body, False
 
     # Default: template — markdown → HTML → branded wrapper
-    from ..context import _markdown_to_html
+    from ..templating import _markdown_to_html
 
     html_content = _markdown_to_html(body)
 
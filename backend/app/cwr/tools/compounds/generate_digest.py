@@ -267,7 +267,7 @@ class GenerateDigestFunction(BaseFunction):
                 for item in items[:20]  # Limit for context
             ])
 
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=ctx.llm_service._get_model(),
                 messages=[
                     {
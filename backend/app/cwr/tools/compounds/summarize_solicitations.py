@@ -158,7 +158,7 @@ Description:
 
 Summary (2-3 sentences):"""
 
-                    response = ctx.llm_service._client.chat.completions.create(
+                    response = await ctx.llm_service.chat_completion(
                         model=ctx.llm_service._get_model(),
                         messages=[
                             {"role": "system", "content": system_prompt},
@@ -16,63 +16,19 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-import markdown
 from sqlalchemy.ext.asyncio import AsyncSession
 
-logger = logging.getLogger("curatore.functions.context")
-
-
-def _markdown_to_html(text: str) -> str:
-    """
-    Convert markdown text to HTML for use in templates.
-
-    Useful for embedding LLM output (which is typically markdown) into
-    HTML email bodies or other HTML contexts.
-
-    Args:
-        text: Markdown text to convert
-
-    Returns:
-        HTML string
-    """
-    md = markdown.Markdown(extensions=["tables", "fenced_code", "nl2br"])
-    return md.convert(str(text) if text else "")
-
-
-def _compact(value):
-    """
-    Filter out None/null values from a list.
-
-    Useful for safely iterating over foreach results where some items may have failed.
-
-    Example:
-        {% for result in steps.process_each | compact %}
-        {{ result }}
-        {% endfor %}
-
-    Args:
-        value: List that may contain None values
-
-    Returns:
-        List with None values removed
-    """
-    if isinstance(value, (list, tuple)):
-        return [item for item in value if item is not None]
-    return value
-
-
-def _default_if_none(value, default=""):
-    """
-    Return a default value if the input is None.
-
-    Args:
-        value: The value to check
-        default: The default to return if value is None
+from .templating import (
+    RenderPlan,
+    VariableStore,
+    compile_params,
+    compile_path,
+    compile_template,
+    get_environment,
+    resolve_path,
+)
 
-    Returns:
-        The original value or the default
-    """
-    return default if value is None else value
+logger = logging.getLogger("curatore.functions.context")
 
 
 @dataclass
@@ -129,6 +85,8 @@ class FunctionContext:
         """Initialize the context."""
         label = self.organization_id or "system"
         self._logger = logging.getLogger(f"curatore.functions.ctx.{label}")
+        if not isinstance(self.variables, VariableStore):
+            self.variables = VariableStore(self.variables)
 
     # =========================================================================
     # ORG-SCOPING HELPERS
@@ -315,36 +273,37 @@ class FunctionContext:
 
     def _create_jinja_env(self):
         """
-        Create a Jinja2 environment with custom filters and globals.
+        Get the Jinja2 environment with custom filters and globals.
 
         Returns:
-            Configured Jinja2 Environment
+            The shared sandboxed Environment (see templating.get_environment)
         """
-        from zoneinfo import ZoneInfo
-
-        from jinja2 import Environment
-
-        env = Environment()
-
-        # Register custom filters
-        env.filters["md_to_html"] = _markdown_to_html
-        env.filters["compact"] = _compact  # Filter None values from lists
-        env.filters["d"] = _default_if_none  # Shorthand for default if None
+        return get_environment()
 
-        # Register globals (functions available in templates)
-        def now_et():
-            """Return current datetime in US Eastern timezone."""
-            return datetime.now(ZoneInfo("America/New_York"))
-
-        def today():
-            """Return today's date formatted as 'Month Day, Year' in US Eastern."""
-            return datetime.now(ZoneInfo("America/New_York")).strftime("%B %d, %Y")
+    @property
+    def steps(self) -> Dict[str, Any]:
+        """Results of previous steps by step name (kept in sync with variables)."""
+        return self.variables.steps
 
-        env.globals["now"] = datetime.utcnow
-        env.globals["now_et"] = now_et
-        env.globals["today"] = today
+    def template_context(self, item: Any = None) -> Dict[str, Any]:
+        """
+        Build the variables available to templates and expressions.
 
-        return env
+        Args:
+            item: Optional item context for foreach iteration
+        """
+        context = {
+            "params": self.params,
+            "steps": self.variables.steps,
+            "variables": self.variables,
+            "now": datetime.utcnow,
+            "org_id": str(self.organization_id) if self.organization_id else "system",
+        }
+
+        # Add item to context if provided (for foreach iteration)
+        if item is not None:
+            context["item"] = item
+        return context
 
     def render_template(self, template: str, item: Any = None) -> str:
         """
@@ -362,34 +321,24 @@ class FunctionContext:
         Available filters:
         - md_to_html: Convert markdown to HTML (useful for LLM output in HTML emails)
 
+        Compiled templates are cached process-wide by source string.
+
         Args:
             template: Jinja2 template string
             item: Optional item context for foreach iteration
         """
         try:
-            env = self._create_jinja_env()
-            t = env.from_string(template)
-            context = {
-                "params": self.params,
-                "steps": {
-                    k.replace("steps.", ""): v
-                    for k, v in self.variables.items()
-                    if k.startswith("steps.")
-                },
-                "variables": self.variables,
-                "org_id": str(self.organization_id) if self.organization_id else "system",
-            }
-
-            # Add item to context if provided (for foreach iteration)
-            if item is not None:
-                context["item"] = item
-
-            return t.render(**context)
+            return compile_template(template).render(self.template_context(item))
         except Exception as e:
             self._logger.error(f"Template rendering failed: {e}")
             raise ValueError(f"Failed to render template: {e}")
 
-    def render_params(self, params: Dict[str, Any], item: Any = None) -> Dict[str, Any]:
+    def render_params(
+        self,
+        params: Dict[str, Any],
+        item: Any = None,
+        plan: Optional[RenderPlan] = None,
+    ) -> Dict[str, Any]:
         """
         Render all string values in a params dict as templates.
 
@@ -400,27 +349,16 @@ class FunctionContext:
         Args:
             params: Dictionary of parameters to render
             item: Optional item context for foreach iteration (makes {{ item.xxx }} available)
+            plan: Render plan precompiled from params (see templating.compile_params);
+                compiled on the fly when omitted
         """
-        def render_value(value: Any) -> Any:
-            if isinstance(value, str) and "{{" in value:
-                # Check if this is a pure template expression (entire string is one {{ }})
-                # that should preserve its data type
-                stripped = value.strip()
-                if stripped.startswith("{{") and stripped.endswith("}}"):
-                    # Extract the expression and evaluate directly to preserve type
-                    inner_expr = stripped[2:-2].strip()
-                    result = self._evaluate_expression(inner_expr, item=item)
-                    if result is not None:
-                        return result
-                # Fall back to string template rendering
-                return self.render_template(value, item=item)
-            elif isinstance(value, dict):
-                return {k: render_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [render_value(i) for i in value]
-            return value
-
-        return render_value(params)
+        try:
+            if plan is None:
+                plan = compile_params(params)
+            return plan(self.template_context(item))
+        except Exception as e:
+            self._logger.error(f"Template rendering failed: {e}")
+            raise ValueError(f"Failed to render template: {e}")
 
     def _evaluate_expression(self, expression: str, item: Any = None) -> Any:
         """
@@ -430,63 +368,16 @@ class FunctionContext:
         - steps.step_name -> step result
         - params.param_name -> parameter value
         - item.field -> current item field (in foreach context)
-        - Simple attribute access chains
+        - Simple attribute access chains and array indexing (e.g. "steps.data[0].id")
 
         Args:
             expression: The expression to evaluate (without {{ }})
             item: Optional item context for foreach iteration
+
+        Returns:
+            The resolved value, or None for complex expressions (use string rendering)
         """
-        try:
-            # Build context for evaluation
-            context = {
-                "params": self.params,
-                "steps": {
-                    k.replace("steps.", ""): v
-                    for k, v in self.variables.items()
-                    if k.startswith("steps.")
-                },
-                "variables": self.variables,
-                "now": datetime.utcnow,
-                "org_id": str(self.organization_id) if self.organization_id else "system",
-            }
-
-            # Add item to context if provided
-            if item is not None:
-                context["item"] = item
-
-            # Handle simple dot-notation access (e.g., "steps.query_notices")
-            # Also supports array indexing (e.g., "steps.data.source_types[0].instances")
-            import re
-            parts = expression.split(".")
-            if parts[0] in context:
-                result = context[parts[0]]
-                for part in parts[1:]:
-                    # Check for array indexing (e.g., "source_types[0]")
-                    match = re.match(r'^(\w+)\[(\d+)\]$', part)
-                    if match:
-                        key, index = match.group(1), int(match.group(2))
-                        if isinstance(result, dict):
-                            result = result.get(key)
-                        elif hasattr(result, key):
-                            result = getattr(result, key)
-                        else:
-                            return None
-                        if isinstance(result, (list, tuple)) and index < len(result):
-                            result = result[index]
-                        else:
-                            return None
-                    elif isinstance(result, dict):
-                        result = result.get(part)
-                    elif hasattr(result, part):
-                        result = getattr(result, part)
-                    else:
-                        return None
-                return result
-
-            # For complex expressions, fall back to None (will use string rendering)
-            return None
-        except Exception:
-            return None
+        return resolve_path(compile_path(expression), self.template_context(item))
 
     # =========================================================================
     # CONTEXT CREATION
@@ -527,14 +418,16 @@ class FunctionContext:
         self,
         run_id: Optional[UUID] = None,
         params: Optional[Dict[str, Any]] = None,
+        session: Optional[AsyncSession] = None,
     ) -> "FunctionContext":
         """
         Create a child context with inherited state.
 
-        Useful for nested procedure/pipeline calls.
+        Useful for nested procedure/pipeline calls, and for concurrent
+        workers that need their own database session.
         """
         return FunctionContext(
-            session=self.session,
+            session=session or self.session,
             organization_id=self.organization_id,
             user_id=self.user_id,
             run_id=run_id or self.run_id,
@@ -12,8 +12,7 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
-from jinja2 import Template
-
+from app.core.llm.packed_prompts import run_packed_prompts
 from app.core.models.llm_models import LLMTaskType
 from app.core.shared.config_loader import config_loader
 
@@ -24,14 +23,15 @@ from ...base import (
     FunctionResult,
 )
 from ...context import FunctionContext
+from ...templating import compile_template
+from .collection import collection_item_id, collection_semaphore, run_collection
 
 logger = logging.getLogger("curatore.functions.llm.classify")
 
 
 def _render_item_template(template_str: str, item: Any) -> str:
-    """Render a Jinja2 template string with item context."""
-    template = Template(template_str)
-    return template.render(item=item)
+    """Render a Jinja2 template string with item context (compiled once per source)."""
+    return compile_template(template_str).render(item=item)
 
 
 class ClassifyFunction(BaseFunction):
@@ -93,6 +93,18 @@ class ClassifyFunction(BaseFunction):
                     "examples": [[{"content": "Text 1"}, {"content": "Text 2"}]],
                     "x-procedure-only": True,
                 },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Collection mode: maximum items processed concurrently. Defaults to llm.max_concurrency and is capped per model and per organization.",
+                    "default": None,
+                    "x-procedure-only": True,
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Collection mode: pack up to this many items into one LLM request (sized to the model's context window). 1 sends one request per item.",
+                    "default": 1,
+                    "x-procedure-only": True,
+                },
             },
             "required": ["text", "categories"],
         },
@@ -133,6 +145,7 @@ class ClassifyFunction(BaseFunction):
         side_effects=False,
         is_primitive=True,
         payload_profile="full",
+        batch_param="items",
         examples=[
             {
                 "description": "Sentiment classification",
@@ -161,6 +174,8 @@ class ClassifyFunction(BaseFunction):
         include_reasoning = params.get("include_reasoning", True)
         model = params.get("model")
         items = params.get("items")
+        max_concurrency = params.get("max_concurrency")
+        batch_size = params.get("batch_size") or 1
 
         if not ctx.llm_service.is_available:
             return FunctionResult.failed_result(
@@ -185,6 +200,8 @@ class ClassifyFunction(BaseFunction):
                 multi_label=multi_label,
                 include_reasoning=include_reasoning,
                 model=model,
+                max_concurrency=max_concurrency,
+                batch_size=batch_size,
             )
 
         # Single mode: classify once
@@ -268,7 +285,7 @@ Classification:"""
             ]
 
             # Generate
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=resolved_model,
                 messages=messages,
                 temperature=temperature,
@@ -282,7 +299,7 @@ Classification:"""
                 result = self._parse_json_response(response_text)
             except json.JSONDecodeError:
                 # Retry once asking for valid JSON
-                retry_response = ctx.llm_service._client.chat.completions.create(
+                retry_response = await ctx.llm_service.chat_completion(
                     model=resolved_model,
                     messages=messages + [
                         {"role": "assistant", "content": response_text},
@@ -306,7 +323,7 @@ Classification:"""
             else:
                 if "category" not in result or result["category"] not in categories:
                     # Retry once with correction feedback
-                    retry_response = ctx.llm_service._client.chat.completions.create(
+                    retry_response = await ctx.llm_service.chat_completion(
                         model=resolved_model,
                         messages=messages + [
                             {"role": "assistant", "content": response_text},
@@ -372,11 +389,15 @@ Classification:"""
         multi_label: bool,
         include_reasoning: bool,
         model: Optional[str],
+        max_concurrency: Optional[int] = None,
+        batch_size: int = 1,
     ) -> FunctionResult:
-        """Execute classification for each item in collection."""
-        results = []
-        failed_count = 0
+        """
+        Execute classification for each item in collection.
 
+        With batch_size > 1, items are packed into multi-item requests;
+        items the packed pass cannot classify fall back to one request each.
+        """
         # Build category list and prompts once
         category_list = "\n".join([
             f"- {cat}: {category_descriptions.get(cat, 'No description')}"
@@ -404,7 +425,8 @@ RULES:
         resolved_model = model or task_config.model
         temperature = task_config.temperature if task_config.temperature is not None else 0.1
 
-        for idx, item in enumerate(items):
+        async def process_item(idx: int, item: Any) -> Dict[str, Any]:
+            """Process one item; failures are reported in the entry, not raised."""
             try:
                 # Render text with item context
                 rendered_text = _render_item_template(text_template, item)
@@ -425,7 +447,7 @@ Classification:"""
                 ]
 
                 # Generate
-                response = ctx.llm_service._client.chat.completions.create(
+                response = await ctx.llm_service.chat_completion(
                     model=resolved_model,
                     messages=messages,
                     temperature=temperature,
@@ -438,7 +460,7 @@ Classification:"""
                 try:
                     classification = self._parse_json_response(response_text)
                 except json.JSONDecodeError:
-                    retry_response = ctx.llm_service._client.chat.completions.create(
+                    retry_response = await ctx.llm_service.chat_completion(
                         model=resolved_model,
                         messages=messages + [
                             {"role": "assistant", "content": response_text},
@@ -461,7 +483,7 @@ Classification:"""
                 else:
                     if "category" not in classification or classification["category"] not in categories:
                         # Retry once with correction feedback
-                        retry_response = ctx.llm_service._client.chat.completions.create(
+                        retry_response = await ctx.llm_service.chat_completion(
                             model=resolved_model,
                             messages=messages + [
                                 {"role": "assistant", "content": response_text},
@@ -494,43 +516,82 @@ Classification:"""
                 if not include_reasoning:
                     classification.pop("reasoning", None)
 
-                # Extract item ID if available
-                item_id = None
-                if isinstance(item, dict):
-                    item_id = item.get("id") or item.get("item_id") or str(idx)
-                else:
-                    item_id = str(idx)
-
-                results.append({
-                    "item_id": item_id,
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "result": classification,
                     "success": True,
-                })
+                }
 
             except json.JSONDecodeError as e:
                 logger.warning(f"Classification failed for item {idx}: invalid JSON - {e}")
-                failed_count += 1
-                results.append({
-                    "item_id": item.get("id") if isinstance(item, dict) else str(idx),
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "result": None,
                     "success": False,
                     "error": f"Invalid JSON response: {e}",
-                })
+                }
             except Exception as e:
                 logger.warning(f"Classification failed for item {idx}: {e}")
-                failed_count += 1
-                results.append({
-                    "item_id": item.get("id") if isinstance(item, dict) else str(idx),
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "result": None,
                     "success": False,
                     "error": str(e),
-                })
+                }
+
+        limit, semaphore = await collection_semaphore(ctx, resolved_model, max_concurrency)
+
+        packed: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        if batch_size > 1:
+            def parse_packed(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                if multi_label:
+                    if not isinstance(entry.get("categories"), list):
+                        return None
+                    entry["categories"] = [
+                        c for c in entry["categories"]
+                        if isinstance(c, dict) and c.get("name") in categories
+                    ]
+                elif entry.get("category") not in categories:
+                    # Single-item path retries with correction feedback
+                    return None
+                return entry
+
+            texts: List[Optional[str]] = []
+            for item in items:
+                try:
+                    texts.append(_render_item_template(text_template, item)[:3000])
+                except Exception:
+                    texts.append(None)
+
+            packed = await run_packed_prompts(
+                ctx.llm_service,
+                texts=texts,
+                system_prompt=system_prompt,
+                task_prompt=f"Categories:\n{category_list}\n\nClassify each item.",
+                model=resolved_model,
+                temperature=temperature,
+                batch_size=batch_size,
+                item_output_tokens=200,
+                parse_item=parse_packed,
+                context_window=None if model else task_config.context_window,
+                semaphore=semaphore,
+            )
+
+        def packed_result(idx: int, item: Any, classification: Dict[str, Any]) -> Dict[str, Any]:
+            if not include_reasoning:
+                classification.pop("reasoning", None)
+            return {"item_id": collection_item_id(item, idx), "result": classification, "success": True}
+
+        results = await run_collection(items, process_item, semaphore, packed, packed_result)
+        failed_count = sum(1 for r in results if not r["success"])
 
         return FunctionResult.success_result(
             data=results,
             message=f"Classified {len(results) - failed_count}/{len(items)} items",
             metadata={
                 "mode": "collection",
+                "max_concurrency": limit,
+                "packed_items": sum(1 for p in packed if p is not None),
                 "categories": categories,
                 "multi_label": multi_label,
                 "total_items": len(items),
@@ -0,0 +1,88 @@
+# backend/app/cwr/tools/primitives/llm/collection.py
+"""
+Shared collection-mode fan-out for the LLM primitives.
+
+classify, decide, extract and summarize process a list of items by
+running one LLM call per item, bounded by the model's concurrency limit.
+Items already answered by a packed multi-item prompt skip the per-item
+call.
+
+Usage:
+    from .collection import collection_semaphore, run_collection
+
+    limit, semaphore = await collection_semaphore(ctx, model, max_concurrency)
+    results = await run_collection(items, process_item, semaphore)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.llm.llm_routing_service import llm_routing_service
+
+from ...context import FunctionContext
+
+
+async def collection_semaphore(
+    ctx: FunctionContext,
+    model: str,
+    max_concurrency: Optional[int],
+) -> Tuple[int, asyncio.Semaphore]:
+    """
+    Resolve the concurrency limit for a model and build its semaphore.
+
+    Args:
+        ctx: Function context (organization and session for routing)
+        model: Resolved model name
+        max_concurrency: Limit requested by the step, if any
+
+    Returns:
+        (limit, semaphore)
+    """
+    limit = await llm_routing_service.get_max_concurrency(
+        model=model,
+        organization_id=ctx.organization_id,
+        session=ctx.session,
+        requested=max_concurrency,
+    )
+    return limit, asyncio.Semaphore(limit)
+
+
+def collection_item_id(item: Any, idx: int) -> str:
+    """Item id reported in collection results: its id/item_id, else its index."""
+    if isinstance(item, dict):
+        return item.get("id") or item.get("item_id") or str(idx)
+    return str(idx)
+
+
+async def run_collection(
+    items: List[Any],
+    process_item: Callable[[int, Any], Awaitable[Dict[str, Any]]],
+    semaphore: asyncio.Semaphore,
+    packed: Optional[Sequence[Optional[Any]]] = None,
+    packed_result: Optional[Callable[[int, Any, Any], Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Process every item concurrently, holding the semaphore per LLM call.
+
+    Args:
+        items: Items to process
+        process_item: Per-item call, (idx, item) -> result dict
+        semaphore: Bounds concurrent per-item calls
+        packed: Parsed packed-prompt results aligned with items (None where
+            an item was not answered)
+        packed_result: Builds the result dict for an item answered by the
+            packed prompt, (idx, item, parsed) -> result dict
+
+    Returns:
+        Result dicts in input order
+    """
+    async def run_item(idx: int, item: Any) -> Dict[str, Any]:
+        if packed is not None and packed[idx] is not None:
+            return packed_result(idx, item, packed[idx])
+        async with semaphore:
+            return await process_item(idx, item)
+
+    # gather preserves input order in its results
+    return list(await asyncio.gather(
+        *(run_item(idx, item) for idx, item in enumerate(items))
+    ))
@@ -28,10 +28,9 @@ Example usage in a procedure:
 
 import json
 import logging
-from typing import Any, List, Optional
-
-from jinja2 import Template
+from typing import Any, Dict, List, Optional
 
+from app.core.llm.packed_prompts import run_packed_prompts
 from app.core.models.llm_models import LLMTaskType
 from app.core.shared.config_loader import config_loader
 
@@ -42,14 +41,15 @@ from ...base import (
     FunctionResult,
 )
 from ...context import FunctionContext
+from ...templating import compile_template
+from .collection import collection_item_id, collection_semaphore, run_collection
 
 logger = logging.getLogger("curatore.functions.llm.decide")
 
 
 def _render_item_template(template_str: str, item: Any) -> str:
-    """Render a Jinja2 template string with item context."""
-    template = Template(template_str)
-    return template.render(item=item)
+    """Render a Jinja2 template string with item context (compiled once per source)."""
+    return compile_template(template_str).render(item=item)
 
 
 class DecideFunction(BaseFunction):
@@ -129,6 +129,18 @@ class DecideFunction(BaseFunction):
                     "examples": [[{"title": "Item 1", "desc": "..."}, {"title": "Item 2", "desc": "..."}]],
                     "x-procedure-only": True,
                 },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Collection mode: maximum items processed concurrently. Defaults to llm.max_concurrency and is capped per model and per organization.",
+                    "default": None,
+                    "x-procedure-only": True,
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Collection mode: pack up to this many items into one LLM request (sized to the model's context window). 1 sends one request per item.",
+                    "default": 1,
+                    "x-procedure-only": True,
+                },
             },
             "required": ["question", "data"],
         },
@@ -164,6 +176,7 @@ class DecideFunction(BaseFunction):
         side_effects=False,
         is_primitive=True,
         payload_profile="full",
+        batch_param="items",
         examples=[
             {
                 "description": "Simple yes/no decision",
@@ -203,6 +216,8 @@ class DecideFunction(BaseFunction):
         include_reasoning = params.get("include_reasoning", True)
         model = params.get("model")
         items = params.get("items")
+        max_concurrency = params.get("max_concurrency")
+        batch_size = params.get("batch_size") or 1
 
         if not ctx.llm_service.is_available:
             return FunctionResult.failed_result(
@@ -223,6 +238,8 @@ class DecideFunction(BaseFunction):
                 confidence_threshold=confidence_threshold,
                 include_reasoning=include_reasoning,
                 model=model,
+                max_concurrency=max_concurrency,
+                batch_size=batch_size,
             )
 
         # Single mode: decide once
@@ -278,8 +295,10 @@ DECISION CRITERIA:
                     json_lines.append(line)
             text = "\n".join(json_lines)
 
-        result = json.loads(text)
+        return self._normalize_decision(json.loads(text))
 
+    def _normalize_decision(self, result: dict) -> dict:
+        """Normalize decision to boolean and confidence to a 0-1 float."""
         # Normalize decision to boolean
         decision = result.get("decision")
         if isinstance(decision, str):
@@ -333,7 +352,7 @@ Respond with JSON only:"""
             temperature = task_config.temperature if task_config.temperature is not None else 0.1
 
             # Generate
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=resolved_model,
                 messages=[
                     {"role": "system", "content": final_system_prompt},
@@ -398,12 +417,15 @@ Respond with JSON only:"""
         confidence_threshold: float,
         include_reasoning: bool,
         model: Optional[str],
+        max_concurrency: Optional[int] = None,
+        batch_size: int = 1,
     ) -> FunctionResult:
-        """Execute decision for each item in collection."""
-        results = []
-        failed_count = 0
-        true_count = 0
+        """
+        Execute decision for each item in collection.
 
+        With batch_size > 1, items are packed into multi-item requests;
+        items the packed pass cannot decide fall back to one request each.
+        """
         final_system_prompt = self._build_system_prompt(system_prompt, criteria)
 
         # Get model and temperature from task type routing (BULK for collection mode)
@@ -411,7 +433,8 @@ Respond with JSON only:"""
         resolved_model = model or task_config.model
         temperature = task_config.temperature if task_config.temperature is not None else 0.1
 
-        for idx, item in enumerate(items):
+        async def process_item(idx: int, item: Any) -> Dict[str, Any]:
+            """Process one item; failures are reported in the entry, not raised."""
             try:
                 # Render data with item context
                 rendered_data = _render_item_template(data_template, item)
@@ -426,7 +449,7 @@ DATA TO EVALUATE:
 Respond with JSON only:"""
 
                 # Generate
-                response = ctx.llm_service._client.chat.completions.create(
+                response = await ctx.llm_service.chat_completion(
                     model=resolved_model,
                     messages=[
                         {"role": "system", "content": final_system_prompt},
@@ -447,54 +470,86 @@ Respond with JSON only:"""
                 if not include_reasoning:
                     decision_result.pop("reasoning", None)
 
-                if decision_result["decision"]:
-                    true_count += 1
-
-                # Extract item ID if available
-                item_id = None
-                if isinstance(item, dict):
-                    item_id = item.get("id") or item.get("item_id") or str(idx)
-                else:
-                    item_id = str(idx)
-
-                results.append({
-                    "item_id": item_id,
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "decision": decision_result["decision"],
                     "confidence": decision_result["confidence"],
                     "reasoning": decision_result.get("reasoning"),
                     "success": True,
-                })
+                }
 
             except json.JSONDecodeError as e:
                 logger.warning(f"Decision failed for item {idx}: invalid JSON - {e}")
-                failed_count += 1
-                results.append({
-                    "item_id": item.get("id") if isinstance(item, dict) else str(idx),
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "decision": default_on_error,
                     "confidence": 0.0,
                     "success": False,
                     "error": f"Invalid JSON response: {e}",
-                })
-                if default_on_error:
-                    true_count += 1
+                }
             except Exception as e:
                 logger.warning(f"Decision failed for item {idx}: {e}")
-                failed_count += 1
-                results.append({
-                    "item_id": item.get("id") if isinstance(item, dict) else str(idx),
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "decision": default_on_error,
                     "confidence": 0.0,
                     "success": False,
                     "error": str(e),
-                })
-                if default_on_error:
-                    true_count += 1
+                }
+
+        limit, semaphore = await collection_semaphore(ctx, resolved_model, max_concurrency)
+
+        packed: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        if batch_size > 1:
+            def parse_packed(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                if "decision" not in entry:
+                    return None
+                return self._normalize_decision(entry)
+
+            texts: List[Optional[str]] = []
+            for item in items:
+                try:
+                    texts.append(_render_item_template(data_template, item)[:5000])
+                except Exception:
+                    texts.append(None)
+
+            packed = await run_packed_prompts(
+                ctx.llm_service,
+                texts=texts,
+                system_prompt=final_system_prompt,
+                task_prompt=f"QUESTION: {question}\n\nAnswer the question for each item's data.",
+                model=resolved_model,
+                temperature=temperature,
+                batch_size=batch_size,
+                item_output_tokens=150,
+                parse_item=parse_packed,
+                context_window=None if model else task_config.context_window,
+                semaphore=semaphore,
+            )
+
+        def packed_result(idx: int, item: Any, decision_result: Dict[str, Any]) -> Dict[str, Any]:
+            if decision_result["confidence"] < confidence_threshold:
+                decision_result["decision"] = default_on_error
+                decision_result["below_threshold"] = True
+            return {
+                "item_id": collection_item_id(item, idx),
+                "decision": decision_result["decision"],
+                "confidence": decision_result["confidence"],
+                "reasoning": decision_result.get("reasoning") if include_reasoning else None,
+                "success": True,
+            }
+
+        results = await run_collection(items, process_item, semaphore, packed, packed_result)
+        failed_count = sum(1 for r in results if not r["success"])
+        true_count = sum(1 for r in results if r["decision"])
 
         return FunctionResult.success_result(
             data=results,
             message=f"Evaluated {len(results)} items: {true_count} YES, {len(results) - true_count} NO",
             metadata={
                 "mode": "collection",
+                "max_concurrency": limit,
+                "packed_items": sum(1 for p in packed if p is not None),
                 "total_items": len(items),
                 "successful_items": len(items) - failed_count,
                 "failed_items": failed_count,
@@ -12,8 +12,7 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
-from jinja2 import Template
-
+from app.core.llm.packed_prompts import run_packed_prompts
 from app.core.models.llm_models import LLMTaskType
 from app.core.shared.config_loader import config_loader
 
@@ -24,14 +23,15 @@ from ...base import (
     FunctionResult,
 )
 from ...context import FunctionContext
+from ...templating import compile_template
+from .collection import collection_item_id, collection_semaphore, run_collection
 
 logger = logging.getLogger("curatore.functions.llm.extract")
 
 
 def _render_item_template(template_str: str, item: Any) -> str:
-    """Render a Jinja2 template string with item context."""
-    template = Template(template_str)
-    return template.render(item=item)
+    """Render a Jinja2 template string with item context (compiled once per source)."""
+    return compile_template(template_str).render(item=item)
 
 
 class ExtractFunction(BaseFunction):
@@ -87,6 +87,18 @@ class ExtractFunction(BaseFunction):
                     "examples": [[{"content": "Text 1"}, {"content": "Text 2"}]],
                     "x-procedure-only": True,
                 },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Collection mode: maximum items processed concurrently. Defaults to llm.max_concurrency and is capped per model and per organization.",
+                    "default": None,
+                    "x-procedure-only": True,
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Collection mode: pack up to this many items into one LLM request (sized to the model's context window). 1 sends one request per item.",
+                    "default": 1,
+                    "x-procedure-only": True,
+                },
             },
             "required": ["text", "fields"],
         },
@@ -123,6 +135,7 @@ class ExtractFunction(BaseFunction):
         side_effects=False,
         is_primitive=True,
         payload_profile="full",
+        batch_param="items",
         examples=[
             {
                 "description": "Extract contact info",
@@ -142,6 +155,8 @@ class ExtractFunction(BaseFunction):
         instructions = params.get("instructions")
         model = params.get("model")
         items = params.get("items")
+        max_concurrency = params.get("max_concurrency")
+        batch_size = params.get("batch_size") or 1
 
         if not ctx.llm_service.is_available:
             return FunctionResult.failed_result(
@@ -159,6 +174,8 @@ class ExtractFunction(BaseFunction):
                 field_descriptions=field_descriptions,
                 instructions=instructions,
                 model=model,
+                max_concurrency=max_concurrency,
+                batch_size=batch_size,
             )
 
         # Single mode: extract once
@@ -227,7 +244,7 @@ Return ONLY the JSON object:"""
             temperature = task_config.temperature if task_config.temperature is not None else 0.1
 
             # Generate
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=resolved_model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -277,11 +294,15 @@ Return ONLY the JSON object:"""
         field_descriptions: Dict[str, str],
         instructions: Optional[str],
         model: Optional[str],
+        max_concurrency: Optional[int] = None,
+        batch_size: int = 1,
     ) -> FunctionResult:
-        """Execute extraction for each item in collection."""
-        results = []
-        failed_count = 0
+        """
+        Execute extraction for each item in collection.
 
+        With batch_size > 1, items are packed into multi-item requests;
+        items the packed pass cannot extract fall back to one request each.
+        """
         # Build field list once
         field_list = "\n".join([
             f"- {field}: {field_descriptions.get(field, 'Extract this field')}"
@@ -297,7 +318,8 @@ Do not include any explanation or markdown formatting."""
         resolved_model = model or task_config.model
         temperature = task_config.temperature if task_config.temperature is not None else 0.1
 
-        for idx, item in enumerate(items):
+        async def process_item(idx: int, item: Any) -> Dict[str, Any]:
+            """Process one item; failures are reported in the entry, not raised."""
             try:
                 # Render text with item context
                 rendered_text = _render_item_template(text_template, item)
@@ -316,7 +338,7 @@ Text to extract from:
 Return ONLY the JSON object:"""
 
                 # Generate
-                response = ctx.llm_service._client.chat.completions.create(
+                response = await ctx.llm_service.chat_completion(
                     model=resolved_model,
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -334,43 +356,77 @@ Return ONLY the JSON object:"""
                     if field not in extracted:
                         extracted[field] = None
 
-                # Extract item ID if available
-                item_id = None
-                if isinstance(item, dict):
-                    item_id = item.get("id") or item.get("item_id") or str(idx)
-                else:
-                    item_id = str(idx)
-
-                results.append({
-                    "item_id": item_id,
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "result": extracted,
                     "success": True,
-                })
+                }
 
             except json.JSONDecodeError as e:
                 logger.warning(f"Extraction failed for item {idx}: invalid JSON - {e}")
-                failed_count += 1
-                results.append({
-                    "item_id": item.get("id") if isinstance(item, dict) else str(idx),
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "result": None,
                     "success": False,
                     "error": f"Invalid JSON response: {e}",
-                })
+                }
             except Exception as e:
                 logger.warning(f"Extraction failed for item {idx}: {e}")
-                failed_count += 1
-                results.append({
-                    "item_id": item.get("id") if isinstance(item, dict) else str(idx),
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "result": None,
                     "success": False,
                     "error": str(e),
-                })
+                }
+
+        limit, semaphore = await collection_semaphore(ctx, resolved_model, max_concurrency)
+
+        packed: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        if batch_size > 1:
+            def parse_packed(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                # Not-found fields come back as null; a missing key means a
+                # partial or malformed entry, so the item is retried alone
+                if any(field not in entry for field in fields):
+                    return None
+                return {field: entry[field] for field in fields}
+
+            texts: List[Optional[str]] = []
+            for item in items:
+                try:
+                    texts.append(_render_item_template(text_template, item))
+                except Exception:
+                    texts.append(None)
+
+            packed = await run_packed_prompts(
+                ctx.llm_service,
+                texts=texts,
+                system_prompt=system_prompt,
+                task_prompt=(
+                    f"Extract the following fields from each item:\n\n{field_list}\n\n"
+                    f"{f'Additional instructions: {instructions}' if instructions else ''}"
+                ),
+                model=resolved_model,
+                temperature=temperature,
+                batch_size=batch_size,
+                item_output_tokens=400,
+                parse_item=parse_packed,
+                context_window=None if model else task_config.context_window,
+                semaphore=semaphore,
+            )
+
+        def packed_result(idx: int, item: Any, extracted: Dict[str, Any]) -> Dict[str, Any]:
+            return {"item_id": collection_item_id(item, idx), "result": extracted, "success": True}
+
+        results = await run_collection(items, process_item, semaphore, packed, packed_result)
+        failed_count = sum(1 for r in results if not r["success"])
 
         return FunctionResult.success_result(
             data=results,
             message=f"Extracted {len(results) - failed_count}/{len(items)} items",
             metadata={
                 "mode": "collection",
+                "max_concurrency": limit,
+                "packed_items": sum(1 for p in packed if p is not None),
                 "fields": fields,
                 "total_items": len(items),
                 "successful_items": len(items) - failed_count,
@@ -12,8 +12,6 @@ the prompt is rendered for each item with {{ item.xxx }} template placeholders.
 import logging
 from typing import Any, List, Optional
 
-from jinja2 import Template
-
 from app.core.models.llm_models import LLMTaskType
 from app.core.shared.config_loader import config_loader
 
@@ -24,14 +22,15 @@ from ...base import (
     FunctionResult,
 )
 from ...context import FunctionContext
+from ...templating import compile_template
+from .collection import collection_item_id
 
 logger = logging.getLogger("curatore.functions.llm.generate")
 
 
 def _render_item_template(template_str: str, item: Any) -> str:
-    """Render a Jinja2 template string with item context."""
-    template = Template(template_str)
-    return template.render(item=item)
+    """Render a Jinja2 template string with item context (compiled once per source)."""
+    return compile_template(template_str).render(item=item)
 
 
 def _strip_code_fences(text: str) -> str:
@@ -143,6 +142,7 @@ class GenerateFunction(BaseFunction):
         side_effects=False,
         is_primitive=True,
         payload_profile="full",
+        batch_param="items",
         examples=[
             {
                 "description": "Simple generation",
@@ -221,7 +221,7 @@ class GenerateFunction(BaseFunction):
             resolved_temperature = temperature if temperature != 0.7 else (task_config.temperature or temperature)
 
             # Generate
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=resolved_model,
                 messages=messages,
                 temperature=resolved_temperature,
@@ -283,7 +283,7 @@ class GenerateFunction(BaseFunction):
                 messages.append({"role": "user", "content": rendered_prompt})
 
                 # Generate
-                response = ctx.llm_service._client.chat.completions.create(
+                response = await ctx.llm_service.chat_completion(
                     model=resolved_model,
                     messages=messages,
                     temperature=resolved_temperature,
@@ -297,15 +297,8 @@ class GenerateFunction(BaseFunction):
 
                 total_chars += len(generated_text) if generated_text else 0
 
-                # Extract item ID if available
-                item_id = None
-                if isinstance(item, dict):
-                    item_id = item.get("id") or item.get("item_id") or str(idx)
-                else:
-                    item_id = str(idx)
-
                 results.append({
-                    "item_id": item_id,
+                    "item_id": collection_item_id(item, idx),
                     "result": generated_text,
                     "success": True,
                 })
@@ -314,7 +307,7 @@ class GenerateFunction(BaseFunction):
                 logger.warning(f"Generation failed for item {idx}: {e}")
                 failed_count += 1
                 results.append({
-                    "item_id": item.get("id") if isinstance(item, dict) else str(idx),
+                    "item_id": collection_item_id(item, idx),
                     "result": None,
                     "success": False,
                     "error": str(e),
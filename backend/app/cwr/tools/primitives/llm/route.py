@@ -31,8 +31,6 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
-from jinja2 import Template
-
 from app.core.models.llm_models import LLMTaskType
 from app.core.shared.config_loader import config_loader
 
@@ -43,14 +41,15 @@ from ...base import (
     FunctionResult,
 )
 from ...context import FunctionContext
+from ...templating import compile_template
+from .collection import collection_item_id
 
 logger = logging.getLogger("curatore.functions.llm.route")
 
 
 def _render_item_template(template_str: str, item: Any) -> str:
-    """Render a Jinja2 template string with item context."""
-    template = Template(template_str)
-    return template.render(item=item)
+    """Render a Jinja2 template string with item context (compiled once per source)."""
+    return compile_template(template_str).render(item=item)
 
 
 class RouteFunction(BaseFunction):
@@ -158,6 +157,7 @@ class RouteFunction(BaseFunction):
         side_effects=False,
         is_primitive=True,
         payload_profile="full",
+        batch_param="items",
         examples=[
             {
                 "description": "Route customer inquiry",
@@ -345,7 +345,7 @@ Select the best matching route and respond with JSON only:"""
             resolved_model = model or task_config.model
             temperature = task_config.temperature if task_config.temperature is not None else 0.1
 
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=resolved_model,
                 messages=[
                     {"role": "system", "content": final_system_prompt},
@@ -444,7 +444,7 @@ Select the best matching route and respond with JSON only:"""
 
 Select the best matching route and respond with JSON only:"""
 
-                response = ctx.llm_service._client.chat.completions.create(
+                response = await ctx.llm_service.chat_completion(
                     model=resolved_model,
                     messages=[
                         {"role": "system", "content": final_system_prompt},
@@ -470,15 +470,8 @@ Select the best matching route and respond with JSON only:"""
                 selected = route_result["route"]
                 route_counts[selected] = route_counts.get(selected, 0) + 1
 
-                # Extract item ID
-                item_id = None
-                if isinstance(item, dict):
-                    item_id = item.get("id") or item.get("item_id") or str(idx)
-                else:
-                    item_id = str(idx)
-
                 entry = {
-                    "item_id": item_id,
+                    "item_id": collection_item_id(item, idx),
                     "route": selected,
                     "confidence": route_result["confidence"],
                     "reasoning": route_result.get("reasoning"),
@@ -492,10 +485,9 @@ Select the best matching route and respond with JSON only:"""
             except json.JSONDecodeError as e:
                 logger.warning(f"Route failed for item {idx}: invalid JSON - {e}")
                 failed_count += 1
-                item_id = item.get("id") if isinstance(item, dict) else str(idx)
                 route_counts[default_route] = route_counts.get(default_route, 0) + 1
                 results.append({
-                    "item_id": item_id,
+                    "item_id": collection_item_id(item, idx),
                     "route": default_route,
                     "confidence": 0.0,
                     "success": False,
@@ -504,10 +496,9 @@ Select the best matching route and respond with JSON only:"""
             except Exception as e:
                 logger.warning(f"Route failed for item {idx}: {e}")
                 failed_count += 1
-                item_id = item.get("id") if isinstance(item, dict) else str(idx)
                 route_counts[default_route] = route_counts.get(default_route, 0) + 1
                 results.append({
-                    "item_id": item_id,
+                    "item_id": collection_item_id(item, idx),
                     "route": default_route,
                     "confidence": 0.0,
                     "success": False,
@@ -17,9 +17,7 @@ automatically chunks the document and uses a map-reduce approach:
 
 import asyncio
 import logging
-from typing import Any, List, Optional
-
-from jinja2 import Template
+from typing import Any, Dict, List, Optional
 
 from app.core.models.llm_models import LLMTaskType
 from app.core.search.document_chunker import document_chunker
@@ -32,6 +30,8 @@ from ...base import (
     FunctionResult,
 )
 from ...context import FunctionContext
+from ...templating import compile_template
+from .collection import collection_item_id, collection_semaphore, run_collection
 
 logger = logging.getLogger("curatore.functions.llm.summarize")
 
@@ -40,9 +40,8 @@ MAX_SINGLE_PASS_TOKENS = 80000
 
 
 def _render_item_template(template_str: str, item: Any) -> str:
-    """Render a Jinja2 template string with item context."""
-    template = Template(template_str)
-    return template.render(item=item)
+    """Render a Jinja2 template string with item context (compiled once per source)."""
+    return compile_template(template_str).render(item=item)
 
 
 class SummarizeFunction(BaseFunction):
@@ -124,6 +123,12 @@ class SummarizeFunction(BaseFunction):
                     "examples": [[{"content": "Text 1"}, {"content": "Text 2"}]],
                     "x-procedure-only": True,
                 },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Collection mode: maximum items processed concurrently. Defaults to llm.max_concurrency and is capped per model and per organization.",
+                    "default": None,
+                    "x-procedure-only": True,
+                },
             },
             "required": ["text"],
         },
@@ -152,6 +157,7 @@ class SummarizeFunction(BaseFunction):
         side_effects=False,
         is_primitive=True,
         payload_profile="full",
+        batch_param="items",
         examples=[
             {
                 "description": "Bullet point summary",
@@ -176,6 +182,7 @@ class SummarizeFunction(BaseFunction):
         map_model = params.get("map_model")
         reduce_model = params.get("reduce_model")
         items = params.get("items")
+        max_concurrency = params.get("max_concurrency")
 
         if not ctx.llm_service.is_available:
             return FunctionResult.failed_result(
@@ -193,6 +200,7 @@ class SummarizeFunction(BaseFunction):
                 max_length=max_length,
                 focus=focus,
                 model=model,
+                max_concurrency=max_concurrency,
             )
 
         # Check if chunking is needed for large documents
@@ -263,7 +271,7 @@ Summary:"""
             temperature = task_config.temperature if task_config.temperature is not None else 0.5
 
             # Generate
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=resolved_model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -351,7 +359,7 @@ Section {chunk.chunk_index + 1} of {chunk.total_chunks}
 
 Provide a concise summary focusing on the key information:"""
 
-                        response = ctx.llm_service._client.chat.completions.create(
+                        response = await ctx.llm_service.chat_completion(
                             model=resolved_map_model,
                             messages=[
                                 {"role": "system", "content": system_prompt},
@@ -384,7 +392,7 @@ Section {chunk.chunk_index + 1} of {chunk.total_chunks}
 
 Provide a concise summary focusing on the key information:"""
 
-                        response = ctx.llm_service._client.chat.completions.create(
+                        response = await ctx.llm_service.chat_completion(
                             model=resolved_map_model,
                             messages=[
                                 {"role": "system", "content": system_prompt},
@@ -454,7 +462,7 @@ Here are the section summaries from different parts of the document:
 
 Create a final, unified summary:"""
 
-            response = ctx.llm_service._client.chat.completions.create(
+            response = await ctx.llm_service.chat_completion(
                 model=resolved_reduce_model,
                 messages=[
                     {"role": "system", "content": reduce_system_prompt},
@@ -499,12 +507,9 @@ Create a final, unified summary:"""
         max_length: int,
         focus: Optional[str],
         model: Optional[str],
+        max_concurrency: Optional[int] = None,
     ) -> FunctionResult:
         """Execute summarization for each item in collection."""
-        results = []
-        failed_count = 0
-        total_chars = 0
-
         # Build style instruction once
         style_instructions = {
             "paragraph": "Write a concise paragraph summary.",
@@ -522,7 +527,8 @@ Be concise and focus on the most important points."""
         resolved_model = model or task_config.model
         temperature = task_config.temperature if task_config.temperature is not None else 0.3
 
-        for idx, item in enumerate(items):
+        async def process_item(idx: int, item: Any) -> Dict[str, Any]:
+            """Process one item; failures are reported in the entry, not raised."""
             try:
                 # Render text with item context
                 rendered_text = _render_item_template(text_template, item)
@@ -539,7 +545,7 @@ Text to summarize:
 Summary:"""
 
                 # Generate
-                response = ctx.llm_service._client.chat.completions.create(
+                response = await ctx.llm_service.chat_completion(
                     model=resolved_model,
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -550,36 +556,34 @@ Summary:"""
                 )
 
                 summary = response.choices[0].message.content.strip()
-                total_chars += len(summary) if summary else 0
-
-                # Extract item ID if available
-                item_id = None
-                if isinstance(item, dict):
-                    item_id = item.get("id") or item.get("item_id") or str(idx)
-                else:
-                    item_id = str(idx)
 
-                results.append({
-                    "item_id": item_id,
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "result": summary,
                     "success": True,
-                })
+                }
 
             except Exception as e:
                 logger.warning(f"Summarization failed for item {idx}: {e}")
-                failed_count += 1
-                results.append({
-                    "item_id": item.get("id") if isinstance(item, dict) else str(idx),
+                return {
+                    "item_id": collection_item_id(item, idx),
                     "result": None,
                     "success": False,
                     "error": str(e),
-                })
+                }
+
+        limit, semaphore = await collection_semaphore(ctx, resolved_model, max_concurrency)
+
+        results = await run_collection(items, process_item, semaphore)
+        failed_count = sum(1 for r in results if not r["success"])
+        total_chars = sum(len(r["result"]) for r in results if r["success"] and r["result"])
 
         return FunctionResult.success_result(
             data=results,
             message=f"Summarized {len(results) - failed_count}/{len(items)} items ({total_chars} total chars)",
             metadata={
                 "mode": "collection",
+                "max_concurrency": limit,
                 "style": style,
                 "total_items": len(items),
                 "successful_items": len(items) - failed_count,
@@ -196,7 +196,7 @@ class BulkUpdateMetadataFunction(BaseFunction):
                 # Flush batch
                 await ctx.session.flush()
 
-                # Propagate canonical metadata to search_chunks for searchability
+                # Propagate canonical metadata to search_documents for searchability
                 if is_canonical:
                     from app.core.search.pg_index_service import pg_index_service
                     for update in batch:
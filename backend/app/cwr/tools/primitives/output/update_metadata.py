@@ -169,7 +169,7 @@ class UpdateMetadataFunction(BaseFunction):
                 )
                 ctx.session.add(new_metadata)
 
-            # Propagate canonical metadata to search_chunks for searchability
+            # Propagate canonical metadata to search_documents for searchability
             if is_canonical:
                 from app.core.search.pg_index_service import pg_index_service
                 await ctx.session.flush()
@@ -2,7 +2,7 @@
 update_source_metadata — Update Asset.source_metadata (generic, any asset type).
 
 Updates a specific namespace within source_metadata using shallow merge,
-then optionally propagates to search_chunks.metadata for searchability.
+then optionally propagates to search_documents.metadata for searchability.
 
 This is NOT SharePoint-specific — it works for any asset type and namespace.
 """
@@ -60,7 +60,7 @@ class UpdateSourceMetadataFunction(BaseFunction):
                 },
                 "propagate_to_search": {
                     "type": "boolean",
-                    "description": "Propagate changes to search_chunks.metadata",
+                    "description": "Propagate changes to search_documents.metadata",
                     "default": True,
                 },
             },
@@ -153,7 +153,7 @@ class UpdateSourceMetadataFunction(BaseFunction):
             flag_modified(asset, "source_metadata")
             await ctx.session.flush()
 
-            # Propagate to search_chunks.metadata
+            # Propagate to search_documents.metadata
             propagated = False
             if propagate_to_search:
                 from app.core.search.pg_index_service import pg_index_service
@@ -0,0 +1,312 @@
+# backend/app/cwr/tools/templating.py
+"""
+Compiled Jinja2 templates for procedure and pipeline parameters.
+
+Every templated parameter, condition and per-item prompt used to be compiled
+from scratch on each render, which dominated CPU for large foreach steps.
+This module keeps one sandboxed Environment per process and caches compiled
+templates by source string.
+
+Features:
+- Shared SandboxedEnvironment with the CWR filters and globals
+- LRU cache of compiled templates keyed by source (TEMPLATE_CACHE_SIZE)
+- Render plans: a params tree compiled once into closures, with pure
+  ``{{ a.b[0] }}`` expressions resolved by a precomputed attribute path
+- VariableStore: a variables dict that keeps its ``steps`` view current
+
+Usage:
+    from app.cwr.tools.templating import compile_params, compile_template
+
+    text = compile_template("Hello {{ item.name }}").render(item=item)
+
+    plan = compile_params(step.params)
+    rendered = plan(context)
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+import markdown
+from jinja2 import Template, meta
+from jinja2.sandbox import SandboxedEnvironment
+
+# Maximum number of distinct template sources kept compiled
+TEMPLATE_CACHE_SIZE = 4096
+
+# Variables holding step results are stored as "steps.<step_name>"
+STEP_PREFIX = "steps."
+
+_INDEXED_PART = re.compile(r"^(\w+)\[(\d+)\]$")
+
+# A compiled params tree: call it with a template context to render
+RenderPlan = Callable[[Dict[str, Any]], Any]
+
+# A compiled dot path: head name plus (key, index) pairs
+ExpressionPath = Tuple[str, Tuple[Tuple[str, Optional[int]], ...]]
+
+
+def _markdown_to_html(text: str) -> str:
+    """
+    Convert markdown text to HTML for use in templates.
+
+    Useful for embedding LLM output (which is typically markdown) into
+    HTML email bodies or other HTML contexts.
+
+    Args:
+        text: Markdown text to convert
+
+    Returns:
+        HTML string
+    """
+    md = markdown.Markdown(extensions=["tables", "fenced_code", "nl2br"])
+    return md.convert(str(text) if text else "")
+
+
+def _compact(value):
+    """
+    Filter out None/null values from a list.
+
+    Useful for safely iterating over foreach results where some items may have failed.
+
+    Example:
+        {% for result in steps.process_each | compact %}
+        {{ result }}
+        {% endfor %}
+
+    Args:
+        value: List that may contain None values
+
+    Returns:
+        List with None values removed
+    """
+    if isinstance(value, (list, tuple)):
+        return [item for item in value if item is not None]
+    return value
+
+
+def _default_if_none(value, default=""):
+    """
+    Return a default value if the input is None.
+
+    Args:
+        value: The value to check
+        default: The default to return if value is None
+
+    Returns:
+        The original value or the default
+    """
+    return default if value is None else value
+
+
+def _now_et() -> datetime:
+    """Return current datetime in US Eastern timezone."""
+    from zoneinfo import ZoneInfo
+    return datetime.now(ZoneInfo("America/New_York"))
+
+
+def _today() -> str:
+    """Return today's date formatted as 'Month Day, Year' in US Eastern."""
+    return _now_et().strftime("%B %d, %Y")
+
+
+@lru_cache(maxsize=1)
+def get_environment() -> SandboxedEnvironment:
+    """
+    Get the shared sandboxed Jinja2 environment.
+
+    Returns:
+        Environment with the md_to_html, compact and d filters and the
+        now, now_et and today globals registered
+    """
+    env = SandboxedEnvironment()
+
+    # Register custom filters
+    env.filters["md_to_html"] = _markdown_to_html
+    env.filters["compact"] = _compact  # Filter None values from lists
+    env.filters["d"] = _default_if_none  # Shorthand for default if None
+
+    # Register globals (functions available in templates)
+    env.globals["now"] = datetime.utcnow
+    env.globals["now_et"] = _now_et
+    env.globals["today"] = _today
+
+    return env
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(source: str) -> Template:
+    """
+    Compile a template string, reusing the cached template for repeat sources.
+
+    Syntax errors propagate and are not cached.
+    """
+    return get_environment().from_string(source)
+
+
+def compile_condition(condition: str) -> Template:
+    """Compile a condition expression as a ``{{ condition }}`` template."""
+    return compile_template("{{ " + condition + " }}")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def template_variables(source: str) -> FrozenSet[str]:
+    """Return the top-level context variables a template source references."""
+    env = get_environment()
+    return frozenset(meta.find_undeclared_variables(env.parse(source)))
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_path(expression: str) -> ExpressionPath:
+    """
+    Split a dot-notation expression (e.g. "steps.data.items[0].id") into parts.
+
+    Expressions that are not plain paths still compile; they simply fail to
+    resolve and callers fall back to rendering the template.
+    """
+    head, *rest = expression.split(".")
+    parts = []
+    for part in rest:
+        match = _INDEXED_PART.match(part)
+        if match:
+            parts.append((match.group(1), int(match.group(2))))
+        else:
+            parts.append((part, None))
+    return head, tuple(parts)
+
+
+def resolve_path(path: ExpressionPath, context: Dict[str, Any]) -> Any:
+    """
+    Resolve a compiled path against a context, preserving the value's type.
+
+    Returns None when any part of the path is missing.
+    """
+    head, parts = path
+    if head not in context:
+        return None
+    result = context[head]
+    try:
+        for key, index in parts:
+            if isinstance(result, dict):
+                result = result.get(key)
+            elif hasattr(result, key):
+                result = getattr(result, key)
+            else:
+                return None
+            if index is not None:
+                if isinstance(result, (list, tuple)) and index < len(result):
+                    result = result[index]
+                else:
+                    return None
+        return result
+    except Exception:
+        return None
+
+
+def compile_params(value: Any, defer_item: bool = False) -> RenderPlan:
+    """
+    Compile a params tree into a render plan.
+
+    Strings containing ``{{`` become compiled templates (syntax errors raise
+    here). With defer_item, strings referencing ``item`` are kept as raw
+    templates for functions that render them per item themselves. A string that is a
+    single ``{{ expression }}`` first resolves the expression as a path so
+    lists, dicts and numbers keep their type, falling back to string
+    rendering when the path does not resolve. Dicts and lists are rebuilt
+    on every render; other values are returned as-is.
+    """
+    if isinstance(value, str) and "{{" in value:
+        if defer_item and "item" in template_variables(value):
+            return lambda context: value
+        stripped = value.strip()
+        if stripped.startswith("{{") and stripped.endswith("}}"):
+            path = compile_path(stripped[2:-2].strip())
+
+            def render_expression(context: Dict[str, Any]) -> Any:
+                result = resolve_path(path, context)
+                if result is not None:
+                    return result
+                # Compiled on first fallback: a resolvable path need not be valid Jinja
+                return compile_template(value).render(context)
+
+            return render_expression
+        return compile_template(value).render
+    if isinstance(value, dict):
+        entries = [(key, compile_params(item, defer_item)) for key, item in value.items()]
+        return lambda context: {key: plan(context) for key, plan in entries}
+    if isinstance(value, list):
+        plans = [compile_params(item, defer_item) for item in value]
+        return lambda context: [plan(context) for plan in plans]
+    return lambda context: value
+
+
+def steps_view(variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the ``steps`` mapping (step name -> result) for a variables dict."""
+    if isinstance(variables, VariableStore):
+        return variables.steps
+    return {
+        key[len(STEP_PREFIX):]: value
+        for key, value in variables.items()
+        if key.startswith(STEP_PREFIX)
+    }
+
+
+class VariableStore(dict):
+    """
+    Context variables that keep a ``steps`` view of their ``steps.*`` entries.
+
+    Templates see step results as ``steps.<name>``; maintaining the view on
+    write avoids rebuilding it from every variable on each render.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.steps: Dict[str, Any] = {
+            key[len(STEP_PREFIX):]: value
+            for key, value in self.items()
+            if isinstance(key, str) and key.startswith(STEP_PREFIX)
+        }
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if isinstance(key, str) and key.startswith(STEP_PREFIX):
+            self.steps[key[len(STEP_PREFIX):]] = value
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        if isinstance(key, str) and key.startswith(STEP_PREFIX):
+            self.steps.pop(key[len(STEP_PREFIX):], None)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        if isinstance(key, str) and key.startswith(STEP_PREFIX):
+            self.steps.pop(key[len(STEP_PREFIX):], None)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self.steps.clear()
+
+    def copy(self) -> "VariableStore":
+        return VariableStore(self)
+
@@ -341,6 +341,30 @@ async def startup_event() -> None:
             print(f"   ⚠️  Queue registry initialization warning: {e}")
             # Non-fatal - registry will use defaults
 
+        # Start shared cache invalidation listener (cross-process cache coherence)
+        try:
+            from .core.shared.shared_cache import (
+                invalidate_shared_cache,
+                start_invalidation_listener,
+            )
+            start_invalidation_listener()
+            # Tool contracts are defined in code; a deploy may change them
+            invalidate_shared_cache("mcp_contracts")
+            print("   ✅ Shared cache invalidation listener started")
+        except Exception as e:
+            print(f"   ⚠️  Shared cache listener warning: {e}")
+            # Non-fatal - caches fall back to TTL expiry
+
+        # Replay run log events left in the telemetry stream by a crash
+        try:
+            from .core.shared.run_telemetry import run_telemetry
+            recovered = await run_telemetry.recover()
+            if recovered:
+                print(f"   ✅ Recovered {recovered} buffered run log events")
+        except Exception as e:
+            print(f"   ⚠️  Run log event recovery warning: {e}")
+            # Non-fatal - the stale run cleanup task retries hourly
+
         # Seed facet reference data baseline (YAML → DB, idempotent)
         try:
             print("📊 Seeding facet reference data baseline...")
@@ -313,6 +313,24 @@ class TestProcedureGeneratorService:
         assert result["success"] is False
         assert "not available" in result["error"]
 
+    @pytest.mark.asyncio
+    @patch("app.cwr.procedures.compiler.ai_generator.llm_service")
+    @patch("app.cwr.procedures.compiler.ai_generator.config_loader")
+    async def test_call_llm_uses_async_completion(self, mock_config, mock_llm):
+        """LLM calls go through the non-blocking chat_completion API."""
+        mock_llm.is_available = True
+        mock_llm.chat_completion = AsyncMock(return_value=_mock_llm_response("{}"))
+        mock_config.get_task_type_config.return_value = MagicMock(model="test", temperature=0.2)
+
+        service = ProcedureGeneratorService()
+        response = await service._call_llm([{"role": "user", "content": "Plan it"}])
+
+        assert response.choices[0].message.content == "{}"
+        kwargs = mock_llm.chat_completion.await_args.kwargs
+        assert kwargs["model"] == "test"
+        assert kwargs["messages"][-1]["content"] == "Plan it"
+        mock_llm._client.chat.completions.create.assert_not_called()
+
 
 class TestParseJSON:
     """Test JSON parsing resilience."""
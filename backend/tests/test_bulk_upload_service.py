@@ -0,0 +1,123 @@
+# backend/tests/test_bulk_upload_service.py
+"""
+Tests for streaming bulk upload analysis.
+
+Runs BulkUploadService against a SQLite database holding the asset columns
+the analysis reads, so the IN lookups are exercised for real.
+
+Covers:
+- Hashing uploads in chunks without reading them into memory at once
+- Hashing while streaming to storage
+- Categorizing unchanged, updated, new and missing files from descriptors
+- Batched IN lookups
+"""
+
+import hashlib
+import sqlite3
+import uuid
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.ingestion.bulk_upload_service import BulkUploadFile, bulk_upload_service
+from app.core.storage.minio_service import HashingReader
+
+ORG_ID = uuid.uuid4()
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    db_path = tmp_path / "assets.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE assets (
+                id CHAR(36) PRIMARY KEY, organization_id CHAR(36), source_type TEXT,
+                original_filename TEXT, file_hash TEXT, file_size INT,
+                status TEXT, current_version_number INT
+            )
+        """)
+        rows = [
+            ("same.pdf", _sha(b"same"), 4),
+            ("changed.pdf", _sha(b"old"), 3),
+            ("gone.pdf", _sha(b"gone"), 4),
+            ("broken.pdf", None, 0),
+        ]
+        for filename, file_hash, size in rows:
+            conn.execute(
+                "INSERT INTO assets VALUES (?, ?, 'upload', ?, ?, ?, 'ready', 1)",
+                (str(uuid.uuid4()), str(ORG_ID), filename, file_hash, size),
+            )
+        # Same content under another organization is ignored
+        conn.execute(
+            "INSERT INTO assets VALUES (?, ?, 'upload', 'new.pdf', ?, 3, 'ready', 1)",
+            (str(uuid.uuid4()), str(uuid.uuid4()), _sha(b"new")),
+        )
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+class TestUploadHashing:
+    """Tests for chunked hashing of uploads."""
+
+    def test_describe_file_rewinds(self):
+        data = b"x" * 3000
+        file_obj = BytesIO(data)
+        file_obj.seek(10)
+
+        with patch("app.core.ingestion.bulk_upload_service.HASH_CHUNK_SIZE", 1024):
+            info = bulk_upload_service.describe_file("a.txt", file_obj)
+
+        assert info == BulkUploadFile("a.txt", _sha(data), 3000)
+        assert file_obj.tell() == 0
+
+    def test_hashing_reader(self):
+        reader = HashingReader(BytesIO(b"hello world"))
+
+        assert reader.read(5) == b"hello"
+        assert reader.read() == b" world"
+        assert reader.size == 11
+        assert reader.hexdigest() == _sha(b"hello world")
+
+
+class TestBulkUploadAnalysis:
+    """Tests for analyze_bulk_upload with (filename, hash, size) descriptors."""
+
+    @pytest.mark.asyncio
+    async def test_categorizes_files(self, sessions):
+        files = [
+            BulkUploadFile("same.pdf", _sha(b"same"), 4),
+            BulkUploadFile("changed.pdf", _sha(b"new content"), 11),
+            BulkUploadFile("new.pdf", _sha(b"new"), 3),
+            # Same content as an existing asset under a new name is new
+            BulkUploadFile("renamed.pdf", _sha(b"same"), 4),
+        ]
+
+        async with sessions() as session:
+            analysis = await bulk_upload_service.analyze_bulk_upload(session, ORG_ID, files)
+
+        assert [f["filename"] for f in analysis.unchanged] == ["same.pdf"]
+        assert [f["filename"] for f in analysis.updated] == ["changed.pdf"]
+        assert analysis.updated[0]["old_file_hash"] == _sha(b"old")
+        assert sorted(f["filename"] for f in analysis.new) == ["new.pdf", "renamed.pdf"]
+        # Assets without a hash are reported as inconsistent, not missing
+        assert [f["filename"] for f in analysis.missing] == ["gone.pdf"]
+        assert analysis.to_dict()["counts"]["total_uploaded"] == 4
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_batched(self, sessions):
+        files = [BulkUploadFile(f"file{i}.pdf", _sha(str(i).encode()), 1) for i in range(5)]
+        files.append(BulkUploadFile("same.pdf", _sha(b"same"), 4))
+
+        with patch("app.core.ingestion.bulk_upload_service.LOOKUP_BATCH_SIZE", 2):
+            async with sessions() as session:
+                analysis = await bulk_upload_service.analyze_bulk_upload(session, ORG_ID, files)
+
+        assert [f["filename"] for f in analysis.unchanged] == ["same.pdf"]
+        assert len(analysis.new) == 5
@@ -0,0 +1,140 @@
+# backend/tests/test_event_service.py
+"""
+Tests for event routing and batched dispatch in EventService.
+
+Covers:
+- Compiled trigger filters
+- Events without matching triggers (no database work)
+- Deferred emission through the outbox
+- Batched dispatch (one commit, one Celery group)
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.database.procedures import EventOutbox
+from app.core.shared.event_service import EventService, TriggerRoute
+
+
+def _route(kind="procedure", slug="notify", event_filter=None, trigger_params=None):
+    return TriggerRoute(
+        kind=kind,
+        trigger_id=str(uuid.uuid4()),
+        target_id=str(uuid.uuid4()),
+        slug=slug,
+        event_filter=event_filter,
+        trigger_params=trigger_params,
+    )
+
+
+def _session():
+    session = MagicMock()
+    session.add = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+class TestTriggerRouteFilters:
+    """Tests for compiled event filters."""
+
+    def test_operators_and_nested_paths(self):
+        route = _route(event_filter={
+            "run.status": "completed",
+            "tags": {"$contains": "important"},
+            "source": {"$in": ["sam", "sharepoint"]},
+            "mode": {"$ne": "dry_run"},
+        })
+        payload = {
+            "run": {"status": "completed"},
+            "tags": ["important"],
+            "source": "sam",
+            "mode": "full",
+        }
+
+        assert route.matches(payload)
+        assert not route.matches({**payload, "run": {"status": "failed"}})
+        assert not route.matches({**payload, "tags": "important"})
+        assert not route.matches({**payload, "source": "scrape"})
+        assert not route.matches({**payload, "mode": "dry_run"})
+
+    def test_round_trip_keeps_filter(self):
+        route = _route(event_filter={"status": "completed"})
+        restored = TriggerRoute(**route.to_dict())
+
+        assert restored.matches({"status": "completed"})
+        assert not restored.matches({"status": "failed"})
+
+
+class TestEventDispatch:
+    """Tests for emit() routing, outbox and batched dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_no_matching_triggers_skips_database(self):
+        service = EventService()
+        session = _session()
+        routes = {"sam_pull.completed": [_route(event_filter={"new_notices": 5})]}
+
+        with patch.object(service, "get_trigger_routes", AsyncMock(return_value=routes)):
+            result = await service.emit(
+                session, "sam_pull.completed", uuid.uuid4(), {"new_notices": 0}, defer=True
+            )
+
+        assert result["procedures_triggered"] == []
+        session.add.assert_not_called()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_deferred_emit_writes_outbox(self):
+        service = EventService()
+        session = _session()
+        org_id = uuid.uuid4()
+        routes = {"asset.extraction_completed": [_route()]}
+
+        with patch.object(service, "get_trigger_routes", AsyncMock(return_value=routes)), \
+                patch.object(service, "_schedule_outbox_dispatch") as schedule:
+            result = await service.emit(
+                session, "asset.extraction_completed", org_id, {"asset_id": "a1"}, defer=True
+            )
+
+        assert result["queued"] is True
+        entry = session.add.call_args[0][0]
+        assert isinstance(entry, EventOutbox)
+        assert entry.organization_id == org_id
+        assert entry.payload == {"asset_id": "a1"}
+        session.commit.assert_awaited_once()
+        schedule.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_commits_once_and_submits_group(self):
+        service = EventService()
+        session = _session()
+        org_id = uuid.uuid4()
+        procedure_route = _route(trigger_params={"limit": 10})
+        pipeline_route = _route(kind="pipeline", slug="enrich")
+        routes = {"sam_pull.completed": [procedure_route, pipeline_route]}
+
+        with patch.object(service, "get_trigger_routes", AsyncMock(return_value=routes)), \
+                patch("celery.group") as group, \
+                patch("app.core.tasks.execute_procedure_task") as proc_task, \
+                patch("app.core.tasks.execute_pipeline_task") as pipe_task:
+            result = await service.emit(
+                session, "sam_pull.completed", org_id, {"search_id": "s1"}
+            )
+
+        assert len(result["procedures_triggered"]) == 1
+        assert len(result["pipelines_triggered"]) == 1
+        session.commit.assert_awaited_once()
+        group.assert_called_once()
+        assert len(group.call_args[0][0]) == 2
+        group.return_value.apply_async.assert_called_once()
+
+        params = proc_task.si.call_args[0][3]
+        assert params == {"limit": 10, "search_id": "s1"}
+        assert pipe_task.si.call_args[1]["pipeline_slug"] == "enrich"
+
+        # Trigger counters are bumped with one executemany per trigger table
+        counter_calls = [c for c in session.execute.await_args_list if len(c[0]) == 2]
+        assert len(counter_calls) == 2
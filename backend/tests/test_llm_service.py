@@ -668,5 +668,400 @@ class TestModelSelection:
             assert "model" in call_kwargs
 
 
+
+class TestAsyncCompletion:
+    """Test the async completion API."""
+
+    @pytest.mark.asyncio
+    async def test_async_client_pooled_per_loop(self, llm_service_instance):
+        """The async client is created once per event loop and reused."""
+        adapter = llm_service_instance._adapter
+
+        first = adapter.get_async_client()
+        second = adapter.get_async_client()
+
+        assert first is not None
+        assert first is second
+        assert adapter._async_client_loop is not None
+
+    def test_async_client_closed_when_task_loop_ends(self, llm_service_instance):
+        """Each task loop's client is closed when asyncio.run() finishes."""
+        import asyncio
+
+        adapter = llm_service_instance._adapter
+
+        async def task():
+            client = adapter.get_async_client()
+            await asyncio.sleep(0)
+            return client
+
+        first = asyncio.run(task())
+        second = asyncio.run(task())
+
+        assert first is not second
+        assert first.is_closed() and second.is_closed()
+
+    @pytest.mark.asyncio
+    async def test_async_client_none_without_api_key(self):
+        """No async client is built when no API key is configured."""
+        with patch(f"{_ADAPTER_MOD}.settings") as mock_settings, \
+             patch(f"{_ADAPTER_MOD}.config_loader") as mock_config_loader:
+            mock_settings.openai_api_key = None
+            mock_config_loader.get_llm_config.return_value = None
+
+            adapter = LLMAdapter()
+
+        assert adapter.get_async_client() is None
+        with pytest.raises(RuntimeError):
+            await LLMService(adapter=adapter).chat_completion(model="m", messages=[])
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_awaits_async_client(self, llm_service_instance):
+        """chat_completion forwards kwargs to the async client."""
+        mock_response = MagicMock()
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        with patch.object(
+            llm_service_instance._adapter, "get_async_client", return_value=async_client
+        ):
+            result = await llm_service_instance.chat_completion(
+                model="gpt-4", messages=[{"role": "user", "content": "hi"}], max_tokens=10,
+            )
+
+        assert result is mock_response
+        async_client.chat.completions.create.assert_awaited_once_with(
+            model="gpt-4", messages=[{"role": "user", "content": "hi"}], max_tokens=10,
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_uses_async_completion(self, llm_service_instance):
+        """generate() goes through chat_completion rather than the sync client."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "  answer  "
+        task_config = MagicMock(model="gpt-4")
+
+        with patch(f"{_SERVICE_MOD}.llm_routing_service") as mock_routing, \
+             patch.object(
+                 llm_service_instance, "chat_completion",
+                 AsyncMock(return_value=mock_response),
+             ) as mock_completion:
+            mock_routing.get_config_for_task = AsyncMock(return_value=task_config)
+            result = await llm_service_instance.generate("question")
+
+        assert result == {"content": "answer"}
+        assert mock_completion.await_args.kwargs["model"] == "gpt-4"
+
+
+
+class TestCollectionConcurrency:
+    """Test bounded-concurrency collection mode for LLM primitives."""
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_caps(self):
+        """Requested concurrency is clamped by the model and org caps."""
+        from app.core.llm.llm_routing_service import LLMRoutingService
+
+        service = LLMRoutingService()
+        llm_config = MagicMock(max_concurrency=8, model_concurrency={"slow-model": 3})
+
+        with patch("app.core.llm.llm_routing_service.config_loader") as mock_loader:
+            mock_loader.get_llm_config.return_value = llm_config
+
+            assert await service.get_max_concurrency("fast-model") == 8
+            assert await service.get_max_concurrency("fast-model", requested=20) == 20
+            assert await service.get_max_concurrency("slow-model", requested=20) == 3
+
+            with patch.object(
+                service, "_get_organization_concurrency", AsyncMock(return_value=2)
+            ):
+                limit = await service.get_max_concurrency(
+                    "fast-model", organization_id="org", session=MagicMock(), requested=20,
+                )
+            assert limit == 2
+
+    @pytest.mark.asyncio
+    async def test_collection_runs_concurrently_and_preserves_order(self):
+        """Items overlap up to the limit; output order and per-item errors are kept."""
+        import asyncio
+
+        from app.cwr.tools.primitives.llm.summarize import SummarizeFunction
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_completion(**kwargs):
+            nonlocal in_flight, peak
+            text = kwargs["messages"][1]["content"]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier items finish later so completion order != input order
+            await asyncio.sleep(0.01 if "item-0" in text else 0)
+            in_flight -= 1
+            if "item-2" in text:
+                raise RuntimeError("boom")
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = text.split("---")[1].strip()
+            return response
+
+        ctx = MagicMock()
+        ctx.organization_id = None
+        ctx.llm_service.chat_completion = fake_completion
+        items = [{"id": f"i{n}", "content": f"item-{n}"} for n in range(5)]
+
+        with patch(
+            "app.cwr.tools.primitives.llm.collection.llm_routing_service"
+        ) as mock_routing, patch(
+            "app.cwr.tools.primitives.llm.summarize.config_loader"
+        ) as mock_loader:
+            mock_routing.get_max_concurrency = AsyncMock(return_value=3)
+            mock_loader.get_task_type_config.return_value = MagicMock(model="m", temperature=0.1)
+
+            result = await SummarizeFunction()._execute_collection(
+                ctx=ctx,
+                items=items,
+                text_template="{{ item.content }}",
+                style="paragraph",
+                max_length=100,
+                focus=None,
+                model=None,
+                max_concurrency=3,
+            )
+
+        assert [r["item_id"] for r in result.data] == ["i0", "i1", "i2", "i3", "i4"]
+        assert result.data[0]["result"] == "item-0"
+        assert result.data[2]["success"] is False
+        assert result.data[2]["error"] == "boom"
+        assert result.metadata["failed_items"] == 1
+        assert 1 < peak <= 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("module", ["classify", "decide"])
+    async def test_collection_failed_items_keep_item_id(self, module):
+        """Failed items report the same item_id key as successful ones."""
+        from app.cwr.tools.primitives.llm.classify import ClassifyFunction
+        from app.cwr.tools.primitives.llm.decide import DecideFunction
+
+        async def fake_completion(**kwargs):
+            text = kwargs["messages"][1]["content"]
+            if "bad" in text:
+                raise RuntimeError("boom")
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = json.dumps(
+                {"category": "A", "decision": True, "confidence": 0.9, "reasoning": "ok"}
+            )
+            return response
+
+        ctx = MagicMock()
+        ctx.organization_id = None
+        ctx.llm_service.chat_completion = fake_completion
+        items = [{"item_id": "k0", "content": "good"}, {"item_id": "k1", "content": "bad"}]
+
+        with patch(
+            "app.cwr.tools.primitives.llm.collection.llm_routing_service"
+        ) as mock_routing, patch(
+            f"app.cwr.tools.primitives.llm.{module}.config_loader"
+        ) as mock_loader:
+            mock_routing.get_max_concurrency = AsyncMock(return_value=2)
+            mock_loader.get_task_type_config.return_value = MagicMock(model="m", temperature=0.1)
+
+            if module == "classify":
+                result = await ClassifyFunction()._execute_collection(
+                    ctx=ctx, items=items, text_template="{{ item.content }}", categories=["A", "B"],
+                    category_descriptions={}, multi_label=False, include_reasoning=True, model=None,
+                )
+            else:
+                result = await DecideFunction()._execute_collection(
+                    ctx=ctx, items=items, question="OK?", data_template="{{ item.content }}", criteria=None,
+                    system_prompt=None, default_on_error=False, confidence_threshold=0.0,
+                    include_reasoning=True, model=None,
+                )
+
+        assert [(r["item_id"], r["success"]) for r in result.data] == [("k0", True), ("k1", False)]
+
+
+
+class TestResponseCache:
+    """Test the prompt-fingerprint LLM response cache."""
+
+    def test_fingerprint_ignores_only_transport_fields(self):
+        """Every argument but timeouts and extra headers changes the key."""
+        from app.core.llm.llm_response_cache import fingerprint
+
+        base = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.1}
+        tools = [{"type": "function", "function": {"name": "lookup", "parameters": {}}}]
+
+        assert fingerprint(base) == fingerprint({**base, "timeout": 30, "extra_headers": {"x": "1"}})
+        assert fingerprint(base) != fingerprint({**base, "temperature": 0.2})
+        assert fingerprint(base) != fingerprint({**base, "max_tokens": 10})
+        assert fingerprint(base) != fingerprint({**base, "tools": tools})
+        assert fingerprint({**base, "tools": tools}) != fingerprint({**base, "tools": tools, "tool_choice": "required"})
+        for field, value in (("top_p", 0.5), ("stop", ["\n"]), ("seed", 7), ("n", 2)):
+            assert fingerprint(base) != fingerprint({**base, field: value})
+
+    def test_enabled_for_scopes_step_flag(self):
+        """The step-level flag applies only inside the block."""
+        from app.core.llm.llm_response_cache import LLMResponseCache
+
+        cache = LLMResponseCache()
+        with patch.object(LLMResponseCache, "enabled", True):
+            assert cache.should_cache() is False
+            with cache.enabled_for(True):
+                assert cache.should_cache() is True
+                assert cache.should_cache(False) is False
+            assert cache.should_cache() is False
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_cache_hit_skips_provider(self, llm_service_instance):
+        """A cached response is returned without calling the provider."""
+        cached_response = MagicMock()
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock()
+
+        with patch.object(
+            llm_service_instance._adapter, "get_async_client", return_value=async_client
+        ), patch(f"{_SERVICE_MOD}.llm_response_cache") as mock_cache:
+            mock_cache.should_cache.return_value = True
+            mock_cache.get = AsyncMock(return_value=cached_response)
+
+            result = await llm_service_instance.chat_completion(
+                model="gpt-4", messages=[], cache=True,
+            )
+
+        assert result is cached_response
+        async_client.chat.completions.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_cache_miss_stores_response(self, llm_service_instance):
+        """A miss calls the provider and stores the response."""
+        response = MagicMock()
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock(return_value=response)
+
+        with patch.object(
+            llm_service_instance._adapter, "get_async_client", return_value=async_client
+        ), patch(f"{_SERVICE_MOD}.llm_response_cache") as mock_cache:
+            mock_cache.should_cache.return_value = True
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+
+            result = await llm_service_instance.chat_completion(model="gpt-4", messages=[])
+
+        assert result is response
+        mock_cache.set.assert_awaited_once()
+        assert mock_cache.set.await_args.args[1] is response
+
+    def test_step_cache_flag_round_trips(self):
+        """Procedure steps accept and serialize `cache: true`."""
+        from app.cwr.procedures.store.definitions import ProcedureDefinition
+
+        definition = ProcedureDefinition.from_dict({
+            "name": "Digest",
+            "slug": "digest",
+            "steps": [
+                {"name": "summarize", "function": "llm_summarize", "cache": True},
+                {"name": "notify", "function": "send_email"},
+            ],
+        })
+
+        assert definition.steps[0].cache is True
+        assert definition.steps[1].cache is False
+        steps = definition.to_dict()["steps"]
+        assert steps[0]["cache"] is True
+        assert "cache" not in steps[1]
+
+
+
+class TestPackedPrompts:
+    """Test packed multi-item prompts for collection mode."""
+
+    def test_pack_batches_respects_items_and_tokens(self):
+        """Batches close on the item limit or the token budget."""
+        from app.core.llm.packed_prompts import ITEM_FRAME_TOKENS, pack_batches
+
+        counts = [10, 10, 10, 10, 10]
+        assert pack_batches(counts, overhead_tokens=0, max_items=2, max_input_tokens=10_000) == [
+            [0, 1], [2, 3], [4],
+        ]
+        budget = 2 * (10 + ITEM_FRAME_TOKENS) + 5
+        assert pack_batches([10, None, 10, 10], 5, max_items=10, max_input_tokens=budget) == [
+            [0, 2], [3],
+        ]
+
+    def test_parse_packed_response_formats(self):
+        """Bare arrays, wrapped arrays and fenced JSON all parse by index."""
+        from app.core.llm.packed_prompts import parse_packed_response
+
+        expected = {0: {"category": "a"}, 1: {"category": "b"}}
+        assert parse_packed_response('[{"index": 0, "category": "a"}, {"index": 1, "category": "b"}]') == expected
+        assert parse_packed_response('{"results": [{"index": 1, "category": "b"}, {"index": 0, "category": "a"}]}') == expected
+        assert parse_packed_response('```json\n[{"index": "0", "category": "a"}]\n```') == {0: {"category": "a"}}
+        with pytest.raises(ValueError):
+            parse_packed_response('{"category": "a"}')
+
+    @staticmethod
+    def _llm(responses):
+        """LLM stub that answers each packed request via responses(item_texts)."""
+        import re
+
+        calls = []
+
+        async def chat_completion(**kwargs):
+            texts = re.findall(r'<item index="\d+">\n(.*?)\n</item>', kwargs["messages"][1]["content"], re.S)
+            calls.append(texts)
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = responses(texts)
+            return response
+
+        service = MagicMock()
+        service.chat_completion = chat_completion
+        return service, calls
+
+    @pytest.mark.asyncio
+    async def test_run_packed_maps_results_to_items(self):
+        """Each item gets its own parsed result from one request."""
+        from app.core.llm.packed_prompts import run_packed_prompts
+
+        service, calls = self._llm(lambda texts: json.dumps(
+            [{"index": i, "label": t.upper()} for i, t in enumerate(texts)]
+        ))
+        results = await run_packed_prompts(
+            service, texts=["a", "b", "c"], system_prompt="sys", task_prompt="task",
+            model="m", temperature=0.0, batch_size=10, item_output_tokens=50,
+            parse_item=lambda entry: entry["label"],
+        )
+
+        assert results == ["A", "B", "C"]
+        assert calls == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_run_packed_splits_on_parse_failure(self):
+        """Unparseable batches are split; lone items are left to the caller."""
+        from app.core.llm.packed_prompts import run_packed_prompts
+
+        def respond(texts):
+            if len(texts) > 2:
+                return "not json"
+            return json.dumps([
+                {"index": i, "label": t} for i, t in enumerate(texts) if t != "bad"
+            ])
+
+        service, calls = self._llm(respond)
+        results = await run_packed_prompts(
+            service, texts=["a", "b", "bad", "d"], system_prompt="sys", task_prompt="task",
+            model="m", temperature=0.0, batch_size=10, item_output_tokens=50,
+            parse_item=lambda entry: entry["label"],
+        )
+
+        # ["bad", "d"] returns only "d"; the missing "bad" is a single and falls back
+        assert results == ["a", "b", None, "d"]
+        assert calls[0] == ["a", "b", "bad", "d"]
+        assert sorted(map(tuple, calls[1:])) == [("a", "b"), ("bad", "d")]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
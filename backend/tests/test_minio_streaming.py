@@ -0,0 +1,154 @@
+# backend/tests/test_minio_streaming.py
+"""
+Tests for streaming object reads and uploads in MinIOService.
+
+Uses a mocked MinIO client, so no MinIO service is required.
+
+Covers:
+- Chunked iteration with connection release
+- Async streaming for response bodies
+- Downloads straight to a file
+- Incremental text decoding across chunk boundaries
+- Multipart uploads of unknown length
+- Async chunk sources piped into uploads
+"""
+
+import hashlib
+from io import BytesIO
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from app.core.storage.minio_service import MULTIPART_PART_SIZE, MinIOService
+
+
+def _response(chunks):
+    response = MagicMock()
+    response.stream.return_value = iter(chunks)
+    return response
+
+
+@pytest.fixture
+def minio():
+    client = MagicMock()
+    service = MinIOService.__new__(MinIOService)
+    with patch.object(MinIOService, "client", new_callable=PropertyMock, return_value=client):
+        yield service, client
+
+
+class TestStreamingReads:
+    """Tests for iter_object, stream_object, fget_object and read_object_text."""
+
+    def test_iter_object_releases_connection(self, minio):
+        service, client = minio
+        response = _response([b"ab", b"cd"])
+        client.get_object.return_value = response
+
+        chunks = service.iter_object("bucket", "key", chunk_size=2, offset=4, length=4)
+
+        client.get_object.assert_called_once_with("bucket", "key", offset=4, length=4)
+        assert list(chunks) == [b"ab", b"cd"]
+        response.stream.assert_called_once_with(2)
+        response.close.assert_called_once()
+        response.release_conn.assert_called_once()
+
+    def test_iter_object_closed_early_releases_connection(self, minio):
+        service, client = minio
+        response = _response([b"ab", b"cd"])
+        client.get_object.return_value = response
+
+        chunks = service.iter_object("bucket", "key")
+        assert next(chunks) == b"ab"
+        chunks.close()
+
+        response.release_conn.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_object(self, minio):
+        service, client = minio
+        response = _response([b"one", b"two"])
+        client.get_object.return_value = response
+
+        chunks = await service.stream_object("bucket", "key")
+
+        assert [chunk async for chunk in chunks] == [b"one", b"two"]
+        response.release_conn.assert_called_once()
+
+    def test_fget_object_writes_file(self, minio, tmp_path):
+        service, client = minio
+        client.get_object.return_value = _response([b"hello ", b"world"])
+        path = tmp_path / "out.bin"
+
+        written = service.fget_object("bucket", "key", path)
+
+        assert written == 11
+        assert path.read_bytes() == b"hello world"
+
+    def test_read_object_text_decodes_split_characters(self, minio):
+        service, client = minio
+        encoded = "naïve café".encode("utf-8")
+        # Split inside the two-byte "ï"
+        client.get_object.return_value = _response([encoded[:3], encoded[3:]])
+
+        assert service.read_object_text("bucket", "key") == "naïve café"
+
+
+class TestStreamingUploads:
+    """Tests for put_object from file handles."""
+
+    def test_unknown_length_uses_multipart(self, minio):
+        service, client = minio
+        client.put_object.return_value.etag = "etag"
+
+        etag = service.put_object("bucket", "key", BytesIO(b"data"))
+
+        assert etag == "etag"
+        kwargs = client.put_object.call_args.kwargs
+        assert kwargs["length"] == -1
+        assert kwargs["part_size"] == MULTIPART_PART_SIZE
+
+    def test_known_length_keeps_sdk_part_size(self, minio):
+        service, client = minio
+
+        service.put_object("bucket", "key", BytesIO(b"data"), length=4)
+
+        kwargs = client.put_object.call_args.kwargs
+        assert kwargs["length"] == 4
+        assert kwargs["part_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_put_async_stream_hashes_chunks(self, minio):
+        service, client = minio
+        received = {}
+
+        def put_object(**kwargs):
+            received["data"] = kwargs["data"].read(-1)
+            return MagicMock(etag="etag")
+
+        client.put_object.side_effect = put_object
+
+        async def chunks():
+            for part in (b"abc", b"", b"def"):
+                yield part
+
+        upload = await service.put_async_stream("bucket", "key", chunks())
+
+        assert received["data"] == b"abcdef"
+        assert upload.file_size == 6
+        assert upload.file_hash == hashlib.sha256(b"abcdef").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_put_async_stream_aborts_on_source_error(self, minio):
+        service, client = minio
+
+        def put_object(**kwargs):
+            kwargs["data"].read(-1)
+
+        client.put_object.side_effect = put_object
+
+        async def chunks():
+            yield b"partial"
+            raise ConnectionError("source dropped")
+
+        with pytest.raises(ConnectionError):
+            await service.put_async_stream("bucket", "key", chunks())
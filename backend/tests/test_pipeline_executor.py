@@ -3,15 +3,19 @@
 Tests for the PipelineExecutor class.
 
 Tests execute_definition() with mock functions and sessions.
-Covers gather, filter, transform, output stages, error handling, and resume.
+Covers gather, filter, transform, output stages, error handling, resume,
+streaming between per-item stages, and per-item watermarks.
 """
 
+import asyncio
+import json
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from app.cwr.pipelines.runtime.definitions import OnErrorPolicy, PipelineDefinition, StageDefinition, StageType
-from app.cwr.pipelines.runtime.executor import PipelineExecutor
+from app.cwr.pipelines.runtime.executor import PipelineExecutor, _PipelineItem
 from app.cwr.tools import fn
 from app.cwr.tools.base import (
     BaseFunction,
@@ -176,6 +180,8 @@ def _make_pipeline(stages, **kwargs):
             params=s.get("params", {}),
             on_error=OnErrorPolicy(s.get("on_error", "skip")),
             batch_size=s.get("batch_size", 50),
+            batched=s.get("batched", False),
+            concurrency=s.get("concurrency", 1),
         )
         for s in stages
     ]
@@ -465,3 +471,331 @@ class TestPipelineResume:
             assert "gather" not in stage_calls
             # Output should have been called
             assert "output" in stage_calls
+
+
+# =============================================================================
+# STREAMING TESTS
+# =============================================================================
+
+
+@asynccontextmanager
+async def _worker_session():
+    yield MagicMock()
+
+
+def _recording_function(name, handler, batch_param=None):
+    """Build a per-item stage function that delegates to handler(params)."""
+
+    class Recording(BaseFunction):
+        meta = FunctionMeta(
+            name=name,
+            category=FunctionCategory.LOGIC,
+            description="Recording test function",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "item": {"type": "object", "description": "Item"},
+                    "items": {"type": "array", "description": "Batch of items"},
+                },
+                "required": [],
+            },
+            tags=["test"],
+            batch_param=batch_param,
+        )
+
+        async def execute(self, ctx, **params):
+            return await handler(params)
+
+    return Recording()
+
+
+def _functions(**functions):
+    functions.setdefault("test_gather", DummyGatherFunction())
+    functions.setdefault("test_output", DummyOutputFunction())
+    return lambda name: functions.get(name)
+
+
+class TestStreamingStages:
+    """Tests for streaming segments of filter/transform/enrich stages."""
+
+    @pytest.mark.asyncio
+    async def test_items_flow_to_next_stage_before_stage_finishes(self, executor, mock_session, org_id):
+        events = []
+
+        async def keep(params):
+            events.append(f"filter:{params['item']['id']}")
+            await asyncio.sleep(0)
+            return FunctionResult.success_result(data=True)
+
+        async def enrich(params):
+            events.append(f"enrich:{params['item']['id']}")
+            return FunctionResult.success_result(data={"enriched": True})
+
+        with patch.object(fn, "get_or_none", side_effect=_functions(
+            test_filter=_recording_function("test_filter", keep),
+            test_transform=_recording_function("test_transform", enrich),
+        )), patch("app.cwr.pipelines.runtime.executor.database_service.get_session", _worker_session):
+            result = await executor.execute_definition(
+                session=mock_session,
+                organization_id=org_id,
+                definition=_make_pipeline([
+                    {"name": "gather", "type": "gather", "function": "test_gather"},
+                    {"name": "filter", "type": "filter", "function": "test_filter"},
+                    {"name": "enrich", "type": "enrich", "function": "test_transform"},
+                ]),
+            )
+
+        assert result["status"] == "completed"
+        assert events.index("enrich:1") < events.index("filter:3")
+        assert [item["id"] for item in result["final_items"]] == ["1", "2", "3"]
+        assert result["stage_results"]["filter"] == {"status": "success", "processed": 3, "failed": 0, "filtered": 0}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_keeps_item_order(self, executor, mock_session, org_id):
+        state = {"active": 0, "peak": 0}
+
+        async def gather(params):
+            return FunctionResult.success_result(data=[{"id": str(n), "n": n} for n in range(9)])
+
+        async def slow(params):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            # Later items finish first
+            await asyncio.sleep(0.001 * (9 - params["item"]["n"]))
+            state["active"] -= 1
+            return FunctionResult.success_result(data={"double": params["item"]["n"] * 2})
+
+        with patch.object(fn, "get_or_none", side_effect=_functions(
+            test_gather=_recording_function("test_gather", gather),
+            test_transform=_recording_function("test_transform", slow),
+        )), patch("app.cwr.pipelines.runtime.executor.database_service.get_session", _worker_session):
+            result = await executor.execute_definition(
+                session=mock_session,
+                organization_id=org_id,
+                definition=_make_pipeline([
+                    {"name": "gather", "type": "gather", "function": "test_gather"},
+                    {"name": "transform", "type": "transform", "function": "test_transform", "concurrency": 3},
+                ]),
+            )
+
+        assert 1 < state["peak"] <= 3
+        assert [item["double"] for item in result["final_items"]] == [n * 2 for n in range(9)]
+
+    @pytest.mark.asyncio
+    async def test_batch_capable_function_receives_lists(self, executor, mock_session, org_id):
+        batches = []
+
+        async def measure(params):
+            batches.append([item["id"] for item in params["items"]])
+            return FunctionResult.success_result(data=[{"length": len(item["title"])} for item in params["items"]])
+
+        with patch.object(fn, "get_or_none", side_effect=_functions(
+            test_transform=_recording_function("test_transform", measure, batch_param="items"),
+        )):
+            result = await executor.execute_definition(
+                session=mock_session,
+                organization_id=org_id,
+                definition=_make_pipeline([
+                    {"name": "gather", "type": "gather", "function": "test_gather"},
+                    {"name": "measure", "type": "enrich", "function": "test_transform", "batch_size": 2, "batched": True},
+                ]),
+            )
+
+        assert batches == [["1", "2"], ["3"]]
+        assert [item["length"] for item in result["final_items"]] == [6, 6, 6]
+        assert result["stage_results"]["measure"]["processed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_batched_decide_stages_keep_decisions(self, executor, mock_session, org_id):
+        from app.cwr.tools.primitives.llm.decide import DecideFunction
+
+        async def fake_completion(**kwargs):
+            title = kwargs["messages"][1]["content"].split("---")[1].strip()
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = json.dumps(
+                {"decision": title != "Item 2", "confidence": 0.9, "reasoning": f"Checked {title}"}
+            )
+            return response
+
+        llm_service = MagicMock(is_available=True)
+        llm_service.chat_completion = fake_completion
+        decide_params = {"question": "Is it relevant?", "data": "{{ item.title }}"}
+
+        with patch.object(fn, "get_or_none", side_effect=_functions(llm_decide=DecideFunction())), \
+                patch("app.core.llm.llm_service.llm_service", llm_service), \
+                patch("app.cwr.tools.primitives.llm.collection.llm_routing_service") as routing, \
+                patch("app.cwr.tools.primitives.llm.decide.config_loader") as loader:
+            routing.get_max_concurrency = AsyncMock(return_value=2)
+            loader.get_task_type_config.return_value = MagicMock(model="m", temperature=0.1, context_window=None)
+            result = await executor.execute_definition(
+                session=mock_session,
+                organization_id=org_id,
+                definition=_make_pipeline([
+                    {"name": "gather", "type": "gather", "function": "test_gather"},
+                    {"name": "check", "type": "filter", "function": "llm_decide",
+                     "params": decide_params, "batched": True},
+                    {"name": "judge", "type": "enrich", "function": "llm_decide",
+                     "params": decide_params, "batched": True},
+                ]),
+            )
+
+        # Decision entries are the item's result, as in a per-item call: the
+        # filter passes the (truthy) decision dict and enrich merges it
+        assert result["stage_results"]["check"] == {"status": "success", "processed": 3, "failed": 0, "filtered": 0}
+        assert [
+            (item["id"], item["decision"], item["confidence"], item["reasoning"]) for item in result["final_items"]
+        ] == [
+            ("1", True, 0.9, "Checked Item 1"),
+            ("2", False, 0.9, "Checked Item 2"),
+            ("3", True, 0.9, "Checked Item 3"),
+        ]
+        assert all("item_id" not in item and "success" not in item for item in result["final_items"])
+
+    @pytest.mark.asyncio
+    async def test_fail_policy_stops_segment(self, executor, mock_session, org_id):
+        async def fail_second(params):
+            if params["item"]["id"] == "2":
+                return FunctionResult.failed_result(error="Bad item")
+            return FunctionResult.success_result(data={})
+
+        with patch.object(fn, "get_or_none", side_effect=_functions(
+            test_fail_transform=_recording_function("test_fail_transform", fail_second),
+            test_transform=DummyTransformFunction(),
+        )), patch("app.cwr.pipelines.runtime.executor.database_service.get_session", _worker_session):
+            result = await executor.execute_definition(
+                session=mock_session,
+                organization_id=org_id,
+                definition=_make_pipeline(
+                    [
+                        {"name": "gather", "type": "gather", "function": "test_gather"},
+                        {"name": "check", "type": "transform", "function": "test_fail_transform", "on_error": "fail"},
+                        {"name": "enrich", "type": "enrich", "function": "test_transform"},
+                        {"name": "output", "type": "output", "function": "test_output"},
+                    ],
+                    on_error=OnErrorPolicy.FAIL,
+                ),
+            )
+
+        assert result["status"] == "partial"
+        assert result["stage_results"]["check"]["status"] == "failed"
+        assert result["stage_results"]["check"]["error"] == "Bad item"
+        assert result["stage_results"]["enrich"]["status"] == "failed"
+        assert "output" not in result["stage_results"]
+
+
+class TestItemWatermarks:
+    """Tests for per-item watermarks and resuming from them."""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_finished_items(self, executor, mock_session, org_id):
+        calls = []
+        written = {}
+
+        async def keep(params):
+            calls.append(f"filter:{params['item']['id']}")
+            return FunctionResult.success_result(data=True)
+
+        async def enrich(params):
+            calls.append(f"enrich:{params['item']['id']}")
+            return FunctionResult.success_result(data={"enriched": True})
+
+        async def write_item_states(pipeline_run_id, items):
+            for item in items:
+                written[item.data["id"]] = (item.stage_idx, item.status)
+
+        # Item 1 was enriched before the interruption, item 3 only gathered
+        resumed = [
+            _PipelineItem(seq=0, data={"id": "1", "enriched": True}, stage_idx=2, persisted=True),
+            _PipelineItem(seq=2, data={"id": "3"}, stage_idx=0, persisted=True),
+        ]
+        pipeline_run = MagicMock()
+        mock_session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=pipeline_run)))
+
+        with patch.object(fn, "get_or_none", side_effect=_functions(
+            test_filter=_recording_function("test_filter", keep),
+            test_transform=_recording_function("test_transform", enrich),
+        )), patch.object(executor, "_load_item_states", AsyncMock(return_value=resumed)), \
+                patch.object(executor, "_write_item_states", side_effect=write_item_states), \
+                patch("app.cwr.pipelines.runtime.executor.database_service.get_session", _worker_session):
+            result = await executor.execute_definition(
+                session=mock_session,
+                organization_id=org_id,
+                definition=_make_pipeline(
+                    [
+                        {"name": "gather", "type": "gather", "function": "test_gather"},
+                        {"name": "filter", "type": "filter", "function": "test_filter"},
+                        {"name": "enrich", "type": "enrich", "function": "test_transform"},
+                        {"name": "output", "type": "output", "function": "test_output"},
+                    ],
+                    checkpoint_after_stages=["enrich"],
+                ),
+                pipeline_run_id=uuid4(),
+                resume_from_stage=1,
+            )
+
+        assert calls == ["filter:3", "enrich:3"]
+        assert result["stage_results"]["enrich"]["resumed"] == 1
+        assert [item["id"] for item in result["stage_results"]["output"]["items"]] == ["1", "3"]
+        assert all(item["enriched"] for item in result["final_items"])
+        assert written == {"3": (2, "completed")}
+        assert pipeline_run.current_stage == 3
+        assert pipeline_run.checkpoint_data["item_watermarks"] == {"2": 2}
+
+    @pytest.mark.asyncio
+    async def test_gathered_items_recorded_before_checkpoint(self, executor, mock_session, org_id):
+        events = []
+
+        async def enrich(params):
+            events.append(f"enrich:{params['item']['id']}")
+            return FunctionResult.success_result(data={"enriched": True})
+
+        async def write_item_states(pipeline_run_id, items):
+            events.append(sorted((item.data["id"], item.stage_idx, item.status) for item in items))
+
+        pipeline_run = MagicMock()
+        mock_session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=pipeline_run)))
+
+        with patch.object(fn, "get_or_none", side_effect=_functions(
+            test_transform=_recording_function("test_transform", enrich),
+        )), patch.object(executor, "_write_item_states", side_effect=write_item_states):
+            await executor.execute_definition(
+                session=mock_session,
+                organization_id=org_id,
+                definition=_make_pipeline(
+                    [
+                        {"name": "gather", "type": "gather", "function": "test_gather"},
+                        {"name": "enrich", "type": "enrich", "function": "test_transform"},
+                    ],
+                    checkpoint_after_stages=["gather"],
+                ),
+                pipeline_run_id=uuid4(),
+            )
+
+        # All gathered items are stored at the gather watermark before any is enriched
+        assert events[0] == [("1", 0, "processing"), ("2", 0, "processing"), ("3", 0, "processing")]
+        assert events[1] == "enrich:1"
+        assert pipeline_run.checkpoint_data["item_watermarks"] == {"0": 3}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_not_advanced_when_watermarks_unsaved(self, executor, mock_session, org_id):
+        pipeline_run = MagicMock(current_stage=0, checkpoint_data=None)
+        mock_session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=pipeline_run)))
+
+        with patch.object(fn, "get_or_none", side_effect=_functions()), \
+                patch.object(executor, "_write_item_states", AsyncMock(side_effect=RuntimeError("db down"))):
+            await executor.execute_definition(
+                session=mock_session,
+                organization_id=org_id,
+                definition=_make_pipeline(
+                    [
+                        {"name": "gather", "type": "gather", "function": "test_gather"},
+                        {"name": "output", "type": "output", "function": "test_output"},
+                    ],
+                    checkpoint_after_stages=["gather"],
+                ),
+                pipeline_run_id=uuid4(),
+            )
+
+        assert pipeline_run.current_stage == 0
+        assert pipeline_run.checkpoint_data is None
@@ -3,9 +3,13 @@
 Tests for the ProcedureExecutor class.
 
 Tests execute_definition() with mock FunctionContext and mock functions.
-Covers basic execution, error handling, flow control, and dry run.
+Covers basic execution, error handling, flow control, dry run, and
+concurrent/batched legacy foreach steps.
 """
 
+import asyncio
+import json
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -997,3 +1001,207 @@ class TestObservability:
                 assert "side_effects" in ctx
                 assert ctx["side_effects"] is True
                 assert "duration_ms" in ctx
+
+
+# =============================================================================
+# LEGACY FOREACH TESTS
+# =============================================================================
+
+
+def _item_function(handler, batch_param=None):
+    """Build a function whose execute() delegates to handler(ctx, params)."""
+
+    class ItemFunction(BaseFunction):
+        meta = FunctionMeta(
+            name="test_item",
+            category=FunctionCategory.LLM,
+            description="Test item function",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "n": {"type": "integer"},
+                    "prompt": {"type": "string"},
+                    "topic": {"type": "string"},
+                    "items": {"type": "array"},
+                },
+            },
+            batch_param=batch_param,
+        )
+
+        async def execute(self, ctx, **params):
+            return await handler(ctx, params)
+
+    return ItemFunction()
+
+
+@asynccontextmanager
+async def _worker_session():
+    yield MagicMock()
+
+
+class TestLegacyForeach:
+    """Tests for foreach steps with concurrency, batch_size and max_failures."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_items_keep_order(self, executor, mock_session):
+        state = {"active": 0, "peak": 0}
+
+        async def handler(ctx, params):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            # Later items finish first
+            await asyncio.sleep(0.001 * (10 - params["n"]))
+            state["active"] -= 1
+            assert ctx.session is not mock_session
+            return FunctionResult.success_result(data=params["n"] * 10)
+
+        ctx = FunctionContext(session=mock_session, params={"items": [{"id": f"i{n}", "n": n} for n in range(10)]})
+        step = StepDefinition(
+            name="each", function="test_item", params={"n": "{{ item.n }}"},
+            foreach="{{ params.items }}", concurrency=3,
+        )
+
+        with patch("app.cwr.procedures.runtime.executor.database_service.get_session", _worker_session):
+            result = await executor._execute_step_foreach(ctx, step, _item_function(handler))
+
+        assert result["status"] == "success"
+        assert [entry["result"] for entry in result["data"]] == [n * 10 for n in range(10)]
+        assert [entry["item_id"] for entry in result["data"]] == [f"i{n}" for n in range(10)]
+        assert 1 < state["peak"] <= 3
+
+    @pytest.mark.asyncio
+    async def test_failure_threshold_stops_scheduling(self, executor, mock_session):
+        calls = []
+
+        async def handler(ctx, params):
+            calls.append(params["n"])
+            if params["n"] % 2:
+                return FunctionResult.failed_result(error=f"bad {params['n']}")
+            return FunctionResult.success_result(data=params["n"])
+
+        ctx = FunctionContext(session=mock_session, params={"items": list(range(10))})
+        step = StepDefinition(
+            name="each", function="test_item", params={"n": "{{ item }}"},
+            foreach="{{ params.items }}", max_failures=2,
+        )
+
+        result = await executor._execute_step_foreach(ctx, step, _item_function(handler))
+
+        assert calls == [0, 1, 2, 3]
+        assert result["status"] == "failed"
+        assert result["items_failed"] == 2
+        assert len(result["data"]) == 10
+        assert result["data"][1]["error"] == "bad 1"
+        assert all(entry["skipped"] for entry in result["data"][4:])
+
+    @pytest.mark.asyncio
+    async def test_batch_capable_function_gets_batches(self, executor, mock_session):
+        calls = []
+
+        async def handler(ctx, params):
+            calls.append(params)
+            return FunctionResult.success_result(data=[
+                {"item_id": item["id"], "result": params["prompt"].replace("{{ item.id }}", item["id"]), "success": True}
+                for item in params["items"]
+            ])
+
+        items = [{"id": f"a{n}"} for n in range(5)]
+        ctx = FunctionContext(session=mock_session, params={"items": items, "topic": "cats"})
+        step = StepDefinition(
+            name="each", function="test_item",
+            params={"prompt": "About {{ item.id }}", "topic": "{{ params.topic }}"},
+            foreach="{{ params.items }}", batch_size=2,
+        )
+
+        result = await executor._execute_step_foreach(ctx, step, _item_function(handler, batch_param="items"))
+
+        assert [len(call["items"]) for call in calls] == [2, 2, 1]
+        # Item templates are left for the function; everything else is rendered
+        assert calls[0]["prompt"] == "About {{ item.id }}"
+        assert calls[0]["topic"] == "cats"
+        assert [entry["result"] for entry in result["data"]] == [f"About a{n}" for n in range(5)]
+        assert result["status"] == "success"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("module, params, answer", [
+        (
+            "decide",
+            {"question": "Is it urgent?", "data": "{{ item.text }}"},
+            lambda text: {"decision": "urgent" in text, "confidence": 0.9, "reasoning": f"Read {text}"},
+        ),
+        (
+            "route",
+            {"data": "{{ item.text }}", "routes": [{"name": "fast"}, {"name": "slow"}]},
+            lambda text: {"route": "fast" if "urgent" in text else "slow", "confidence": 0.9, "reasoning": f"Read {text}"},
+        ),
+    ])
+    async def test_batched_llm_primitive_matches_per_item_results(self, executor, mock_session, module, params, answer):
+        from app.cwr.tools.primitives.llm.decide import DecideFunction
+        from app.cwr.tools.primitives.llm.route import RouteFunction
+
+        async def fake_completion(**kwargs):
+            text = kwargs["messages"][1]["content"].split("---")[1].strip()
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = json.dumps(answer(text))
+            return response
+
+        llm_service = MagicMock(is_available=True)
+        llm_service.chat_completion = fake_completion
+        func = {"decide": DecideFunction, "route": RouteFunction}[module]()
+        items = [{"id": f"m{n}", "text": text} for n, text in enumerate(["urgent fix", "weekly report", "urgent call"])]
+
+        async def run(batch_size):
+            ctx = FunctionContext(session=mock_session, params={"items": items})
+            step = StepDefinition(
+                name="each", function=func.meta.name, params=params,
+                foreach="{{ params.items }}", batch_size=batch_size,
+            )
+            return await executor._execute_step_foreach(ctx, step, func)
+
+        with patch("app.core.llm.llm_service.llm_service", llm_service), \
+                patch("app.cwr.tools.primitives.llm.collection.llm_routing_service") as routing, \
+                patch(f"app.cwr.tools.primitives.llm.{module}.config_loader") as loader:
+            routing.get_max_concurrency = AsyncMock(return_value=2)
+            loader.get_task_type_config.return_value = MagicMock(model="m", temperature=0.1, context_window=None)
+            per_item, batched = await run(None), await run(2)
+
+        assert batched["status"] == per_item["status"] == "success"
+        assert [entry["result"] for entry in batched["data"]] == [entry["result"] for entry in per_item["data"]]
+        assert [entry["result"]["reasoning"] for entry in batched["data"]] == [
+            "Read urgent fix", "Read weekly report", "Read urgent call",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_misaligned_batch_result_fails_batch(self, executor, mock_session):
+        async def handler(ctx, params):
+            return FunctionResult.success_result(data=["only one"])
+
+        ctx = FunctionContext(session=mock_session, params={"items": [1, 2]})
+        step = StepDefinition(
+            name="each", function="test_item", params={}, foreach="{{ params.items }}", batch_size=2,
+        )
+
+        result = await executor._execute_step_foreach(ctx, step, _item_function(handler, batch_param="items"))
+
+        assert result["status"] == "failed"
+        assert "batch of 2" in result["data"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_progress_events_replace_per_item_events(self, executor, mock_session):
+        async def handler(ctx, params):
+            return FunctionResult.success_result(data=params["n"])
+
+        ctx = FunctionContext(session=mock_session, params={"items": list(range(200))})
+        step = StepDefinition(
+            name="each", function="test_item", params={"n": "{{ item }}"}, foreach="{{ params.items }}",
+        )
+
+        with patch.object(FunctionContext, "log_run_event", new_callable=AsyncMock) as mock_log:
+            result = await executor._execute_step_foreach(ctx, step, _item_function(handler))
+
+        event_types = [call.kwargs["event_type"] for call in mock_log.call_args_list]
+        assert result["items_processed"] == 200
+        assert event_types.count("step_start") == 1
+        assert event_types.count("step_complete") == 1
+        assert 1 < event_types.count("progress") <= 10
@@ -136,6 +136,28 @@ class TestSchemaValidation:
             result = validator.validate(definition)
             assert result.valid, f"Policy '{policy}' should be valid"
 
+    def test_foreach_execution_options(self, validator):
+        step = {
+            "name": "step_one",
+            "function": "llm_generate",
+            "params": {"prompt": "About {{ item.title }}"},
+            "foreach": "{{ params.items }}",
+            "concurrency": 4,
+            "batch_size": 20,
+            "max_failures": 5,
+        }
+        parameters = [{"name": "items", "type": "list"}]
+        assert validator.validate(_minimal_procedure(parameters=parameters, steps=[step])).valid
+
+        result = validator.validate(_minimal_procedure(
+            parameters=parameters,
+            steps=[{**step, "concurrency": 0, "batch_size": "20"}],
+        ))
+        assert not result.valid
+        assert {e.path for e in result.errors if e.code == ValidationErrorCode.INVALID_FIELD_TYPE} == {
+            "steps[0].concurrency", "steps[0].batch_size",
+        }
+
 
 # =============================================================================
 # FUNCTION VALIDATION TESTS
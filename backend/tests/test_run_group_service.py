@@ -0,0 +1,177 @@
+# backend/tests/test_run_group_service.py
+"""
+Tests for atomic run-group child accounting.
+
+Runs the RunGroupService statements against a SQLite database holding the
+columns they touch, so counter increments and the completion transition
+are exercised for real.
+
+Covers:
+- Counting children registered, completed and failed
+- No completion before the parent finalizes the group
+- Completion (and its event) firing exactly once
+- Concurrent child completions without lost updates
+- Counting a child once when it is reported more than once
+"""
+
+import asyncio
+import sqlite3
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.shared.run_group_service import run_group_service
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    db_path = tmp_path / "groups.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE run_groups (
+                id CHAR(36) PRIMARY KEY, organization_id CHAR(36), group_type TEXT,
+                parent_run_id CHAR(36), status TEXT,
+                total_children INT DEFAULT 0, completed_children INT DEFAULT 0,
+                failed_children INT DEFAULT 0, config TEXT DEFAULT '{}',
+                results_summary TEXT, created_at TIMESTAMP, started_at TIMESTAMP,
+                finalized_at TIMESTAMP, completed_at TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "CREATE TABLE runs (id CHAR(36) PRIMARY KEY, group_id CHAR(36), "
+            "group_result_recorded_at TIMESTAMP)"
+        )
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def _create_group(session_factory, child_count):
+    group_id = uuid.uuid4()
+    children = [uuid.uuid4() for _ in range(child_count)]
+    async with session_factory() as session:
+        await session.execute(
+            text(
+                "INSERT INTO run_groups (id, organization_id, group_type, status, created_at) "
+                "VALUES (:id, :org, 'sam_pull', 'pending', CURRENT_TIMESTAMP)"
+            ),
+            {"id": str(group_id), "org": str(uuid.uuid4())},
+        )
+        for child_id in children:
+            await session.execute(
+                text("INSERT INTO runs (id, group_id) VALUES (:id, :group_id)"),
+                {"id": str(child_id), "group_id": str(group_id)},
+            )
+        await run_group_service.register_children(session, group_id, child_count)
+        await session.commit()
+    return group_id, children
+
+
+async def _group_row(session_factory, group_id):
+    async with session_factory() as session:
+        result = await session.execute(
+            text(
+                "SELECT status, total_children, completed_children, failed_children "
+                "FROM run_groups WHERE id = :id"
+            ),
+            {"id": str(group_id)},
+        )
+        return tuple(result.one())
+
+
+async def _group_counts(session, group_id):
+    result = await session.execute(
+        text("SELECT completed_children, failed_children FROM run_groups WHERE id = :id"),
+        {"id": str(group_id)},
+    )
+    return tuple(result.one())
+
+
+class TestRunGroupAccounting:
+    """Tests for counters and the completion transition."""
+
+    @pytest.mark.asyncio
+    async def test_completes_once_after_finalize(self, sessions):
+        group_id, children = await _create_group(sessions, 3)
+
+        with patch.object(run_group_service, "_emit_group_event", AsyncMock()) as emit:
+            async with sessions() as session:
+                assert await run_group_service.child_completed(session, children[0]) is None
+                assert await run_group_service.finalize_group(session, group_id) is None
+                assert await run_group_service.child_failed(session, children[1]) is None
+                group = await run_group_service.child_completed(session, children[2])
+                # Finalizing again does not complete the group a second time
+                assert await run_group_service.finalize_group(session, group_id) is None
+                await session.commit()
+
+        assert group.status == "partial"
+        assert group.results_summary["completed_children"] == 2
+        assert emit.await_count == 1
+        assert await _group_row(sessions, group_id) == ("partial", 3, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_no_completion_before_finalize(self, sessions):
+        group_id, children = await _create_group(sessions, 1)
+
+        with patch.object(run_group_service, "_emit_group_event", AsyncMock()) as emit:
+            async with sessions() as session:
+                assert await run_group_service.child_completed(session, children[0]) is None
+                await session.commit()
+                group = await run_group_service.finalize_group(session, group_id)
+                await session.commit()
+
+        assert group.status == "completed"
+        assert emit.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_group_completes_on_finalize(self, sessions):
+        group_id, _ = await _create_group(sessions, 0)
+
+        with patch.object(run_group_service, "_emit_group_event", AsyncMock()):
+            async with sessions() as session:
+                group = await run_group_service.finalize_group(session, group_id)
+                await session.commit()
+
+        assert group.status == "completed"
+        assert group.results_summary["message"] == "No children to process"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_children_are_all_counted(self, sessions):
+        group_id, children = await _create_group(sessions, 20)
+        async with sessions() as session:
+            await run_group_service.finalize_group(session, group_id)
+            await session.commit()
+
+        async def complete(child_id):
+            async with sessions() as session:
+                group = await run_group_service.child_completed(session, child_id)
+                await session.commit()
+                return group
+
+        with patch.object(run_group_service, "_emit_group_event", AsyncMock()) as emit:
+            results = await asyncio.gather(*(complete(c) for c in children))
+
+        assert sum(1 for group in results if group is not None) == 1
+        assert emit.await_count == 1
+        assert await _group_row(sessions, group_id) == ("completed", 20, 20, 0)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_child_completing_later_counts_once(self, sessions):
+        group_id, children = await _create_group(sessions, 2)
+
+        with patch.object(run_group_service, "_emit_group_event", AsyncMock()) as emit:
+            async with sessions() as session:
+                await run_group_service.finalize_group(session, group_id)
+                # Timeout sweep fails the stalled child; its worker finishes later
+                assert await run_group_service.child_failed(session, children[0]) is None
+                assert await run_group_service.child_completed(session, children[0]) is None
+                assert await _group_counts(session, group_id) == (0, 1)
+                group = await run_group_service.child_completed(session, children[1])
+                await session.commit()
+
+        assert group.status == "partial"
+        assert emit.await_count == 1
+        assert await _group_row(sessions, group_id) == ("partial", 2, 1, 1)
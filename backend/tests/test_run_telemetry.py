@@ -0,0 +1,313 @@
+# backend/tests/test_run_telemetry.py
+"""
+Tests for the write-behind run telemetry buffer.
+
+Uses mocked database sessions and a mocked Redis client, so no services
+are required.
+
+Covers:
+- log_event buffering instead of committing the caller's session
+- Batched event inserts and per-run progress coalescing
+- Re-buffering writes when a flush fails
+- Skipping locked runs and holding events of runs not visible yet
+- Journaling events to the Redis stream in pipelined batches
+- Replaying events stranded in the Redis stream
+"""
+
+import itertools
+import json
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.database.models import RunLogEvent
+from app.core.shared.run_log_service import RunLogService
+from app.core.shared.run_service import RunService
+from app.core.shared.run_telemetry import (
+    FLUSH_MAX_EVENTS,
+    TELEMETRY_STREAM,
+    UNSEEN_RUN_GRACE_SECONDS,
+    RunTelemetryBuffer,
+    _event_row,
+)
+
+
+def _event(run_id, message="hello"):
+    return RunLogEvent(
+        id=uuid.uuid4(),
+        run_id=run_id,
+        level="INFO",
+        event_type="progress",
+        message=message,
+        context={"n": 1},
+        created_at=datetime.utcnow(),
+    )
+
+
+def _db_session(existing_run_ids=(), locked_run_ids=()):
+    """A session whose run id SELECTs see existing_run_ids, minus locked ones under SKIP LOCKED."""
+
+    async def execute(statement, *args):
+        visible = list(existing_run_ids)
+        if getattr(statement, "is_select", False):
+            compiled = statement.compile(dialect=postgresql.dialect())
+            wanted = {value for values in compiled.params.values() for value in values}
+            skip = set(locked_run_ids) if "SKIP LOCKED" in str(compiled) else set()
+            visible = [run_id for run_id in existing_run_ids if run_id in wanted and run_id not in skip]
+        return MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=visible))))
+
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=execute)
+
+    @asynccontextmanager
+    async def get_session():
+        yield session
+
+    return session, get_session
+
+
+class _Pipeline:
+    """Records pipelined XADDs and assigns sequential entry ids."""
+
+    def __init__(self):
+        self.ids = (f"{n}-0" for n in itertools.count(1))
+        self.queued = 0
+        self.executions = []
+
+    def xadd(self, *args, **kwargs):
+        self.queued += 1
+
+    def execute(self):
+        count, self.queued = self.queued, 0
+        self.executions.append((count, threading.get_ident()))
+        return [next(self.ids) for _ in range(count)]
+
+
+@pytest.fixture
+def stream():
+    """A buffer whose Redis stream client is mocked."""
+    client = MagicMock()
+    client.pipeline.return_value = _Pipeline()
+    buffer = RunTelemetryBuffer()
+    with patch.object(buffer, "_stream_client", return_value=client):
+        yield buffer, client
+
+
+class TestLogEvent:
+    """Tests for RunLogService.log_event with the buffer."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_buffered_not_committed(self, stream):
+        buffer, client = stream
+        run_id = uuid.uuid4()
+        org_id = uuid.uuid4()
+        session = MagicMock()
+        session.commit = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=org_id)))
+        service = RunLogService()
+
+        with patch("app.core.shared.run_log_service.run_telemetry", buffer), \
+                patch.object(service, "_publish_log_event") as publish:
+            first = await service.log_event(session, run_id, "INFO", "start", "Started")
+            await service.log_event(session, run_id, "INFO", "progress", "Halfway")
+
+        session.commit.assert_not_called()
+        # The organization is looked up once per run
+        assert session.execute.await_count == 1
+        assert publish.call_count == 2
+        assert publish.call_args.kwargs["organization_id"] == org_id
+        assert first.id is not None and first.created_at is not None
+        assert [event.row["message"] for event in buffer._events] == ["Started", "Halfway"]
+        # Nothing touches Redis until the flusher journals the batch
+        client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_does_not_flush_inline(self, stream):
+        buffer, _ = stream
+        run_id = uuid.uuid4()
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None)))
+        service = RunLogService()
+
+        with patch("app.core.shared.run_log_service.run_telemetry", buffer), \
+                patch.object(buffer, "flush", AsyncMock()) as flush:
+            for n in range(FLUSH_MAX_EVENTS + 1):
+                await service.log_event(session, run_id, "INFO", "progress", f"e{n}")
+
+        # The caller may hold locks the flush needs; only the flusher flushes
+        flush.assert_not_awaited()
+        assert buffer.should_flush()
+
+    @pytest.mark.asyncio
+    async def test_journal_pipelines_batch_off_loop(self, stream):
+        buffer, client = stream
+        for n in range(3):
+            buffer.add_event(_event(uuid.uuid4(), f"e{n}"))
+
+        await buffer.journal()
+        await buffer.journal()
+
+        pipeline = client.pipeline.return_value
+        assert len(pipeline.executions) == 1
+        count, thread = pipeline.executions[0]
+        assert count == 3 and thread != threading.get_ident()
+        assert [event.entry_id for event in buffer._events] == ["1-0", "2-0", "3-0"]
+
+    @pytest.mark.asyncio
+    async def test_progress_is_buffered(self, stream):
+        buffer, _ = stream
+        run_id = uuid.uuid4()
+        session = MagicMock()
+        session.commit = AsyncMock()
+
+        with patch("app.core.shared.run_service.run_telemetry", buffer):
+            await RunService().update_run_progress(session, run_id, current=5, total=10, unit="files", phase="scan")
+
+        session.commit.assert_not_called()
+        assert buffer._progress[run_id] == {"current": 5, "total": 10, "unit": "files", "percent": 50, "phase": "scan"}
+
+
+class TestFlush:
+    """Tests for RunTelemetryBuffer.flush."""
+
+    @pytest.mark.asyncio
+    async def test_flush_batches_events_and_coalesces_progress(self, stream):
+        buffer, client = stream
+        run_a, run_b = uuid.uuid4(), uuid.uuid4()
+        for n in range(3):
+            buffer.add_event(_event(run_a, f"a{n}"))
+            buffer.set_progress(run_a, {"current": n})
+        buffer.set_progress(run_b, {"current": 7})
+        await buffer.journal()
+        buffer.add_event(_event(run_a, "a3"))
+        session, get_session = _db_session(existing_run_ids=[run_a, run_b])
+
+        with patch("app.core.shared.database_service.database_service.get_session", get_session), \
+                patch.object(buffer, "_insert_events", AsyncMock()) as insert_events, \
+                patch.object(buffer, "_publish_progress", AsyncMock()) as publish:
+            await buffer.flush()
+
+        rows = insert_events.await_args.args[1]
+        assert [row["message"] for row in rows] == ["a0", "a1", "a2", "a3"]
+        # One executemany for progress, with only the latest value per run
+        progress_rows = next(call.args[1] for call in session.execute.await_args_list if len(call.args) > 1)
+        assert {row["b_id"]: row["b_progress"] for row in progress_rows} == {run_a: {"current": 2}, run_b: {"current": 7}}
+        # The unjournaled event was inserted directly and never journaled
+        client.xdel.assert_called_once_with(TELEMETRY_STREAM, "1-0", "2-0", "3-0")
+        assert sorted(publish.await_args.args[0], key=str) == sorted([run_a, run_b], key=str)
+        assert not buffer.has_pending() and not buffer._unjournaled
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_writes(self, stream):
+        buffer, client = stream
+        run_id = uuid.uuid4()
+        buffer.add_event(_event(run_id))
+        buffer.set_progress(run_id, {"current": 1})
+
+        @asynccontextmanager
+        async def broken_session():
+            raise ConnectionError("database down")
+            yield
+
+        with patch("app.core.shared.database_service.database_service.get_session", broken_session):
+            await buffer.flush()
+
+        assert len(buffer._events) == 1
+        assert buffer._progress == {run_id: {"current": 1}}
+        client.xdel.assert_not_called()
+        # Kept events are journaled on the next tick
+        assert buffer._unjournaled == buffer._events
+
+    @pytest.mark.asyncio
+    async def test_locked_runs_are_skipped_and_retried(self, stream):
+        buffer, _ = stream
+        free, locked = uuid.uuid4(), uuid.uuid4()
+        buffer.set_progress(free, {"current": 1})
+        buffer.set_progress(locked, {"current": 2})
+        session, get_session = _db_session(existing_run_ids=[free, locked], locked_run_ids=[locked])
+
+        with patch("app.core.shared.database_service.database_service.get_session", get_session), \
+                patch.object(buffer, "_publish_progress", AsyncMock()) as publish:
+            assert await buffer.flush() is True
+
+        statements = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert statements[0].startswith("SET LOCAL lock_timeout")
+        progress_rows = next(call.args[1] for call in session.execute.await_args_list if len(call.args) > 1)
+        assert [row["b_id"] for row in progress_rows] == [free]
+        publish.assert_awaited_once_with([free])
+        # The locked run's progress waits for the next flush
+        assert buffer._progress == {locked: {"current": 2}}
+
+    @pytest.mark.asyncio
+    async def test_events_of_uncommitted_runs_are_held(self, stream):
+        buffer, client = stream
+        live, pending = uuid.uuid4(), uuid.uuid4()
+        stale = _event(uuid.uuid4(), "stale")
+        stale.created_at = datetime.utcnow() - timedelta(seconds=UNSEEN_RUN_GRACE_SECONDS + 1)
+        for event in (_event(live, "live"), _event(pending, "pending"), stale):
+            buffer.add_event(event)
+        await buffer.journal()
+        _, get_session = _db_session(existing_run_ids=[live])
+
+        with patch("app.core.shared.database_service.database_service.get_session", get_session), \
+                patch.object(buffer, "_publish_progress", AsyncMock()):
+            await buffer.flush()
+
+        # The pending run's event stays buffered (and journaled); the event
+        # of a run missing for longer than the grace period is dropped
+        assert [event.row["message"] for event in buffer._events] == ["pending"]
+        assert buffer._unjournaled == []
+        client.xdel.assert_called_once_with(TELEMETRY_STREAM, "1-0", "3-0")
+
+    @pytest.mark.asyncio
+    async def test_insert_skips_duplicates_and_deleted_runs(self):
+        live, deleted = uuid.uuid4(), uuid.uuid4()
+        session, _ = _db_session(existing_run_ids=[live])
+        rows = [_event_row(_event(run)) for run in (live, deleted)]
+
+        assert await RunTelemetryBuffer._insert_events(session, rows) == {deleted}
+
+        statement = session.execute.await_args_list[1].args[0]
+        compiled = statement.compile(dialect=postgresql.dialect())
+        assert "ON CONFLICT (id) DO NOTHING" in str(compiled)
+        assert live in compiled.params.values()
+        assert deleted not in compiled.params.values()
+
+
+class TestRecover:
+    """Tests for RunTelemetryBuffer.recover."""
+
+    @pytest.mark.asyncio
+    async def test_stranded_entries_are_inserted_and_removed(self, stream):
+        buffer, client = stream
+        run_id = uuid.uuid4()
+        event = _event(run_id, "stranded")
+        entry = json.dumps({
+            "id": str(event.id),
+            "run_id": str(run_id),
+            "level": "INFO",
+            "event_type": "progress",
+            "message": "stranded",
+            "context": None,
+            "created_at": event.created_at.isoformat(),
+        })
+        client.xrange.side_effect = [[("5-0", {"event": entry}), ("6-0", {"bad": "entry"})], []]
+        _, get_session = _db_session()
+
+        with patch("app.core.shared.database_service.database_service.get_session", get_session), \
+                patch.object(buffer, "_insert_events", AsyncMock()) as insert_events:
+            recovered = await buffer.recover(min_age_seconds=60)
+
+        assert recovered == 2
+        [row] = insert_events.await_args.args[1]
+        assert row["id"] == event.id and row["run_id"] == run_id
+        client.xdel.assert_called_once_with(TELEMETRY_STREAM, "5-0", "6-0")
+        # Only entries older than the minimum age are read
+        max_id = int(client.xrange.call_args_list[0].args[2])
+        assert max_id <= (time.time() - 60) * 1000
@@ -274,24 +274,31 @@ class TestEmbeddingServiceWithMocks:
     @pytest.mark.asyncio
     async def test_get_embedding_success(self, mock_get_client, mock_get_config, embedding_service):
         """Test successful embedding generation."""
+        from unittest.mock import AsyncMock
+
+        from app.core.search.embedding_service import AdaptiveConcurrencyLimiter
+
         # Mock config
         mock_config = MagicMock()
         mock_config.api_key = "test-key"
         mock_config.base_url = "https://api.openai.com/v1"
         mock_get_config.return_value = mock_config
 
-        # Mock client
+        # Mock async client
         mock_embedding = [0.1] * 1536
         mock_response = MagicMock()
         mock_response.data = [MagicMock(embedding=mock_embedding)]
         mock_client = MagicMock()
-        mock_client.embeddings.create.return_value = mock_response
+        mock_client.embeddings.create = AsyncMock(return_value=mock_response)
         mock_get_client.return_value = mock_client
+        embedding_service._limiter = AdaptiveConcurrencyLimiter()
 
-        result = await embedding_service.get_embedding("Test text")
+        with patch("app.core.search.embedding_service.embedding_cache") as mock_cache:
+            mock_cache.enabled = False
+            result = await embedding_service.get_embedding("Test text")
 
-        # Should attempt to generate embedding
-        assert mock_get_client.called or mock_get_config.called
+        assert mock_get_client.called
+        assert result == mock_embedding
 
     @patch.object(EmbeddingService, '_get_config')
     @pytest.mark.asyncio
@@ -309,6 +316,795 @@ class TestEmbeddingServiceWithMocks:
             pass
 
 
+    def test_client_closed_when_task_loop_ends(self, embedding_service):
+        """Each task loop's client is closed when asyncio.run() finishes."""
+        import asyncio
+
+        config = MagicMock(api_key="test-key", base_url=None, timeout=5, verify_ssl=True)
+
+        async def task():
+            client = embedding_service._get_client()
+            await asyncio.sleep(0)
+            return client
+
+        with patch.object(EmbeddingService, "_get_config", return_value=config):
+            first = asyncio.run(task())
+            second = asyncio.run(task())
+
+        assert first is not second
+        assert first.is_closed() and second.is_closed()
+
+
+class TestEmbeddingConcurrency:
+    """Tests for token-sized batching and AIMD concurrency control."""
+
+    def test_token_batches_respect_token_budget(self):
+        """Batches are split when the token budget would be exceeded."""
+        from app.core.search import embedding_service as module
+
+        service = EmbeddingService()
+        texts = ["a", "b", "c", "d", "e"]
+        with patch.object(module, "MAX_BATCH_TOKENS", 20), \
+                patch.object(module.document_chunker, "count_tokens", return_value=8):
+            batches = service._token_batches(texts)
+
+        assert batches == [(0, ["a", "b"]), (2, ["c", "d"]), (4, ["e"])]
+
+    @pytest.mark.asyncio
+    async def test_limiter_increases_on_success(self):
+        """Successful requests grow the concurrency limit additively."""
+        from app.core.search.embedding_service import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=8)
+        for _ in range(4):
+            started = await limiter.acquire()
+            await limiter.release(started)
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_limiter_halves_once_per_congestion_event(self):
+        """A burst of 429s from requests already in flight halves the limit once."""
+        from app.core.search.embedding_service import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=8)
+        starts = [await limiter.acquire() for _ in range(4)]
+        for started in starts:
+            await limiter.release(started, rate_limited=True)
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_preserves_order(self):
+        """Concurrent batches are reassembled in input order."""
+        from unittest.mock import AsyncMock
+
+        service = EmbeddingService()
+        service._token_batches = MagicMock(return_value=[(0, ["a", "b"]), (2, ["c"])])
+        service._embed_batch = AsyncMock(
+            side_effect=lambda batch: [[float(ord(t))] for t in batch]
+        )
+
+        result = await service._embed_texts(["a", "b", "c"])
+        assert result == [[97.0], [98.0], [99.0]]
+
+
+# =============================================================================
+# Embedding Cache Tests
+# =============================================================================
+
+
+class TestEmbeddingCache:
+    """Tests for the content-hash embedding cache."""
+
+    @pytest.fixture
+    def cache(self):
+        from unittest.mock import AsyncMock
+
+        from app.core.search.embedding_cache import EmbeddingCache
+
+        cache = EmbeddingCache()
+        cache._get_redis = AsyncMock(return_value=None)  # local tier only
+        return cache
+
+    def test_key_includes_model_and_dimensions(self, cache):
+        """Keys differ by model and dimensions for the same text."""
+        a = cache.make_key("text-embedding-3-small", 1536, "hello")
+        assert a == cache.make_key("text-embedding-3-small", 1536, "hello")
+        assert a != cache.make_key("text-embedding-3-large", 1536, "hello")
+        assert a != cache.make_key("text-embedding-3-small", 256, "hello")
+
+    def test_encode_decode_roundtrip(self):
+        """Packed float32 values decode to the same embedding."""
+        from app.core.search.embedding_cache import decode_embedding, encode_embedding
+
+        values = [0.5, -0.25, 1.0]
+        assert decode_embedding(encode_embedding(values)) == values
+
+    @pytest.mark.asyncio
+    async def test_get_many_hits_and_misses(self, cache):
+        """Stored embeddings are returned; unknown texts are misses."""
+        await cache.set_many("m", 3, {"a": [1.0, 2.0, 3.0]})
+        result = await cache.get_many("m", 3, ["a", "b"])
+        assert result == [[1.0, 2.0, 3.0], None]
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_vectors_not_cached(self, cache):
+        """Fallback zero vectors from failed API calls are never cached."""
+        await cache.set_many("m", 3, {"a": [0.0, 0.0, 0.0]})
+        assert await cache.get_many("m", 3, ["a"]) == [None]
+
+    def test_local_lru_evicts_oldest(self, cache):
+        """The in-process tier evicts least recently used entries."""
+        from app.core.search.embedding_cache import encode_embedding
+
+        with patch.object(type(cache), "local_size", new=2):
+            cache._local_put("k1", encode_embedding([1.0]))
+            cache._local_put("k2", encode_embedding([2.0]))
+            cache._local_get("k1")
+            cache._local_put("k3", encode_embedding([3.0]))
+        assert set(cache._local) == {"k1", "k3"}
+        assert cache._local_get("k3") == [3.0]
+
+    @pytest.mark.asyncio
+    async def test_local_tier_stores_packed_floats(self, cache):
+        """Local entries are float32 bytes, not lists of Python floats."""
+        await cache.set_many("m", 3, {"a": [0.5, 1.5, 2.5]})
+
+        [stored] = cache._local.values()
+        assert isinstance(stored, bytes) and len(stored) == 12
+        assert await cache.get_many("m", 3, ["a"]) == [[0.5, 1.5, 2.5]]
+
+    @pytest.mark.asyncio
+    async def test_embedding_service_only_embeds_misses(self, cache):
+        """EmbeddingService sends only uncached, de-duplicated texts to the API."""
+        await cache.set_many("m", 3, {"cached": [1.0, 1.0, 1.0]})
+        service = EmbeddingService()
+        service._model_name = "m"
+        service._embedding_dim = 3
+        sent = []
+
+        async def fake_embed(texts):
+            sent.append(list(texts))
+            return [[2.0, 2.0, 2.0] for _ in texts]
+
+        with patch("app.core.search.embedding_service.embedding_cache", cache):
+            result = await service._with_cache(["cached", "new", "new"], fake_embed)
+
+        assert sent == [["new"]]
+        assert result == [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0], [2.0, 2.0, 2.0]]
+
+
+# =============================================================================
+# Bulk Chunk Writer Tests
+# =============================================================================
+
+
+class TestChunkWriter:
+    """Tests for the bulk search_chunks writer."""
+
+    @pytest.fixture
+    def row(self):
+        from uuid import uuid4
+
+        from app.core.search.chunk_writer import ChunkRow
+
+        return ChunkRow(
+            source_type="asset",
+            source_id=uuid4(),
+            organization_id=uuid4(),
+            chunk_index=0,
+            content="Hello\x00 world",
+            title="Doc",
+            embedding=[0.5, -1.0, 2.0],
+        )
+
+    def test_chunk_row_sanitizes_null_bytes(self, row):
+        """ChunkRow strips null bytes that PostgreSQL rejects."""
+        assert row.content == "Hello world"
+
+    def test_encode_vector_matches_pgvector_binary(self):
+        """Binary vector encoding matches pgvector's own wire format."""
+        from pgvector import Vector
+
+        from app.core.search.chunk_writer import encode_vector
+
+        values = [0.1, 0.2, -3.5]
+        assert encode_vector(values) == Vector(values).to_binary()
+
+    def test_copy_payload_framing(self, row):
+        """Binary COPY stream has header, one tuple per row and trailer."""
+        import struct
+
+        from app.core.search.chunk_writer import CHUNK_COLUMNS, iter_copy_payload
+
+        payload = b"".join(iter_copy_payload([row, row]))
+        assert payload.startswith(b"PGCOPY\n\xff\r\n\x00")
+        assert payload.endswith(struct.pack(">h", -1))
+        field_count = struct.pack(">h", len(CHUNK_COLUMNS))
+        assert payload[19:21] == field_count
+
+    @pytest.mark.asyncio
+    async def test_non_asyncpg_driver_uses_batched_insert(self, row):
+        """Fallback path writes rows with one INSERT per batch."""
+        from unittest.mock import AsyncMock
+
+        from app.core.search import chunk_writer
+
+        conn = MagicMock()
+        conn.dialect.driver = "aiosqlite"
+        session = MagicMock()
+        session.connection = AsyncMock(return_value=conn)
+        session.execute = AsyncMock()
+
+        rows = [row] * (chunk_writer.INSERT_BATCH_SIZE + 1)
+        written = await chunk_writer.write_chunks(session, rows)
+
+        assert written == len(rows)
+        assert session.execute.await_count == 2
+        params = session.execute.await_args_list[0].args[1]
+        assert params["r0_embedding"] == "[0.5,-1.0,2.0]"
+
+
+class TestChunkDiff:
+    """Tests for incremental chunk diffing."""
+
+    @staticmethod
+    def _existing(contents):
+        from app.core.search.chunk_writer import content_hash
+
+        return [(f"row{i}", i, content_hash(c)) for i, c in enumerate(contents)]
+
+    def test_unchanged_content_reuses_every_row(self):
+        """Identical chunks are kept in place with nothing to embed."""
+        from app.core.search.chunk_writer import diff_chunks
+
+        diff = diff_chunks(self._existing(["a", "b", "c"]), ["a", "b", "c"])
+
+        assert diff.insert == []
+        assert diff.delete == []
+        assert diff.moved == {}
+        assert diff.keep == {"row0": 0, "row1": 1, "row2": 2}
+
+    def test_insertion_shifts_following_chunks(self):
+        """A new chunk is embedded; later chunks only change index."""
+        from app.core.search.chunk_writer import diff_chunks
+
+        diff = diff_chunks(self._existing(["a", "b", "c"]), ["a", "new", "b", "c"])
+
+        assert diff.insert == [1]
+        assert diff.moved == {"row1": 2, "row2": 3}
+        assert diff.delete == []
+
+    def test_removed_and_edited_chunks(self):
+        """Edited chunks are re-inserted and stale rows are deleted."""
+        from app.core.search.chunk_writer import diff_chunks
+
+        diff = diff_chunks(self._existing(["a", "b", "c"]), ["a", "c2"])
+
+        assert diff.insert == [1]
+        assert sorted(diff.delete) == ["row1", "row2"]
+        assert diff.keep == {"row0": 0}
+
+    def test_duplicate_contents_matched_pairwise(self):
+        """Repeated chunks map to distinct rows, preferring same index."""
+        from app.core.search.chunk_writer import diff_chunks
+
+        diff = diff_chunks(self._existing(["x", "y", "x"]), ["x", "x"])
+
+        assert diff.keep == {"row0": 0, "row2": 1}
+        assert diff.moved == {"row2": 1}
+        assert diff.delete == ["row1"]
+
+    def test_content_hash_matches_sanitized_text(self):
+        """Hashes ignore null bytes, matching what is stored."""
+        from app.core.search.chunk_writer import content_hash
+
+        assert content_hash("a\x00b") == content_hash("ab")
+
+
+class TestSearchDocuments:
+    """Tests for per-document metadata in search_documents."""
+
+    @pytest.mark.asyncio
+    async def test_write_documents_upserts_once_per_source(self):
+        """Duplicate sources collapse to one row; the upsert replaces metadata."""
+        from unittest.mock import AsyncMock
+        from uuid import uuid4
+
+        from app.core.search.chunk_writer import DocumentRow, write_documents
+
+        session = MagicMock()
+        session.execute = AsyncMock()
+        source_id, org_id = uuid4(), uuid4()
+        docs = [
+            DocumentRow("asset", source_id, org_id, {"source": {"storage_folder": "a"}}),
+            DocumentRow("asset", source_id, org_id, {"source": {"storage_folder": "b"}}),
+        ]
+
+        written = await write_documents(session, docs)
+
+        assert written == 1
+        sql = str(session.execute.await_args.args[0])
+        params = session.execute.await_args.args[1]
+        assert "ON CONFLICT (source_type, source_id)" in sql
+        assert "metadata = EXCLUDED.metadata" in sql
+        assert params["d0_metadata"] == '{"source": {"storage_folder": "b"}}'
+
+    @pytest.mark.asyncio
+    async def test_propagate_source_metadata_updates_one_document_row(self):
+        """All namespaces are merged with a single UPDATE of search_documents."""
+        from unittest.mock import AsyncMock
+        from uuid import uuid4
+
+        from app.core.search.pg_index_service import PgIndexService
+
+        asset = MagicMock()
+        asset.organization_id = uuid4()
+        asset.source_metadata = {
+            "sharepoint": {"folder": "/Docs"},
+            "source": {"storage_folder": "sp/docs"},
+            "custom": {"ignored": True},
+        }
+        lookup = MagicMock()
+        lookup.scalar_one_or_none.return_value = asset
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=lookup)
+
+        with patch("app.core.search.pg_search_service.pg_search_service"):
+            ok = await PgIndexService().propagate_source_metadata(session, uuid4())
+
+        assert ok is True
+        updates = [
+            call for call in session.execute.await_args_list
+            if "UPDATE" in str(call.args[0])
+        ]
+        assert len(updates) == 1
+        assert "UPDATE search_documents" in str(updates[0].args[0])
+        namespaces = updates[0].args[1]["namespaces"]
+        assert "sharepoint" in namespaces and "custom" not in namespaces
+
+    @pytest.mark.asyncio
+    async def test_metadata_filters_evaluate_against_documents(self):
+        """Metadata conditions are wrapped in a correlated EXISTS on search_documents."""
+        from unittest.mock import AsyncMock
+        from uuid import uuid4
+
+        from app.core.search.pg_search_service import PgSearchService, SearchResults
+
+        service = PgSearchService()
+        with patch.object(
+            service, "_execute_typed_search", AsyncMock(return_value=SearchResults(total=0, hits=[]))
+        ) as execute:
+            await service.search_salesforce(
+                MagicMock(), uuid4(), "acme", account_types=["Customer"], stages=["Won"],
+            )
+
+        filter_clause = execute.await_args.args[1]
+        assert "sc.metadata" not in filter_clause
+        assert filter_clause.count("EXISTS (SELECT 1 FROM search_documents sd") == 1
+        assert "sd.metadata->'salesforce'->>'account_type' = ANY(:account_types)" in filter_clause
+        assert "sd.source_id = sc.source_id" in filter_clause
+
+
+class TestFacetEngine:
+    """Tests for single-scan search facets and precomputed browse facets."""
+
+    @staticmethod
+    def _rows(*rows):
+        result = MagicMock()
+        result.fetchall.return_value = [
+            MagicMock(facet_name=f, value=v, count=c, is_other=o) for f, v, c, o in rows
+        ]
+        return result
+
+    @pytest.mark.asyncio
+    async def test_search_facets_single_statement_and_cache(self):
+        """All facets come from one statement; repeats hit the cache until invalidated."""
+        from unittest.mock import AsyncMock
+        from uuid import uuid4
+
+        from app.core.search.facet_service import FacetService
+
+        service = FacetService()
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=self._rows(
+            ("source_type", "upload", 3, False),
+            ("agency", "GSA", 2, False),
+            ("agency", None, 5, True),
+        ))
+        org_id = uuid4()
+        facet_defs = {"agency": {"mappings": {"sam_notice": "sam.agency"}}}
+
+        with patch(
+            "app.core.metadata.registry_service.metadata_registry_service"
+        ) as registry:
+            registry.get_facet_definitions.return_value = facet_defs
+            facets = await service.get_search_facets(
+                session, org_id, "cyber", ["source_type", "agency", "bogus"]
+            )
+            again = await service.get_search_facets(
+                session, org_id, "cyber", ["source_type", "agency", "bogus"]
+            )
+
+            assert session.execute.await_count == 1
+            sql = str(session.execute.await_args.args[0])
+            params = session.execute.await_args.args[1]
+            assert "CROSS JOIN LATERAL (VALUES" in sql
+            assert "LEFT JOIN search_documents sd" in sql
+            assert params["fns_0"] == "sam" and params["ffield_0"] == "agency"
+            assert set(facets) == {"source_type", "agency"}
+            assert facets["agency"].buckets[0].value == "GSA"
+            assert facets["agency"].total_other == 5
+            assert again["agency"].total_other == 5
+
+            service.invalidate(org_id)
+            await service.get_search_facets(
+                session, org_id, "cyber", ["source_type", "agency", "bogus"]
+            )
+            assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_browse_facets_read_precomputed_counts(self):
+        """Browse facets read search_facet_counts once paths are in sync."""
+        from unittest.mock import AsyncMock
+        from uuid import uuid4
+
+        from app.core.search.facet_service import FacetService
+
+        service = FacetService()
+        service._synced_paths = [("agency", "sam_notice", "sam.agency")]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=self._rows(("agency", "GSA", 7, False)))
+        facet_defs = {"agency": {"mappings": {"sam_notice": "sam.agency"}}}
+
+        with patch(
+            "app.core.metadata.registry_service.metadata_registry_service"
+        ) as registry:
+            registry.get_facet_definitions.return_value = facet_defs
+            facets = await service.get_browse_facets(
+                session, uuid4(), ["agency"], source_types=["sam_notice"]
+            )
+
+        assert session.execute.await_count == 1
+        sql = str(session.execute.await_args.args[0])
+        assert "FROM search_facet_counts" in sql
+        assert "doc_count > 0" in sql
+        assert session.execute.await_args.args[1]["source_types"] == ["sam_notice"]
+        assert facets["agency"].buckets[0].count == 7
+
+    @pytest.mark.asyncio
+    async def test_path_change_rebuilds_counts(self):
+        """Changed registry paths are rewritten and all counts rebuilt under a lock."""
+        from unittest.mock import AsyncMock
+
+        from app.core.search.facet_service import FacetService
+
+        service = FacetService()
+        current = MagicMock()
+        current.fetchall.return_value = []
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=current)
+        facet_defs = {"agency": {"mappings": {"sam_notice": "sam.agency"}}}
+
+        with patch(
+            "app.core.metadata.registry_service.metadata_registry_service"
+        ) as registry:
+            registry.get_facet_definitions.return_value = facet_defs
+            result = await service.sync_facet_paths(session)
+            unchanged = MagicMock()
+            unchanged.fetchall.return_value = [
+                MagicMock(facet_name="agency", source_type="sam_notice", json_path="sam.agency")
+            ]
+            session.execute = AsyncMock(return_value=unchanged)
+            second = await service.sync_facet_paths(session)
+
+        assert result["changed"] is True and result["paths"] == 1
+        assert second["changed"] is False
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_browse_sync_uses_own_session(self):
+        """A lazy path sync commits its own session, never the caller's."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock
+        from uuid import uuid4
+
+        from app.core.search.facet_service import FacetService
+
+        service = FacetService()
+        session = MagicMock()
+        session.commit = AsyncMock()
+        session.execute = AsyncMock(return_value=self._rows())
+        sync_session = MagicMock()
+
+        @asynccontextmanager
+        async def get_session():
+            yield sync_session
+
+        with patch(
+            "app.core.metadata.registry_service.metadata_registry_service"
+        ) as registry, patch(
+            "app.core.shared.database_service.database_service.get_session", get_session
+        ), patch.object(service, "sync_facet_paths", AsyncMock()) as sync:
+            registry.get_facet_definitions.return_value = {"agency": {"mappings": {"sam_notice": "sam.agency"}}}
+            await service.get_browse_facets(session, uuid4(), ["agency"])
+
+        sync.assert_awaited_once_with(sync_session)
+        session.commit.assert_not_called()
+
+    def test_invalidate_metadata_cache_drops_facets(self):
+        """Metadata cache invalidation also drops cached facet results."""
+        from uuid import uuid4
+
+        from app.core.search.facet_service import facet_service
+        from app.core.search.pg_search_service import Facet, PgSearchService
+
+        org_id = uuid4()
+        facet_service._cache.set_local(
+            str(org_id), "k", {"agency": Facet(field="agency", buckets=[])}
+        )
+        with patch("app.core.shared.shared_cache._get_redis", return_value=None):
+            PgSearchService().invalidate_metadata_cache(org_id)
+        assert facet_service._cache.get_local(str(org_id), "k") is None
+
+
+class TestAliasMatcher:
+    """Tests for the precomputed facet alias fuzzy-match index."""
+
+    INDEX = {
+        "department of homeland security": ["Department of Homeland Security", "DHS"],
+        "dhs": ["Department of Homeland Security", "DHS"],
+        "general services administration": ["General Services Administration", "GSA"],
+        "gsa": ["General Services Administration", "GSA"],
+    }
+
+    def test_matches_same_alias_as_full_scan(self):
+        """The indexed search returns the alias a full SequenceMatcher scan picks."""
+        from difflib import SequenceMatcher
+
+        from app.core.metadata.alias_matcher import AliasMatcher
+
+        with patch("app.core.metadata.alias_matcher.process", None):
+            matcher = AliasMatcher(self.INDEX)
+            results = {
+                value: matcher.match(value, 0.85)
+                for value in ["Department of Homeland Securty", "General Service Administration", "GSA."]
+            }
+        for value, result in results.items():
+            scores = {
+                alias: SequenceMatcher(None, value.lower(), alias).ratio() for alias in self.INDEX
+            }
+            best = max(scores, key=scores.get)
+            expected = (best, scores[best]) if scores[best] >= 0.85 else None
+            if expected is None:
+                assert result is None
+            else:
+                assert result[0] == expected[0]
+                assert result[1] == pytest.approx(expected[1])
+
+    def test_unmatched_values_are_remembered(self):
+        """A value that failed a threshold is not rescored at the same or higher threshold."""
+        from app.core.metadata.alias_matcher import AliasMatcher
+
+        with patch("app.core.metadata.alias_matcher.process", None):
+            matcher = AliasMatcher(self.INDEX)
+        with patch.object(matcher, "_best_difflib", wraps=matcher._best_difflib) as scan, \
+                patch("app.core.metadata.alias_matcher.process", None):
+            assert matcher.match("Department of Energy", 0.9) is None
+            assert matcher.match("department of energy", 0.95) is None
+            assert scan.call_count == 1
+            matcher.match("Department of Energy", 0.5)
+            assert scan.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_service_rebuilds_matcher_when_index_changes(self):
+        """try_fuzzy_match reuses the matcher until the reverse index is reloaded."""
+        from unittest.mock import AsyncMock
+
+        from app.core.metadata.facet_reference_service import FacetReferenceService
+
+        service = FacetReferenceService()
+        index = dict(self.INDEX)
+        service._get_reverse_index = AsyncMock(return_value=index)
+
+        match = await service.try_fuzzy_match(None, None, "agency", "Department of Homeland Securty")
+        matcher = service._matchers[("global", "agency")]
+        await service.try_fuzzy_match(None, None, "agency", "GSA")
+
+        assert match["matched_alias"] == "department of homeland security"
+        assert match["all_aliases"] == ["Department of Homeland Security", "DHS"]
+        assert service._matchers[("global", "agency")] is matcher
+
+        service._get_reverse_index = AsyncMock(return_value=dict(self.INDEX))
+        await service.try_fuzzy_match(None, None, "agency", "GSA")
+        assert service._matchers[("global", "agency")] is not matcher
+
+
+class TestAnnIndexManagement:
+    """Tests for ANN index sizing, DDL and per-query tuning."""
+
+    def test_lists_sizing(self):
+        """lists = rows/1000 up to 1M rows, sqrt(rows) above, min 10."""
+        from app.core.search.ann_index_service import recommended_lists
+
+        assert recommended_lists(0) == 10
+        assert recommended_lists(500_000) == 500
+        assert recommended_lists(1_000_000) == 1000
+        assert recommended_lists(4_000_000) == 2000
+
+    def test_partial_hnsw_index_sql(self):
+        """Per-org indexes carry a predicate on the validated organization id."""
+        from uuid import uuid4
+
+        from app.core.search.ann_index_service import build_index_sql, org_index_name
+
+        org_id = uuid4()
+        sql = build_index_sql(org_index_name(org_id), "hnsw", organization_id=org_id,
+                              hnsw_m=24, hnsw_ef_construction=100)
+
+        assert sql.startswith(f"CREATE INDEX CONCURRENTLY {org_index_name(org_id)} ")
+        assert "USING hnsw (embedding vector_cosine_ops) WITH (m = 24, ef_construction = 100)" in sql
+        assert sql.endswith(f"WHERE organization_id = '{org_id}'")
+
+    def test_org_index_names_fit_identifier_limit(self):
+        """The temporary rebuild name must not be truncated onto the live index."""
+        from uuid import uuid4
+
+        from app.core.search.ann_index_service import (
+            LEGACY_ORG_INDEX_PREFIX,
+            MAX_IDENTIFIER_LENGTH,
+            REBUILD_SUFFIX,
+            _index_organization_id,
+            org_index_name,
+        )
+
+        org_id = uuid4()
+        name = org_index_name(org_id)
+
+        assert len((name + REBUILD_SUFFIX).encode()) <= MAX_IDENTIFIER_LENGTH
+        assert _index_organization_id(name) == str(org_id)
+        assert _index_organization_id(LEGACY_ORG_INDEX_PREFIX + org_id.hex) == str(org_id)
+        assert _index_organization_id(name + REBUILD_SUFFIX) is None
+
+    def test_invalid_index_input_rejected(self):
+        """Unknown methods and non-UUID org ids never reach the DDL."""
+        from app.core.search.ann_index_service import build_index_sql
+
+        with pytest.raises(ValueError):
+            build_index_sql("ix", "btree")
+        with pytest.raises(ValueError):
+            build_index_sql("ix", "ivfflat", organization_id="x'; DROP TABLE t; --")
+
+    def test_query_settings_resolution(self):
+        """Explicit values win; probes default to sqrt(lists) of the index used."""
+        from app.core.search.ann_index_service import AnnIndexService
+
+        service = AnnIndexService()
+        indexes = [
+            {"name": "ix_search_chunks_embedding", "method": "ivfflat",
+             "options": {"lists": 400}, "organization_id": None, "valid": True},
+            {"name": "ix_org", "method": "ivfflat",
+             "options": {"lists": 16}, "organization_id": "org-small", "valid": True},
+        ]
+        config = MagicMock(ann_ivfflat_probes=None, ann_hnsw_ef_search=None)
+
+        with patch.object(service, "_get_search_config", return_value=config):
+            assert service._resolve_query_settings(indexes, "org-big", None, None) == {
+                "ivfflat.probes": "20",
+            }
+            assert service._resolve_query_settings(indexes, "org-small", None, None) == {
+                "ivfflat.probes": "4",
+                "plan_cache_mode": "force_custom_plan",
+            }
+            assert service._resolve_query_settings(indexes, "org-big", 64, 7) == {
+                "ivfflat.probes": "7",
+                "hnsw.ef_search": "64",
+            }
+
+    @pytest.mark.asyncio
+    async def test_apply_query_settings_single_statement(self):
+        """All settings are applied transaction-locally in one round trip."""
+        from unittest.mock import AsyncMock
+
+        from app.core.search.ann_index_service import AnnIndexService
+
+        service = AnnIndexService()
+        service._index_info = []
+        service._index_info_at = float("inf")
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        with patch.object(service, "_get_search_config", return_value=None):
+            applied = await service.apply_query_settings(session, "org", ef_search=100, probes=5)
+
+        assert applied == {"ivfflat.probes": "5", "hnsw.ef_search": "100"}
+        session.execute.assert_awaited_once()
+        sql, params = session.execute.await_args.args
+        assert str(sql).count("set_config(") == 2
+        assert params["name_1"] == "hnsw.ef_search"
+        assert params["value_1"] == "100"
+
+
+class TestHybridSearch:
+    """Tests for single-pass hybrid search with capped totals."""
+
+    @staticmethod
+    def _row(**overrides):
+        row = dict(
+            candidate_total=1200, truncated=True, source_id="s1", title="Doc",
+            filename="doc.pdf", source_type="asset", source_type_filter="upload",
+            content_type="application/pdf", url=None, created_at="2026-01-01",
+            score=0.75, keyword_score=0.4, semantic_score=0.8, metadata=None,
+            highlight="<mark>cyber</mark> plan",
+        )
+        row.update(overrides)
+        return MagicMock(**row)
+
+    async def _run(self, rows, fusion="rrf", offset=0):
+        from unittest.mock import AsyncMock
+
+        from app.core.search.pg_search_service import PgSearchService
+
+        service = PgSearchService()
+        session = MagicMock()
+        result = MagicMock()
+        result.fetchall.return_value = rows
+        session.execute = AsyncMock(return_value=result)
+
+        with patch("app.core.search.pg_search_service.embedding_service") as embed, \
+                patch.object(service, "_get_hybrid_settings", return_value=(fusion, 60, 1000, 200)):
+            embed.get_embedding = AsyncMock(return_value=[0.1, 0.2])
+            results = await service._hybrid_search_generic(
+                session, "sc.organization_id = :org_id", {"org_id": "o", "fts_query": "cyber:*"},
+                "cyber", 0.5, 20, offset, lambda st: st,
+            )
+        return results, session
+
+    @pytest.mark.asyncio
+    async def test_single_query_with_capped_total(self):
+        """Hits and the candidate total come from one statement."""
+        results, session = await self._run([self._row()])
+
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0])
+        assert "count_sql" not in sql and "1 - (sc.embedding <=> CAST(:embedding AS vector)) > 0.3" not in sql
+        assert ":rrf_k" in sql
+        assert results.total == 1200
+        assert results.total_capped is True
+        assert results.hits[0].score == 75.0
+        assert results.hits[0].source_type == "upload"
+
+    @pytest.mark.asyncio
+    async def test_page_past_last_candidate(self):
+        """The stats row alone yields the total without hits."""
+        empty = self._row(truncated=False, candidate_total=12, source_id=None)
+        results, _ = await self._run([empty], offset=40)
+
+        assert results.hits == []
+        assert results.total == 12
+        assert results.total_capped is False
+
+    @pytest.mark.asyncio
+    async def test_weighted_fusion(self):
+        """Weighted fusion sums raw scores instead of ranks."""
+        _, session = await self._run([self._row()], fusion="weighted")
+
+        sql = str(session.execute.await_args.args[0])
+        assert ":rrf_k" not in sql
+        assert ":keyword_weight * COALESCE(k.keyword_score, 0)" in sql
+
+    @pytest.mark.asyncio
+    async def test_candidate_limits_cover_requested_page(self):
+        """Deep pages raise the candidate limits so the page can be filled."""
+        _, session = await self._run([], offset=1500)
+
+        params = session.execute.await_args.args[1]
+        assert params["keyword_candidates"] == 1520
+        assert params["semantic_candidates"] == 1520
+
+
 # =============================================================================
 # Search Configuration Tests
 # =============================================================================
@@ -227,7 +227,7 @@ class TestSearchWithFacetsSessionIntegrity:
 
             # First two calls are from search() -> _keyword_search_generic
             # (count query and search query). Simulate the first one failing.
-            if call_count <= 2 and "to_tsquery" in sql_text and "ranked_chunks" not in sql_text and "asset_facets" not in sql_text:
+            if call_count <= 2 and "to_tsquery" in sql_text and "ranked_chunks" not in sql_text and "facet_name" not in sql_text:
                 raise Exception("different vector dimensions 1536 and 1024")
 
             # After rollback, facet queries should succeed
@@ -269,14 +269,18 @@ class TestSearchWithFacetsSessionIntegrity:
 
             # Facet queries succeed and return data
             mock_result = MagicMock()
-            if "asset_facets" in sql_text:
-                # Source type facet query
-                Row = type("Row", (), {"value": "upload", "count": 10})
-                mock_result.fetchall.return_value = [Row()]
-            elif "content_type" in sql_text:
-                # Content type facet query
-                Row = type("Row", (), {"value": "application/pdf", "count": 5})
-                mock_result.fetchall.return_value = [Row()]
+            if "facet_name" in sql_text:
+                # Single facet statement (all facets in one scan)
+                mock_result.fetchall.return_value = [
+                    type("Row", (), {
+                        "facet_name": "source_type", "value": "upload",
+                        "count": 10, "is_other": False,
+                    })(),
+                    type("Row", (), {
+                        "facet_name": "content_type", "value": "application/pdf",
+                        "count": 5, "is_other": False,
+                    })(),
+                ]
             else:
                 mock_result.fetchall.return_value = []
                 mock_result.scalar.return_value = 0
@@ -295,9 +299,9 @@ class TestSearchWithFacetsSessionIntegrity:
         # Should have 0 hits but valid facets
         assert result.total == 0
         assert result.hits == []
-        # Facets should be populated from the facet queries
-        if result.facets:
-            assert "source_type" in result.facets
+        # Facets should be populated from the facet query
+        assert result.facets["source_type"].buckets[0].count == 10
+        assert result.facets["content_type"].buckets[0].value == "application/pdf"
 
 
 # =============================================================================
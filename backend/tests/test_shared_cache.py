@@ -0,0 +1,176 @@
+"""
+Tests for the two-tier shared cache (in-process LRU + Redis).
+
+Redis is replaced by a small in-memory stand-in implementing the handful of
+commands SharedCache uses, so the tests cover versioning and invalidation
+without a Redis server.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.core.shared import shared_cache
+from app.core.shared.shared_cache import SharedCache, handle_invalidation_message
+
+
+class FakeRedis:
+    """Minimal synchronous Redis stand-in (mget/get/set/incr/publish)."""
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+
+    def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key) or 0) + 1)
+        return int(self.data[key])
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch.object(shared_cache, "_get_redis", return_value=redis), \
+            patch("app.core.shared.pubsub_service.pubsub_service.get_sync_client", return_value=redis):
+        yield redis
+
+
+def _loader(value, calls):
+    async def load():
+        calls.append(value)
+        return value
+    return load
+
+
+class TestSharedCache:
+    """Tests for SharedCache tiers, versioning and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_loader(self, fake_redis):
+        """A second lookup is served from the in-process tier."""
+        cache = SharedCache("test_local_hit", ttl=60)
+        calls = []
+
+        first = await cache.get_or_load("org", "k", _loader({"a": 1}, calls))
+        second = await cache.get_or_load("org", "k", _loader({"a": 2}, calls))
+
+        assert first == second == {"a": 1}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_between_processes(self, fake_redis):
+        """A value loaded by one process is read from Redis by another."""
+        writer = SharedCache("test_shared", ttl=60)
+        reader = SharedCache("test_shared", ttl=60)
+        calls = []
+
+        await writer.get_or_load("org", "k", _loader({"a": 1}, calls))
+        value = await reader.get_or_load("org", "k", _loader({"a": 2}, calls))
+
+        assert value == {"a": 1}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_calls_run_off_the_event_loop(self, fake_redis):
+        """L2 reads and writes on a miss never block the loop thread."""
+        cache = SharedCache("test_off_loop", ttl=60)
+        loop_thread = threading.get_ident()
+        threads = []
+        for command in ("mget", "get", "set"):
+            original = getattr(fake_redis, command)
+
+            def record(*args, _original=original, **kwargs):
+                threads.append(threading.get_ident())
+                return _original(*args, **kwargs)
+
+            setattr(fake_redis, command, record)
+
+        await cache.get_or_load("org", "k", _loader({"a": 1}, []))
+
+        assert len(threads) == 3
+        assert loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_invalidate_bumps_version_and_broadcasts(self, fake_redis):
+        """Invalidation makes stored values unreachable and publishes a message."""
+        cache = SharedCache("test_invalidate", ttl=60)
+        calls = []
+
+        await cache.get_or_load("org", "k", _loader({"a": 1}, calls))
+        cache.invalidate("org")
+        value = await cache.get_or_load("org", "k", _loader({"a": 2}, calls))
+
+        assert value == {"a": 2}
+        assert fake_redis.data["curatore:cache:test_invalidate:ver:org"] == "1"
+        assert '"scope": "org"' in fake_redis.published[0][1]
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_kept(self, fake_redis):
+        """A value computed before an invalidation is neither cached nor served."""
+        cache = SharedCache("test_race", ttl=60)
+
+        async def stale_load():
+            cache.invalidate("org")  # data changed while loading
+            return {"a": "stale"}
+
+        await cache.get_or_load("org", "k", stale_load)
+        calls = []
+        value = await cache.get_or_load("org", "k", _loader({"a": "fresh"}, calls))
+
+        assert value == {"a": "fresh"}
+        assert calls == [{"a": "fresh"}]
+
+    def test_remote_invalidation_drops_local_entries(self):
+        """Messages from other processes drop matching L1 entries; own messages are ignored."""
+        cache = SharedCache("test_remote", ttl=60)
+        cache.set_local("org1", "k", {"a": 1})
+        cache.set_local("org2", "k", {"a": 2})
+
+        handle_invalidation_message(
+            {"cache": "test_remote", "scope": "org1", "origin": shared_cache._ORIGIN}
+        )
+        assert cache.get_local("org1", "k") == {"a": 1}
+
+        handle_invalidation_message({"cache": "test_remote", "scope": "org1", "origin": "other"})
+        assert cache.get_local("org1", "k") is None
+        assert cache.get_local("org2", "k") == {"a": 2}
+
+    def test_lru_eviction(self):
+        """The in-process tier keeps at most max_entries, evicting least recently used."""
+        cache = SharedCache("test_lru", ttl=60, max_entries=2)
+        cache.set_local("s", "a", 1)
+        cache.set_local("s", "b", 2)
+        cache.get_local("s", "a")
+        cache.set_local("s", "c", 3)
+
+        assert cache.get_local("s", "a") == 1
+        assert cache.get_local("s", "b") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fall_back_to_loader(self):
+        """Connection errors degrade to the in-process tier."""
+        class DownRedis(FakeRedis):
+            def mget(self, *keys):
+                raise ConnectionError("redis down")
+
+        cache = SharedCache("test_down", ttl=60)
+        calls = []
+        with patch.object(shared_cache, "_get_redis", return_value=DownRedis()), \
+                patch.object(shared_cache, "_redis_down_until", 0.0):
+            value = await cache.get_or_load("org", "k", _loader({"a": 1}, calls))
+
+        assert value == {"a": 1}
+        assert cache.get_local("org", "k") == {"a": 1}
@@ -0,0 +1,106 @@
+# backend/tests/test_sharepoint_downloader.py
+"""
+Tests for the pooled SharePoint download session.
+
+Graph and the token endpoint are served by an httpx MockTransport and
+MinIO by a mocked client, so no network access is required.
+
+Covers:
+- One token request shared by every download of a run
+- Streaming file bodies into object storage with a SHA-256 hash
+- Refreshing the token once after a 401
+"""
+
+import asyncio
+import hashlib
+import uuid
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import httpx
+import pytest
+
+from app.connectors.sharepoint.sharepoint_service import TokenManager
+from app.connectors.sharepoint.sharepoint_sync_service import SharePointDownloader
+from app.core.storage.minio_service import MinIOService
+
+FILES = {
+    "item-1": b"first file " * 1000,
+    "item-2": b"second file",
+    "item-3": b"",
+}
+
+
+def _downloader(handler):
+    downloader = SharePointDownloader(uuid.uuid4(), session=MagicMock())
+    downloader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    downloader._token_manager = TokenManager("tenant", "client", "secret")
+    downloader._graph_base = "https://graph.test/v1.0"
+    return downloader
+
+
+@pytest.fixture
+def stored():
+    """Patch MinIO with a client that records uploaded objects."""
+    objects = {}
+    client = MagicMock()
+
+    def put_object(bucket_name, object_name, data, length, **kwargs):
+        objects[object_name] = data.read(-1)
+        return MagicMock(etag="etag")
+
+    client.put_object.side_effect = put_object
+    service = MinIOService.__new__(MinIOService)
+    with patch.object(MinIOService, "client", new_callable=PropertyMock, return_value=client), \
+            patch("app.core.storage.minio_service.get_minio_service", return_value=service):
+        yield objects
+
+
+class TestSharePointDownloader:
+    """Tests for SharePointDownloader.download_to_storage."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_share_one_token(self, stored):
+        requests = {"token": 0, "download": 0}
+
+        def handler(request):
+            if request.url.path.endswith("/oauth2/v2.0/token"):
+                requests["token"] += 1
+                return httpx.Response(200, json={"access_token": "token-1"})
+            requests["download"] += 1
+            assert request.headers["Authorization"] == "Bearer token-1"
+            item_id = request.url.path.split("/")[-2]
+            return httpx.Response(200, content=FILES[item_id])
+
+        async with _downloader(handler) as downloader:
+            uploads = await asyncio.gather(*(
+                downloader.download_to_storage("drive", item_id, item_id, "uploads", f"key/{item_id}")
+                for item_id in FILES
+            ))
+
+        assert requests == {"token": 1, "download": 3}
+        for item_id, upload in zip(FILES, uploads):
+            assert stored[f"key/{item_id}"] == FILES[item_id]
+            assert upload.file_size == len(FILES[item_id])
+            assert upload.file_hash == hashlib.sha256(FILES[item_id]).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_refreshes_token_once(self, stored):
+        tokens = iter(["expired", "fresh"])
+        requests = {"token": 0}
+
+        def handler(request):
+            if request.url.path.endswith("/oauth2/v2.0/token"):
+                requests["token"] += 1
+                return httpx.Response(200, json={"access_token": next(tokens)})
+            if request.headers["Authorization"] == "Bearer expired":
+                return httpx.Response(401)
+            return httpx.Response(200, content=b"content")
+
+        async with _downloader(handler) as downloader:
+            upload = await downloader.download_to_storage(
+                "drive", "item-1", "a.pdf", "uploads", "key/a", retry_delay_seconds=0
+            )
+
+        assert requests["token"] == 2
+        assert stored["key/a"] == b"content"
+        assert upload.file_hash == hashlib.sha256(b"content").hexdigest()
@@ -0,0 +1,133 @@
+# backend/tests/test_template_cache.py
+"""
+Tests for compiled template rendering in the CWR runtime.
+
+Covers:
+- Process-wide compiled template cache and sandboxing
+- Render plans preserving value types and item context
+- The steps view kept in sync with context variables
+- Precompiling step params at procedure load
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from jinja2.exceptions import SecurityError
+
+from app.cwr.procedures.store.definitions import ProcedureDefinition
+from app.cwr.procedures.store.loader import ProcedureLoader
+from app.cwr.tools.context import FunctionContext
+from app.cwr.tools.templating import VariableStore, compile_params, compile_template
+
+
+def _context(**variables):
+    ctx = FunctionContext(session=MagicMock(), params={"limit": 5})
+    for name, value in variables.items():
+        ctx.set_step_result(name, value)
+    return ctx
+
+
+class TestTemplateCache:
+    """Tests for compile_template."""
+
+    def test_same_source_compiles_once(self):
+        source = "cache test {{ item.name }}"
+
+        assert compile_template(source) is compile_template(source)
+        assert compile_template(source).render(item={"name": "x"}) == "cache test x"
+
+    def test_environment_is_sandboxed(self):
+        with pytest.raises(SecurityError):
+            compile_template("{{ item.__class__.__mro__ }}").render(item={})
+
+    def test_custom_filters_registered(self):
+        assert compile_template("{{ items | compact | length }}").render(items=[1, None, 2]) == "2"
+
+
+class TestRenderParams:
+    """Tests for FunctionContext.render_params with render plans."""
+
+    def test_pure_expressions_keep_type(self):
+        ctx = _context(search=[{"id": "a"}, {"id": "b"}])
+        params = {
+            "items": "{{ steps.search }}",
+            "first": "{{ steps.search[0].id }}",
+            "query": "limit={{ params.limit }} item={{ item.name }}",
+            "count": "{{ steps.search | length }}",
+            "nested": [{"value": "{{ item.name }}"}, 3],
+        }
+
+        rendered = ctx.render_params(params, item={"name": "doc"})
+
+        assert rendered["items"] == [{"id": "a"}, {"id": "b"}]
+        assert rendered["first"] == "a"
+        assert rendered["query"] == "limit=5 item=doc"
+        assert rendered["count"] == "2"
+        assert rendered["nested"] == [{"value": "doc"}, 3]
+
+    def test_plan_reused_across_items(self):
+        ctx = _context()
+        plan = compile_params({"title": "Item {{ item }}"})
+
+        rendered = [ctx.render_params({}, item=i, plan=plan)["title"] for i in range(3)]
+
+        assert rendered == ["Item 0", "Item 1", "Item 2"]
+
+    def test_render_errors_raise_value_error(self):
+        with pytest.raises(ValueError, match="Failed to render template"):
+            _context().render_params({"bad": "{{ item.name | no_such_filter }}"}, item={})
+
+
+class TestStepsView:
+    """Tests for VariableStore and the context's steps view."""
+
+    def test_steps_follow_variable_writes(self):
+        ctx = _context(first=1)
+        ctx.variables["steps.second"] = 2
+        ctx.set_variable("other", 3)
+
+        assert ctx.steps == {"first": 1, "second": 2}
+
+        ctx.variables.pop("steps.first")
+        ctx.variables.update({"steps.third": 3})
+        assert ctx.steps == {"second": 2, "third": 3}
+        assert ctx.render_template("{{ steps.third }}") == "3"
+
+    def test_child_context_gets_own_view(self):
+        ctx = _context(first=1)
+        child = ctx.child_context()
+        child.set_step_result("second", 2)
+
+        assert isinstance(child.variables, VariableStore)
+        assert child.steps == {"first": 1, "second": 2}
+        assert ctx.steps == {"first": 1}
+
+
+class TestPrecompile:
+    """Tests for ProcedureLoader.precompile."""
+
+    def test_plans_compiled_for_nested_steps(self):
+        definition = ProcedureDefinition.from_dict({
+            "name": "Test",
+            "slug": "test",
+            "steps": [
+                {
+                    "name": "loop",
+                    "function": "foreach",
+                    "params": {"items": "{{ params.items }}"},
+                    "branches": {
+                        "each": [{"name": "log", "function": "log", "params": {"message": "{{ item }}"}}],
+                    },
+                },
+                {"name": "broken", "function": "log", "params": {"message": "Hi {{ item.name | }}"}},
+            ],
+        })
+
+        ProcedureLoader().precompile(definition)
+
+        loop, broken = definition.steps
+        each = loop.branches["each"][0]
+        assert each.render_plan({"item": "x"}) == {"message": "x"}
+        assert loop.render_plan({"params": {"items": [1, 2]}}) == {"items": [1, 2]}
+        # Invalid templates are left to fail when the step renders
+        assert broken.render_plan is None
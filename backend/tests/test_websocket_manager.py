@@ -0,0 +1,147 @@
+# backend/tests/test_websocket_manager.py
+"""
+Tests for non-blocking WebSocket fan-out.
+
+Uses fake WebSocket objects, so no server or Redis is required.
+
+Covers:
+- Broadcasts encoding once and not waiting on slow clients
+- Latest-wins coalescing of queued run_progress messages
+- Dropping connections whose queue overflows or whose send stalls
+"""
+
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.ops import websocket_manager as manager_module
+from app.core.ops.websocket_manager import SLOW_CONSUMER_CLOSE_CODE, WebSocketManager
+
+
+def _websocket(gate=None):
+    """A fake WebSocket recording sent text; sends block while gate is unset."""
+    websocket = MagicMock()
+    websocket.sent = []
+
+    async def send_text(text):
+        if gate is not None:
+            await gate.wait()
+        websocket.sent.append(json.loads(text))
+
+    websocket.send_text = AsyncMock(side_effect=send_text)
+    websocket.close = AsyncMock()
+    return websocket
+
+
+def _progress(run_id, current):
+    return {"type": "run_progress", "data": {"run_id": run_id, "progress": {"current": current}}}
+
+
+async def _drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestBroadcast:
+    """Tests for WebSocketManager.broadcast_to_org."""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self):
+        manager = WebSocketManager()
+        org_id = uuid.uuid4()
+        stalled, fast = _websocket(gate=asyncio.Event()), _websocket()
+        await manager.connect(stalled, org_id, uuid.uuid4())
+        await manager.connect(fast, org_id, uuid.uuid4())
+
+        with patch.object(manager_module.json, "dumps", wraps=json.dumps) as dumps:
+            sent = await manager.broadcast_to_org(org_id, {"type": "run_status", "data": {"run_id": "r1"}})
+
+        assert sent == 2
+        dumps.assert_called_once()
+        await _drain()
+        assert fast.sent == [{"type": "run_status", "data": {"run_id": "r1"}}]
+        assert stalled.sent == []
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_progress_coalesced_per_run(self):
+        manager = WebSocketManager()
+        org_id = uuid.uuid4()
+        gate = asyncio.Event()
+        websocket = _websocket(gate=gate)
+        await manager.connect(websocket, org_id, uuid.uuid4())
+
+        # The first message is taken by the writer and blocks in send
+        await manager.broadcast_to_org(org_id, {"type": "run_status", "data": {"run_id": "a"}})
+        await _drain()
+        for n in range(3):
+            await manager.broadcast_to_org(org_id, _progress("a", n))
+            await manager.broadcast_to_org(org_id, _progress("b", n))
+        await manager.broadcast_to_org(org_id, {"type": "run_status", "data": {"run_id": "a"}})
+        gate.set()
+        await _drain()
+
+        assert [(m["type"], m["data"]["run_id"], m["data"].get("progress")) for m in websocket.sent] == [
+            ("run_status", "a", None),
+            ("run_progress", "a", {"current": 2}),
+            ("run_progress", "b", {"current": 2}),
+            ("run_status", "a", None),
+        ]
+        await manager.close_all()
+
+
+class TestSlowConsumers:
+    """Tests for dropping connections that fall behind."""
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_disconnects(self):
+        manager = WebSocketManager()
+        org_id = uuid.uuid4()
+        websocket = _websocket(gate=asyncio.Event())
+        await manager.connect(websocket, org_id, uuid.uuid4())
+
+        with patch.object(manager_module, "MAX_QUEUED_MESSAGES", 3):
+            results = [
+                await manager.send_to_connection(websocket, {"type": "run_status", "data": {"n": n}})
+                for n in range(6)
+            ]
+            await asyncio.wait_for(manager.wait_closed(websocket), 1)
+
+        # Three fill the queue before the writer runs; the rest are refused
+        assert results == [True, True, True, False, False, False]
+        websocket.close.assert_awaited_once()
+        assert websocket.close.await_args.kwargs["code"] == SLOW_CONSUMER_CLOSE_CODE
+        assert manager.get_org_connection_count(org_id) == 0
+        assert manager.get_total_connection_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_stalled_send_disconnects(self):
+        manager = WebSocketManager()
+        org_id = uuid.uuid4()
+        websocket = _websocket(gate=asyncio.Event())
+        await manager.connect(websocket, org_id, uuid.uuid4())
+
+        with patch.object(manager_module, "SEND_TIMEOUT_SECONDS", 0.01):
+            await manager.broadcast_to_org(org_id, {"type": "run_status", "data": {}})
+            await asyncio.wait_for(manager.wait_closed(websocket), 1)
+
+        websocket.close.assert_awaited_once()
+        assert manager.get_org_connection_count(org_id) == 0
+        assert await manager.broadcast_to_org(org_id, {"type": "run_status", "data": {}}) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_send_disconnects_without_close(self):
+        manager = WebSocketManager()
+        org_id = uuid.uuid4()
+        websocket = _websocket()
+        websocket.send_text.side_effect = RuntimeError("connection reset")
+        await manager.connect(websocket, org_id, uuid.uuid4())
+
+        await manager.broadcast_to_org(org_id, {"type": "run_status", "data": {}})
+        await asyncio.wait_for(manager.wait_closed(websocket), 1)
+
+        websocket.close.assert_not_called()
+        assert manager.get_total_connection_count() == 0
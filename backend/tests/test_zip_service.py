@@ -0,0 +1,139 @@
+# backend/tests/test_zip_service.py
+"""
+Tests for the streaming ZIP export builder.
+
+Covers:
+- Archives streamed front to back are valid ZIP files
+- Combined exports (individual files, merged document and summary)
+- Bounded prefetch of document downloads
+- Selection errors raised before any bytes are streamed
+- Multipart upload of a streamed archive to object storage
+"""
+
+import io
+import threading
+import time
+import uuid
+import zipfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.storage.zip_service import ZipService
+
+
+def _service(documents, delay=0.0):
+    service = ZipService.__new__(ZipService)
+    service.minio = MagicMock()
+    service.minio.enabled = True
+
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def read_object_text(bucket, key):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        return documents[key]
+
+    service.minio.read_object_text.side_effect = read_object_text
+    artifacts = {
+        doc_id: MagicMock(bucket="processed", object_key=doc_id, original_filename=f"{doc_id}.pdf")
+        for doc_id in documents
+    }
+    return service, artifacts, state
+
+
+@pytest.fixture(autouse=True)
+def no_stored_results():
+    with patch("app.core.storage.zip_service.storage_service") as storage:
+        storage.get_processing_result.return_value = None
+        storage.get_all_processing_results.return_value = []
+        yield storage
+
+
+class TestArchiveStreaming:
+    """Tests for iter_archive."""
+
+    def test_standard_archive_streams_valid_zip(self):
+        documents = {f"doc{i}": f"# Title {i}\n" + "text " * 50_000 for i in range(3)}
+        service, artifacts, _ = _service(documents)
+
+        chunks = list(service.iter_archive(list(documents), artifacts=artifacts))
+
+        assert len(chunks) > 1
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert names[:3] == [f"processed_documents/doc{i}.md" for i in range(3)]
+        assert names[3].startswith("PROCESSING_SUMMARY_")
+        assert archive.read("processed_documents/doc1.md").decode() == documents["doc1"]
+
+    def test_combined_archive_includes_merged_document(self):
+        documents = {"a": "# Alpha\nbody", "b": "# Beta\nbody"}
+        service, artifacts, _ = _service(documents)
+
+        data = b"".join(service.iter_archive(["a", "b"], artifacts=artifacts, combined=True))
+
+        archive = zipfile.ZipFile(io.BytesIO(data))
+        combined_name = next(n for n in archive.namelist() if n.startswith("COMBINED_EXPORT_"))
+        combined = archive.read(combined_name).decode()
+        assert "## Alpha" in combined and "## Beta" in combined
+        assert combined.index("## Alpha") < combined.index("## Beta")
+        assert "individual_files/a.md" in archive.namelist()
+
+    def test_prefetch_is_bounded(self):
+        documents = {f"doc{i}": f"content {i}" for i in range(12)}
+        service, artifacts, state = _service(documents, delay=0.02)
+
+        data = b"".join(service.iter_archive(list(documents), artifacts=artifacts, prefetch=3))
+
+        assert 1 < state["peak"] <= 3
+        archive = zipfile.ZipFile(io.BytesIO(data))
+        assert len([n for n in archive.namelist() if n.endswith(".md")]) == 13
+
+
+class TestBulkDownload:
+    """Tests for stream_bulk_download and save_to_storage."""
+
+    @pytest.mark.asyncio
+    async def test_rag_ready_without_documents_fails_before_streaming(self):
+        service, _, _ = _service({})
+
+        with patch.object(service, "_load_processed_artifacts", AsyncMock(return_value={})):
+            with pytest.raises(ValueError, match="No RAG-ready documents"):
+                await service.stream_bulk_download(["doc1"], "rag_ready")
+
+    @pytest.mark.asyncio
+    async def test_save_to_storage_uploads_stream(self):
+        documents = {"doc1": "# One"}
+        service, artifacts, _ = _service(documents)
+        service.minio.bucket_temp = "temp"
+        uploaded = {}
+
+        def put_stream(bucket, key, data, content_type):
+            uploaded["data"] = data.read()
+            return MagicMock(file_size=len(uploaded["data"]), file_hash="hash")
+
+        service.minio.put_stream.side_effect = put_stream
+        session = MagicMock()
+        session.commit = AsyncMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        org_id = uuid.uuid4()
+
+        with patch.object(service, "_load_processed_artifacts", AsyncMock(return_value=artifacts)), \
+                patch("app.core.shared.database_service.database_service.get_session", return_value=session_cm), \
+                patch("app.core.storage.zip_service.artifact_service.create_artifact", AsyncMock()) as create:
+            archive = await service.stream_bulk_download(["doc1"], "individual", custom_filename="export")
+            result = await service.save_to_storage(archive, org_id)
+
+        assert archive.filename == "export.zip"
+        assert zipfile.ZipFile(io.BytesIO(uploaded["data"])).namelist()[0] == "processed_documents/doc1.md"
+        assert result["object_key"].startswith(f"{org_id}/exports/")
+        assert result["file_size"] == len(uploaded["data"])
+        assert create.await_args.kwargs["artifact_type"] == "temp"
@@ -580,7 +580,7 @@ export default function SearchPage() {
             {/* Results Header */}
             <div className="flex items-center justify-between text-sm text-gray-500 dark:text-gray-400">
               <span>
-                {results.total.toLocaleString()} result{results.total !== 1 ? 's' : ''} found
+                {results.total.toLocaleString()}{results.total_capped ? '+' : ''} result{results.total !== 1 || results.total_capped ? 's' : ''} found
               </span>
               {isLoading && (
                 <span className="flex items-center gap-2">
@@ -2977,6 +2977,8 @@ export interface Facet {
 export interface SearchFacets {
   source_type?: Facet
   content_type?: Facet
+  /** Registry facets requested via facet_fields (e.g. agency) */
+  [facet: string]: Facet | undefined
 }
 
 /**
@@ -2997,6 +2999,8 @@ export interface SearchRequest {
   limit?: number
   offset?: number
   include_facets?: boolean
+  /** source_type, content_type and/or registry facet names */
+  facet_fields?: string[]
 }
 
 /**
@@ -3021,6 +3025,8 @@ export interface SearchHit {
  */
 export interface SearchResponse {
   total: number
+  /** True when total is a lower bound (hybrid search), shown as "N+" */
+  total_capped?: boolean
   limit: number
   offset: number
   query: string
@@ -3182,6 +3188,24 @@ export const searchApi = {
     })
     return handleJson(res)
   },
+
+  /**
+   * Get browse facet counts (all indexed documents, no query)
+   */
+  async getBrowseFacets(
+    token: string | undefined,
+    facets: string[],
+    options?: { source_types?: string[]; size?: number }
+  ): Promise<Record<string, Facet>> {
+    const searchParams = new URLSearchParams()
+    facets.forEach((f) => searchParams.append('facets', f))
+    options?.source_types?.forEach((st) => searchParams.append('source_types', st))
+    if (options?.size !== undefined) searchParams.set('size', String(options.size))
+    const res = await apiFetch(`/data/search/facets?${searchParams.toString()}`, {
+      cache: 'no-store',
+    })
+    return handleJson(res)
+  },
 }
 
 // ============================================================================
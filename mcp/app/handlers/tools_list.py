@@ -2,47 +2,34 @@
 """Handles MCP tools/list request."""
 
 import logging
-import time
 from typing import Any, Dict, List, Optional
 
 from app.models.mcp import MCPToolsListResponse
 from app.services.backend_client import backend_client
+from app.services.contract_cache import contract_cache
 from app.services.contract_converter import ContractConverter
 from app.services.policy_service import policy_service
 
 logger = logging.getLogger("mcp.handlers.tools_list")
 
-# In-memory cache for contracts
-_contract_cache: List[Dict[str, Any]] = []
-_cache_timestamp: float = 0
-
 
 async def _get_contracts(
     api_key: Optional[str] = None,
     correlation_id: Optional[str] = None,
     user_email: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    """Get contracts from cache or backend."""
-    global _contract_cache, _cache_timestamp
-
-    cache_ttl = policy_service.contract_cache_ttl
-    if _contract_cache and (time.time() - _cache_timestamp) < cache_ttl:
-        return _contract_cache
-
+    """Get contracts from cache (in-process, then Redis) or backend."""
     # Fetch ALL contracts from backend (filtering done by policy_service)
-    contracts = await backend_client.get_contracts(
-        side_effects=None,  # Don't filter at source - let policy handle it
-        api_key=api_key,
-        correlation_id=correlation_id,
-        user_email=user_email,
+    return await contract_cache.get_or_load(
+        policy_service.contract_cache_ttl,
+        lambda: backend_client.get_contracts(
+            side_effects=None,  # Don't filter at source - let policy handle it
+            api_key=api_key,
+            correlation_id=correlation_id,
+            user_email=user_email,
+        ),
     )
 
-    _contract_cache = contracts
-    _cache_timestamp = time.time()
-    logger.debug(f"Cached {len(contracts)} contracts")
-
-    return contracts
-
 
 async def handle_tools_list(
     api_key: Optional[str] = None,
@@ -77,7 +64,5 @@ async def handle_tools_list(
 
 
 def clear_cache():
-    """Clear the contract cache."""
-    global _contract_cache, _cache_timestamp
-    _contract_cache = []
-    _cache_timestamp = 0
+    """Clear the in-process contract cache."""
+    contract_cache.clear()
@@ -1,6 +1,7 @@
 # MCP Gateway Main Entry Point
 """FastAPI application with MCP SDK Streamable HTTP transport."""
 
+import asyncio
 import json
 import logging
 from contextlib import asynccontextmanager
@@ -17,6 +18,7 @@ from app.middleware.correlation import CorrelationMiddleware
 from app.models.openai import OpenAIToolsResponse
 from app.server import ctx_api_key, ctx_correlation_id, ctx_user_email, session_manager
 from app.services.backend_client import backend_client
+from app.services.contract_cache import contract_cache
 from app.services.openai_converter import mcp_tools_to_openai
 from app.services.policy_service import policy_service
 from app.services.progress_service import progress_service
@@ -42,12 +44,17 @@ async def lifespan(app: FastAPI):
     else:
         logger.info(f"Policy v{policy.version}: legacy mode, {len(policy.allowlist)} allowed tools")
 
+    # Drop cached contracts when the backend invalidates them
+    cache_listener = asyncio.create_task(contract_cache.run_invalidation_listener())
+
     # Start MCP SDK session manager (manages Streamable HTTP transport lifecycle)
     async with session_manager.run():
         yield
 
     # Shutdown
     logger.info("Shutting down MCP Gateway")
+    cache_listener.cancel()
+    await contract_cache.close()
     await backend_client.close()
 
 
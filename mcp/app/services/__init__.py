@@ -2,6 +2,7 @@
 """Service layer for MCP Gateway."""
 
 from .backend_client import BackendClient, backend_client
+from .contract_cache import ContractCache, contract_cache
 from .contract_converter import ContractConverter
 from .facet_validator import FacetValidator, facet_validator
 from .openai_converter import mcp_to_openai_tool, mcp_tools_to_openai
@@ -11,6 +12,8 @@ from .progress_service import ProgressService, progress_service
 __all__ = [
     "BackendClient",
     "backend_client",
+    "ContractCache",
+    "contract_cache",
     "ContractConverter",
     "mcp_to_openai_tool",
     "mcp_tools_to_openai",
@@ -0,0 +1,151 @@
+# Contract Cache Service
+"""
+Two-tier cache for backend tool contracts.
+
+Contracts are cached in process and in Redis (settings.redis_url), so
+gateway replicas share one copy and restarted replicas start warm. The
+Redis layout follows the backend's SharedCache ("mcp_contracts"): the
+backend bumps the cache epoch and broadcasts an invalidation on
+curatore:cache:invalidate when its contracts may have changed (startup),
+and the listener started in the app lifespan drops the local copy.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import redis.asyncio as redis
+
+from app.config import settings
+
+logger = logging.getLogger("mcp.services.contract_cache")
+
+CACHE_NAME = "mcp_contracts"
+INVALIDATION_CHANNEL = "curatore:cache:invalidate"
+
+# Seconds to skip Redis after a connection error
+REDIS_RETRY_INTERVAL = 30
+
+
+class ContractCache:
+    """In-process + Redis cache of the backend contract list."""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url or settings.redis_url
+        self._contracts: List[Dict[str, Any]] = []
+        self._timestamp: float = 0
+        self._redis: Optional[redis.Redis] = None
+        self._redis_down_until: float = 0
+
+    def _key(self, suffix: str) -> str:
+        return f"curatore:cache:{CACHE_NAME}:{suffix}"
+
+    def _get_redis(self) -> Optional[redis.Redis]:
+        if time.time() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            self._redis = redis.from_url(
+                self.redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._redis
+
+    def _mark_redis_down(self, error: Exception) -> None:
+        logger.warning(f"Contract cache Redis unavailable, using in-process cache only: {error}")
+        self._redis_down_until = time.time() + REDIS_RETRY_INTERVAL
+
+    def clear(self) -> None:
+        """Clear the in-process copy."""
+        self._contracts = []
+        self._timestamp = 0
+
+    async def get_or_load(
+        self,
+        ttl: int,
+        loader: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Return cached contracts, loading them from the backend on a miss.
+
+        Args:
+            ttl: Cache TTL in seconds (both tiers)
+            loader: Coroutine factory fetching contracts from the backend
+
+        Returns:
+            List of contract dictionaries
+        """
+        if self._contracts and (time.time() - self._timestamp) < ttl:
+            return self._contracts
+
+        client = self._get_redis()
+        value_key = None
+        if client is not None:
+            try:
+                epoch, version = await client.mget(self._key("epoch"), self._key("ver:global"))
+                value_key = self._key(f"{epoch or 0}.{version or 0}:global:contracts")
+                raw = await client.get(value_key)
+                if raw is not None:
+                    self._contracts = json.loads(raw)
+                    self._timestamp = time.time()
+                    return self._contracts
+            except Exception as e:
+                self._mark_redis_down(e)
+                value_key = None
+
+        contracts = await loader()
+
+        if value_key is not None:
+            try:
+                await client.set(value_key, json.dumps(contracts), ex=ttl)
+            except Exception as e:
+                self._mark_redis_down(e)
+
+        self._contracts = contracts
+        self._timestamp = time.time()
+        logger.debug(f"Cached {len(contracts)} contracts")
+        return contracts
+
+    async def run_invalidation_listener(self) -> None:
+        """Drop the local copy when the backend invalidates contracts (runs until cancelled)."""
+        backoff = 1
+        while True:
+            subscriber = redis.from_url(self.redis_url, encoding="utf-8", decode_responses=True)
+            try:
+                pubsub = subscriber.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything published while disconnected was missed
+                self.clear()
+                backoff = 1
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        data = json.loads(message["data"])
+                    except json.JSONDecodeError:
+                        continue
+                    if data.get("cache") == CACHE_NAME:
+                        logger.info("Contract cache invalidated by backend")
+                        self.clear()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Contract cache listener disconnected: {e}")
+            finally:
+                await subscriber.close()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, REDIS_RETRY_INTERVAL)
+
+    async def close(self) -> None:
+        """Close the Redis client."""
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+# Global instance
+contract_cache = ContractCache()